@@ -1,8 +1,11 @@
 from __future__ import annotations
 import argparse
 import asyncio
+import hashlib
+import hmac
 import json
 import os
+import uuid
 from pathlib import Path
 import statistics
 import time
@@ -118,6 +121,87 @@ async def run_webhook_load(base_url: str, total: int, concurrency: int) -> LoadR
     return LoadResult(durations, failures)
 
 
+def _gitea_event(i: int, repos: int) -> tuple[str, Dict[str, Any]]:
+    owner = "load-org"
+    name = f"repo-{i % max(1, repos)}"
+    repository = {
+        "id": 1000 + (i % max(1, repos)),
+        "name": name,
+        "full_name": f"{owner}/{name}",
+        "owner": {"login": owner},
+        "clone_url": f"https://gitea.local/{owner}/{name}.git",
+    }
+    pull_request = {
+        "number": 1 + i // max(1, repos),
+        "title": f"Load test change {i}",
+        "state": "open",
+        "merged": False,
+        "head": {"ref": f"feature/load-{i}", "sha": hashlib.sha1(str(i).encode()).hexdigest()},
+        "base": {"ref": "main"},
+        "user": {"login": "load-bot"},
+    }
+    sender = {"login": "load-bot"}
+    if i % 3 == 2:
+        review = {"state": "approved", "body": "LGTM", "user": {"login": "reviewer"}}
+        payload = {
+            "action": "reviewed",
+            "number": pull_request["number"],
+            "pull_request": pull_request,
+            "review": review,
+            "repository": repository,
+            "sender": sender,
+        }
+        return "pull_request_review", payload
+    action = "opened" if i % 3 == 0 else "synchronized"
+    return "pull_request", {
+        "action": action,
+        "number": pull_request["number"],
+        "pull_request": pull_request,
+        "repository": repository,
+        "sender": sender,
+    }
+
+
+async def run_gitea_webhook_load(base_url: str, total: int, concurrency: int, repos: int) -> LoadResult:
+    """Post signed pull_request and pull_request_review deliveries to the real ingestion endpoint."""
+    secret = os.getenv("GITEA_WEBHOOK_SECRET", "").strip().encode()
+    if not secret:
+        print("GITEA_WEBHOOK_SECRET is not set; skipping signed Gitea webhook load")
+        return LoadResult([], 0)
+    sem = asyncio.Semaphore(concurrency)
+    durations: List[float] = []
+    failures = 0
+    run_tag = uuid.uuid4().hex[:8]
+
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        async def worker(i: int):
+            nonlocal failures
+            event_type, payload = _gitea_event(i, repos)
+            body = json.dumps(payload).encode("utf-8")
+            signature = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+            headers = {
+                "Content-Type": "application/json",
+                "X-Gitea-Event": event_type,
+                "X-Gitea-Signature": signature,
+                "X-Gitea-Delivery": f"load-{run_tag}-{i}",
+            }
+            async with sem:
+                duration_ms, ok = await _timed_request(
+                    client,
+                    "POST",
+                    f"{base_url}/webhook/gitea",
+                    content=body,
+                    headers=headers,
+                    expected_statuses={202},
+                )
+                durations.append(duration_ms)
+                if not ok:
+                    failures += 1
+
+        await asyncio.gather(*(worker(i) for i in range(total)))
+    return LoadResult(durations, failures)
+
+
 async def run_api_load(base_url: str, total: int, concurrency: int) -> LoadResult:
     sem = asyncio.Semaphore(concurrency)
     durations: List[float] = []
@@ -201,6 +285,9 @@ async def main() -> None:
     parser.add_argument("--ws-url", default="ws://127.0.0.1:8082/ws/events", help="WebSocket URL")
     parser.add_argument("--webhook-total", type=int, default=100)
     parser.add_argument("--webhook-concurrency", type=int, default=25)
+    parser.add_argument("--gitea-webhook-total", type=int, default=300)
+    parser.add_argument("--gitea-webhook-concurrency", type=int, default=25)
+    parser.add_argument("--gitea-webhook-repos", type=int, default=10, help="Distinct repositories in the event mix")
     parser.add_argument("--api-total", type=int, default=200)
     parser.add_argument("--api-concurrency", type=int, default=50)
     parser.add_argument("--epic-total", type=int, default=10)
@@ -210,11 +297,18 @@ async def main() -> None:
     args = parser.parse_args()
 
     webhook_result = await run_webhook_load(args.webhook_base_url, args.webhook_total, args.webhook_concurrency)
+    gitea_webhook_result = await run_gitea_webhook_load(
+        args.webhook_base_url,
+        args.gitea_webhook_total,
+        args.gitea_webhook_concurrency,
+        args.gitea_webhook_repos,
+    )
     api_result = await run_api_load(args.api_base_url, args.api_total, args.api_concurrency)
     epic_result = await run_parallel_epic_trigger_load(args.api_base_url, args.epic_total, args.epic_concurrency)
     ws_result = await run_websocket_load(args.ws_url, args.ws_clients)
 
     print(webhook_result.summary("webhook"))
+    print(gitea_webhook_result.summary("gitea_webhook"))
     print(api_result.summary("api_heartbeat"))
     print(epic_result.summary("parallel_epic_trigger"))
     print(ws_result.summary("websocket_connect"))
@@ -227,6 +321,9 @@ async def main() -> None:
             "ws_url": args.ws_url,
             "webhook_total": args.webhook_total,
             "webhook_concurrency": args.webhook_concurrency,
+            "gitea_webhook_total": args.gitea_webhook_total,
+            "gitea_webhook_concurrency": args.gitea_webhook_concurrency,
+            "gitea_webhook_repos": args.gitea_webhook_repos,
             "api_total": args.api_total,
             "api_concurrency": args.api_concurrency,
             "epic_total": args.epic_total,
@@ -235,6 +332,7 @@ async def main() -> None:
         },
         "results": {
             "webhook": webhook_result.as_dict(),
+            "gitea_webhook": gitea_webhook_result.as_dict(),
             "api_heartbeat": api_result.as_dict(),
             "parallel_epic_trigger": epic_result.as_dict(),
             "websocket_connect": ws_result.as_dict(),
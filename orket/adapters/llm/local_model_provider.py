@@ -17,9 +17,15 @@ from orket.adapters.llm.local_model_provider_runtime_target import (
     provider_runtime_target_payload,
 )
 from orket.adapters.llm.local_prompting_policy import LocalPromptingPolicyResult, resolve_local_prompting_policy
+from orket.adapters.llm.model_response_cache import (
+    ModelResponseCache,
+    model_response_cache_key,
+    resolve_model_response_cache,
+)
 from orket.adapters.llm.openai_compat_runtime import (
     build_orket_session_id,
     build_prompt_fingerprint,
+    extract_openai_prompt_cache_usage,
     normalize_openai_base_url,
     select_response_headers,
     validate_openai_messages,
@@ -27,9 +33,30 @@ from orket.adapters.llm.openai_compat_runtime import (
 from orket.adapters.llm.openai_native_tools import build_openai_native_tooling
 from orket.adapters.llm.provider_extractors import extractor_for_provider
 from orket.exceptions import ModelConnectionError, ModelProviderError, ModelTimeoutError
+from orket.instrumentation import MODEL_PROMPT_CACHE_REUSE_RATIO, record_model_completion
 from orket.logging import log_event
+from orket.runtime.config.prompt_prefix_layout import (
+    PROMPT_LAYOUT_PREFIX_STABLE,
+    prefix_affinity_key,
+    prompt_cache_hints,
+    resolve_prompt_layout,
+)
 from orket.runtime.provider_runtime_target import ProviderRuntimeTarget
 
+# Raw keys that describe one backend call rather than the completion; never cached, refreshed on hits.
+_PER_REQUEST_RAW_KEYS = (
+    "orket_request_id",
+    "orket_session_id",
+    "orket_session_epoch",
+    "provider_session_epoch",
+    "context_reset_status",
+    "prompt_cache",
+    "timings",
+    "latency_ms",
+    "retries",
+    "http",
+)
+
 
 @dataclass
 class ModelResponse:
@@ -71,11 +98,13 @@ class LocalModelProvider:
         base_url: str = "",
         api_key: str = "",
         connect_timeout_seconds: float = 30.0,
+        response_cache: ModelResponseCache | None = None,
     ):
         """Initialize provider.
 
         `timeout` is the total response generation timeout in seconds.
         `connect_timeout_seconds` is the TCP connection establishment timeout in seconds.
+        `response_cache` defaults to the process-wide cache selected by ORKET_MODEL_RESPONSE_CACHE.
         """
         self.requested_model = str(model or "").strip()
         self.model = self.requested_model
@@ -115,6 +144,7 @@ class LocalModelProvider:
         self._openai_session_epoch = 0
         self._seen_context_epochs: set[int] = set()
         self._runtime_target: ProviderRuntimeTarget | None = None
+        self.response_cache = response_cache if response_cache is not None else resolve_model_response_cache()
 
     @staticmethod
     def _resolve_temperature_override(default_temperature: float) -> float:
@@ -237,8 +267,35 @@ class LocalModelProvider:
         )
         if self.provider_name == "llama_cpp" and native_tools:
             raise ModelProviderError("llama.cpp first slice admits JSON-wrapper tool calls only.")
+        cache = self.response_cache
+        cache_key = ""
+        if cache is not None and cache.enabled:
+            cache_key = self._response_cache_key(
+                policy,
+                native_tools=native_tools,
+                native_tool_choice=native_tool_choice,
+                native_payload_overrides=native_payload_overrides,
+            )
+            cached = await cache.lookup(cache_key)
+            if cached is not None:
+                raw = dict(cached.get("raw") or {})
+                raw.update(self._request_identity(policy, runtime_context=resolved_context))
+                raw.update(
+                    {
+                        "timings": {"prompt_ms": 0.0, "predicted_ms": 0.0, "total_ms": 0.0},
+                        "latency_ms": 0,
+                        "retries": 0,
+                        "response_cache": {
+                            "status": "hit",
+                            "key": cache_key,
+                            "saved_latency_ms": int(cached.get("latency_ms") or 0),
+                            **cache.stats(),
+                        },
+                    }
+                )
+                return ModelResponse(content=str(cached["content"]), raw=raw)
         if self.provider_backend == "openai_compat":
-            return await self._complete_openai_compat(
+            response = await self._complete_openai_compat(
                 policy.messages,
                 policy,
                 runtime_context=resolved_context,
@@ -246,13 +303,53 @@ class LocalModelProvider:
                 native_tool_choice=native_tool_choice,
                 native_payload_overrides=native_payload_overrides,
             )
-        return await self._complete_ollama(
-            policy.messages,
-            policy,
-            native_tools=native_tools,
-            native_tool_choice=native_tool_choice,
-            native_payload_overrides=native_payload_overrides,
+        else:
+            response = await self._complete_ollama(
+                policy.messages,
+                policy,
+                native_tools=native_tools,
+                native_tool_choice=native_tool_choice,
+                native_payload_overrides=native_payload_overrides,
+            )
+        if cache is not None and cache_key:
+            await cache.store(
+                cache_key,
+                content=response.content,
+                raw={key: value for key, value in response.raw.items() if key not in _PER_REQUEST_RAW_KEYS},
+                latency_ms=int(response.raw.get("latency_ms") or 0),
+            )
+            response.raw["response_cache"] = {"status": "miss", "key": cache_key, **cache.stats()}
+        return response
+
+    def _response_cache_key(
+        self,
+        policy: LocalPromptingPolicyResult,
+        *,
+        native_tools: list[dict[str, Any]],
+        native_tool_choice: str | None,
+        native_payload_overrides: Mapping[str, Any],
+    ) -> str:
+        prompt_fingerprint = build_prompt_fingerprint(
+            {
+                "messages": policy.messages,
+                "tools": native_tools,
+                "tool_choice": native_tool_choice,
+                "payload_overrides": dict(native_payload_overrides),
+            }
         )
+        parameters = {
+            "provider_backend": self.provider_backend,
+            "provider_name": self.provider_name,
+            "temperature": self.temperature,
+            "seed": self.seed,
+            "task_class": policy.task_class,
+            "profile_id": policy.profile_id,
+            "template_hash": policy.template_hash,
+            "sampling_bundle": policy.sampling_bundle,
+            "stop_sequences": policy.effective_stop_sequences,
+            "openai_response_format": str(os.getenv("ORKET_LLM_OPENAI_RESPONSE_FORMAT", "")).strip().lower(),
+        }
+        return model_response_cache_key(model=self.model, parameters=parameters, prompt_fingerprint=prompt_fingerprint)
 
     async def _complete_ollama(
         self,
@@ -302,6 +399,13 @@ class LocalModelProvider:
                 tool_calls = extractor.extract_tool_calls(response)
                 prompt_tokens, completion_tokens, total_tokens = extractor.extract_usage(response)
                 prompt_ms, predicted_ms, total_ms = extractor.extract_timings(response, latency_ms)
+                record_model_completion(
+                    "ollama",
+                    latency_seconds=latency_ms / 1000.0,
+                    time_to_first_token_seconds=prompt_ms / 1000.0,
+                    completion_tokens=completion_tokens,
+                    generation_seconds=predicted_ms / 1000.0,
+                )
 
                 raw = {
                     "ollama": response,
@@ -379,6 +483,49 @@ class LocalModelProvider:
             retry_delay *= 2
         raise ModelProviderError(f"Unexpected error invoking model {self.model}: retry loop exited without response.")
 
+    def _openai_session_id(
+        self,
+        messages: list[dict[str, str]],
+        local_prompting_policy: LocalPromptingPolicyResult,
+        *,
+        runtime_context: Mapping[str, Any],
+    ) -> str:
+        base_session_id = build_orket_session_id(
+            runtime_context=runtime_context,
+            model=self.model,
+            provider_name=self.provider_name,
+            fallback_messages=list(messages),
+            preferred_session_id=str(local_prompting_policy.lmstudio_session_id or ""),
+        )
+        prefix_stable = resolve_prompt_layout(runtime_context) == PROMPT_LAYOUT_PREFIX_STABLE
+        if prefix_stable and prefix_affinity_key(runtime_context):
+            # One backend session per role keeps each role's pinned prefix on its own warm cache.
+            base_session_id = f"{base_session_id}:{str(runtime_context.get('role')).strip().lower()}"
+        return self._resolve_request_session_id(base_session_id)
+
+    def _request_identity(
+        self,
+        local_prompting_policy: LocalPromptingPolicyResult,
+        *,
+        runtime_context: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        """Session and request identity the current call would carry, for responses served from cache."""
+        if self.provider_backend != "openai_compat":
+            return {"provider_session_epoch": None, "context_reset_status": "stateless_backend"}
+        orket_session_epoch = max(0, int(getattr(self, "_openai_session_epoch", 0) or 0))
+        return {
+            "orket_session_id": self._openai_session_id(
+                local_prompting_policy.messages,
+                local_prompting_policy,
+                runtime_context=runtime_context,
+            ),
+            "orket_session_epoch": orket_session_epoch,
+            "orket_request_id": f"orket-{time.time_ns()}",
+            "prompt_cache": {"layout": resolve_prompt_layout(runtime_context)},
+            "provider_session_epoch": orket_session_epoch,
+            "context_reset_status": self._context_reset_status(provider_session_epoch=orket_session_epoch),
+        }
+
     async def _complete_openai_compat(
         self,
         messages: list[dict[str, str]],
@@ -413,14 +560,10 @@ class LocalModelProvider:
         if native_tool_choice:
             payload["tool_choice"] = native_tool_choice
         payload.update(native_payload_overrides)
-        base_session_id = build_orket_session_id(
-            runtime_context=runtime_context,
-            model=self.model,
-            provider_name=self.provider_name,
-            fallback_messages=list(messages),
-            preferred_session_id=str(local_prompting_policy.lmstudio_session_id or ""),
-        )
-        orket_session_id = self._resolve_request_session_id(base_session_id)
+        prompt_layout = resolve_prompt_layout(runtime_context)
+        if prompt_layout == PROMPT_LAYOUT_PREFIX_STABLE:
+            payload.update(prompt_cache_hints(provider_name=self.provider_name, runtime_context=runtime_context))
+        orket_session_id = self._openai_session_id(messages, local_prompting_policy, runtime_context=runtime_context)
         orket_session_epoch = max(0, int(getattr(self, "_openai_session_epoch", 0) or 0))
         context_reset_status = self._context_reset_status(provider_session_epoch=orket_session_epoch)
         orket_request_id = f"orket-{time.time_ns()}"
@@ -458,6 +601,27 @@ class LocalModelProvider:
                 latency_ms = int((time.perf_counter() - started_at) * 1000)
                 prompt_tokens, completion_tokens, total_tokens = extractor.extract_usage(parsed)
                 prompt_ms, predicted_ms, total_ms = extractor.extract_timings(parsed, latency_ms)
+                record_model_completion(
+                    "openai_compat",
+                    latency_seconds=latency_ms / 1000.0,
+                    time_to_first_token_seconds=prompt_ms / 1000.0,
+                    completion_tokens=completion_tokens,
+                    generation_seconds=predicted_ms / 1000.0,
+                )
+                prompt_cache_usage = extract_openai_prompt_cache_usage(parsed)
+                prompt_cache: dict[str, Any] = {"layout": prompt_layout}
+                if prompt_cache_usage is not None:
+                    cached_tokens, prompt_cache_tokens = prompt_cache_usage
+                    reuse_ratio = cached_tokens / prompt_cache_tokens if prompt_cache_tokens else 0.0
+                    MODEL_PROMPT_CACHE_REUSE_RATIO.observe(reuse_ratio, "openai_compat")
+                    prompt_cache.update(
+                        {
+                            "cached_tokens": cached_tokens,
+                            "prompt_tokens": prompt_cache_tokens,
+                            "reuse_ratio": round(reuse_ratio, 4),
+                            "prompt_eval_ms": prompt_ms,
+                        }
+                    )
                 outbound_role_sequence = [
                     str(message.get("role") or "").strip().lower()
                     for message in messages
@@ -508,6 +672,7 @@ class LocalModelProvider:
                     "orket_session_epoch": orket_session_epoch,
                     "orket_request_id": orket_request_id,
                     "prompt_fingerprint": prompt_fingerprint,
+                    "prompt_cache": prompt_cache,
                     "request_payload_byte_count": request_payload_byte_count,
                     "model_alias": self.model,
                     "orket_trace": {
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from orket.exceptions import ModelResponseCacheMiss
+from orket.instrumentation import MODEL_RESPONSE_CACHE_LOOKUPS, MODEL_RESPONSE_CACHE_SAVED_SECONDS
+from orket.logging import log_event
+from orket.runtime_paths import resolve_model_response_cache_root
+
+CACHE_ENTRY_SCHEMA_VERSION = "orket.model_response_cache.v1"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600.0
+
+
+class ModelResponseCacheMode(StrEnum):
+    OFF = "off"
+    READ_WRITE = "read_write"
+    REPLAY_ONLY = "replay_only"
+
+
+def model_response_cache_key(*, model: str, parameters: dict[str, Any], prompt_fingerprint: str) -> str:
+    """Content address of one completion request: model, sampling parameters, and prompt fingerprint."""
+    identity = {"model": str(model), "parameters": parameters, "prompt_fingerprint": str(prompt_fingerprint)}
+    encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ModelResponseCache:
+    """On-disk, content-addressed store of model completions.
+
+    Entries live at ``<root>/<key[:2]>/<key>.json``. Reads refresh an entry's mtime, so size
+    eviction drops the least recently used entries first; entries older than ``max_age_seconds``
+    (by creation time) are treated as misses and removed. In replay-only mode a miss raises
+    ``ModelResponseCacheMiss`` and nothing is written.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        mode: ModelResponseCacheMode = ModelResponseCacheMode.READ_WRITE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self.root = Path(root)
+        self.mode = ModelResponseCacheMode(mode)
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+        self._stats: dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0, "saved_latency_ms": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != ModelResponseCacheMode.OFF
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    async def lookup(self, key: str) -> dict[str, Any] | None:
+        """Return the cached ``{"content", "raw"}`` for ``key``; raise on a replay-only miss."""
+        if not self.enabled:
+            return None
+        entry = await asyncio.to_thread(self._read_entry, key)
+        if entry is None:
+            self._bump("misses")
+            MODEL_RESPONSE_CACHE_LOOKUPS.inc("miss")
+            if self.mode == ModelResponseCacheMode.REPLAY_ONLY:
+                raise ModelResponseCacheMiss(f"Model response cache has no entry for request {key} (replay-only).")
+            return None
+        saved_ms = int(entry.get("latency_ms") or 0)
+        self._bump("hits")
+        self._bump("saved_latency_ms", saved_ms)
+        MODEL_RESPONSE_CACHE_LOOKUPS.inc("hit")
+        MODEL_RESPONSE_CACHE_SAVED_SECONDS.inc(amount=saved_ms / 1000.0)
+        return entry
+
+    async def store(self, key: str, *, content: str, raw: dict[str, Any], latency_ms: int) -> None:
+        if self.mode != ModelResponseCacheMode.READ_WRITE:
+            return
+        entry = {
+            "schema_version": CACHE_ENTRY_SCHEMA_VERSION,
+            "key": key,
+            "created_at": time.time(),
+            "latency_ms": int(latency_ms),
+            "content": content,
+            "raw": raw,
+        }
+        try:
+            encoded = json.dumps(entry, ensure_ascii=False, sort_keys=True, default=_json_default).encode("utf-8")
+            await asyncio.to_thread(self._write_entry, key, encoded)
+        except (OSError, TypeError, ValueError) as exc:
+            log_event("model_response_cache_store_failed", {"key": key, "error": str(exc)})
+            return
+        self._bump("stores")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(self._stats)
+        lookups = counts["hits"] + counts["misses"]
+        stats: dict[str, Any] = dict(counts)
+        stats["mode"] = self.mode.value
+        stats["hit_rate"] = round(counts["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _read_entry(self, key: str) -> dict[str, Any] | None:
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._remove(path)
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key or not isinstance(entry.get("content"), str):
+            self._remove(path)
+            return None
+        if self.max_age_seconds and time.time() - float(entry.get("created_at") or 0.0) > self.max_age_seconds:
+            self._remove(path)
+            self._bump("expired")
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def _write_entry(self, key: str, encoded: bytes) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        previous = path.stat().st_size if path.exists() else 0
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(encoded)
+        tmp_path.replace(path)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(item.stat().st_size for item in self.root.glob("*/*.json"))
+            else:
+                self._total_bytes += len(encoded) - previous
+            over_budget = bool(self.max_bytes) and self._total_bytes > self.max_bytes
+        if over_budget:
+            self._evict_to_budget()
+
+    def _evict_to_budget(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for item in self.root.glob("*/*.json"):
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, item))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        # Evict down to 90% of the budget so a full cache does not rescan on every store.
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, size, item in entries:
+            if total <= target:
+                break
+            self._remove(item)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._total_bytes = total
+            self._stats["evictions"] += evicted
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+
+def _json_default(value: Any) -> Any:
+    for attr in ("model_dump", "dict"):
+        dump = getattr(value, attr, None)
+        if callable(dump):
+            return dump()
+    return str(value)
+
+
+_SHARED_CACHES: dict[tuple[str, str, int, float], ModelResponseCache] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def resolve_model_response_cache() -> ModelResponseCache | None:
+    """Process-wide cache configured by ``ORKET_MODEL_RESPONSE_CACHE`` (off, read_write, replay_only)."""
+    raw_mode = str(os.getenv("ORKET_MODEL_RESPONSE_CACHE", "off")).strip().lower().replace("-", "_") or "off"
+    try:
+        mode = ModelResponseCacheMode(raw_mode)
+    except ValueError as exc:
+        raise ValueError(
+            f"ORKET_MODEL_RESPONSE_CACHE must be one of off, read_write, replay_only; got '{raw_mode}'."
+        ) from exc
+    if mode == ModelResponseCacheMode.OFF:
+        return None
+    root = resolve_model_response_cache_root(os.getenv("ORKET_MODEL_RESPONSE_CACHE_DIR") or None)
+    max_bytes = int(float(os.getenv("ORKET_MODEL_RESPONSE_CACHE_MAX_MB", "512")) * 1024 * 1024)
+    max_age_seconds = float(os.getenv("ORKET_MODEL_RESPONSE_CACHE_MAX_AGE_HOURS", "168")) * 3600.0
+    config = (str(root.resolve()), mode.value, max_bytes, max_age_seconds)
+    with _SHARED_CACHES_LOCK:
+        cache = _SHARED_CACHES.get(config)
+        if cache is None:
+            cache = _SHARED_CACHES[config] = ModelResponseCache(
+                root, mode=mode, max_bytes=max_bytes, max_age_seconds=max_age_seconds
+            )
+        return cache
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+
+import httpx
+import ollama
+
+
+class OllamaModelWarmBackend:
+    """Load, keep alive, and unload Ollama models with empty generate requests.
+
+    Ollama loads a model for any request and keeps it resident for the request's
+    ``keep_alive``; a ``keep_alive`` of zero unloads it.
+    """
+
+    def __init__(self, *, host: str = "", keep_alive_seconds: float = 300.0) -> None:
+        resolved_host = str(host or os.getenv("ORKET_LLM_OLLAMA_HOST") or os.getenv("OLLAMA_HOST") or "").strip()
+        self.client = ollama.AsyncClient(host=resolved_host) if resolved_host else ollama.AsyncClient()
+        self.keep_alive_duration = f"{max(1, int(keep_alive_seconds))}s"
+
+    async def prewarm(self, model_id: str) -> None:
+        await self._generate(model_id, self.keep_alive_duration)
+
+    async def keep_alive(self, model_id: str) -> None:
+        await self._generate(model_id, self.keep_alive_duration)
+
+    async def unload(self, model_id: str) -> None:
+        await self._generate(model_id, 0)
+
+    async def _generate(self, model_id: str, keep_alive: str | int) -> None:
+        try:
+            await self.client.generate(model=model_id, prompt="", keep_alive=keep_alive)
+        except (ollama.ResponseError, ConnectionError, httpx.HTTPError) as exc:
+            raise RuntimeError(f"ollama warm-state request failed for {model_id}: {exc}") from exc
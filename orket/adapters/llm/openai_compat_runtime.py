@@ -285,6 +285,25 @@ def extract_openai_timings(payload: dict[str, Any], latency_ms: int) -> tuple[fl
     return resolved_prompt_ms, resolved_predicted_ms, resolved_total_ms
 
 
+def extract_openai_prompt_cache_usage(payload: dict[str, Any]) -> tuple[int, int] | None:
+    """Return ``(cached_tokens, prompt_tokens)`` when the backend reports prefix-cache reuse.
+
+    llama.cpp reports reused tokens as ``timings.cache_n`` next to the evaluated ``timings.prompt_n``;
+    OpenAI-style servers report ``usage.prompt_tokens_details.cached_tokens``.
+    """
+    timings = _dict_payload(payload.get("timings"))
+    cache_n = _to_int(timings.get("cache_n"))
+    prompt_n = _to_int(timings.get("prompt_n"))
+    if cache_n is not None and prompt_n is not None:
+        return cache_n, cache_n + prompt_n
+    usage = _dict_payload(payload.get("usage"))
+    cached_tokens = _to_int(_dict_payload(usage.get("prompt_tokens_details")).get("cached_tokens"))
+    prompt_tokens = _to_int(usage.get("prompt_tokens"))
+    if cached_tokens is not None and prompt_tokens:
+        return cached_tokens, prompt_tokens
+    return None
+
+
 def build_orket_session_id(
     *,
     runtime_context: Mapping[str, Any],
@@ -7,8 +7,10 @@ Hardened for parallel execution with safe locking patterns.
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
 import json
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, TypeVar
@@ -17,25 +19,69 @@ import aiosqlite
 
 from orket.core.contracts.repositories import CardRepository
 from orket.core.domain.records import IssueRecord
+from orket.instrumentation import SQLITE_QUERY_SECONDS, sqlite_operation_label
 from orket.schema import CardStatus
 
 from .card_archive_ops import CardArchiveOps
-from .card_migrations import CardMigrations
+from .card_migrations import CARD_LISTING_GENERATED_COLUMNS, CardMigrations
 from .card_misc_ops import CardMiscOps
+from .card_write_batcher import CardWriteBehindBatcher
 from .sqlite_connection import connect_sqlite_wal
 
 ResultT = TypeVar("ResultT")
 
+_UPSERT_ISSUE_SQL = """
+    INSERT OR REPLACE INTO issues
+    (
+        id, session_id, build_id, seat, summary, type, priority, sprint,
+        status, assignee, note, retry_count, max_retries, verification_json,
+        metrics_json, params_json, depends_on_json, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def encode_card_listing_cursor(sort_key: str, card_id: str) -> str:
+    raw = json.dumps([sort_key, card_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_card_listing_cursor(cursor: str) -> tuple[str, str]:
+    token = str(cursor or "").strip()
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, binascii.Error) as exc:
+        raise ValueError("invalid card listing cursor") from exc
+    if not (isinstance(payload, list) and len(payload) == 2 and all(isinstance(item, str) for item in payload)):
+        raise ValueError("invalid card listing cursor")
+    return payload[0], payload[1]
+
 
 class AsyncCardRepository(CardRepository):
     """Async implementation of CardRepository using aiosqlite."""
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        write_behind: bool = False,
+        write_behind_max_rows: int = 64,
+        write_behind_max_delay_seconds: float = 0.05,
+    ) -> None:
         self.db_path = str(db_path)
         self._write_lock = asyncio.Lock()
         self._migrations = CardMigrations()
         self._archive_ops = CardArchiveOps(self._execute)
         self._misc_ops = CardMiscOps(self._execute, self.get_by_build)
+        self._write_behind = (
+            CardWriteBehindBatcher(
+                self._execute,
+                max_rows=write_behind_max_rows,
+                max_delay_seconds=write_behind_max_delay_seconds,
+            )
+            if write_behind
+            else None
+        )
 
     async def _ensure_initialized(self, conn: aiosqlite.Connection) -> None:
         await self._migrations.ensure_initialized(conn)
@@ -63,23 +109,46 @@ class AsyncCardRepository(CardRepository):
         return await self._archive_ops.find_related_card_ids(tokens, limit=limit)
 
     async def add_transaction(self, card_id: str, role: str, action: str) -> None:
+        if self._write_behind is not None:
+            await self._write_behind.enqueue_transaction(card_id, role, action)
+            return
         await self._misc_ops.add_transaction(card_id, role, action)
 
+    async def append_transactions(self, rows: Iterable[tuple[str, str, str]]) -> int:
+        await self.flush_pending_writes()
+        return await self._misc_ops.append_transactions(rows)
+
     async def get_card_history(self, card_id: str) -> list[str]:
+        await self.flush_pending_writes()
         return await self._misc_ops.get_card_history(card_id)
 
     async def reset_build(self, build_id: str) -> None:
         await self._misc_ops.reset_build(build_id)
 
     async def add_comment(self, issue_id: str, author: str, content: str) -> None:
+        if self._write_behind is not None:
+            await self._write_behind.enqueue_comment(issue_id, author, content)
+            return
         await self._misc_ops.add_comment(issue_id, author, content)
 
     async def get_comments(self, issue_id: str) -> list[dict[str, Any]]:
+        await self.flush_pending_writes()
         return await self._misc_ops.get_comments(issue_id)
 
     async def add_credits(self, issue_id: str, amount: float) -> None:
+        await self.flush_pending_writes()
         await self._misc_ops.add_credits(issue_id, amount)
 
+    async def flush_pending_writes(self) -> int:
+        """Flush buffered write-behind transaction and comment rows; returns the number written."""
+        if self._write_behind is None:
+            return 0
+        return await self._write_behind.flush()
+
+    async def close(self) -> None:
+        if self._write_behind is not None:
+            await self._write_behind.close()
+
     async def get_independent_ready_issues(self, build_id: str) -> list[IssueRecord]:
         return await self._misc_ops.get_independent_ready_issues(build_id)
 
@@ -96,9 +165,10 @@ class AsyncCardRepository(CardRepository):
                 if row_factory:
                     conn.row_factory = aiosqlite.Row
                 await self._ensure_initialized(conn)
-                result = await operation(conn)
-                if commit:
-                    await conn.commit()
+                with SQLITE_QUERY_SECONDS.time(sqlite_operation_label(self, operation)):
+                    result = await operation(conn)
+                    if commit:
+                        await conn.commit()
                 return result
 
         if commit or write:
@@ -133,6 +203,62 @@ class AsyncCardRepository(CardRepository):
         limit: int = 50,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
+        where_sql, params = self._listing_filters(build_id=build_id, session_id=session_id, status=status)
+        query = f"SELECT * FROM issues {where_sql} ORDER BY created_sort_key DESC, id DESC LIMIT ? OFFSET ?"
+        params.extend([max(1, int(limit)), max(0, int(offset))])
+
+        async def _op(conn: aiosqlite.Connection) -> list[dict[str, Any]]:
+            cursor = await conn.execute(query, tuple(params))
+            rows = await cursor.fetchall()
+            return [self._deserialize_row(dict(row)) for row in rows]
+
+        return await self._execute(_op, row_factory=True)
+
+    async def list_cards_page(
+        self,
+        *,
+        build_id: str | None = None,
+        session_id: str | None = None,
+        status: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """Keyset-paginated listing in the same order as ``list_cards``.
+
+        ``cursor`` is the opaque ``next_cursor`` from the previous page; the page
+        is resolved by seeking the listing indexes instead of skipping rows.
+        """
+        where_sql, params = self._listing_filters(build_id=build_id, session_id=session_id, status=status)
+        if cursor:
+            sort_key, card_id = decode_card_listing_cursor(cursor)
+            keyset_clause = "(created_sort_key < ? OR (created_sort_key = ? AND id < ?))"
+            where_sql = f"{where_sql} AND {keyset_clause}" if where_sql else f"WHERE {keyset_clause}"
+            params.extend([sort_key, sort_key, card_id])
+        page_size = max(1, int(limit))
+        query = f"SELECT * FROM issues {where_sql} ORDER BY created_sort_key DESC, id DESC LIMIT ?"
+        params.append(page_size + 1)
+
+        async def _op(conn: aiosqlite.Connection) -> dict[str, Any]:
+            result = await conn.execute(query, tuple(params))
+            rows = [dict(row) for row in await result.fetchall()]
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            next_cursor = (
+                encode_card_listing_cursor(str(rows[-1]["created_sort_key"] or ""), str(rows[-1]["id"]))
+                if has_more
+                else None
+            )
+            return {"items": [self._deserialize_row(row) for row in rows], "next_cursor": next_cursor}
+
+        return await self._execute(_op, row_factory=True)
+
+    @staticmethod
+    def _listing_filters(
+        *,
+        build_id: str | None,
+        session_id: str | None,
+        status: str | None,
+    ) -> tuple[str, list[Any]]:
         where_clauses: list[str] = []
         params: list[Any] = []
 
@@ -143,64 +269,31 @@ class AsyncCardRepository(CardRepository):
             where_clauses.append("session_id = ?")
             params.append(session_id)
         if status:
-            where_clauses.append("LOWER(status) = ?")
+            where_clauses.append("status_key = ?")
             params.append(str(status).lower())
 
         where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-        query = f"SELECT * FROM issues {where_sql} ORDER BY datetime(created_at) DESC, id DESC LIMIT ? OFFSET ?"
-        params.extend([max(1, int(limit)), max(0, int(offset))])
+        return where_sql, params
 
-        async def _op(conn: aiosqlite.Connection) -> list[dict[str, Any]]:
-            cursor = await conn.execute(query, tuple(params))
-            rows = await cursor.fetchall()
-            return [self._deserialize_row(dict(row)) for row in rows]
+    async def save(self, record: IssueRecord | dict[str, Any]) -> None:
+        row = self._issue_row(record)
 
-        return await self._execute(_op, row_factory=True)
+        async def _op(conn: aiosqlite.Connection) -> None:
+            await conn.execute(_UPSERT_ISSUE_SQL, row)
 
-    async def save(self, record: IssueRecord | dict[str, Any]) -> None:
-        if isinstance(record, dict):
-            record = IssueRecord.model_validate(record)
+        await self._execute(_op, commit=True)
 
-        summary = record.summary or "Unnamed Unit"
-        v_json = json.dumps(record.verification)
-        m_json = json.dumps(record.metrics)
-        p_json = json.dumps(record.params)
-        d_json = json.dumps(record.depends_on)
+    async def save_many(self, records: Iterable[IssueRecord | dict[str, Any]]) -> int:
+        """Upsert many cards in a single write transaction."""
+        rows = [self._issue_row(record) for record in records]
+        if not rows:
+            return 0
 
         async def _op(conn: aiosqlite.Connection) -> None:
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO issues
-                (
-                    id, session_id, build_id, seat, summary, type, priority, sprint,
-                    status, assignee, note, retry_count, max_retries, verification_json,
-                    metrics_json, params_json, depends_on_json, created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.id,
-                    record.session_id,
-                    record.build_id,
-                    record.seat,
-                    summary,
-                    record.type.value if hasattr(record.type, "value") else str(record.type),
-                    record.priority,
-                    record.sprint,
-                    record.status.value if hasattr(record.status, "value") else str(record.status),
-                    record.assignee,
-                    record.note,
-                    record.retry_count,
-                    record.max_retries,
-                    v_json,
-                    m_json,
-                    p_json,
-                    d_json,
-                    record.created_at or datetime.now(UTC).isoformat(),
-                ),
-            )
+            await conn.executemany(_UPSERT_ISSUE_SQL, rows)
 
         await self._execute(_op, commit=True)
+        return len(rows)
 
     async def update_status(
         self,
@@ -210,34 +303,99 @@ class AsyncCardRepository(CardRepository):
         reason: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
+        await self.update_status_many([card_id], status, assignee=assignee, reason=reason, metadata=metadata)
+
+    async def update_status_many(
+        self,
+        card_ids: Iterable[str],
+        status: CardStatus,
+        assignee: str | None = None,
+        reason: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> int:
+        """Move many cards to one status in a single write transaction, logging one transaction row per card."""
+        ids = list(dict.fromkeys(str(card_id) for card_id in card_ids))
+        if not ids:
+            return 0
+        await self.flush_pending_writes()
+
         async def _op(conn: aiosqlite.Connection) -> None:
-            prev_cursor = await conn.execute("SELECT status FROM issues WHERE id = ?", (card_id,))
-            prev_row = await prev_cursor.fetchone()
-            prev_status = prev_row["status"] if prev_row else None
+            prev_statuses: dict[str, str] = {}
+            for chunk_start in range(0, len(ids), 500):
+                chunk = ids[chunk_start : chunk_start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = await conn.execute(f"SELECT id, status FROM issues WHERE id IN ({placeholders})", tuple(chunk))
+                prev_statuses.update({str(row["id"]): row["status"] for row in await cursor.fetchall()})
 
             if assignee:
-                await conn.execute(
-                    "UPDATE issues SET status = ?, assignee = ? WHERE id = ?", (status.value, assignee, card_id)
+                await conn.executemany(
+                    "UPDATE issues SET status = ?, assignee = ? WHERE id = ?",
+                    [(status.value, assignee, card_id) for card_id in ids],
                 )
             else:
-                await conn.execute("UPDATE issues SET status = ? WHERE id = ?", (status.value, card_id))
-
-            action = f"Set Status to '{status.value}'"
-            if prev_status is not None:
-                action += f" (from '{prev_status}')"
-            if reason:
-                action += f" reason='{reason}'"
-            if metadata:
-                action += f" meta={json.dumps(metadata, ensure_ascii=False, sort_keys=True)}"
-
-            await conn.execute(
+                await conn.executemany(
+                    "UPDATE issues SET status = ? WHERE id = ?",
+                    [(status.value, card_id) for card_id in ids],
+                )
+            await conn.executemany(
                 "INSERT INTO card_transactions (card_id, role, action) VALUES (?, ?, ?)",
-                (card_id, assignee or "system", action),
+                [
+                    (
+                        card_id,
+                        assignee or "system",
+                        self._status_action(status, prev_statuses.get(card_id), reason, metadata),
+                    )
+                    for card_id in ids
+                ],
             )
 
         await self._execute(_op, row_factory=True, commit=True)
+        return len(ids)
+
+    @staticmethod
+    def _status_action(
+        status: CardStatus,
+        prev_status: str | None,
+        reason: str | None,
+        metadata: dict[str, Any] | None,
+    ) -> str:
+        action = f"Set Status to '{status.value}'"
+        if prev_status is not None:
+            action += f" (from '{prev_status}')"
+        if reason:
+            action += f" reason='{reason}'"
+        if metadata:
+            action += f" meta={json.dumps(metadata, ensure_ascii=False, sort_keys=True)}"
+        return action
+
+    @staticmethod
+    def _issue_row(record: IssueRecord | dict[str, Any]) -> tuple[Any, ...]:
+        if isinstance(record, dict):
+            record = IssueRecord.model_validate(record)
+        return (
+            record.id,
+            record.session_id,
+            record.build_id,
+            record.seat,
+            record.summary or "Unnamed Unit",
+            record.type.value if hasattr(record.type, "value") else str(record.type),
+            record.priority,
+            record.sprint,
+            record.status.value if hasattr(record.status, "value") else str(record.status),
+            record.assignee,
+            record.note,
+            record.retry_count,
+            record.max_retries,
+            json.dumps(record.verification),
+            json.dumps(record.metrics),
+            json.dumps(record.params),
+            json.dumps(record.depends_on),
+            record.created_at or datetime.now(UTC).isoformat(),
+        )
 
     def _deserialize_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        for column in CARD_LISTING_GENERATED_COLUMNS:
+            row.pop(column, None)
         for field in ["verification_json", "metrics_json", "params_json", "depends_on_json"]:
             target = field.replace("_json", "")
             if row.get(field):
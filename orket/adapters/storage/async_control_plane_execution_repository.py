@@ -9,6 +9,7 @@ import aiosqlite
 from orket.adapters.storage.sqlite_connection import connect_sqlite_wal
 from orket.core.contracts import AttemptRecord, RunRecord, StepRecord
 from orket.core.contracts.repositories import ControlPlaneExecutionRepository
+from orket.instrumentation import SQLITE_QUERY_SECONDS, sqlite_operation_label
 
 ResultT = TypeVar("ResultT")
 
@@ -79,9 +80,10 @@ class AsyncControlPlaneExecutionRepository(ControlPlaneExecutionRepository):
             if not self._initialized:
                 await self._ensure_initialized(conn)
                 self._initialized = True
-            result = await operation(conn)
-            if commit:
-                await conn.commit()
+            with SQLITE_QUERY_SECONDS.time(sqlite_operation_label(self, operation)):
+                result = await operation(conn)
+                if commit:
+                    await conn.commit()
             return result
 
     async def save_run_record(
@@ -24,6 +24,7 @@ from orket.core.contracts.control_plane_models import (
     ResourceRecord,
 )
 from orket.core.contracts.repositories import ControlPlaneRecordRepository
+from orket.instrumentation import SQLITE_QUERY_SECONDS, sqlite_operation_label
 
 ResultT = TypeVar("ResultT")
 
@@ -33,11 +34,16 @@ class ControlPlaneRecordConflictError(ValueError):
 
 
 class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
-    """Durable SQLite repository for append-only ControlPlane records."""
+    """Durable SQLite repository for append-only ControlPlane records.
+
+    Writes are serialized through one writer lock; reads open their own WAL connections and
+    run concurrently with each other and with the writer.
+    """
 
     def __init__(self, db_path: str | Path) -> None:
         self.db_path = str(db_path)
         self._lock = asyncio.Lock()
+        self._init_lock = asyncio.Lock()
         self._initialized = False
 
     async def _ensure_initialized(self, conn: aiosqlite.Connection) -> None:
@@ -66,6 +72,8 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
                 status TEXT NOT NULL,
                 creation_timestamp TEXT NOT NULL,
                 payload_json TEXT NOT NULL,
+                holder_ref TEXT,
+                reservation_kind TEXT,
                 PRIMARY KEY (reservation_id, status)
             )
             """
@@ -76,6 +84,13 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
             ON reservation_records (creation_timestamp)
             """
         )
+        await _ensure_payload_columns(conn, "reservation_records", ("holder_ref", "reservation_kind"))
+        await conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_reservation_records_holder
+            ON reservation_records (holder_ref, creation_timestamp, reservation_id)
+            """
+        )
         await conn.execute(
             """
             CREATE TABLE IF NOT EXISTS resource_records (
@@ -160,10 +175,18 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
                 publication_timestamp TEXT NOT NULL,
                 resource_id TEXT NOT NULL,
                 payload_json TEXT NOT NULL,
+                holder_ref TEXT,
                 PRIMARY KEY (lease_id, lease_epoch, status, publication_timestamp)
             )
             """
         )
+        await _ensure_payload_columns(conn, "lease_records", ("holder_ref",))
+        await conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_lease_records_holder
+            ON lease_records (holder_ref, publication_timestamp, lease_epoch)
+            """
+        )
         await conn.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_lease_records_latest
@@ -231,17 +254,32 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
         row_factory: bool = False,
         commit: bool = False,
     ) -> ResultT:
+        await self._ensure_ready()
+        if not commit:
+            async with connect_sqlite_wal(self.db_path) as conn:
+                if row_factory:
+                    conn.row_factory = aiosqlite.Row
+                with SQLITE_QUERY_SECONDS.time(sqlite_operation_label(self, operation)):
+                    return await operation(conn)
         async with self._lock, connect_sqlite_wal(self.db_path) as conn:
             if row_factory:
                 conn.row_factory = aiosqlite.Row
-            if not self._initialized:
-                await self._ensure_initialized(conn)
-                self._initialized = True
-            result = await operation(conn)
-            if commit:
+            with SQLITE_QUERY_SECONDS.time(sqlite_operation_label(self, operation)):
+                result = await operation(conn)
                 await conn.commit()
             return result
 
+    async def _ensure_ready(self) -> None:
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            async with self._lock, connect_sqlite_wal(self.db_path) as conn:
+                await self._ensure_initialized(conn)
+                await conn.commit()
+            self._initialized = True
+
     async def _insert_or_return_existing(
         self,
         *,
@@ -390,14 +428,16 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
             await conn.execute(
                 """
                 INSERT INTO reservation_records (
-                    reservation_id, status, creation_timestamp, payload_json
-                ) VALUES (?, ?, ?, ?)
+                    reservation_id, status, creation_timestamp, payload_json, holder_ref, reservation_kind
+                ) VALUES (?, ?, ?, ?, ?, ?)
                 """,
                 (
                     record.reservation_id,
                     record.status.value,
                     record.creation_timestamp,
                     payload_json,
+                    record.holder_ref,
+                    record.reservation_kind.value,
                 ),
             )
             return record
@@ -445,18 +485,34 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
                 """
                 SELECT payload_json
                 FROM reservation_records
+                WHERE holder_ref = ?
                 ORDER BY creation_timestamp ASC, reservation_id ASC, rowid ASC
-                """
+                """,
+                (holder_ref,),
             )
             rows = await cursor.fetchall()
-            records = [ReservationRecord.model_validate_json(str(row["payload_json"])) for row in rows]
-            return [record for record in records if record.holder_ref == holder_ref]
+            return [ReservationRecord.model_validate_json(str(row["payload_json"])) for row in rows]
 
         return await self._execute(_op, row_factory=True)
 
     async def get_latest_reservation_record_for_holder_ref(self, *, holder_ref: str) -> ReservationRecord | None:
-        records = await self.list_reservation_records_for_holder_ref(holder_ref=holder_ref)
-        return records[-1] if records else None
+        async def _op(conn: aiosqlite.Connection) -> ReservationRecord | None:
+            cursor = await conn.execute(
+                """
+                SELECT payload_json
+                FROM reservation_records
+                WHERE holder_ref = ?
+                ORDER BY creation_timestamp DESC, reservation_id DESC, rowid DESC
+                LIMIT 1
+                """,
+                (holder_ref,),
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                return None
+            return ReservationRecord.model_validate_json(str(row["payload_json"]))
+
+        return await self._execute(_op, row_factory=True)
 
     async def save_resource_record(
         self,
@@ -782,8 +838,8 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
             await conn.execute(
                 """
                 INSERT INTO lease_records (
-                    lease_id, lease_epoch, status, publication_timestamp, resource_id, payload_json
-                ) VALUES (?, ?, ?, ?, ?, ?)
+                    lease_id, lease_epoch, status, publication_timestamp, resource_id, payload_json, holder_ref
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     record.lease_id,
@@ -792,6 +848,7 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
                     record.publication_timestamp,
                     record.resource_id,
                     payload_json,
+                    record.holder_ref,
                 ),
             )
             return record
@@ -833,6 +890,25 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
 
         return await self._execute(_op, row_factory=True)
 
+    async def get_latest_lease_record_for_holder_ref(self, *, holder_ref: str) -> LeaseRecord | None:
+        async def _op(conn: aiosqlite.Connection) -> LeaseRecord | None:
+            cursor = await conn.execute(
+                """
+                SELECT payload_json
+                FROM lease_records
+                WHERE holder_ref = ?
+                ORDER BY publication_timestamp DESC, lease_epoch DESC, rowid DESC
+                LIMIT 1
+                """,
+                (holder_ref,),
+            )
+            row = await cursor.fetchone()
+            if row is None:
+                return None
+            return LeaseRecord.model_validate_json(str(row["payload_json"]))
+
+        return await self._execute(_op, row_factory=True)
+
     async def save_reconciliation_record(
         self,
         *,
@@ -1021,6 +1097,18 @@ class AsyncControlPlaneRecordRepository(ControlPlaneRecordRepository):
         return await self._execute(_op, row_factory=True)
 
 
+async def _ensure_payload_columns(conn: aiosqlite.Connection, table: str, columns: tuple[str, ...]) -> None:
+    """Add payload-derived lookup columns to tables created before they existed and backfill them."""
+    cursor = await conn.execute(f"PRAGMA table_info({table})")
+    existing = {str(row[1]) for row in await cursor.fetchall()}
+    missing = [column for column in columns if column not in existing]
+    for column in missing:
+        await conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+    if missing:
+        assignments = ", ".join(f"{column} = json_extract(payload_json, '$.{column}')" for column in missing)
+        await conn.execute(f"UPDATE {table} SET {assignments}")
+
+
 __all__ = [
     "AsyncControlPlaneRecordRepository",
     "ControlPlaneRecordConflictError",
@@ -8,6 +8,8 @@ from typing import Any, TypeVar
 
 import aiosqlite
 
+from orket.instrumentation import SQLITE_QUERY_SECONDS, sqlite_operation_label
+
 from .sqlite_connection import connect_sqlite_wal
 
 ResultT = TypeVar("ResultT")
@@ -47,9 +49,10 @@ class AsyncFlowRepository:
                 if row_factory:
                     conn.row_factory = aiosqlite.Row
                 await self._ensure_initialized(conn)
-                result = await operation(conn)
-                if commit:
-                    await conn.commit()
+                with SQLITE_QUERY_SECONDS.time(sqlite_operation_label(self, operation)):
+                    result = await operation(conn)
+                    if commit:
+                        await conn.commit()
                 return result
 
         if commit:
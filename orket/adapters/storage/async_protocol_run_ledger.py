@@ -3,12 +3,15 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from orket.runtime.registry.protocol_hashing import hash_canonical_json
+from orket.instrumentation import LEDGER_APPEND_SECONDS, LEDGER_FSYNC_SECONDS
+from orket.runtime.registry.protocol_hashing import canonical_json, hash_canonical_json
 from orket.runtime.registry.tool_invocation_contracts import (
     PROTOCOL_RECEIPT_SCHEMA_VERSION,
     compute_tool_call_hash,
@@ -23,7 +26,7 @@ from orket.runtime.protocol_error_codes import (
 )
 from orket.runtime.result_error_invariants import validate_result_error_invariant
 from orket.runtime.run_graph_reconstruction import (
-    reconstruct_run_graph,
+    IncrementalRunGraphBuilder,
     write_run_graph_artifact,
 )
 
@@ -31,6 +34,8 @@ from .protocol_append_only_ledger import AppendOnlyRunLedger
 
 _TOOL_INVOCATION_KINDS = {"tool_call", "operation_result", "tool_result"}
 _TOOL_RESULT_KINDS = {"operation_result", "tool_result"}
+# Sessions whose run-graph builders stay in memory; older ones are rebuilt from the ledger on demand.
+MAX_CACHED_GRAPH_BUILDERS = 64
 
 
 def _default_event_timestamp() -> str:
@@ -48,6 +53,12 @@ def _parse_event_timestamp(value: Any) -> datetime | None:
         return None
 
 
+def _ledger_record(event: dict[str, Any]) -> dict[str, Any]:
+    # Round-trip through the ledger encoding so the builder sees exactly what replay returns.
+    record: dict[str, Any] = json.loads(canonical_json(event))
+    return record
+
+
 def _coerce_int(value: Any) -> int | None:
     try:
         return int(value)
@@ -69,6 +80,7 @@ class AsyncProtocolRunLedgerRepository:
         self._lock = asyncio.Lock()
         self.max_tool_invocations_per_run = max(int(max_tool_invocations_per_run), 1)
         self._timestamp_factory = timestamp_factory or _default_event_timestamp
+        self._graph_builders: OrderedDict[str, IncrementalRunGraphBuilder] = OrderedDict()
 
     def _events_path(self, session_id: str) -> Path:
         return self.root / "runs" / str(session_id).strip() / "events.log"
@@ -161,16 +173,19 @@ class AsyncProtocolRunLedgerRepository:
             next_seq = 1
             if existing_events:
                 next_seq = max(self._event_sequence(row) for row in existing_events) + 1
-            pending_events = [dict(row) for row in existing_events]
             pending_finalized_event = dict(event)
             pending_finalized_event["event_seq"] = int(next_seq)
             pending_finalized_event["sequence_number"] = int(next_seq)
-            pending_events.append(pending_finalized_event)
-            run_graph_payload = await asyncio.to_thread(
-                reconstruct_run_graph,
-                pending_events,
-                session_id=str(session_id),
-            )
+            # The builder is closed by this finalize; a later append for the session starts a fresh one.
+            graph_builder = self._graph_builders.pop(str(session_id), None)
+            if graph_builder is None or not self._graph_builder_current(graph_builder, existing_events):
+                graph_builder = await asyncio.to_thread(
+                    IncrementalRunGraphBuilder.from_events,
+                    existing_events,
+                    session_id=str(session_id),
+                )
+            graph_builder.add_event(_ledger_record(pending_finalized_event))
+            run_graph_payload = await asyncio.to_thread(graph_builder.build)
             await asyncio.to_thread(
                 write_run_graph_artifact,
                 root=self.root,
@@ -181,6 +196,7 @@ class AsyncProtocolRunLedgerRepository:
                 session_id=session_id,
                 event=event,
                 existing_events=existing_events,
+                track_graph=False,
             )
 
     async def append_event(
@@ -549,6 +565,7 @@ class AsyncProtocolRunLedgerRepository:
         session_id: str,
         event: dict[str, Any],
         existing_events: list[dict[str, Any]] | None = None,
+        track_graph: bool = True,
     ) -> dict[str, Any]:
         existing = existing_events
         if existing is None:
@@ -563,9 +580,31 @@ class AsyncProtocolRunLedgerRepository:
         if int(payload.get("sequence_number") or 0) <= 0:
             payload["sequence_number"] = int(next_seq)
         appended = await asyncio.to_thread(self._ledger(session_id).append_event, payload)
+        if track_graph:
+            self._track_graph_event_locked(session_id=str(session_id), existing_events=existing, appended=appended)
         appended["sequence_number"] = int(appended.get("event_seq") or appended.get("sequence_number") or next_seq)
         return appended
 
+    def _track_graph_event_locked(
+        self,
+        *,
+        session_id: str,
+        existing_events: list[dict[str, Any]],
+        appended: dict[str, Any],
+    ) -> None:
+        """Feed an appended event to the session's run-graph builder, seeding it from the ledger once."""
+        builder = self._graph_builders.pop(session_id, None)
+        if builder is None or not self._graph_builder_current(builder, existing_events):
+            builder = IncrementalRunGraphBuilder.from_events(existing_events, session_id=session_id)
+        builder.add_event(_ledger_record(appended))
+        self._graph_builders[session_id] = builder
+        while len(self._graph_builders) > MAX_CACHED_GRAPH_BUILDERS:
+            self._graph_builders.popitem(last=False)
+
+    def _graph_builder_current(self, builder: IncrementalRunGraphBuilder, events: list[dict[str, Any]]) -> bool:
+        last_seq = self._event_sequence(events[-1]) if events else 0
+        return not builder.out_of_order and builder.event_count == len(events) and builder.last_event_seq == last_seq
+
     def _tool_invocation_count(self, events: list[dict[str, Any]]) -> int:
         return sum(1 for row in events if str(row.get("kind") or "") in _TOOL_INVOCATION_KINDS)
 
@@ -749,13 +788,16 @@ class AsyncProtocolRunLedgerRepository:
             if int(normalized["receipt_seq"]) <= last_seq:
                 raise ValueError(f"{E_RECEIPT_SEQ_NON_MONOTONIC_PREFIX}:{normalized['receipt_seq']}<=last:{last_seq}")
 
+        started = time.perf_counter()
         line = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
         receipts_path.parent.mkdir(parents=True, exist_ok=True)
         with receipts_path.open("a", encoding="utf-8") as handle:
             handle.write(line)
             handle.write("\n")
             handle.flush()
-            os.fsync(handle.fileno())
+            with LEDGER_FSYNC_SECONDS.time("protocol_receipts"):
+                os.fsync(handle.fileno())
+        LEDGER_APPEND_SECONDS.observe(time.perf_counter() - started, "protocol_receipts")
         return normalized
 
     def _load_receipts_sync(self, session_id: str) -> list[dict[str, Any]]:
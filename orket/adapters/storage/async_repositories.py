@@ -15,6 +15,7 @@ import aiosqlite
 
 from orket.core.contracts.repositories import SessionRepository, SnapshotRepository
 from orket.runtime.result_error_invariants import validate_result_error_invariant
+from .card_migrations import CARD_LISTING_GENERATED_COLUMNS
 from .sqlite_connection import connect_sqlite_wal, ensure_wal_mode
 
 
@@ -106,6 +107,8 @@ class AsyncSessionRepository(SessionRepository):
             issues: list[dict[str, Any]] = []
             for row in rows:
                 data = dict(row)
+                for column in CARD_LISTING_GENERATED_COLUMNS:
+                    data.pop(column, None)
                 for source_field, target_field, default in (
                     ("verification_json", "verification", {}),
                     ("metrics_json", "metrics", {}),
@@ -22,6 +22,7 @@ from orket.core.domain.sandbox_lifecycle_records import (
     SandboxLifecycleSnapshotRecord,
     SandboxOperationDedupeEntry,
 )
+from orket.instrumentation import SQLITE_QUERY_SECONDS, sqlite_operation_label
 
 ResultT = TypeVar("ResultT")
 
@@ -123,6 +124,33 @@ class AsyncSandboxLifecycleRepository:
             )
             """
         )
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sandbox_lifecycle_view_revisions (
+                sandbox_id TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL
+            )
+            """
+        )
+        # Every record write or sandbox event bumps the sandbox's view revision in the same
+        # transaction, so read models can refresh only the sandboxes that changed.
+        for trigger_name, trigger_event, table_name in (
+            ("trg_sandbox_lifecycle_records_insert_revision", "INSERT", "sandbox_lifecycle_records"),
+            ("trg_sandbox_lifecycle_records_update_revision", "UPDATE", "sandbox_lifecycle_records"),
+            ("trg_sandbox_lifecycle_events_insert_revision", "INSERT", "sandbox_lifecycle_events"),
+        ):
+            await conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger_name}
+                AFTER {trigger_event} ON {table_name}
+                WHEN NEW.sandbox_id IS NOT NULL
+                BEGIN
+                    INSERT INTO sandbox_lifecycle_view_revisions (sandbox_id, revision)
+                    VALUES (NEW.sandbox_id, 1)
+                    ON CONFLICT(sandbox_id) DO UPDATE SET revision = revision + 1;
+                END
+                """
+            )
         await conn.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_sandbox_approvals_sandbox_id
@@ -153,9 +181,10 @@ class AsyncSandboxLifecycleRepository:
             if row_factory:
                 conn.row_factory = aiosqlite.Row
             await self._ensure_initialized(conn)
-            result = await operation(conn)
-            if commit:
-                await conn.commit()
+            with SQLITE_QUERY_SECONDS.time(sqlite_operation_label(self, operation)):
+                result = await operation(conn)
+                if commit:
+                    await conn.commit()
             return result
 
     async def save_record(self, record: SandboxLifecycleRecord) -> None:
@@ -353,6 +382,22 @@ class AsyncSandboxLifecycleRepository:
 
         return await self._execute(_op, row_factory=True)
 
+    async def list_record_revisions(self) -> dict[str, int]:
+        """Return each record's view revision, which changes whenever the record or its events do."""
+
+        async def _op(conn: aiosqlite.Connection) -> dict[str, int]:
+            cursor = await conn.execute(
+                """
+                SELECT records.sandbox_id, COALESCE(revisions.revision, 0)
+                FROM sandbox_lifecycle_records AS records
+                LEFT JOIN sandbox_lifecycle_view_revisions AS revisions
+                    ON revisions.sandbox_id = records.sandbox_id
+                """
+            )
+            return {str(sandbox_id): int(revision) for sandbox_id, revision in await cursor.fetchall()}
+
+        return await self._execute(_op)
+
     async def remember_operation(
         self,
         entry: SandboxOperationDedupeEntry,
@@ -6,7 +6,7 @@ import aiosqlite
 
 from .sqlite_migrations import SQLiteMigration, SQLiteMigrationRunner
 
-CARD_SCHEMA_USER_VERSION = 1
+CARD_SCHEMA_USER_VERSION = 2
 
 CARD_BOOTSTRAP_MIGRATIONS = [
     SQLiteMigration(
@@ -57,9 +57,35 @@ CARD_BOOTSTRAP_MIGRATIONS = [
             )
             """,
         ),
-    )
+    ),
+    SQLiteMigration(
+        version=2,
+        name="card_listing_sort_keys",
+        statements=(
+            # Virtual generated columns normalize the listing sort and status filter so the
+            # composite indexes below serve ORDER BY/WHERE without wrapping columns in functions.
+            """
+            ALTER TABLE issues ADD COLUMN created_sort_key TEXT
+            GENERATED ALWAYS AS (COALESCE(datetime(created_at), '')) VIRTUAL
+            """,
+            """
+            ALTER TABLE issues ADD COLUMN status_key TEXT
+            GENERATED ALWAYS AS (LOWER(status)) VIRTUAL
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_issues_listing ON issues(created_sort_key, id)",
+            "CREATE INDEX IF NOT EXISTS idx_issues_build_listing ON issues(build_id, created_sort_key, id)",
+            "CREATE INDEX IF NOT EXISTS idx_issues_session_listing ON issues(session_id, created_sort_key, id)",
+            "CREATE INDEX IF NOT EXISTS idx_issues_status_listing ON issues(status_key, created_sort_key, id)",
+            """
+            CREATE INDEX IF NOT EXISTS idx_issues_build_status_listing
+            ON issues(build_id, status_key, created_sort_key, id)
+            """,
+        ),
+    ),
 ]
 
+CARD_LISTING_GENERATED_COLUMNS = ("created_sort_key", "status_key")
+
 
 class CardMigrations:
     """Database schema bootstrap and additive migrations for issue storage."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any, cast
 
@@ -25,6 +26,17 @@ class CardMiscOps:
 
         await self._execute(_op, commit=True)
 
+    async def append_transactions(self, rows: Iterable[tuple[str, str, str]]) -> int:
+        batch = [(str(card_id), str(role), str(action)) for card_id, role, action in rows]
+        if not batch:
+            return 0
+
+        async def _op(conn: aiosqlite.Connection) -> None:
+            await conn.executemany("INSERT INTO card_transactions (card_id, role, action) VALUES (?, ?, ?)", batch)
+
+        await self._execute(_op, commit=True)
+        return len(batch)
+
     async def get_card_history(self, card_id: str) -> list[str]:
         async def _op(conn: aiosqlite.Connection) -> list[str]:
             cursor = await conn.execute(
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from typing import Any
+
+import aiosqlite
+
+from orket.logging import log_event
+
+TRANSACTION_INSERT_SQL = "INSERT INTO card_transactions (card_id, role, action, timestamp) VALUES (?, ?, ?, ?)"
+COMMENT_INSERT_SQL = "INSERT INTO comments (issue_id, author, content, created_at) VALUES (?, ?, ?, ?)"
+
+
+def _sqlite_timestamp() -> str:
+    # Matches SQLite CURRENT_TIMESTAMP so batched and direct transaction rows sort together.
+    return datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class CardWriteBehindBatcher:
+    """Buffers card transaction and comment rows and flushes them in one write transaction.
+
+    Rows are stamped when they are enqueued, so history ordering does not depend on
+    when the flush happens. A flush runs once ``max_rows`` rows are pending or
+    ``max_delay_seconds`` after the first pending row, whichever comes first.
+    """
+
+    def __init__(self, execute: Any, *, max_rows: int = 64, max_delay_seconds: float = 0.05) -> None:
+        self._execute = execute
+        self.max_rows = max(1, int(max_rows))
+        self.max_delay_seconds = max(0.0, float(max_delay_seconds))
+        self._transactions: list[tuple[str, str, str, str]] = []
+        self._comments: list[tuple[str, str, str, str]] = []
+        self._timer: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._transactions) + len(self._comments)
+
+    async def enqueue_transaction(self, card_id: str, role: str, action: str) -> None:
+        self._transactions.append((card_id, role, action, _sqlite_timestamp()))
+        await self._after_enqueue()
+
+    async def enqueue_comment(self, issue_id: str, author: str, content: str) -> None:
+        self._comments.append((issue_id, author, content, datetime.now(UTC).isoformat()))
+        await self._after_enqueue()
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            transactions, comments = self._transactions, self._comments
+            if not transactions and not comments:
+                return 0
+            self._transactions, self._comments = [], []
+
+            async def _op(conn: aiosqlite.Connection) -> None:
+                if transactions:
+                    await conn.executemany(TRANSACTION_INSERT_SQL, transactions)
+                if comments:
+                    await conn.executemany(COMMENT_INSERT_SQL, comments)
+
+            try:
+                await self._execute(_op, commit=True)
+            except (aiosqlite.Error, OSError):
+                self._transactions[:0] = transactions
+                self._comments[:0] = comments
+                raise
+            return len(transactions) + len(comments)
+
+    async def close(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await timer
+        await self.flush()
+
+    async def _after_enqueue(self) -> None:
+        if self.pending_count >= self.max_rows:
+            await self.flush()
+            return
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.max_delay_seconds)
+        self._timer = None
+        try:
+            await self.flush()
+        except (aiosqlite.Error, OSError) as exc:
+            log_event(
+                "card_write_behind_flush_failed",
+                {"pending_rows": self.pending_count, "error": str(exc)},
+            )
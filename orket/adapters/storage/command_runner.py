@@ -35,3 +35,15 @@ class CommandRunner:
             stdout=result.stdout,
             stderr=result.stderr,
         )
+
+    def open_stream(self, *cmd: str) -> subprocess.Popen[str]:
+        """Start a long-running command whose merged stdout and stderr is read line by line."""
+        return subprocess.Popen(
+            list(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
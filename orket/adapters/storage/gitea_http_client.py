@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import json
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, cast
 
 import httpx
@@ -18,13 +21,48 @@ from .gitea_state_errors import (
 
 logger = logging.getLogger("orket.gitea_state_adapter")
 
+HTTP_NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    etag: str
+    payload: Any
+
 
 class GiteaHTTPClient:
-    """HTTP request and retry handling for Gitea state operations."""
+    """HTTP request and retry handling for Gitea state operations.
+
+    Plain GET calls through ``request_json`` are revalidated with ``If-None-Match``
+    against a bounded local response cache, so an unchanged resource costs one
+    empty 304 round trip on a pooled keep-alive connection. Cached payloads are
+    shared between callers and must be treated as read-only.
+    """
 
     def __init__(self, adapter: Any) -> None:
         self.adapter = adapter
-        self._client = httpx.AsyncClient(timeout=self.adapter.timeout_seconds)
+        self._client = httpx.AsyncClient(
+            timeout=self.adapter.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.adapter.max_connections,
+                max_keepalive_connections=self.adapter.max_keepalive_connections,
+                keepalive_expiry=self.adapter.keepalive_expiry_seconds,
+            ),
+            http2=self._resolve_http2(bool(self.adapter.http2)),
+        )
+        self._response_cache: OrderedDict[tuple[str, str, tuple[tuple[str, str], ...]], _CachedResponse] = (
+            OrderedDict()
+        )
+        self.cache_stats = {"hits": 0, "misses": 0, "stored": 0}
+
+    @staticmethod
+    def _resolve_http2(requested: bool) -> bool:
+        if not requested:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("gitea_state_adapter http2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            return False
+        return True
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -40,8 +78,11 @@ class GiteaHTTPClient:
     ) -> httpx.Response:
         url = f"{self.adapter._repo_api}{path}"
         headers = self.adapter.build_headers(extra_headers)
+        conditional = "If-None-Match" in headers
         try:
             response = await self._client.request(method, url, headers=headers, params=params, json=payload)
+            if conditional and response.status_code == HTTP_NOT_MODIFIED:
+                return response
             response.raise_for_status()
             return response
         except httpx.TimeoutException as exc:
@@ -81,16 +122,50 @@ class GiteaHTTPClient:
         payload: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
     ) -> Any:
+        cache_key = self._cache_key(method, path, params) if payload is None and extra_headers is None else None
+        cached = self._response_cache.get(cache_key) if cache_key is not None else None
         response = await self.adapter._request_response_with_retry(
             method,
             path,
             params=params,
             payload=payload,
-            extra_headers=extra_headers,
+            extra_headers={"If-None-Match": cached.etag} if cached is not None else extra_headers,
         )
-        if not response.text.strip():
+        if cached is not None and cache_key is not None and response.status_code == HTTP_NOT_MODIFIED:
+            self._response_cache.move_to_end(cache_key)
+            self.cache_stats["hits"] += 1
+            return cached.payload
+        parsed = response.json() if response.text.strip() else None
+        if cache_key is not None:
+            self.cache_stats["misses"] += 1
+            self._store_cached_response(cache_key, etag=str(response.headers.get("ETag") or ""), payload=parsed)
+        return parsed
+
+    def _cache_key(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+    ) -> tuple[str, str, tuple[tuple[str, str], ...]] | None:
+        if method.upper() != "GET" or self.adapter.response_cache_size <= 0:
             return None
-        return response.json()
+        return ("GET", path, tuple(sorted((str(key), str(value)) for key, value in (params or {}).items())))
+
+    def _store_cached_response(
+        self,
+        cache_key: tuple[str, str, tuple[tuple[str, str], ...]],
+        *,
+        etag: str,
+        payload: Any,
+    ) -> None:
+        if not etag:
+            self._response_cache.pop(cache_key, None)
+            return
+        self._response_cache[cache_key] = _CachedResponse(etag=etag, payload=payload)
+        self._response_cache.move_to_end(cache_key)
+        self.cache_stats["stored"] += 1
+        while len(self._response_cache) > self.adapter.response_cache_size:
+            self._response_cache.popitem(last=False)
 
     async def request_response_with_retry(
         self,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
@@ -54,6 +56,13 @@ class GiteaStateAdapter(StateBackendContract):
         max_retries: int = 2,
         backoff_base_seconds: float = 0.1,
         backoff_max_seconds: float = 1.0,
+        page_size: int = 50,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: bool = False,
+        response_cache_size: int = 256,
+        snapshot_cache_size: int = 1024,
     ):
         self.base_url = base_url.rstrip("/")
         self.owner = owner
@@ -63,7 +72,16 @@ class GiteaStateAdapter(StateBackendContract):
         self.max_retries = max(0, int(max_retries))
         self.backoff_base_seconds = max(0.0, float(backoff_base_seconds))
         self.backoff_max_seconds = max(self.backoff_base_seconds, float(backoff_max_seconds))
+        self.page_size = max(1, int(page_size))
+        self.max_connections = max(1, int(max_connections))
+        self.max_keepalive_connections = max(0, min(int(max_keepalive_connections), self.max_connections))
+        self.keepalive_expiry_seconds = max(0.0, float(keepalive_expiry_seconds))
+        self.http2 = bool(http2)
+        self.response_cache_size = max(0, int(response_cache_size))
+        self.snapshot_cache_size = max(0, int(snapshot_cache_size))
         self._token = SecretToken(token)
+        self._snapshot_cache: OrderedDict[Any, tuple[str, dict[str, Any] | None]] = OrderedDict()
+        self.snapshot_decode_count = 0
 
         self.http = GiteaHTTPClient(self)
         self.leases = GiteaLeaseManager(self)
@@ -198,32 +216,40 @@ class GiteaStateAdapter(StateBackendContract):
         GiteaHTTPClient.log_failure(failure_class, **fields)
 
     async def fetch_ready_cards(self, *, limit: int = 1) -> list[dict[str, Any]]:
-        payload = await self._request_json(
-            "GET",
-            "/issues",
-            params={"state": "open", "labels": self.ready_label, "limit": max(1, int(limit))},
-        )
-        if not isinstance(payload, list):
-            return []
-        cards: list[dict[str, Any]] = []
-        for issue in payload:
-            if not isinstance(issue, dict):
-                continue
-            try:
-                snapshot = decode_snapshot(str(issue.get("body") or ""))
-            except (ValueError, ValidationError):
-                continue
-            cards.append(
-                {
-                    "card_id": snapshot.card_id,
-                    "issue_number": issue.get("number"),
-                    "state": snapshot.state,
-                    "version": snapshot.version,
-                    "lease": snapshot.lease.model_dump(),
-                    "metadata": snapshot.metadata,
-                }
+        bounded = max(1, int(limit))
+        return [card async for card in self.iter_ready_cards(page_size=bounded, max_cards=bounded)]
+
+    async def iter_ready_cards(
+        self,
+        *,
+        page_size: int | None = None,
+        max_cards: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream ready cards page by page until the queue or ``max_cards`` is exhausted."""
+        size = max(1, min(int(page_size or self.page_size), self.page_size))
+        page = 1
+        yielded = 0
+        while True:
+            payload = await self._request_json(
+                "GET",
+                "/issues",
+                params={"state": "open", "labels": self.ready_label, "limit": size, "page": page},
             )
-        return cards
+            if not isinstance(payload, list) or not payload:
+                return
+            for issue in payload:
+                if not isinstance(issue, dict):
+                    continue
+                card = self._card_from_issue(issue)
+                if card is None:
+                    continue
+                yield card
+                yielded += 1
+                if max_cards is not None and yielded >= max_cards:
+                    return
+            if len(payload) < size:
+                return
+            page += 1
 
     async def fetch_card_snapshot(self, card_id: str) -> dict[str, Any] | None:
         try:
@@ -233,13 +259,35 @@ class GiteaStateAdapter(StateBackendContract):
         payload = await self._request_json("GET", f"/issues/{issue_number}")
         if not isinstance(payload, dict):
             return None
+        return self._card_from_issue(payload)
+
+    def _card_from_issue(self, issue: dict[str, Any]) -> dict[str, Any] | None:
+        body = str(issue.get("body") or "")
+        issue_number = issue.get("number")
+        cached = self._snapshot_cache.get(issue_number) if self.snapshot_cache_size > 0 else None
+        if cached is not None and cached[0] == body:
+            self._snapshot_cache.move_to_end(issue_number)
+            card = cached[1]
+        else:
+            card = self._decode_issue_card(issue_number=issue_number, body=body)
+            if self.snapshot_cache_size > 0:
+                self._snapshot_cache[issue_number] = (body, card)
+                self._snapshot_cache.move_to_end(issue_number)
+                while len(self._snapshot_cache) > self.snapshot_cache_size:
+                    self._snapshot_cache.popitem(last=False)
+        if card is None:
+            return None
+        return {**card, "lease": dict(card["lease"]), "metadata": dict(card["metadata"])}
+
+    def _decode_issue_card(self, *, issue_number: Any, body: str) -> dict[str, Any] | None:
+        self.snapshot_decode_count += 1
         try:
-            snapshot = decode_snapshot(str(payload.get("body") or ""))
+            snapshot = decode_snapshot(body)
         except (ValueError, ValidationError):
             return None
         return {
             "card_id": snapshot.card_id,
-            "issue_number": payload.get("number"),
+            "issue_number": issue_number,
             "state": snapshot.state,
             "version": snapshot.version,
             "lease": snapshot.lease.model_dump(),
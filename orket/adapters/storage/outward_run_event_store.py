@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -9,7 +10,8 @@ import aiosqlite
 
 from orket.adapters.storage.sqlite_connection import connect_sqlite_wal
 from orket.adapters.storage.sqlite_migrations import SQLiteMigration, SQLiteMigrationRunner
-from orket.core.domain.outward_run_events import LedgerEvent
+from orket.core.domain.outward_ledger import GENESIS_CHAIN_HASH, chain_hash_for, event_hash_for
+from orket.core.domain.outward_run_events import LedgerCheckpoint, LedgerEvent
 
 _MIGRATIONS = [
     SQLiteMigration(
@@ -32,8 +34,27 @@ _MIGRATIONS = [
             "CREATE INDEX IF NOT EXISTS idx_run_events_run_order ON run_events (run_id, turn, at, event_id)",
             "CREATE INDEX IF NOT EXISTS idx_run_events_type ON run_events (event_type)",
         ),
-    )
+    ),
+    SQLiteMigration(
+        version=2,
+        name="create_outward_run_event_checkpoints",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS run_event_checkpoints (
+                run_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                event_id TEXT NOT NULL,
+                chain_hash TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                PRIMARY KEY (run_id, position)
+            )
+            """,
+        ),
+    ),
 ]
+_CANONICAL_ORDER = "turn ASC, at ASC, event_id ASC"
+_REVERSE_CANONICAL_ORDER = "turn DESC, at DESC, event_id DESC"
 
 
 class OutwardRunEventStore:
@@ -52,30 +73,62 @@ class OutwardRunEventStore:
             self._initialized = True
 
     async def append(self, event: LedgerEvent) -> LedgerEvent:
+        """Insert ``event`` with its event hash and chain hash computed against the run's chain.
+
+        Events that sort after the current chain tail (the normal case) are chained in O(1).
+        An event that sorts before the tail, or a run whose tail predates append-time hashing,
+        rechains the run and drops its checkpoints so the next export re-verifies from genesis.
+        """
         self._validate_event(event)
         await self.ensure_initialized()
+        event_hash = event_hash_for(replace(event, payload=json.loads(_payload_json(event.payload))))
         async with connect_sqlite_wal(self.db_path) as conn:
-            await conn.execute(
-                """
-                INSERT INTO run_events (
-                    event_id, event_type, run_id, turn, agent_id, at, payload_json, event_hash, chain_hash
+            conn.row_factory = aiosqlite.Row
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await conn.execute(
+                    f"""
+                    SELECT turn, at, event_id, chain_hash FROM run_events
+                    WHERE run_id = ?
+                    ORDER BY {_REVERSE_CANONICAL_ORDER}
+                    LIMIT 1
+                    """,
+                    (event.run_id,),
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    event.event_id,
-                    event.event_type,
-                    event.run_id,
-                    event.turn,
-                    event.agent_id,
-                    event.at,
-                    _payload_json(event.payload),
-                    event.event_hash,
-                    event.chain_hash,
-                ),
-            )
-            await conn.commit()
-        return event
+                tail = await cursor.fetchone()
+                appends_at_tail = tail is None or (
+                    tail["chain_hash"] is not None
+                    and _order_key(event.turn, event.at, event.event_id)
+                    > _order_key(tail["turn"], str(tail["at"]), str(tail["event_id"]))
+                )
+                previous_chain_hash = GENESIS_CHAIN_HASH if tail is None else str(tail["chain_hash"])
+                chain_hash = chain_hash_for(previous_chain_hash, event_hash) if appends_at_tail else None
+                await conn.execute(
+                    """
+                    INSERT INTO run_events (
+                        event_id, event_type, run_id, turn, agent_id, at, payload_json, event_hash, chain_hash
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        event.event_id,
+                        event.event_type,
+                        event.run_id,
+                        event.turn,
+                        event.agent_id,
+                        event.at,
+                        _payload_json(event.payload),
+                        event_hash,
+                        chain_hash,
+                    ),
+                )
+                if not appends_at_tail:
+                    chain_hash = await _rechain_run(conn, event.run_id, event_id=event.event_id)
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+        return replace(event, event_hash=event_hash, chain_hash=chain_hash)
 
     async def get(self, event_id: str) -> LedgerEvent | None:
         await self.ensure_initialized()
@@ -98,6 +151,68 @@ class OutwardRunEventStore:
             )
             await conn.commit()
 
+    async def update_hashes_many(self, rows: list[tuple[str, str, str]]) -> None:
+        """Apply ``(event_id, event_hash, chain_hash)`` repairs in one transaction."""
+        if not rows:
+            return
+        await self.ensure_initialized()
+        async with connect_sqlite_wal(self.db_path) as conn:
+            await conn.executemany(
+                "UPDATE run_events SET event_hash = ?, chain_hash = ? WHERE event_id = ?",
+                [(event_hash, chain_hash, event_id) for event_id, event_hash, chain_hash in rows],
+            )
+            await conn.commit()
+
+    async def count_for_run(self, run_id: str) -> int:
+        await self.ensure_initialized()
+        async with connect_sqlite_wal(self.db_path) as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM run_events WHERE run_id = ?", (run_id,))
+            row = await cursor.fetchone()
+        return int(row[0]) if row is not None else 0
+
+    async def save_checkpoint(self, checkpoint: LedgerCheckpoint) -> None:
+        await self.ensure_initialized()
+        async with connect_sqlite_wal(self.db_path) as conn:
+            await conn.execute(
+                """
+                INSERT OR REPLACE INTO run_event_checkpoints (
+                    run_id, position, event_id, chain_hash, created_at, signature
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    checkpoint.run_id,
+                    checkpoint.position,
+                    checkpoint.event_id,
+                    checkpoint.chain_hash,
+                    checkpoint.created_at,
+                    checkpoint.signature,
+                ),
+            )
+            await conn.commit()
+
+    async def list_checkpoints(self, run_id: str) -> list[LedgerCheckpoint]:
+        """Return the run's checkpoints, newest position first."""
+        await self.ensure_initialized()
+        async with connect_sqlite_wal(self.db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                "SELECT * FROM run_event_checkpoints WHERE run_id = ? ORDER BY position DESC",
+                (run_id,),
+            )
+            rows = await cursor.fetchall()
+        return [
+            LedgerCheckpoint(
+                run_id=str(row["run_id"]),
+                position=int(row["position"]),
+                event_id=str(row["event_id"]),
+                chain_hash=str(row["chain_hash"]),
+                created_at=str(row["created_at"]),
+                signature=str(row["signature"]),
+            )
+            for row in rows
+        ]
+
     async def list_for_run(
         self,
         run_id: str,
@@ -106,8 +221,9 @@ class OutwardRunEventStore:
         to_turn: int | None = None,
         types: tuple[str, ...] = (),
         agent_id: str | None = None,
-        limit: int = 1000,
+        limit: int | None = 1000,
     ) -> list[LedgerEvent]:
+        """List a run's events in canonical order; ``limit=None`` returns the whole run."""
         await self.ensure_initialized()
         conditions = ["run_id = ?"]
         params: list[Any] = [run_id]
@@ -125,7 +241,10 @@ class OutwardRunEventStore:
         if clean_agent_id:
             conditions.append("agent_id = ?")
             params.append(clean_agent_id)
-        params.append(max(1, min(int(limit), 5000)))
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT ?"
+            params.append(max(1, min(int(limit), 5000)))
         async with connect_sqlite_wal(self.db_path) as conn:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
@@ -133,7 +252,7 @@ class OutwardRunEventStore:
                 SELECT * FROM run_events
                 WHERE {' AND '.join(conditions)}
                 ORDER BY run_id ASC, turn ASC, at ASC, event_id ASC
-                LIMIT ?
+                {limit_clause}
                 """,
                 tuple(params),
             )
@@ -152,6 +271,34 @@ class OutwardRunEventStore:
             raise ValueError("at is required")
 
 
+def _order_key(turn: int | None, at: str, event_id: str) -> tuple[bool, int, str, str]:
+    # Mirrors SQLite's ascending order, where a NULL turn sorts before every integer.
+    return (turn is not None, int(turn or 0), at, event_id)
+
+
+async def _rechain_run(conn: aiosqlite.Connection, run_id: str, *, event_id: str) -> str:
+    cursor = await conn.execute(
+        f"SELECT * FROM run_events WHERE run_id = ? ORDER BY {_CANONICAL_ORDER}",
+        (run_id,),
+    )
+    rows = await cursor.fetchall()
+    previous_chain_hash = GENESIS_CHAIN_HASH
+    updates: list[tuple[str, str, str]] = []
+    event_chain_hash = GENESIS_CHAIN_HASH
+    for row in rows:
+        stored = _row_to_event(row)
+        event_hash = event_hash_for(stored)
+        chain_hash = chain_hash_for(previous_chain_hash, event_hash)
+        if stored.event_hash != event_hash or stored.chain_hash != chain_hash:
+            updates.append((event_hash, chain_hash, stored.event_id))
+        if stored.event_id == event_id:
+            event_chain_hash = chain_hash
+        previous_chain_hash = chain_hash
+    await conn.executemany("UPDATE run_events SET event_hash = ?, chain_hash = ? WHERE event_id = ?", updates)
+    await conn.execute("DELETE FROM run_event_checkpoints WHERE run_id = ?", (run_id,))
+    return event_chain_hash
+
+
 def _payload_json(payload: dict[str, Any]) -> str:
     return json.dumps(payload, sort_keys=True, separators=(",", ":"))
 
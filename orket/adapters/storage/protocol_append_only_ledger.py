@@ -3,11 +3,13 @@ from __future__ import annotations
 import json
 import os
 import struct
+import time
 from pathlib import Path
 from typing import Any
 
 import google_crc32c
 
+from orket.instrumentation import LEDGER_APPEND_SECONDS, LEDGER_FSYNC_SECONDS
 from orket.runtime.registry.protocol_hashing import canonical_json
 from orket.runtime.protocol_error_codes import (
     E_LEDGER_CORRUPT,
@@ -112,12 +114,15 @@ class AppendOnlyRunLedger:
         elif int(explicit_event_seq) != next_event_seq:
             raise LedgerFramingError(E_LEDGER_SEQ, f"expected={next_event_seq},actual={explicit_event_seq}")
 
+        started = time.perf_counter()
         frame = encode_lpj_c32_record(event, max_payload_bytes=self.max_payload_bytes)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with self.path.open("ab") as handle:
             handle.write(frame)
             handle.flush()
-            os.fsync(handle.fileno())
+            with LEDGER_FSYNC_SECONDS.time("protocol_events"):
+                os.fsync(handle.fileno())
+        LEDGER_APPEND_SECONDS.observe(time.perf_counter() - started, "protocol_events")
         self._next_event_seq = int(event["event_seq"]) + 1
         return event
 
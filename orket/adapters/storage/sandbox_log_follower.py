@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import atexit
+import heapq
+import re
+import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+LOG_BUFFER_LINES_PER_SERVICE = 2000
+MAX_FOLLOWED_SANDBOXES = 64
+FOLLOW_PRIME_TIMEOUT_SECONDS = 2.0
+FOLLOW_SETTLE_SECONDS = 0.2
+FOLLOW_RESTART_BACKOFF_SECONDS = 5.0
+
+# Compose prefixes each line with "<container> | "; v1 names containers "<project>_<service>_<n>",
+# v2 prints "<service>-<n>".
+_COMPOSE_LINE_PREFIX = re.compile(r"^(?P<container>[A-Za-z0-9][\w.-]*?)\s+\|\s?(?P<text>.*)$")
+_CONTAINER_INDEX_SUFFIX = re.compile(r"[-_]\d+$")
+# ``--timestamps`` puts an RFC 3339 timestamp in front of each container line.
+_LINE_TIMESTAMP = re.compile(r"(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z) ?")
+
+OpenStream = Callable[..., "subprocess.Popen[str]"]
+
+
+@dataclass(frozen=True)
+class SandboxLogLine:
+    seq: int
+    service: str | None
+    text: str
+    received_at: float
+
+
+class SandboxLogBuffer:
+    """Bounded per-service ring buffers of log lines sharing one sequence counter.
+
+    Each service keeps its newest ``capacity`` lines; older lines fall off the ring. Lines
+    without a recognizable compose prefix (compose's own errors) are kept under ``None``.
+    """
+
+    def __init__(self, *, capacity: int = LOG_BUFFER_LINES_PER_SERVICE) -> None:
+        self.capacity = max(1, int(capacity))
+        self._lines: dict[str | None, deque[SandboxLogLine]] = {}
+        self._next_seq = 1
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            return self._next_seq - 1
+
+    def append(self, service: str | None, text: str, *, received_at: float | None = None) -> SandboxLogLine:
+        with self._lock:
+            line = SandboxLogLine(
+                seq=self._next_seq,
+                service=service,
+                text=text,
+                received_at=time.time() if received_at is None else received_at,
+            )
+            self._next_seq += 1
+            ring = self._lines.get(service)
+            if ring is None:
+                ring = self._lines[service] = deque(maxlen=self.capacity)
+            ring.append(line)
+            return line
+
+    def tail(self, count: int, *, service: str | None = None) -> list[SandboxLogLine]:
+        if count <= 0:
+            return []
+        return self._snapshot(service)[-count:]
+
+    def seq_range(
+        self, start_seq: int, end_seq: int | None = None, *, service: str | None = None
+    ) -> list[SandboxLogLine]:
+        """Return buffered lines with ``start_seq <= seq < end_seq``."""
+        return [
+            line
+            for line in self._snapshot(service)
+            if line.seq >= start_seq and (end_seq is None or line.seq < end_seq)
+        ]
+
+    def since(self, received_at: float, *, service: str | None = None) -> list[SandboxLogLine]:
+        return [line for line in self._snapshot(service) if line.received_at >= received_at]
+
+    def _snapshot(self, service: str | None) -> list[SandboxLogLine]:
+        with self._lock:
+            if service is not None:
+                return list(self._lines.get(service, ()))
+            rings = [list(ring) for ring in self._lines.values()]
+        return list(heapq.merge(*rings, key=lambda line: line.seq))
+
+
+class SandboxLogFollower:
+    """Follows one sandbox's compose logs with a single long-lived ``logs -f`` process.
+
+    A daemon thread reads the stream into a :class:`SandboxLogBuffer`, so queries are served
+    from memory and polling never forks. The first query waits briefly for compose to replay
+    the buffered tail; concurrent queries wait for the same priming without holding the lock.
+    When the stream ends (containers stopped, compose error) the next query restarts it, at
+    most once per backoff window, with ``--since`` the last docker timestamp seen. Lines a
+    service already delivered are dropped, so cursors never see a line twice.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        *,
+        compose_project: str,
+        open_stream: OpenStream,
+        capacity: int = LOG_BUFFER_LINES_PER_SERVICE,
+        prime_timeout_seconds: float = FOLLOW_PRIME_TIMEOUT_SECONDS,
+        settle_seconds: float = FOLLOW_SETTLE_SECONDS,
+        restart_backoff_seconds: float = FOLLOW_RESTART_BACKOFF_SECONDS,
+    ) -> None:
+        self.command = tuple(command)
+        self.compose_project = compose_project
+        self.buffer = SandboxLogBuffer(capacity=capacity)
+        self.prime_timeout_seconds = float(prime_timeout_seconds)
+        self.settle_seconds = float(settle_seconds)
+        self.restart_backoff_seconds = float(restart_backoff_seconds)
+        self.starts = 0
+        self._open_stream = open_stream
+        self._proc: subprocess.Popen[str] | None = None
+        self._reader: threading.Thread | None = None
+        self._activity = threading.Event()
+        self._primed = threading.Event()
+        self._last_timestamps: dict[str | None, tuple[str, str]] = {}
+        self._last_activity = 0.0
+        self._last_start = float("-inf")
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def ensure_following(self) -> None:
+        with self._lock:
+            idle = not (self._closed or self.running or self._reader_alive())
+            backed_off = not self.starts or time.monotonic() - self._last_start >= self.restart_backoff_seconds
+            started = idle and backed_off
+            if started:
+                self._start_locked()
+        if started:
+            self._wait_primed()
+            self._primed.set()
+        elif not self._primed.is_set():
+            self._primed.wait(timeout=self.prime_timeout_seconds)
+
+    def tail(self, count: int, *, service: str | None = None) -> list[SandboxLogLine]:
+        self.ensure_following()
+        return self.buffer.tail(count, service=service)
+
+    def seq_range(
+        self, start_seq: int, end_seq: int | None = None, *, service: str | None = None
+    ) -> list[SandboxLogLine]:
+        self.ensure_following()
+        return self.buffer.seq_range(start_seq, end_seq, service=service)
+
+    def since(self, received_at: float, *, service: str | None = None) -> list[SandboxLogLine]:
+        self.ensure_following()
+        return self.buffer.since(received_at, service=service)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._primed.set()
+            proc, self._proc = self._proc, None
+            reader, self._reader = self._reader, None
+        if proc is None:
+            return
+        _terminate(proc)
+        if reader is not None:
+            reader.join(timeout=1)
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def _start_locked(self) -> None:
+        if self._proc is not None and self._proc.stdout is not None:
+            self._proc.stdout.close()
+        self._activity.clear()
+        self._primed.clear()
+        self._last_start = time.monotonic()
+        self.starts += 1
+        command = list(self.command)
+        if self._last_timestamps:
+            # Resume where the previous stream stopped instead of replaying the tail again.
+            since = min(self._last_timestamps.values())
+            command.append(f"--since={since[0]}.{since[1]}Z")
+        try:
+            proc = self._open_stream(*command)
+        except OSError:
+            # A missing compose binary behaves like a stream that ended; the backoff applies.
+            self._proc = None
+            self._primed.set()
+            return
+        self._proc = proc
+        self._reader = threading.Thread(
+            target=self._read, args=(proc,), name=f"sandbox-log-follower:{self.compose_project}", daemon=True
+        )
+        self._reader.start()
+
+    def _reader_alive(self) -> bool:
+        return self._reader is not None and self._reader.is_alive()
+
+    def _wait_primed(self) -> None:
+        deadline = time.monotonic() + self.prime_timeout_seconds
+        if not self._activity.wait(timeout=self.prime_timeout_seconds):
+            return
+        # Compose replays the buffered tail in one burst; wait until it goes quiet.
+        while self._reader_alive() and time.monotonic() < deadline:
+            quiet_for = time.monotonic() - self._last_activity
+            if quiet_for >= self.settle_seconds:
+                return
+            time.sleep(self.settle_seconds - quiet_for)
+
+    def _read(self, proc: subprocess.Popen[str]) -> None:
+        stream = proc.stdout
+        try:
+            if stream is not None:
+                for raw in stream:
+                    service, text = parse_compose_log_line(raw.rstrip("\r\n"), compose_project=self.compose_project)
+                    text, timestamp = split_compose_log_timestamp(text)
+                    self._last_activity = time.monotonic()
+                    self._activity.set()
+                    if timestamp is not None:
+                        key = _timestamp_key(timestamp)
+                        last = self._last_timestamps.get(service)
+                        if last is not None and key <= last:
+                            continue
+                        self._last_timestamps[service] = key
+                    self.buffer.append(service, text)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._last_activity = time.monotonic()
+            self._activity.set()
+            proc.poll()
+
+
+def parse_compose_log_line(raw: str, *, compose_project: str) -> tuple[str | None, str]:
+    """Split a compose log line into its service name and the line as printed."""
+    match = _COMPOSE_LINE_PREFIX.match(raw)
+    if match is None:
+        return None, raw
+    service = _CONTAINER_INDEX_SUFFIX.sub("", match.group("container"))
+    for separator in ("_", "-"):
+        prefix = f"{compose_project}{separator}"
+        if compose_project and service.startswith(prefix) and len(service) > len(prefix):
+            service = service[len(prefix) :]
+            break
+    return service, raw
+
+
+def split_compose_log_timestamp(raw: str) -> tuple[str, str | None]:
+    """Remove the ``--timestamps`` timestamp from a container line, returning the line and the timestamp."""
+    match = _COMPOSE_LINE_PREFIX.match(raw)
+    if match is None:
+        return raw, None
+    text_start = match.start("text")
+    stamp = _LINE_TIMESTAMP.match(raw, text_start)
+    if stamp is None:
+        return raw, None
+    return raw[:text_start] + raw[stamp.end() :], stamp.group("timestamp")
+
+
+def _timestamp_key(timestamp: str) -> tuple[str, str]:
+    # Docker trims trailing zeros from the fraction; pad it so keys compare in time order.
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return seconds, fraction.ljust(9, "0")
+
+
+def render_log_lines(lines: Iterable[SandboxLogLine]) -> str:
+    return "".join(f"{line.text}\n" for line in lines)
+
+
+def compose_follow_command(compose_path: Path, compose_project: str, *, tail: int) -> list[str]:
+    return [
+        "docker-compose",
+        "-f",
+        str(compose_path),
+        "-p",
+        compose_project,
+        "logs",
+        "-f",
+        "--no-color",
+        "--timestamps",
+        f"--tail={tail}",
+    ]
+
+
+_followers: OrderedDict[tuple[str, str], SandboxLogFollower] = OrderedDict()
+_followers_lock = threading.Lock()
+
+
+def sandbox_log_follower(
+    compose_path: Path,
+    compose_project: str,
+    *,
+    open_stream: OpenStream,
+    capacity: int = LOG_BUFFER_LINES_PER_SERVICE,
+) -> SandboxLogFollower:
+    """Return the shared follower for a sandbox; the least recently used follower is closed past the cap."""
+    key = (str(compose_path), compose_project)
+    evicted: SandboxLogFollower | None = None
+    with _followers_lock:
+        follower = _followers.get(key)
+        if follower is None:
+            follower = SandboxLogFollower(
+                compose_follow_command(compose_path, compose_project, tail=capacity),
+                compose_project=compose_project,
+                open_stream=open_stream,
+                capacity=capacity,
+            )
+            _followers[key] = follower
+            if len(_followers) > MAX_FOLLOWED_SANDBOXES:
+                _, evicted = _followers.popitem(last=False)
+        else:
+            _followers.move_to_end(key)
+    if evicted is not None:
+        evicted.close()
+    return follower
+
+
+def stop_sandbox_log_follower(compose_project: str) -> None:
+    with _followers_lock:
+        keys = [key for key in _followers if key[1] == compose_project]
+        stopped = [_followers.pop(key) for key in keys]
+    for follower in stopped:
+        follower.close()
+
+
+def close_sandbox_log_followers() -> None:
+    with _followers_lock:
+        followers = list(_followers.values())
+        _followers.clear()
+    for follower in followers:
+        follower.close()
+
+
+def _terminate(proc: subprocess.Popen[str]) -> None:
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+atexit.register(close_sandbox_log_followers)
@@ -15,6 +15,7 @@ class ToolArgumentSchema:
     recoverable: bool = False
     greedy_string_arg: str | None = None
     missing_reason: str | None = None
+    read_only: bool = False
 
 
 @dataclass(frozen=True)
@@ -83,6 +84,10 @@ class ToolRegistry:
             return None
         return schema
 
+    def is_read_only(self, tool_name: str) -> bool:
+        schema = self.get(tool_name)
+        return schema is not None and schema.read_only
+
     def as_dict(self) -> dict[str, dict[str, Any]]:
         return {
             name: {
@@ -90,6 +95,7 @@ class ToolRegistry:
                 "recoverable": schema.recoverable,
                 "greedy_string_arg": schema.greedy_string_arg,
                 "missing_reason": schema.missing_reason,
+                "read_only": schema.read_only,
             }
             for name, schema in sorted(self._schemas.items())
         }
@@ -102,7 +108,9 @@ DEFAULT_TOOL_REGISTRY = ToolRegistry(
             required_args=("path",),
             recoverable=True,
             missing_reason="missing_path",
+            read_only=True,
         ),
+        ToolArgumentSchema(tool_name="list_directory", required_args=("path",), read_only=True),
         ToolArgumentSchema(
             tool_name="write_file",
             required_args=("path", "content"),
@@ -124,7 +132,7 @@ DEFAULT_TOOL_REGISTRY = ToolRegistry(
         ),
         ToolArgumentSchema(tool_name="create_issue", required_args=("title",)),
         ToolArgumentSchema(tool_name="add_issue_comment", required_args=("comment",)),
-        ToolArgumentSchema(tool_name="get_issue_context", required_args=("issue_id",)),
+        ToolArgumentSchema(tool_name="get_issue_context", required_args=("issue_id",), read_only=True),
     ]
 )
 
@@ -0,0 +1,570 @@
+"""Durable ingestion queue for Gitea webhook deliveries.
+
+The webhook endpoint only verifies, enqueues and acknowledges; a worker pool drains the
+queue. Deliveries are deduplicated by delivery id and processed in arrival order per
+repository, so two events for the same repository never run concurrently or out of order
+even when several server processes share the queue file. The same file carries the
+sliding-window rate-limit state, so the limit holds across ``ORKET_WEBHOOK_WORKERS``.
+Finished deliveries keep their row, and so their dedupe key, but their payload and result
+are cleared once they are older than the retention window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+from orket.adapters.storage.sqlite_connection import connect_sqlite_wal
+from orket.adapters.storage.sqlite_migrations import SQLiteMigration, SQLiteMigrationRunner
+from orket.logging import log_event
+
+DELIVERY_LEASE_SECONDS = 300.0
+DELIVERY_MAX_ATTEMPTS = 5
+DELIVERY_RETRY_BASE_SECONDS = 5.0
+DELIVERY_RETENTION_SECONDS = 7 * 24 * 3600.0
+PRUNE_INTERVAL_SECONDS = 300.0
+WORKER_POLL_INTERVAL_SECONDS = 1.0
+
+_MIGRATIONS = [
+    SQLiteMigration(
+        version=1,
+        name="create_webhook_delivery_queue",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS webhook_deliveries (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                delivery_id TEXT NOT NULL UNIQUE,
+                repo_key TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                payload_json TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                received_at REAL NOT NULL,
+                available_at REAL NOT NULL,
+                claimed_by TEXT,
+                claim_expires_at REAL,
+                finished_at REAL,
+                result_json TEXT,
+                last_error TEXT
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_pending
+            ON webhook_deliveries (status, repo_key, seq)
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS webhook_rate_limit_hits (
+                scope TEXT NOT NULL,
+                hit_at REAL NOT NULL
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_webhook_rate_limit_hits_scope
+            ON webhook_rate_limit_hits (scope, hit_at)
+            """,
+        ),
+    ),
+    SQLiteMigration(
+        version=2,
+        name="index_finished_webhook_deliveries",
+        statements=(
+            """
+            CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_finished
+            ON webhook_deliveries (status, finished_at)
+            """,
+        ),
+    ),
+]
+
+DeliveryHandler = Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class WebhookDelivery:
+    seq: int
+    delivery_id: str
+    repo_key: str
+    event_type: str
+    payload: dict[str, Any]
+    attempts: int
+    received_at: float
+
+
+class WebhookDeliveryQueue:
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+
+    async def ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            async with connect_sqlite_wal(self.db_path) as conn:
+                await SQLiteMigrationRunner(namespace="webhook_delivery_queue").apply(conn, _MIGRATIONS)
+                await conn.commit()
+            self._initialized = True
+
+    async def enqueue(
+        self,
+        *,
+        delivery_id: str,
+        event_type: str,
+        repo_key: str,
+        payload: dict[str, Any],
+        now: float | None = None,
+    ) -> bool:
+        """Queue a delivery; returns False when the delivery id was already received."""
+        await self.ensure_initialized()
+        received_at = time.time() if now is None else now
+        async with connect_sqlite_wal(self.db_path) as conn:
+            cursor = await conn.execute(
+                """
+                INSERT OR IGNORE INTO webhook_deliveries (
+                    delivery_id, repo_key, event_type, payload_json, status, received_at, available_at
+                ) VALUES (?, ?, ?, ?, 'queued', ?, ?)
+                """,
+                (
+                    delivery_id,
+                    repo_key,
+                    event_type,
+                    json.dumps(payload, sort_keys=True, separators=(",", ":")),
+                    received_at,
+                    received_at,
+                ),
+            )
+            await conn.commit()
+            return int(cursor.rowcount or 0) > 0
+
+    async def claim_next(
+        self,
+        *,
+        worker_id: str,
+        lease_seconds: float = DELIVERY_LEASE_SECONDS,
+        now: float | None = None,
+    ) -> WebhookDelivery | None:
+        """Claim the oldest ready delivery whose repository has no earlier unfinished delivery."""
+        await self.ensure_initialized()
+        claimed_at = time.time() if now is None else now
+        async with connect_sqlite_wal(self.db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                # A worker that died mid-delivery leaves an expired claim; hand it back to the queue.
+                await conn.execute(
+                    """
+                    UPDATE webhook_deliveries
+                    SET status = 'queued', claimed_by = NULL, claim_expires_at = NULL
+                    WHERE status = 'processing' AND claim_expires_at < ?
+                    """,
+                    (claimed_at,),
+                )
+                cursor = await conn.execute(
+                    """
+                    SELECT * FROM webhook_deliveries AS candidate
+                    WHERE candidate.status = 'queued'
+                      AND candidate.available_at <= ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM webhook_deliveries AS earlier
+                          WHERE earlier.repo_key = candidate.repo_key
+                            AND earlier.status IN ('queued', 'processing')
+                            AND earlier.seq < candidate.seq
+                      )
+                    ORDER BY candidate.seq ASC
+                    LIMIT 1
+                    """,
+                    (claimed_at,),
+                )
+                row = await cursor.fetchone()
+                if row is None:
+                    await conn.commit()
+                    return None
+                await conn.execute(
+                    """
+                    UPDATE webhook_deliveries
+                    SET status = 'processing', attempts = attempts + 1, claimed_by = ?, claim_expires_at = ?
+                    WHERE seq = ?
+                    """,
+                    (worker_id, claimed_at + lease_seconds, int(row["seq"])),
+                )
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+        return WebhookDelivery(
+            seq=int(row["seq"]),
+            delivery_id=str(row["delivery_id"]),
+            repo_key=str(row["repo_key"]),
+            event_type=str(row["event_type"]),
+            payload=json.loads(str(row["payload_json"])),
+            attempts=int(row["attempts"]) + 1,
+            received_at=float(row["received_at"]),
+        )
+
+    async def renew_claim(
+        self,
+        delivery_id: str,
+        *,
+        worker_id: str,
+        lease_seconds: float = DELIVERY_LEASE_SECONDS,
+        now: float | None = None,
+    ) -> bool:
+        """Extend a live claim; returns False when ``worker_id`` no longer holds the delivery."""
+        await self.ensure_initialized()
+        renewed_at = time.time() if now is None else now
+        async with connect_sqlite_wal(self.db_path) as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE webhook_deliveries
+                SET claim_expires_at = ?
+                WHERE delivery_id = ? AND status = 'processing' AND claimed_by = ?
+                """,
+                (renewed_at + lease_seconds, delivery_id, worker_id),
+            )
+            await conn.commit()
+            return int(cursor.rowcount or 0) > 0
+
+    async def complete(self, delivery_id: str, *, result: dict[str, Any], now: float | None = None) -> None:
+        await self._finish(
+            delivery_id,
+            status="done",
+            result_json=json.dumps(result, sort_keys=True, default=str),
+            error=None,
+            now=now,
+        )
+
+    async def fail(
+        self,
+        delivery_id: str,
+        *,
+        error: str,
+        attempts: int,
+        max_attempts: int = DELIVERY_MAX_ATTEMPTS,
+        retry_base_seconds: float = DELIVERY_RETRY_BASE_SECONDS,
+        now: float | None = None,
+    ) -> str:
+        """Requeue a failed delivery with exponential backoff, or dead-letter it after ``max_attempts``."""
+        if attempts >= max_attempts:
+            await self._finish(delivery_id, status="failed", result_json=None, error=error, now=now)
+            return "failed"
+        await self.ensure_initialized()
+        failed_at = time.time() if now is None else now
+        async with connect_sqlite_wal(self.db_path) as conn:
+            await conn.execute(
+                """
+                UPDATE webhook_deliveries
+                SET status = 'queued', available_at = ?, claimed_by = NULL, claim_expires_at = NULL, last_error = ?
+                WHERE delivery_id = ?
+                """,
+                (failed_at + retry_base_seconds * (2 ** max(0, attempts - 1)), error, delivery_id),
+            )
+            await conn.commit()
+        return "queued"
+
+    async def pending_counts(self) -> dict[str, int]:
+        """Count unfinished deliveries; finished rows are skipped through the status index."""
+        await self.ensure_initialized()
+        async with connect_sqlite_wal(self.db_path) as conn:
+            cursor = await conn.execute(
+                """
+                SELECT status, COUNT(*) FROM webhook_deliveries
+                WHERE status IN ('queued', 'processing')
+                GROUP BY status
+                """
+            )
+            rows = await cursor.fetchall()
+        counts = {"queued": 0, "processing": 0}
+        counts.update({str(row[0]): int(row[1]) for row in rows})
+        return counts
+
+    async def prune_finished(self, *, older_than_seconds: float, now: float | None = None) -> int:
+        """Clear payload and result of deliveries finished before the cutoff; the row stays for dedupe."""
+        await self.ensure_initialized()
+        cutoff = (time.time() if now is None else now) - max(0.0, float(older_than_seconds))
+        async with connect_sqlite_wal(self.db_path) as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE webhook_deliveries
+                SET payload_json = '', result_json = NULL
+                WHERE status IN ('done', 'failed') AND finished_at < ? AND payload_json <> ''
+                """,
+                (cutoff,),
+            )
+            await conn.commit()
+            return int(cursor.rowcount or 0)
+
+    async def get(self, delivery_id: str) -> dict[str, Any] | None:
+        await self.ensure_initialized()
+        async with connect_sqlite_wal(self.db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute("SELECT * FROM webhook_deliveries WHERE delivery_id = ?", (delivery_id,))
+            row = await cursor.fetchone()
+        return dict(zip(row.keys(), row, strict=True)) if row is not None else None
+
+    async def try_acquire_rate_slot(
+        self,
+        *,
+        scope: str,
+        limit: int,
+        window_seconds: float,
+        now: float | None = None,
+    ) -> bool:
+        """Record one hit in ``scope`` unless ``limit`` hits already fall inside the sliding window."""
+        await self.ensure_initialized()
+        hit_at = time.time() if now is None else now
+        async with connect_sqlite_wal(self.db_path) as conn:
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                await conn.execute(
+                    "DELETE FROM webhook_rate_limit_hits WHERE scope = ? AND hit_at < ?",
+                    (scope, hit_at - window_seconds),
+                )
+                cursor = await conn.execute("SELECT COUNT(*) FROM webhook_rate_limit_hits WHERE scope = ?", (scope,))
+                row = await cursor.fetchone()
+                if row is not None and int(row[0]) >= limit:
+                    await conn.commit()
+                    return False
+                await conn.execute(
+                    "INSERT INTO webhook_rate_limit_hits (scope, hit_at) VALUES (?, ?)",
+                    (scope, hit_at),
+                )
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+        return True
+
+    async def _finish(
+        self,
+        delivery_id: str,
+        *,
+        status: str,
+        result_json: str | None,
+        error: str | None,
+        now: float | None,
+    ) -> None:
+        await self.ensure_initialized()
+        finished_at = time.time() if now is None else now
+        async with connect_sqlite_wal(self.db_path) as conn:
+            await conn.execute(
+                """
+                UPDATE webhook_deliveries
+                SET status = ?, finished_at = ?, result_json = ?, last_error = COALESCE(?, last_error),
+                    claimed_by = NULL, claim_expires_at = NULL
+                WHERE delivery_id = ?
+                """,
+                (status, finished_at, result_json, error, delivery_id),
+            )
+            await conn.commit()
+
+
+class SharedSlidingWindowRateLimiter:
+    """Sliding-window limiter whose state lives in the delivery queue file, shared by every worker process."""
+
+    def __init__(
+        self,
+        queue: WebhookDeliveryQueue,
+        limit: int,
+        window_seconds: int = 60,
+        *,
+        scope: str = "webhook",
+    ) -> None:
+        self.queue = queue
+        self.limit = max(1, int(limit))
+        self.window_seconds = window_seconds
+        self.scope = scope
+
+    async def allow(self) -> bool:
+        return await self.queue.try_acquire_rate_slot(
+            scope=self.scope, limit=self.limit, window_seconds=float(self.window_seconds)
+        )
+
+
+class WebhookDeliveryWorkerPool:
+    """Drains a :class:`WebhookDeliveryQueue` with a fixed number of asyncio workers.
+
+    Workers wake on :meth:`notify` for deliveries enqueued by this process and otherwise poll,
+    which picks up deliveries acknowledged by sibling server processes. While a handler runs,
+    its worker renews the claim every third of the lease, so a slow delivery is never handed
+    to another worker; only a worker that stops renewing loses its claim.
+    """
+
+    def __init__(
+        self,
+        queue: WebhookDeliveryQueue,
+        handler: DeliveryHandler,
+        *,
+        workers: int = 4,
+        poll_interval_seconds: float = WORKER_POLL_INTERVAL_SECONDS,
+        lease_seconds: float = DELIVERY_LEASE_SECONDS,
+        max_attempts: int = DELIVERY_MAX_ATTEMPTS,
+        retry_base_seconds: float = DELIVERY_RETRY_BASE_SECONDS,
+        retention_seconds: float = DELIVERY_RETENTION_SECONDS,
+        prune_interval_seconds: float = PRUNE_INTERVAL_SECONDS,
+        workspace: Path | None = None,
+    ) -> None:
+        self.queue = queue
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.poll_interval_seconds = float(poll_interval_seconds)
+        self.lease_seconds = max(0.001, float(lease_seconds))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_base_seconds = float(retry_base_seconds)
+        self.retention_seconds = max(0.0, float(retention_seconds))
+        self.prune_interval_seconds = max(0.0, float(prune_interval_seconds))
+        self.workspace = workspace or Path.cwd()
+        self.worker_prefix = f"webhook-worker:{uuid.uuid4().hex[:8]}"
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._tasks: list[asyncio.Task[None]] = []
+        self._next_prune_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._run(f"{self.worker_prefix}:{index}"), name=f"{self.worker_prefix}:{index}")
+            for index in range(self.workers)
+        ]
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_once(self, worker_id: str | None = None) -> bool:
+        """Process one ready delivery; returns False when nothing was ready."""
+        claimant = worker_id or f"{self.worker_prefix}:inline"
+        delivery = await self.queue.claim_next(worker_id=claimant, lease_seconds=self.lease_seconds)
+        if delivery is None:
+            return False
+        heartbeat = asyncio.create_task(self._renew_claim(delivery, claimant))
+        try:
+            try:
+                result = await self.handler(delivery.event_type, delivery.payload)
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+        except Exception as exc:  # A failing delivery is retried or dead-lettered; it must not stop the worker.
+            status = await self.queue.fail(
+                delivery.delivery_id,
+                error=str(exc),
+                attempts=delivery.attempts,
+                max_attempts=self.max_attempts,
+                retry_base_seconds=self.retry_base_seconds,
+            )
+            log_event(
+                "webhook_delivery_failed",
+                {
+                    "delivery_id": delivery.delivery_id,
+                    "repo": delivery.repo_key,
+                    "event": delivery.event_type,
+                    "attempts": delivery.attempts,
+                    "status": status,
+                    "error": str(exc),
+                },
+                workspace=self.workspace,
+            )
+            return True
+        await self.queue.complete(delivery.delivery_id, result=result)
+        log_event(
+            "webhook_delivery_processed",
+            {
+                "delivery_id": delivery.delivery_id,
+                "repo": delivery.repo_key,
+                "event": delivery.event_type,
+                "attempts": delivery.attempts,
+                "queue_ms": round((time.time() - delivery.received_at) * 1000.0, 3),
+                "status": str(result.get("status") or ""),
+            },
+            workspace=self.workspace,
+        )
+        return True
+
+    async def drain(self) -> int:
+        """Process ready deliveries inline until none are left; returns how many were handled."""
+        handled = 0
+        while await self.run_once():
+            handled += 1
+        return handled
+
+    async def _renew_claim(self, delivery: WebhookDelivery, worker_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3.0)
+            if not await self.queue.renew_claim(
+                delivery.delivery_id, worker_id=worker_id, lease_seconds=self.lease_seconds
+            ):
+                log_event(
+                    "webhook_delivery_claim_lost",
+                    {"delivery_id": delivery.delivery_id, "repo": delivery.repo_key, "worker": worker_id},
+                    workspace=self.workspace,
+                )
+                return
+
+    async def prune_if_due(self) -> int:
+        """Clear expired finished payloads at most once per prune interval across this pool's workers."""
+        started = time.monotonic()
+        if started < self._next_prune_at:
+            return 0
+        self._next_prune_at = started + self.prune_interval_seconds
+        pruned = await self.queue.prune_finished(older_than_seconds=self.retention_seconds)
+        if pruned:
+            log_event(
+                "webhook_delivery_payloads_pruned",
+                {"count": pruned, "retention_seconds": self.retention_seconds},
+                workspace=self.workspace,
+            )
+        return pruned
+
+    async def _run(self, worker_id: str) -> None:
+        while not self._stopping:
+            self._wake.clear()
+            if await self.run_once(worker_id):
+                continue
+            await self.prune_if_due()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval_seconds)
+
+
+def webhook_delivery_id(delivery_header: str | None, body: bytes) -> str:
+    """Use Gitea's delivery id; without one, key the delivery by its body so replays still dedupe."""
+    header = str(delivery_header or "").strip()
+    if header:
+        return header
+    return f"sha256:{hashlib.sha256(body).hexdigest()}"
+
+
+__all__ = [
+    "DELIVERY_LEASE_SECONDS",
+    "DELIVERY_MAX_ATTEMPTS",
+    "DELIVERY_RETENTION_SECONDS",
+    "SharedSlidingWindowRateLimiter",
+    "WebhookDelivery",
+    "WebhookDeliveryQueue",
+    "WebhookDeliveryWorkerPool",
+    "webhook_delivery_id",
+]
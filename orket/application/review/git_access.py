@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import atexit
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from orket.application.review.errors import ReviewError
+
+GIT_COMMAND_TIMEOUT_SECONDS = 30
+MAX_CACHED_BLOB_READERS = 4
+MAX_CACHED_DIFFS = 32
+
+
+@dataclass(frozen=True)
+class GitObject:
+    object_id: str
+    object_type: str
+    content: bytes
+
+
+@dataclass(frozen=True)
+class GitDiffRange:
+    name_status: str
+    numstat: str
+    unified: str
+
+
+class GitBlobReader:
+    """Serves object reads for one repository from a single long-lived ``git cat-file --batch`` process.
+
+    Each read writes one ``<object>`` line and reads the framed reply, so reading hundreds of
+    files costs one fork instead of one per file. A read that exceeds the timeout kills the
+    process; the next read starts a fresh one.
+    """
+
+    COMMAND = ("git", "cat-file", "--batch")
+
+    def __init__(self, repo_root: Path, *, timeout_seconds: float = GIT_COMMAND_TIMEOUT_SECONDS) -> None:
+        self.repo_root = repo_root
+        self.timeout_seconds = float(timeout_seconds)
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def read(self, spec: str) -> GitObject | None:
+        """Return the object named by ``spec`` (``<ref>`` or ``<ref>:<path>``), or ``None`` when it is missing."""
+        if "\n" in spec:
+            raise ValueError("git object spec must not contain newlines")
+        with self._lock:
+            proc = self._ensure_process()
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(self.timeout_seconds, _kill)
+            timer.start()
+            try:
+                assert proc.stdin is not None and proc.stdout is not None
+                proc.stdin.write(spec.encode("utf-8") + b"\n")
+                proc.stdin.flush()
+                header = proc.stdout.readline()
+                parts = header.decode("utf-8", errors="replace").split()
+                if len(parts) == 2 and parts[1] in {"missing", "ambiguous"}:
+                    return None
+                if len(parts) != 3 or not parts[2].isdigit():
+                    raise OSError(f"unexpected cat-file header: {header!r}")
+                size = int(parts[2])
+                content = proc.stdout.read(size + 1)
+                if len(content) != size + 1:
+                    raise OSError("truncated cat-file reply")
+                return GitObject(object_id=parts[0], object_type=parts[1], content=content[:size])
+            except (OSError, ValueError) as exc:
+                self._discard_process()
+                if timed_out.is_set():
+                    raise ReviewError(
+                        f"Review git command timed out after {self.timeout_seconds:g}s: {' '.join(self.COMMAND)}",
+                        command=list(self.COMMAND),
+                        stderr=spec,
+                    ) from exc
+                raise ReviewError(
+                    f"Review git command failed: {' '.join(self.COMMAND)}",
+                    command=list(self.COMMAND),
+                    stderr=str(exc),
+                ) from exc
+            finally:
+                timer.cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            self._discard_process()
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        try:
+            self._proc = subprocess.Popen(
+                list(self.COMMAND),
+                cwd=str(self.repo_root),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as exc:
+            raise ReviewError(
+                "Review git command failed: git executable was not found", command=list(self.COMMAND)
+            ) from exc
+        return self._proc
+
+    def _discard_process(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                stream.close()
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+_readers: OrderedDict[Path, GitBlobReader] = OrderedDict()
+_diffs: OrderedDict[tuple[Path, str, str], GitDiffRange] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def blob_reader(repo_root: Path) -> GitBlobReader:
+    """Return the shared batch reader for ``repo_root``; the least recently used reader is closed past the cap."""
+    key = repo_root.resolve()
+    evicted: GitBlobReader | None = None
+    with _cache_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = GitBlobReader(key)
+            _readers[key] = reader
+            if len(_readers) > MAX_CACHED_BLOB_READERS:
+                _, evicted = _readers.popitem(last=False)
+        else:
+            _readers.move_to_end(key)
+    if evicted is not None:
+        evicted.close()
+    return reader
+
+
+def resolve_commit(repo_root: Path, ref: str) -> str | None:
+    obj = blob_reader(repo_root).read(f"{ref}^{{commit}}")
+    return obj.object_id if obj is not None else None
+
+
+def diff_range(
+    repo_root: Path,
+    base_ref: str,
+    head_ref: str,
+    *,
+    run_git: Callable[[Path, list[str]], str],
+) -> GitDiffRange:
+    """Return name-status, numstat and unified diff text for ``base_ref..head_ref`` from one ``git diff`` pass.
+
+    Results are cached by resolved commit ids, so symbolic refs that move are never served stale.
+    """
+    base_id = resolve_commit(repo_root, base_ref)
+    head_id = resolve_commit(repo_root, head_ref)
+    cache_key = (repo_root.resolve(), base_id, head_id) if base_id and head_id else None
+    if cache_key is not None:
+        with _cache_lock:
+            cached = _diffs.get(cache_key)
+            if cached is not None:
+                _diffs.move_to_end(cache_key)
+                return cached
+    combined = run_git(repo_root, ["diff", "--raw", "--numstat", "--patch", "--unified=3", base_ref, head_ref])
+    result = _split_combined_diff(combined)
+    if cache_key is not None:
+        with _cache_lock:
+            _diffs[cache_key] = result
+            if len(_diffs) > MAX_CACHED_DIFFS:
+                _diffs.popitem(last=False)
+    return result
+
+
+def clear_git_access_cache() -> None:
+    with _cache_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+        _diffs.clear()
+    for reader in readers:
+        reader.close()
+
+
+def _split_combined_diff(text: str) -> GitDiffRange:
+    if text.startswith("diff --git "):
+        patch_start = 0
+    else:
+        marker = text.find("\ndiff --git ")
+        patch_start = marker + 1 if marker >= 0 else len(text)
+    header, unified = text[:patch_start], text[patch_start:]
+    name_status: list[str] = []
+    numstat: list[str] = []
+    for line in header.splitlines():
+        if line.startswith(":"):
+            # Raw lines are ":<modes> <ids> <status>\t<paths>"; the name-status form drops the prefix.
+            fields = line.split(" ", 4)
+            if len(fields) == 5:
+                name_status.append(fields[4])
+        elif line.strip():
+            numstat.append(line)
+    return GitDiffRange(
+        name_status="\n".join(name_status) + ("\n" if name_status else ""),
+        numstat="\n".join(numstat) + ("\n" if numstat else ""),
+        unified=unified,
+    )
+
+
+atexit.register(clear_git_access_cache)
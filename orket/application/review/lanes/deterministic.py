@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import re
 from collections.abc import Mapping
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, cast
 
 from orket.application.review.models import (
     DeterministicDecision,
     DeterministicFinding,
     DeterministicReviewDecisionPayload,
     ReviewSnapshot,
+    Severity,
 )
 
 SEVERITY_RANK = {"info": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
 DEFAULT_FORBIDDEN_PATTERN_SEVERITY = "high"
+MAX_CACHED_SCANNERS = 32
+
+_HUNK_NEW_START = re.compile(r"\+(\d+)(?:,(\d+))?")
+_LEADING_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+# Backreferences and conditionals address groups by number or name, which renumbering breaks.
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
 
 
 def _added_diff_lines(diff_unified: str) -> list[dict[str, Any]]:
@@ -32,7 +42,7 @@ def _added_diff_lines(diff_unified: str) -> list[dict[str, Any]]:
             continue
         if line.startswith("@@ "):
             in_hunk = True
-            match = re.search(r"\+(\d+)(?:,(\d+))?", line)
+            match = _HUNK_NEW_START.search(line)
             if match:
                 new_line = int(match.group(1))
             continue
@@ -89,6 +99,171 @@ def _forbidden_pattern_rows(raw_patterns: Any) -> list[dict[str, Any]]:
     return rows
 
 
+class _PrefixTrie:
+    """Character trie over policy path prefixes; one walk per path finds every matching prefix."""
+
+    def __init__(self, prefixes: list[str]) -> None:
+        self._root: dict[str, Any] = {}
+        for index, prefix in enumerate(prefixes):
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault("", []).append(index)
+
+    def matches(self, path: str) -> list[int]:
+        """Return indices of every prefix that ``path`` starts with, in policy order."""
+        found: list[int] = list(self._root.get("", []))
+        node = self._root
+        for char in path:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            found.extend(node.get("", []))
+        return sorted(found)
+
+    def any_match(self, path: str) -> bool:
+        node = self._root
+        if "" in node:
+            return True
+        for char in path:
+            child = node.get(char)
+            if child is None:
+                return False
+            node = child
+            if "" in node:
+                return True
+        return False
+
+
+@dataclass(frozen=True)
+class _PatternRule:
+    pattern: str
+    severity: Severity
+    max_occurrences: int
+    regex: re.Pattern[str] | None
+
+
+@dataclass(frozen=True)
+class _ScannerProgram:
+    blocked_prefixes: list[str]
+    blocked_trie: _PrefixTrie
+    rules: list[_PatternRule]
+    combined: re.Pattern[str] | None
+    searchable_rules: tuple[int, ...]
+    isolated_rules: tuple[int, ...]
+    required_roots: _PrefixTrie
+    test_roots: _PrefixTrie
+
+
+def _alternation_branch(index: int, pattern: str, regex: re.Pattern[str]) -> str | None:
+    """Return ``pattern`` as the named group ``r<index>`` of the combined scan, or ``None`` to scan it alone.
+
+    Leading global flags such as ``(?i)`` become a scoped group so they keep applying to this
+    rule only. Patterns that name or refer back to groups stay isolated.
+    """
+    if regex.groupindex or _GROUP_REFERENCE.search(pattern):
+        return None
+    flags = ""
+    body = pattern
+    while match := _LEADING_GLOBAL_FLAGS.match(body):
+        flags += match.group(1)
+        body = body[match.end() :]
+    if "x" in flags:
+        body += "\n"
+    branch = f"(?P<r{index}>(?{flags}:{body}))"
+    try:
+        compiled = re.compile(branch, re.MULTILINE)
+    except re.error:
+        return None
+    return branch if compiled.groups == regex.groups + 1 else None
+
+
+def _build_scanner(checks: Mapping[str, Any]) -> _ScannerProgram:
+    blocked_prefixes = [str(item) for item in list(checks.get("path_blocklist") or [])]
+    rules: list[_PatternRule] = []
+    for row in _forbidden_pattern_rows(checks.get("forbidden_patterns")):
+        pattern = str(row["pattern"])
+        try:
+            regex: re.Pattern[str] | None = re.compile(pattern, re.MULTILINE)
+        except re.error:
+            regex = None
+        rules.append(
+            _PatternRule(
+                pattern=pattern,
+                severity=cast(Severity, row["severity"]),
+                max_occurrences=max(1, int(row.get("max_occurrences", 1))),
+                regex=regex,
+            )
+        )
+    branches: list[str] = []
+    isolated_rules: list[int] = []
+    for index, rule in enumerate(rules):
+        if rule.regex is None:
+            continue
+        branch = _alternation_branch(index, rule.pattern, rule.regex)
+        if branch is None:
+            isolated_rules.append(index)
+        else:
+            branches.append(branch)
+    return _ScannerProgram(
+        blocked_prefixes=blocked_prefixes,
+        blocked_trie=_PrefixTrie(blocked_prefixes),
+        rules=rules,
+        combined=re.compile("|".join(branches), re.MULTILINE) if branches else None,
+        searchable_rules=tuple(index for index, rule in enumerate(rules) if rule.regex is not None),
+        isolated_rules=tuple(isolated_rules),
+        required_roots=_PrefixTrie([str(item) for item in list(checks.get("test_hint_required_roots") or [])]),
+        test_roots=_PrefixTrie([str(item) for item in list(checks.get("test_hint_test_roots") or [])]),
+    )
+
+
+@lru_cache(maxsize=MAX_CACHED_SCANNERS)
+def _cached_scanner(policy_digest: str, checks_json: str) -> _ScannerProgram:
+    return _build_scanner(json.loads(checks_json))
+
+
+def _compiled_scanner(policy_digest: str, checks: Mapping[str, Any]) -> _ScannerProgram:
+    """Return the compiled scanner for a policy, built once per policy digest and check set."""
+    try:
+        checks_json = json.dumps(checks, sort_keys=True, ensure_ascii=True)
+    except (TypeError, ValueError):
+        return _build_scanner(checks)
+    return _cached_scanner(policy_digest, checks_json)
+
+
+def _scan_added_lines(program: _ScannerProgram, added_lines: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Return the matched lines per rule, honouring each rule's ``max_occurrences`` cap.
+
+    Each added line gets one search of the combined alternation of all rules. Lines it misses
+    only run the isolated rules; on a hit, ``lastgroup`` names one matching rule and every other
+    open rule is confirmed against the line, since several rules may match the same line.
+    """
+    hits: list[list[dict[str, Any]]] = [[] for _ in program.rules]
+    open_rules = set(program.searchable_rules)
+    for entry in added_lines:
+        if not open_rules:
+            break
+        text = str(entry.get("text") or "")
+        candidates = program.isolated_rules
+        matched_index = -1
+        if program.combined is not None:
+            match = program.combined.search(text)
+            if match is not None and match.lastgroup is not None:
+                candidates = program.searchable_rules
+                matched_index = int(match.lastgroup[1:])
+        for index in candidates:
+            if index not in open_rules:
+                continue
+            rule = program.rules[index]
+            if index != matched_index and (rule.regex is None or rule.regex.search(text) is None):
+                continue
+            hits[index].append(entry)
+            if len(hits[index]) >= rule.max_occurrences:
+                open_rules.discard(index)
+    return hits
+
+
 def run_deterministic_lane(
     *,
     snapshot: ReviewSnapshot,
@@ -97,63 +272,52 @@ def run_deterministic_lane(
     policy_digest: str,
 ) -> DeterministicReviewDecisionPayload:
     checks = (resolved_policy.get("deterministic") or {}).get("checks") or {}
+    program = _compiled_scanner(policy_digest, checks)
     findings: list[DeterministicFinding] = []
     executed_checks: list[str] = []
 
-    blocked_prefixes = [str(item) for item in list(checks.get("path_blocklist") or [])]
-    if blocked_prefixes:
+    if program.blocked_prefixes:
         executed_checks.append("path_policy")
         for changed in snapshot.changed_files:
             if not changed.path:
                 continue
-            for prefix in blocked_prefixes:
-                if changed.path.startswith(prefix):
-                    findings.append(
-                        DeterministicFinding(
-                            code="PATH_BLOCKED",
-                            severity="high",
-                            message=f"Path '{changed.path}' is blocked by policy prefix '{prefix}'",
-                            path=changed.path,
-                            details={"prefix": prefix},
-                        )
+            for index in program.blocked_trie.matches(changed.path):
+                prefix = program.blocked_prefixes[index]
+                findings.append(
+                    DeterministicFinding(
+                        code="PATH_BLOCKED",
+                        severity="high",
+                        message=f"Path '{changed.path}' is blocked by policy prefix '{prefix}'",
+                        path=changed.path,
+                        details={"prefix": prefix},
                     )
+                )
 
-    patterns = _forbidden_pattern_rows(checks.get("forbidden_patterns"))
-    if patterns:
+    if program.rules:
         executed_checks.append("forbidden_patterns")
-        added_lines = _added_diff_lines(snapshot.diff_unified)
-        for row in patterns:
-            pattern = str(row["pattern"])
-            severity = str(row["severity"])
-            try:
-                regex = re.compile(pattern, re.MULTILINE)
-            except re.error:
+        hits = _scan_added_lines(program, _added_diff_lines(snapshot.diff_unified))
+        for rule, matched in zip(program.rules, hits, strict=True):
+            if rule.regex is None:
                 findings.append(
                     DeterministicFinding(
                         code="PATTERN_INVALID",
                         severity="medium",
-                        message=f"Invalid forbidden pattern in policy: {pattern}",
-                        details={"pattern": pattern},
+                        message=f"Invalid forbidden pattern in policy: {rule.pattern}",
+                        details={"pattern": rule.pattern},
                     )
                 )
                 continue
-            max_occurrences = max(1, int(row.get("max_occurrences", 1)))
-            matches = 0
-            for entry in added_lines:
-                if regex.search(str(entry.get("text") or "")):
-                    findings.append(
-                        DeterministicFinding(
-                            code="PATTERN_MATCHED",
-                            severity=severity,
-                            message=f"Forbidden pattern matched: {pattern}",
-                            path=str(entry.get("path") or ""),
-                            span={"start": int(entry.get("line") or 0), "end": int(entry.get("line") or 0)},
-                            details={"pattern": pattern},
-                        )
+            for entry in matched:
+                findings.append(
+                    DeterministicFinding(
+                        code="PATTERN_MATCHED",
+                        severity=rule.severity,
+                        message=f"Forbidden pattern matched: {rule.pattern}",
+                        path=str(entry.get("path") or ""),
+                        span={"start": int(entry.get("line") or 0), "end": int(entry.get("line") or 0)},
+                        details={"pattern": rule.pattern},
                     )
-                    matches += 1
-                    if matches >= max_occurrences:
-                        break
+                )
 
     executed_checks.append("thresholds")
     if snapshot.truncation.files_truncated > 0:
@@ -179,12 +343,8 @@ def run_deterministic_lane(
         )
 
     executed_checks.append("test_hints")
-    required_roots = [str(item) for item in list(checks.get("test_hint_required_roots") or [])]
-    test_roots = [str(item) for item in list(checks.get("test_hint_test_roots") or [])]
-    src_changed = any(
-        any(changed.path.startswith(root) for root in required_roots) for changed in snapshot.changed_files
-    )
-    tests_changed = any(any(changed.path.startswith(root) for root in test_roots) for changed in snapshot.changed_files)
+    src_changed = any(program.required_roots.any_match(changed.path) for changed in snapshot.changed_files)
+    tests_changed = any(program.test_roots.any_match(changed.path) for changed in snapshot.changed_files)
     if src_changed and not tests_changed:
         findings.append(
             DeterministicFinding(
@@ -6,6 +6,7 @@ from pathlib import Path
 import httpx
 
 from orket.application.review.errors import ReviewError
+from orket.application.review.git_access import GIT_COMMAND_TIMEOUT_SECONDS, blob_reader, diff_range
 from orket.application.review.models import (
     ChangedFile,
     ContextBlob,
@@ -14,8 +15,6 @@ from orket.application.review.models import (
     TruncationReport,
 )
 
-GIT_COMMAND_TIMEOUT_SECONDS = 30
-
 
 def _run_git(repo_root: Path, args: list[str]) -> str:
     command = ["git", *args]
@@ -202,12 +201,11 @@ def load_from_diff(
     include_paths: set[str] | None = None,
     metadata: dict[str, object] | None = None,
 ) -> ReviewSnapshot:
-    name_status = _run_git(repo_root, ["diff", "--name-status", base_ref, head_ref])
-    numstat = _run_git(repo_root, ["diff", "--numstat", base_ref, head_ref])
-    unified = _run_git(repo_root, ["diff", "--unified=3", base_ref, head_ref])
+    diff = diff_range(repo_root, base_ref, head_ref, run_git=_run_git)
+    unified = diff.unified
 
-    status_map = _parse_name_status(name_status)
-    numstat_map = _parse_numstat(numstat)
+    status_map = _parse_name_status(diff.name_status)
+    numstat_map = _parse_numstat(diff.numstat)
     all_paths = sorted(set(status_map.keys()) | set(numstat_map.keys()))
     if include_paths is not None:
         all_paths = [path for path in all_paths if path in include_paths]
@@ -260,19 +258,24 @@ def load_from_files(
     selected_paths = sorted(set(paths))
     if include_paths is not None:
         selected_paths = [path for path in selected_paths if path in include_paths]
+    reader = blob_reader(repo_root)
+    if selected_paths and reader.read(f"{ref}^{{tree}}") is None:
+        raise ReviewError(
+            f"Review git command failed: unknown ref {ref}",
+            command=list(reader.COMMAND),
+            stderr=f"fatal: invalid object name '{ref}'.",
+        )
     for raw_path in selected_paths:
         path = raw_path.strip().replace("\\", "/")
         if not path:
             continue
-        try:
+        blob = reader.read(f"{ref}:{path}")
+        if blob is None:
+            raise FileNotFoundError(path)
+        if blob.object_type == "blob":
+            content = blob.content.decode("utf-8", errors="replace")
+        else:
             content = _run_git(repo_root, ["show", f"{ref}:{path}"])
-        except ReviewError as exc:
-            if (
-                exc.command[:2] == ["git", "show"]
-                and "does not exist in" in exc.stderr
-            ):
-                raise FileNotFoundError(path) from exc
-            raise
         changed_files.append(ChangedFile(path=path, status="selected", additions=0, deletions=0))
         context_blobs.append(ContextBlob(path=path, content=content))
         diff_blocks.append(f"*** FILE {path} @ {ref}\n{content}")
@@ -66,44 +66,122 @@ class GiteaStateWorker:
     ) -> bool:
         candidates = await self.adapter.fetch_ready_cards(limit=max(1, int(fetch_limit)))
         for candidate in candidates:
-            card_id = str(candidate.get("issue_number") or candidate.get("card_id") or "").strip()
+            card_id = self._candidate_card_id(candidate)
             if not card_id:
                 continue
             try:
                 lease = await self._acquire_required_lease(card_id)
             except LeaseNotAvailableError:
                 continue
-            reservation_id = await self._publish_claim_reservation_if_enabled(card_id=card_id, lease_observation=lease)
-            await self._publish_claimed_lease_if_enabled(
-                card_id=card_id,
-                lease_observation=lease,
-                source_reservation_id=reservation_id,
-            )
-            run, attempt = await self._begin_claimed_execution_if_enabled(
-                card_id=card_id,
-                card=candidate,
-                lease_observation=lease,
-            )
-            await self._publish_pre_effect_checkpoint_if_enabled(
-                card_id=card_id,
-                card=candidate,
-                lease_observation=lease,
-                run=run,
-                attempt=attempt,
-            )
-            await self._run_claimed(
-                card_id=card_id,
-                card=candidate,
-                work_fn=work_fn,
-                lease_epoch=self._lease_epoch(lease),
-                lease_observation=lease if isinstance(lease, dict) else None,
-                control_plane_run_id=None if run is None else run.run_id,
-                control_plane_attempt_id=None if attempt is None else attempt.attempt_id,
-                control_plane_reservation_id=reservation_id,
-            )
+            await self._execute_claimed(card_id=card_id, card=candidate, lease=lease, work_fn=work_fn)
             return True
         return False
 
+    async def run_concurrent(
+        self,
+        *,
+        work_fn: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+        fetch_limit: int = 5,
+        max_in_flight: int = 1,
+        max_consecutive_lease_failures: int | None = None,
+    ) -> int:
+        """Claim and run up to ``max_in_flight`` cards at once from one fetched candidate list.
+
+        Each claimed card keeps its own lease-renew task. Claiming stops early once
+        ``max_consecutive_lease_failures`` leases in a row are refused, since the
+        remaining candidates are most likely held by other workers. Returns the
+        number of cards consumed.
+        """
+        limit = max(1, int(max_in_flight))
+        failure_limit = max(1, int(max_consecutive_lease_failures or limit))
+        candidates = await self.adapter.fetch_ready_cards(limit=max(1, int(fetch_limit)))
+        in_flight: set[asyncio.Task[None]] = set()
+        finished: list[asyncio.Task[None]] = []
+        consumed = 0
+        consecutive_lease_failures = 0
+        try:
+            for candidate in candidates:
+                card_id = self._candidate_card_id(candidate)
+                if not card_id:
+                    continue
+                if len(in_flight) >= limit:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    finished.extend(done)
+                    if any(not task.cancelled() and task.exception() is not None for task in done):
+                        break
+                try:
+                    lease = await self._acquire_required_lease(card_id)
+                except LeaseNotAvailableError:
+                    consecutive_lease_failures += 1
+                    if consecutive_lease_failures >= failure_limit:
+                        log_event(
+                            "gitea_worker_claim_backpressure",
+                            {
+                                "worker_id": self.worker_id,
+                                "consecutive_lease_failures": consecutive_lease_failures,
+                                "in_flight": len(in_flight),
+                            },
+                        )
+                        break
+                    continue
+                consecutive_lease_failures = 0
+                consumed += 1
+                in_flight.add(
+                    asyncio.create_task(
+                        self._execute_claimed(card_id=card_id, card=candidate, lease=lease, work_fn=work_fn)
+                    )
+                )
+        finally:
+            if in_flight:
+                done, _pending = await asyncio.wait(in_flight)
+                finished.extend(done)
+        for task in finished:
+            error = None if task.cancelled() else task.exception()
+            if error is not None:
+                raise error
+        return consumed
+
+    async def _execute_claimed(
+        self,
+        *,
+        card_id: str,
+        card: dict[str, Any],
+        lease: dict[str, Any],
+        work_fn: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+    ) -> None:
+        reservation_id = await self._publish_claim_reservation_if_enabled(card_id=card_id, lease_observation=lease)
+        await self._publish_claimed_lease_if_enabled(
+            card_id=card_id,
+            lease_observation=lease,
+            source_reservation_id=reservation_id,
+        )
+        run, attempt = await self._begin_claimed_execution_if_enabled(
+            card_id=card_id,
+            card=card,
+            lease_observation=lease,
+        )
+        await self._publish_pre_effect_checkpoint_if_enabled(
+            card_id=card_id,
+            card=card,
+            lease_observation=lease,
+            run=run,
+            attempt=attempt,
+        )
+        await self._run_claimed(
+            card_id=card_id,
+            card=card,
+            work_fn=work_fn,
+            lease_epoch=self._lease_epoch(lease),
+            lease_observation=lease if isinstance(lease, dict) else None,
+            control_plane_run_id=None if run is None else run.run_id,
+            control_plane_attempt_id=None if attempt is None else attempt.attempt_id,
+            control_plane_reservation_id=reservation_id,
+        )
+
+    @staticmethod
+    def _candidate_card_id(candidate: dict[str, Any]) -> str:
+        return str(candidate.get("issue_number") or candidate.get("card_id") or "").strip()
+
     async def _acquire_required_lease(self, card_id: str) -> dict[str, Any]:
         lease = await self.adapter.acquire_lease(
             card_id,
@@ -11,6 +11,9 @@ from typing import Any
 class GiteaStateWorkerCoordinator:
     """
     Bounded coordinator loop for repeatedly invoking a GiteaStateWorker.
+
+    With ``max_in_flight`` above one, each iteration drains one fetched candidate
+    list through ``worker.run_concurrent`` instead of claiming a single card.
     """
 
     def __init__(
@@ -22,6 +25,7 @@ class GiteaStateWorkerCoordinator:
         max_idle_streak: int = 10,
         max_duration_seconds: float = 60.0,
         idle_sleep_seconds: float = 0.0,
+        max_in_flight: int = 1,
     ):
         self.worker = worker
         self.fetch_limit = max(1, int(fetch_limit))
@@ -29,6 +33,7 @@ class GiteaStateWorkerCoordinator:
         self.max_idle_streak = max(1, int(max_idle_streak))
         self.max_duration_seconds = max(0.0, float(max_duration_seconds))
         self.idle_sleep_seconds = max(0.0, float(idle_sleep_seconds))
+        self.max_in_flight = max(1, int(max_in_flight))
 
     async def run(
         self,
@@ -49,11 +54,11 @@ class GiteaStateWorkerCoordinator:
                 stop_reason = "max_duration_seconds"
                 break
 
-            consumed = bool(await self.worker.run_once(work_fn=work_fn, fetch_limit=self.fetch_limit))
+            consumed = await self._run_iteration(work_fn=work_fn)
             iterations += 1
 
             if consumed:
-                consumed_count += 1
+                consumed_count += consumed
                 idle_streak = 0
                 continue
 
@@ -72,9 +77,21 @@ class GiteaStateWorkerCoordinator:
             "idle_count": idle_count,
             "stop_reason": stop_reason,
             "elapsed_ms": elapsed_ms,
+            "max_in_flight": self.max_in_flight,
         }
         if summary_out is not None:
             out_path = Path(summary_out)
             out_path.parent.mkdir(parents=True, exist_ok=True)
             await asyncio.to_thread(out_path.write_text, json.dumps(summary, indent=2), encoding="utf-8")
         return summary
+
+    async def _run_iteration(self, *, work_fn: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]) -> int:
+        if self.max_in_flight <= 1:
+            return int(bool(await self.worker.run_once(work_fn=work_fn, fetch_limit=self.fetch_limit)))
+        return int(
+            await self.worker.run_concurrent(
+                work_fn=work_fn,
+                fetch_limit=max(self.fetch_limit, self.max_in_flight),
+                max_in_flight=self.max_in_flight,
+            )
+        )
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from orket.instrumentation import MODEL_COLD_STARTS, MODEL_LOAD_SECONDS, MODEL_WARM_EVICTIONS
+from orket.logging import log_event
+
+_PARAMETER_COUNT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)b", re.IGNORECASE)
+# Roughly 4-bit weights plus KV cache and runtime overhead.
+_MB_PER_BILLION_PARAMETERS = 700.0
+DEFAULT_MODEL_MEMORY_MB = 4096.0
+
+
+class ModelWarmBackend(Protocol):
+    """Backend operations the warm-state manager drives.
+
+    ``prewarm`` matches ``ModelStreamProvider.prewarm``; ``keep_alive`` extends a resident
+    model's residency; ``unload`` releases it.
+    """
+
+    async def prewarm(self, model_id: str) -> None: ...
+
+    async def keep_alive(self, model_id: str) -> None: ...
+
+    async def unload(self, model_id: str) -> None: ...
+
+
+def estimate_model_memory_mb(model_id: str, *, default_mb: float = DEFAULT_MODEL_MEMORY_MB) -> float:
+    match = _PARAMETER_COUNT_PATTERN.search(str(model_id or ""))
+    if not match:
+        return float(default_mb)
+    return float(match.group(1)) * _MB_PER_BILLION_PARAMETERS
+
+
+@dataclass
+class _ResidentModel:
+    memory_mb: float
+    last_needed: float
+    last_touched: float
+
+
+class ModelWarmStateManager:
+    """Track resident models and keep the ones upcoming turns need warm.
+
+    A model is resident from the moment it is loaded until ``keep_alive_seconds`` pass without
+    a turn or keep-alive touching it, mirroring how local backends unload idle models. Loads
+    that would exceed ``memory_budget_mb`` first unload the least recently needed resident
+    models; models the current wave needs are never evicted for a prewarm.
+    """
+
+    def __init__(
+        self,
+        backend: ModelWarmBackend,
+        *,
+        memory_budget_mb: float,
+        keep_alive_seconds: float = 300.0,
+        model_memory_mb: Callable[[str], float] = estimate_model_memory_mb,
+        clock: Callable[[], float] = time.monotonic,
+        workspace: Any = None,
+    ) -> None:
+        self.backend = backend
+        self.memory_budget_mb = max(0.0, float(memory_budget_mb))
+        self.keep_alive_seconds = max(1.0, float(keep_alive_seconds))
+        self.model_memory_mb = model_memory_mb
+        self.clock = clock
+        self.workspace = workspace
+        self._resident: dict[str, _ResidentModel] = {}
+        self._lock = asyncio.Lock()
+        self._stats: dict[str, Any] = {
+            "cold_starts": 0,
+            "cold_start_seconds": 0.0,
+            "prewarms": 0,
+            "prewarm_seconds": 0.0,
+            "keep_alives": 0,
+            "evictions": 0,
+            "backend_errors": 0,
+        }
+
+    def resident_models(self) -> list[str]:
+        self._expire_idle(self.clock())
+        return sorted(self._resident)
+
+    def used_memory_mb(self) -> float:
+        return sum(model.memory_mb for model in self._resident.values())
+
+    async def ensure_warm(self, model_id: str, *, protected: Iterable[str] = ()) -> bool:
+        """Make ``model_id`` resident for an imminent turn; return True when that was a cold start."""
+        async with self._lock:
+            now = self.clock()
+            self._expire_idle(now)
+            resident = self._resident.get(model_id)
+            if resident is not None:
+                resident.last_needed = now
+                resident.last_touched = now
+                return False
+            await self._load(model_id, reason="cold_start", protected={model_id, *protected}, required=True)
+            return True
+
+    async def prewarm(self, model_ids: Iterable[str], *, protected: Iterable[str] = ()) -> list[str]:
+        """Load models ahead of need while they fit the budget without evicting ``protected`` models."""
+        loaded: list[str] = []
+        async with self._lock:
+            keep = set(protected)
+            for model_id in dict.fromkeys(model_ids):
+                self._expire_idle(self.clock())
+                if model_id in self._resident:
+                    keep.add(model_id)
+                    continue
+                if await self._load(model_id, reason="prewarm", protected=keep | {model_id}, required=False):
+                    loaded.append(model_id)
+                    keep.add(model_id)
+        return loaded
+
+    async def prepare_wave(self, needed: Sequence[str]) -> list[str]:
+        """Make every model a dispatch wave needs resident; return the ones that were cold starts."""
+        return [model_id for model_id in dict.fromkeys(needed) if await self.ensure_warm(model_id, protected=needed)]
+
+    async def send_keep_alives(self) -> int:
+        """Refresh resident models that would go idle before the next keep-alive tick."""
+        sent = 0
+        async with self._lock:
+            now = self.clock()
+            self._expire_idle(now)
+            for model_id, resident in list(self._resident.items()):
+                if now - resident.last_touched < self.keep_alive_seconds / 2:
+                    continue
+                try:
+                    await self.backend.keep_alive(model_id)
+                except (OSError, RuntimeError, ValueError) as exc:
+                    self._backend_error("keep_alive", model_id, exc)
+                    continue
+                resident.last_touched = self.clock()
+                sent += 1
+            self._stats["keep_alives"] += sent
+        return sent
+
+    async def run_keep_alive_loop(self, stop: asyncio.Event) -> None:
+        interval = self.keep_alive_seconds / 2
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except TimeoutError:
+                await self.send_keep_alives()
+
+    def report(self) -> dict[str, Any]:
+        report = dict(self._stats)
+        report["cold_start_seconds"] = round(report["cold_start_seconds"], 6)
+        report["prewarm_seconds"] = round(report["prewarm_seconds"], 6)
+        report["resident_models"] = self.resident_models()
+        report["used_memory_mb"] = round(self.used_memory_mb(), 1)
+        report["memory_budget_mb"] = self.memory_budget_mb
+        return report
+
+    async def _load(self, model_id: str, *, reason: str, protected: set[str], required: bool) -> bool:
+        memory_mb = float(self.model_memory_mb(model_id))
+        victims, fits = self._eviction_plan(memory_mb, protected)
+        if not fits and not required:
+            return False
+        for victim in victims:
+            await self._unload(victim)
+        started = self.clock()
+        try:
+            await self.backend.prewarm(model_id)
+        except (OSError, RuntimeError, ValueError) as exc:
+            self._backend_error(reason, model_id, exc)
+            return False
+        finished = self.clock()
+        elapsed = max(0.0, finished - started)
+        self._resident[model_id] = _ResidentModel(memory_mb=memory_mb, last_needed=finished, last_touched=finished)
+        MODEL_LOAD_SECONDS.observe(elapsed, model_id, reason)
+        if reason == "cold_start":
+            MODEL_COLD_STARTS.inc(model_id)
+            self._stats["cold_starts"] += 1
+            self._stats["cold_start_seconds"] += elapsed
+        else:
+            self._stats["prewarms"] += 1
+            self._stats["prewarm_seconds"] += elapsed
+        return True
+
+    def _eviction_plan(self, memory_mb: float, protected: set[str]) -> tuple[list[str], bool]:
+        """Least recently needed unprotected models to unload so ``memory_mb`` fits, and whether it then fits."""
+        victims: list[str] = []
+        used = self.used_memory_mb()
+        candidates = sorted(
+            (item for item in self._resident.items() if item[0] not in protected),
+            key=lambda item: item[1].last_needed,
+        )
+        for model_id, resident in candidates:
+            if used + memory_mb <= self.memory_budget_mb:
+                break
+            victims.append(model_id)
+            used -= resident.memory_mb
+        return victims, used + memory_mb <= self.memory_budget_mb
+
+    async def _unload(self, model_id: str) -> None:
+        self._resident.pop(model_id, None)
+        self._stats["evictions"] += 1
+        MODEL_WARM_EVICTIONS.inc(model_id)
+        try:
+            await self.backend.unload(model_id)
+        except (OSError, RuntimeError, ValueError) as exc:
+            self._backend_error("unload", model_id, exc)
+
+    def _expire_idle(self, now: float) -> None:
+        for model_id, resident in list(self._resident.items()):
+            if now - resident.last_touched > self.keep_alive_seconds:
+                del self._resident[model_id]
+
+    def _backend_error(self, operation: str, model_id: str, exc: Exception) -> None:
+        self._stats["backend_errors"] += 1
+        log_event(
+            "model_warm_state_backend_error",
+            {"operation": operation, "model": model_id, "error": str(exc)},
+            workspace=self.workspace,
+        )
+
+
+def resolve_model_warm_state_settings() -> dict[str, Any] | None:
+    """Warm-state settings from ``ORKET_MODEL_WARM_STATE`` and friends; None when disabled (the default)."""
+    enabled = str(os.getenv("ORKET_MODEL_WARM_STATE", "")).strip().lower() in {"1", "true", "yes", "on"}
+    if not enabled:
+        return None
+    return {
+        "memory_budget_mb": float(os.getenv("ORKET_MODEL_WARM_MEMORY_BUDGET_MB", "16384")),
+        "keep_alive_seconds": float(os.getenv("ORKET_MODEL_KEEP_ALIVE_SECONDS", "300")),
+    }
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
+import os
 from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass, replace
@@ -18,8 +21,11 @@ from orket.core.domain.outward_ledger import (
     normalize_event_groups,
     verify_ledger_export,
 )
-from orket.core.domain.outward_run_events import LedgerEvent
+from orket.core.domain.outward_run_events import LedgerCheckpoint, LedgerEvent
 from orket.core.domain.outward_runs import OutwardRunRecord
+from orket.logging import log_event
+
+LEDGER_CHECKPOINT_INTERVAL = 256
 
 
 class OutwardLedgerValidationError(ValueError):
@@ -33,17 +39,36 @@ class _HashedEvent:
     previous_chain_hash: str
 
 
+@dataclass(frozen=True)
+class _HashedLedger:
+    events: list[_HashedEvent]
+    verified_through: int
+
+
 class OutwardLedgerService:
+    """Exports and verifies a run's hash-chained ledger.
+
+    Events are chained by the event store at append time. Every ``checkpoint_interval`` newly
+    verified events, the service stores an HMAC-signed checkpoint of the chain head; later
+    exports and verifications trust the chain up to the newest checkpoint that still matches
+    the stored rows and only rehash the events after it. Without
+    ``ORKET_OUTWARD_LEDGER_CHECKPOINT_HMAC_KEY`` checkpoints are neither written nor trusted,
+    so every export rehashes the whole run.
+    """
+
     def __init__(
         self,
         *,
         run_store: OutwardRunStore,
         event_store: OutwardRunEventStore,
         utc_now: Callable[[], str],
+        checkpoint_interval: int = LEDGER_CHECKPOINT_INTERVAL,
     ) -> None:
         self.run_store = run_store
         self.event_store = event_store
         self.utc_now = utc_now
+        self.checkpoint_interval = max(1, int(checkpoint_interval))
+        self._missing_key_logged = False
 
     async def export(
         self,
@@ -54,6 +79,30 @@ class OutwardLedgerService:
         operator_ref: str = "operator:api",
         record_request: bool = False,
     ) -> dict[str, Any]:
+        payload, _ = await self._export(
+            run_id,
+            types=types,
+            include_pii=include_pii,
+            operator_ref=operator_ref,
+            record_request=record_request,
+        )
+        return payload
+
+    async def verify_run(self, run_id: str) -> dict[str, Any]:
+        payload, ledger = await self._export(
+            run_id, types=("all",), include_pii=False, operator_ref="operator:api", record_request=False
+        )
+        return verify_ledger_export(payload, trusted_through=ledger.verified_through)
+
+    async def _export(
+        self,
+        run_id: str,
+        *,
+        types: tuple[str, ...],
+        include_pii: bool,
+        operator_ref: str,
+        record_request: bool,
+    ) -> tuple[dict[str, Any], _HashedLedger]:
         run = await self._require_run(run_id)
         try:
             groups = normalize_event_groups(types)
@@ -68,9 +117,10 @@ class OutwardLedgerService:
                 include_pii=include_pii,
                 operator_ref=operator_ref,
             )
-        events = await self._ensure_hashes(run.run_id)
+        ledger = await self._ensure_hashes(run.run_id)
+        events = ledger.events
         disclosed = _disclosed_events(events, groups)
-        return {
+        payload = {
             "schema_version": SCHEMA_VERSION,
             "export_scope": export_scope,
             "run_id": run.run_id,
@@ -96,10 +146,7 @@ class OutwardLedgerService:
                 "meaning": "full canonical ledger" if export_scope == "all" else "partial verified view",
             },
         }
-
-    async def verify_run(self, run_id: str) -> dict[str, Any]:
-        payload = await self.export(run_id, types=("all",), include_pii=False, record_request=False)
-        return verify_ledger_export(payload)
+        return payload, ledger
 
     async def _require_run(self, run_id: str) -> OutwardRunRecord:
         clean_run_id = str(run_id or "").strip()
@@ -120,8 +167,8 @@ class OutwardLedgerService:
         operator_ref: str,
     ) -> None:
         requested_at = self.utc_now()
-        existing_events = await self.event_store.list_for_run(run.run_id, limit=5000)
-        event_id = f"run:{run.run_id}:ledger_export_requested:{len(existing_events) + 1:04d}"
+        existing_count = await self.event_store.count_for_run(run.run_id)
+        event_id = f"run:{run.run_id}:ledger_export_requested:{existing_count + 1:04d}"
         await self.event_store.append(
             LedgerEvent(
                 event_id=event_id,
@@ -141,25 +188,108 @@ class OutwardLedgerService:
             )
         )
 
-    async def _ensure_hashes(self, run_id: str) -> list[_HashedEvent]:
-        events = await self.event_store.list_for_run(run_id, limit=5000)
+    async def _ensure_hashes(self, run_id: str) -> _HashedLedger:
+        events = await self.event_store.list_for_run(run_id, limit=None)
+        checkpoint_key = self._checkpoint_key()
+        checkpoint = await self._trusted_checkpoint(run_id, events, checkpoint_key)
+        start = checkpoint.position if checkpoint is not None else 0
         previous_chain_hash = GENESIS_CHAIN_HASH
         hashed_events: list[_HashedEvent] = []
+        repairs: list[tuple[str, str, str]] = []
         for position, event in enumerate(events, start=1):
-            event_hash = event_hash_for(event)
-            chain_hash = chain_hash_for(previous_chain_hash, event_hash)
-            if event.event_hash != event_hash or event.chain_hash != chain_hash:
-                await self.event_store.update_hashes(
-                    event_id=event.event_id,
-                    event_hash=event_hash,
-                    chain_hash=chain_hash,
-                )
-            hashed_event = replace(event, event_hash=event_hash, chain_hash=chain_hash)
+            if position <= start:
+                hashed_event = event
+            else:
+                event_hash = event_hash_for(event)
+                chain_hash = chain_hash_for(previous_chain_hash, event_hash)
+                if event.event_hash != event_hash or event.chain_hash != chain_hash:
+                    repairs.append((event.event_id, event_hash, chain_hash))
+                hashed_event = replace(event, event_hash=event_hash, chain_hash=chain_hash)
             hashed_events.append(
                 _HashedEvent(event=hashed_event, position=position, previous_chain_hash=previous_chain_hash)
             )
-            previous_chain_hash = chain_hash
-        return hashed_events
+            previous_chain_hash = str(hashed_event.chain_hash)
+        await self.event_store.update_hashes_many(repairs)
+        if checkpoint_key is not None and len(hashed_events) - start >= self.checkpoint_interval:
+            tail = hashed_events[-1]
+            await self.event_store.save_checkpoint(
+                _signed_checkpoint(
+                    checkpoint_key,
+                    run_id=run_id,
+                    position=tail.position,
+                    event_id=tail.event.event_id,
+                    chain_hash=str(tail.event.chain_hash),
+                    created_at=self.utc_now(),
+                )
+            )
+        return _HashedLedger(events=hashed_events, verified_through=start)
+
+    def _checkpoint_key(self) -> bytes | None:
+        key = _checkpoint_hmac_key()
+        if key is None and not self._missing_key_logged:
+            self._missing_key_logged = True
+            log_event(
+                "outward_ledger_checkpoints_disabled",
+                {"reason": "ORKET_OUTWARD_LEDGER_CHECKPOINT_HMAC_KEY is not set; ledgers are rehashed in full"},
+            )
+        return key
+
+    async def _trusted_checkpoint(
+        self, run_id: str, events: list[LedgerEvent], key: bytes | None
+    ) -> LedgerCheckpoint | None:
+        """Return the newest checkpoint whose signature and anchor row still match; others are skipped, not deleted."""
+        if key is None:
+            return None
+        for checkpoint in await self.event_store.list_checkpoints(run_id):
+            anchor = events[checkpoint.position - 1] if 0 < checkpoint.position <= len(events) else None
+            if (
+                anchor is not None
+                and _checkpoint_signed(key, checkpoint)
+                and anchor.event_id == checkpoint.event_id
+                and anchor.chain_hash == checkpoint.chain_hash
+            ):
+                return checkpoint
+        return None
+
+
+def _checkpoint_hmac_key() -> bytes | None:
+    configured = str(os.environ.get("ORKET_OUTWARD_LEDGER_CHECKPOINT_HMAC_KEY") or "").strip()
+    return configured.encode("utf-8") if configured else None
+
+
+def _checkpoint_signature(
+    key: bytes, *, run_id: str, position: int, event_id: str, chain_hash: str, created_at: str
+) -> str:
+    message = f"{run_id}\n{position}\n{event_id}\n{chain_hash}\n{created_at}"
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _signed_checkpoint(
+    key: bytes, *, run_id: str, position: int, event_id: str, chain_hash: str, created_at: str
+) -> LedgerCheckpoint:
+    return LedgerCheckpoint(
+        run_id=run_id,
+        position=position,
+        event_id=event_id,
+        chain_hash=chain_hash,
+        created_at=created_at,
+        signature=_checkpoint_signature(
+            key,
+            run_id=run_id, position=position, event_id=event_id, chain_hash=chain_hash, created_at=created_at
+        ),
+    )
+
+
+def _checkpoint_signed(key: bytes, checkpoint: LedgerCheckpoint) -> bool:
+    expected = _checkpoint_signature(
+        key,
+        run_id=checkpoint.run_id,
+        position=checkpoint.position,
+        event_id=checkpoint.event_id,
+        chain_hash=checkpoint.chain_hash,
+        created_at=checkpoint.created_at,
+    )
+    return hmac.compare_digest(expected, checkpoint.signature)
 
 
 def _disclosed_events(events: list[_HashedEvent], groups: tuple[str, ...]) -> list[_HashedEvent]:
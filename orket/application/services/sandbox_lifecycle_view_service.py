@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Protocol, TypeAlias
+from typing import Any, Protocol, TypeAlias, runtime_checkable
 
 from orket.application.services.sandbox_control_plane_resource_service import (
     SandboxControlPlaneResourceService,
@@ -43,6 +43,20 @@ class SandboxLifecycleReadRepository(Protocol):
     ) -> list[SandboxLifecycleEventRecord]: ...
 
 
+@runtime_checkable
+class SandboxLifecycleRevisionRepository(SandboxLifecycleReadRepository, Protocol):
+    async def list_record_revisions(self) -> dict[str, int]: ...
+
+    async def get_record(self, sandbox_id: str) -> SandboxLifecycleRecord | None: ...
+
+
+@dataclass(frozen=True)
+class _MaterializedLifecycleRow:
+    revision: int
+    record: SandboxLifecycleRecord
+    restart_summary: dict[str, Any]
+
+
 @dataclass(frozen=True)
 class SandboxLifecycleOperatorView:
     sandbox_id: str
@@ -97,7 +111,13 @@ class SandboxLifecycleOperatorView:
 
 
 class SandboxLifecycleViewService:
-    """Projects durable lifecycle records into operator-facing read models."""
+    """Projects durable lifecycle records into operator-facing read models.
+
+    When the repository exposes per-record view revisions, the lifecycle part of each view
+    (record and restart summary) is materialized in memory and refreshed only for sandboxes
+    whose record or events changed since the previous listing. Control-plane fields are
+    still read per listing because they are written outside the lifecycle repository.
+    """
 
     def __init__(
         self,
@@ -109,12 +129,11 @@ class SandboxLifecycleViewService:
         self.repository = repository
         self.control_plane_repository = control_plane_repository
         self.control_plane_execution_repository = control_plane_execution_repository
+        self._materialized: dict[str, _MaterializedLifecycleRow] = {}
 
     async def list_views(self, *, observed_at: str) -> list[SandboxLifecycleOperatorView]:
-        records = await self.repository.list_records()
         views: list[SandboxLifecycleOperatorView] = []
-        for record in records:
-            events = await self.repository.list_events(record.sandbox_id)
+        for record, restart_summary in await self._lifecycle_rows():
             operator_actions = await self._operator_actions_for_record(record)
             run_record, attempt_record = await self._execution_authority_for_record(record)
             control_plane_summary = await self._control_plane_record_summary(record, attempt_record=attempt_record)
@@ -122,7 +141,7 @@ class SandboxLifecycleViewService:
                 self.build_view(
                     record=record,
                     observed_at=observed_at,
-                    events=events,
+                    restart_summary=restart_summary,
                     operator_actions=operator_actions,
                     run_record=run_record,
                     attempt_record=attempt_record,
@@ -131,12 +150,37 @@ class SandboxLifecycleViewService:
             )
         return sorted(views, key=lambda item: (item.cleanup_due_at or "", item.sandbox_id))
 
+    async def _lifecycle_rows(self) -> list[tuple[SandboxLifecycleRecord, dict[str, Any]]]:
+        if not isinstance(self.repository, SandboxLifecycleRevisionRepository):
+            records = await self.repository.list_records()
+            return [
+                (record, self._restart_summary(await self.repository.list_events(record.sandbox_id)))
+                for record in records
+            ]
+        revisions = await self.repository.list_record_revisions()
+        for sandbox_id in set(self._materialized) - set(revisions):
+            del self._materialized[sandbox_id]
+        for sandbox_id, revision in revisions.items():
+            cached = self._materialized.get(sandbox_id)
+            if cached is not None and cached.revision == revision:
+                continue
+            record = await self.repository.get_record(sandbox_id)
+            if record is None:
+                self._materialized.pop(sandbox_id, None)
+                continue
+            events = await self.repository.list_events(sandbox_id)
+            self._materialized[sandbox_id] = _MaterializedLifecycleRow(
+                revision=revision, record=record, restart_summary=self._restart_summary(events)
+            )
+        return [(row.record, row.restart_summary) for row in self._materialized.values()]
+
     def build_view(
         self,
         *,
         record: SandboxLifecycleRecord,
         observed_at: str,
         events: list[SandboxLifecycleEventRecord] | None = None,
+        restart_summary: dict[str, Any] | None = None,
         operator_actions: list[OperatorActionRecord] | None = None,
         run_record: RunRecord | None = None,
         attempt_record: AttemptRecord | None = None,
@@ -166,7 +210,7 @@ class SandboxLifecycleViewService:
             cleanup_owner_instance_id=record.cleanup_owner_instance_id,
             lease_expires_at=record.lease_expires_at,
             heartbeat_age_seconds=heartbeat_age,
-            restart_summary=self._restart_summary(events),
+            restart_summary=dict(restart_summary) if restart_summary is not None else self._restart_summary(events),
             cleanup_eligible=cleanup_eligible,
             cleanup_due_at=record.cleanup_due_at,
             requires_reconciliation=record.requires_reconciliation,
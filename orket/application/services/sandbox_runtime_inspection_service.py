@@ -6,6 +6,7 @@ from typing import Any
 from orket.adapters.storage.command_runner import CommandRunner
 
 OPTIONAL_SANDBOX_HEALTH_SERVICES = frozenset({"pgadmin", "mongo-express"})
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
 
 
 class SandboxRuntimeInspectionService:
@@ -15,24 +16,35 @@ class SandboxRuntimeInspectionService:
         self.command_runner = command_runner
 
     async def list_project_container_rows(self, *, compose_project: str) -> list[dict[str, Any]]:
+        rows_by_project = await self._list_container_rows(f"label={COMPOSE_PROJECT_LABEL}={compose_project}")
+        rows = [row for project_rows in rows_by_project.values() for row in project_rows]
+        return sorted(rows, key=lambda item: str(item.get("Name") or ""))
+
+    async def list_container_rows_by_project(self) -> dict[str, list[dict[str, Any]]]:
+        """Return container rows for every compose project from a single ``docker ps`` call."""
+        rows_by_project = await self._list_container_rows(f"label={COMPOSE_PROJECT_LABEL}")
+        rows_by_project.pop("", None)
+        return rows_by_project
+
+    async def _list_container_rows(self, label_filter: str) -> dict[str, list[dict[str, Any]]]:
         result = await self.command_runner.run_async(
             "docker",
             "ps",
             "-a",
             "--filter",
-            f"label=com.docker.compose.project={compose_project}",
+            label_filter,
             "--format",
             "{{json .}}",
         )
         if result.returncode != 0:
-            return []
-        rows: list[dict[str, Any]] = []
+            return {}
+        rows_by_project: dict[str, list[dict[str, Any]]] = {}
         for row in self._parse_rows(result.stdout):
             name = str(row.get("Names") or "").strip()
             if not name:
                 continue
             labels = self._parse_label_blob(row.get("Labels"))
-            rows.append(
+            rows_by_project.setdefault(str(labels.get(COMPOSE_PROJECT_LABEL) or "").strip(), []).append(
                 {
                     "Name": name,
                     "Service": str(labels.get("com.docker.compose.service") or "").strip(),
@@ -40,7 +52,10 @@ class SandboxRuntimeInspectionService:
                     "Status": str(row.get("Status") or "").strip(),
                 }
             )
-        return sorted(rows, key=lambda item: str(item.get("Name") or ""))
+        return {
+            project: sorted(rows, key=lambda item: str(item.get("Name") or ""))
+            for project, rows in rows_by_project.items()
+        }
 
     @staticmethod
     def tracked_container_rows(container_rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from datetime import UTC, datetime, timedelta
@@ -451,26 +452,53 @@ class SandboxRuntimeLifecycleService:
             ),
         ]
 
+    async def _observe_all_project_resources(self) -> dict[str, list[ObservedDockerResource]]:
+        """Observe resources of every compose project with one listing per resource type."""
+        listings = await asyncio.gather(
+            *(
+                self._list_resources(
+                    compose_project=None,
+                    resource_type=resource_type,
+                    command=command,
+                    name_field=name_field,
+                )
+                for resource_type, command, name_field in (
+                    (DockerResourceType.CONTAINER, ("docker", "ps", "-a"), "Names"),
+                    (DockerResourceType.NETWORK, ("docker", "network", "ls"), "Name"),
+                    (DockerResourceType.MANAGED_VOLUME, ("docker", "volume", "ls"), "Name"),
+                )
+            )
+        )
+        resources_by_project: dict[str, list[ObservedDockerResource]] = {}
+        for resources in listings:
+            for resource in resources:
+                compose_project = str(resource.labels.get("com.docker.compose.project") or "").strip()
+                if compose_project:
+                    resources_by_project.setdefault(compose_project, []).append(resource)
+        return resources_by_project
+
     async def _list_resources(
         self,
         *,
-        compose_project: str,
+        compose_project: str | None,
         resource_type: DockerResourceType,
         command: tuple[str, ...],
         name_field: str,
     ) -> list[ObservedDockerResource]:
+        label_filter = "label=com.docker.compose.project"
+        if compose_project is not None:
+            label_filter = f"{label_filter}={compose_project}"
         result = await self.command_runner.run_async(
             *command,
             "--filter",
-            f"label=com.docker.compose.project={compose_project}",
+            label_filter,
             "--format",
             "{{json .}}",
         )
         if result.returncode != 0:
             detail = result.stderr.strip() or f"returncode={result.returncode}"
-            raise RuntimeError(
-                f"Failed to observe {resource_type.value} resources for compose project '{compose_project}': {detail}"
-            )
+            target = "all compose projects" if compose_project is None else f"compose project '{compose_project}'"
+            raise RuntimeError(f"Failed to observe {resource_type.value} resources for {target}: {detail}")
         return [
             ObservedDockerResource(
                 resource_type=resource_type,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -20,6 +22,7 @@ from orket.core.domain.sandbox_lifecycle import (
 )
 from orket.core.domain.sandbox_lifecycle_records import SandboxLifecycleRecord
 from orket.core.domain.verification import AGENT_OUTPUT_DIR
+from orket.logging import log_event
 
 if TYPE_CHECKING:
     from orket.application.services.sandbox_runtime_lifecycle_service import SandboxRuntimeLifecycleService
@@ -33,6 +36,7 @@ class SandboxRuntimeRecoveryService:
         self.scheduler = SandboxCleanupSchedulerService(lifecycle_service.mutations)
         self.restart_policy = SandboxRestartPolicyService(lifecycle_service=lifecycle_service)
         self.runtime_inspector = SandboxRuntimeInspectionService(command_runner=lifecycle_service.command_runner)
+        self.last_sweep_metrics: dict[str, object] = {}
 
     async def reconcile_sandbox(self, *, sandbox_id: str) -> SandboxLifecycleRecord:
         record = await self.lifecycle_service.repository.get_record(sandbox_id)
@@ -95,23 +99,67 @@ class SandboxRuntimeRecoveryService:
         )
         return record if result is None else result.record
 
-    async def sweep_due_cleanups(self, *, max_records: int = 1) -> list[SandboxLifecycleRecord]:
+    async def sweep_due_cleanups(
+        self, *, max_records: int = 1, concurrency: int = 1
+    ) -> list[SandboxLifecycleRecord]:
+        """Claim and clean up to ``max_records`` due sandboxes in batches of ``concurrency``.
+
+        Claims stay sequential so the compare-and-set fence decides ownership; the claimed
+        cleanups of a batch run concurrently. Sweep timing is kept in ``last_sweep_metrics``.
+        """
         if max_records < 1:
             return []
+        started = time.perf_counter()
+        batch_size = max(1, int(concurrency))
         cleaned: list[SandboxLifecycleRecord] = []
         sweep_token = uuid4().hex
-        for index in range(max_records):
-            try:
-                claimed = await self.scheduler.claim_next_due_cleanup(
-                    observed_at=self.lifecycle_service._now(),
-                    claimant_id=self.lifecycle_service.instance_id,
-                    operation_id_prefix=f"cleanup-sweep:{sweep_token}:{index}",
-                )
+        claimed_count = 0
+        failed_count = 0
+        batches = 0
+        index = 0
+        exhausted = False
+        while index < max_records and not exhausted:
+            batch: list[SandboxLifecycleRecord] = []
+            while index < max_records and len(batch) < batch_size:
+                operation_index = index
+                index += 1
+                try:
+                    claimed = await self.scheduler.claim_next_due_cleanup(
+                        observed_at=self.lifecycle_service._now(),
+                        claimant_id=self.lifecycle_service.instance_id,
+                        operation_id_prefix=f"cleanup-sweep:{sweep_token}:{operation_index}",
+                    )
+                except (SandboxLifecycleError, ValueError):
+                    continue
                 if claimed is None:
+                    exhausted = True
                     break
-                cleaned.append(await self._execute_claimed_cleanup(record=claimed.record))
-            except (SandboxLifecycleError, ValueError):
+                batch.append(claimed.record)
+            if not batch:
                 continue
+            batches += 1
+            claimed_count += len(batch)
+            results = await asyncio.gather(
+                *(self._execute_claimed_cleanup(record=record) for record in batch),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, (SandboxLifecycleError, ValueError)):
+                    failed_count += 1
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                cleaned.append(result)
+        self.last_sweep_metrics = {
+            "max_records": max_records,
+            "concurrency": batch_size,
+            "batches": batches,
+            "claimed": claimed_count,
+            "cleaned": len(cleaned),
+            "failed": failed_count,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        log_event("sandbox_cleanup_sweep_completed", dict(self.last_sweep_metrics))
         return cleaned
 
     async def preview_due_cleanups(self, *, max_records: int = 1) -> list[dict[str, object]]:
@@ -144,13 +192,20 @@ class SandboxRuntimeRecoveryService:
         if not isinstance(rows, list):
             raise RuntimeError("docker-compose ls returned an unexpected payload.")
         known_projects = {record.compose_project for record in await self.lifecycle_service.repository.list_records()}
+        candidates = [
+            compose_project
+            for compose_project in (str((row or {}).get("Name") or "").strip() for row in rows)
+            if compose_project.startswith("orket-sandbox-") and compose_project not in known_projects
+        ]
         created: list[SandboxLifecycleRecord] = []
+        if not candidates:
+            return created
+        resources_by_project = await self.lifecycle_service._observe_all_project_resources()
         observed_at = self.lifecycle_service._now()
-        for row in rows:
-            compose_project = str((row or {}).get("Name") or "").strip()
-            if not compose_project.startswith("orket-sandbox-") or compose_project in known_projects:
+        for compose_project in candidates:
+            if compose_project in known_projects:
                 continue
-            observed_resources = await self.lifecycle_service._observe_project_resources(compose_project)
+            observed_resources = resources_by_project.get(compose_project, [])
             if not observed_resources:
                 continue
             record = self._build_orphan_record(
@@ -273,17 +273,18 @@ class Orchestrator:
         resume_mode: bool = False,
         model_override: str | None = None,
     ) -> list[IssueConfig]:
-        return cast(list[IssueConfig], await orchestrator_ops.execute_epic(
-            self,
-            active_build=active_build,
-            run_id=run_id,
-            epic=epic,
-            team=team,
-            env=env,
-            target_issue_id=cast(Any, target_issue_id),
-            resume_mode=resume_mode,
-            model_override=model_override,
-        ))
+        async with orchestrator_ops._model_warm_state_scope(self, run_id=run_id, env=env):
+            return cast(list[IssueConfig], await orchestrator_ops.execute_epic(
+                self,
+                active_build=active_build,
+                run_id=run_id,
+                epic=epic,
+                team=team,
+                env=env,
+                target_issue_id=cast(Any, target_issue_id),
+                resume_mode=resume_mode,
+                model_override=model_override,
+            ))
 
     async def _save_checkpoint(
         self,
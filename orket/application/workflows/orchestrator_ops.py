@@ -2,6 +2,8 @@ import asyncio
 import inspect
 import json
 import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
@@ -15,6 +17,10 @@ from orket.application.services.deployment_planner import (
     DeploymentPlanner,
     DeploymentValidationError,
 )
+from orket.application.services.model_warm_state_manager import (
+    ModelWarmStateManager,
+    resolve_model_warm_state_settings,
+)
 from orket.application.services.orchestrator_review_preflight_service import (
     OrchestratorReviewPreflightService,
 )
@@ -52,6 +58,7 @@ from orket.core.domain.workitem_transition import WorkItemTransitionService
 from orket.core.policies.tool_gate import ToolGate
 from orket.decision_nodes.contracts import PlanningInput
 from orket.exceptions import CardNotFound, ExecutionFailed
+from orket.instrumentation import ORCHESTRATOR_WAVE_OCCUPANCY, ORCHESTRATOR_WAVE_SIZE
 from orket.logging import log_event
 from orket.orchestration.models import ModelSelector
 from orket.runtime.settings import resolve_bool, resolve_str
@@ -104,6 +111,61 @@ async def _close_provider_transport(provider: Any) -> None:
         await maybe_awaitable
 
 
+@asynccontextmanager
+async def _model_warm_state_scope(self: Any, *, run_id: str, env: EnvironmentConfig) -> AsyncIterator[None]:
+    """Run an epic with a model warm-state manager when ``ORKET_MODEL_WARM_STATE`` is on and the backend supports it."""
+    settings = resolve_model_warm_state_settings()
+    create_warm_backend = getattr(self.model_client_node, "create_warm_backend", None)
+    if settings is None or not callable(create_warm_backend):
+        self._model_warm_state = None
+        yield
+        return
+    backend = create_warm_backend(env, keep_alive_seconds=settings["keep_alive_seconds"])
+    if backend is None:
+        self._model_warm_state = None
+        yield
+        return
+    warm_state = ModelWarmStateManager(backend, workspace=self.workspace, **settings)
+    self._model_warm_state = warm_state
+    stop = asyncio.Event()
+    keep_alive_task = asyncio.create_task(warm_state.run_keep_alive_loop(stop))
+    try:
+        yield
+    finally:
+        stop.set()
+        await keep_alive_task
+        self._model_warm_state = None
+        log_event("model_warm_state_summary", {"run_id": run_id, **warm_state.report()}, self.workspace)
+
+
+def _team_seat_models(
+    team: TeamConfig, epic: EpicConfig, prompt_strategy_node: Any, model_override: str | None
+) -> dict[str, str]:
+    seat_models: dict[str, str] = {}
+    for seat_name, seat in (getattr(team, "seats", {}) or {}).items():
+        roles = list(getattr(seat, "roles", []) or [])
+        if roles:
+            seat_models[seat_name] = _select_prompt_strategy_model(
+                prompt_strategy_node=prompt_strategy_node, role=roles[0], asset_config=epic, override=model_override
+            )
+    return seat_models
+
+
+async def _prepare_model_wave(
+    self: Any, warm_state: ModelWarmStateManager, candidates: list[Any], seat_models: dict[str, str], run_id: str
+) -> Any:
+    """Warm the wave's models now and return the prewarm of every other seat's model, to run alongside the wave."""
+    needed = [seat_models[seat] for seat in (getattr(item, "seat", "") for item in candidates) if seat in seat_models]
+    cold_starts = await warm_state.prepare_wave(needed)
+    log_event(
+        "model_warm_state_wave",
+        {"run_id": run_id, "needed": sorted(set(needed)), "cold_starts": cold_starts},
+        self.workspace,
+    )
+    upcoming = [model for model in seat_models.values() if model not in needed]
+    return warm_state.prewarm(upcoming, protected=needed)
+
+
 def _select_prompt_strategy_model(
     *,
     prompt_strategy_node: Any,
@@ -269,6 +331,17 @@ def _resolve_small_project_builder_variant(self: Any) -> str:
     return str(resolve_small_project_builder_variant(raw, "", ""))
 
 
+def _resolve_packed_turn_artifacts(self: Any) -> bool:
+    return bool(resolve_bool(
+        "ORKET_TURN_ARTIFACTS_PACKED",
+        process_rules=_org_process_rules(self.org),
+        process_key="packed_turn_artifacts",
+        user_key="packed_turn_artifacts",
+        user_settings=_user_settings(self),
+        default=False,
+    ))
+
+
 def _resolve_protocol_governed_enabled(self: Any) -> bool:
     user_settings = _user_settings(self)
     return bool(resolve_bool(
@@ -1078,6 +1151,11 @@ async def execute_epic(
         user_settings=user_settings,
     )
     prompt_strategy_node = self.decision_nodes.resolve_prompt_strategy(model_selector, self.org)
+    seat_models = (
+        _team_seat_models(team, epic, prompt_strategy_node, model_override)
+        if getattr(self, "_model_warm_state", None) is not None
+        else {}
+    )
 
     tool_gate = ToolGate(organization=self.org, workspace_root=self.workspace)
     from orket.application.services.turn_tool_control_plane_service import build_turn_tool_control_plane_service
@@ -1093,6 +1171,7 @@ async def execute_epic(
         tool_gate,
         self.workspace,
         control_plane_service=build_turn_tool_control_plane_service(turn_tool_control_plane_db_path),
+        packed_turn_artifacts=_resolve_packed_turn_artifacts(self),
     )
 
     from orket.policy import create_session_policy
@@ -1109,110 +1188,120 @@ async def execute_epic(
         decision_nodes=self.decision_nodes,
     )
 
-    # Concurrency/loop control via loop policy node.
-    concurrency_limit = self.loop_policy_node.concurrency_limit(self.org)
-    semaphore = asyncio.Semaphore(concurrency_limit)
+    try:
+        # Concurrency/loop control via loop policy node.
+        concurrency_limit = self.loop_policy_node.concurrency_limit(self.org)
+        semaphore = asyncio.Semaphore(concurrency_limit)
 
-    log_event(
-        "orchestrator_hyper_loop_start",
-        {"epic": epic.name, "run_id": run_id, "concurrency": concurrency_limit},
-        self.workspace,
-    )
+        log_event(
+            "orchestrator_hyper_loop_start",
+            {"epic": epic.name, "run_id": run_id, "concurrency": concurrency_limit},
+            self.workspace,
+        )
 
-    iteration_count = 0
-    max_iterations = self.loop_policy_node.max_iterations(self.org)
+        iteration_count = 0
+        max_iterations = self.loop_policy_node.max_iterations(self.org)
 
-    while iteration_count < max_iterations:
-        iteration_count += 1
+        while iteration_count < max_iterations:
+            iteration_count += 1
 
-        backlog = await self.async_cards.get_by_build(active_build)
-        if await self._maybe_schedule_team_replan(backlog, run_id, active_build, team):
-            continue
-        independent_ready = await self.async_cards.get_independent_ready_issues(active_build)
-        candidates = self.planner_node.plan(
-            PlanningInput(
-                backlog=backlog,
-                independent_ready=independent_ready,
-                target_issue_id=target_issue_id,
+            backlog = await self.async_cards.get_by_build(active_build)
+            if await self._maybe_schedule_team_replan(backlog, run_id, active_build, team):
+                continue
+            independent_ready = await self.async_cards.get_independent_ready_issues(active_build)
+            candidates = self.planner_node.plan(
+                PlanningInput(
+                    backlog=backlog,
+                    independent_ready=independent_ready,
+                    target_issue_id=target_issue_id,
+                )
             )
-        )
 
-        if not candidates:
-            propagated_count = await self._propagate_dependency_blocks(backlog, run_id)
-            if propagated_count:
-                continue
+            if not candidates:
+                propagated_count = await self._propagate_dependency_blocks(backlog, run_id)
+                if propagated_count:
+                    continue
+
+                # Empty-candidate policy (seam) with backward-compatible fallback.
+                outcome_fn = getattr(self.loop_policy_node, "no_candidate_outcome", None)
+                if callable(outcome_fn):
+                    outcome = outcome_fn(backlog)
+                else:
+                    is_done = self.loop_policy_node.is_backlog_done(backlog)
+                    outcome = {"is_done": is_done, "event_name": "orchestrator_epic_complete" if is_done else None}
+
+                if outcome.get("is_done"):
+                    event_name = outcome.get("event_name")
+                    if event_name:
+                        log_event(event_name, {"epic": epic.name, "run_id": run_id}, self.workspace)
+                    break
+
+                backlog_snapshot = [
+                    {
+                        "id": getattr(item, "id", "unknown"),
+                        "status": (
+                            getattr(item.status, "value", str(item.status)) if hasattr(item, "status") else "unknown"
+                        ),
+                    }
+                    for item in backlog
+                ]
+                reason = outcome.get("reason") or "No executable candidates while backlog incomplete."
+                log_event(
+                    "orchestrator_stalled",
+                    {
+                        "run_id": run_id,
+                        "epic": epic.name,
+                        "iteration": iteration_count,
+                        "reason": reason,
+                        "backlog": backlog_snapshot,
+                    },
+                    self.workspace,
+                )
+                raise ExecutionFailed(reason)
 
-            # Empty-candidate policy (seam) with backward-compatible fallback.
-            outcome_fn = getattr(self.loop_policy_node, "no_candidate_outcome", None)
-            if callable(outcome_fn):
-                outcome = outcome_fn(backlog)
-            else:
-                is_done = self.loop_policy_node.is_backlog_done(backlog)
-                outcome = {"is_done": is_done, "event_name": "orchestrator_epic_complete" if is_done else None}
-
-            if outcome.get("is_done"):
-                event_name = outcome.get("event_name")
-                if event_name:
-                    log_event(event_name, {"epic": epic.name, "run_id": run_id}, self.workspace)
-                break
-
-            backlog_snapshot = [
-                {
-                    "id": getattr(item, "id", "unknown"),
-                    "status": (
-                        getattr(item.status, "value", str(item.status)) if hasattr(item, "status") else "unknown"
-                    ),
-                }
-                for item in backlog
-            ]
-            reason = outcome.get("reason") or "No executable candidates while backlog incomplete."
             log_event(
-                "orchestrator_stalled",
-                {
-                    "run_id": run_id,
-                    "epic": epic.name,
-                    "iteration": iteration_count,
-                    "reason": reason,
-                    "backlog": backlog_snapshot,
-                },
+                "orchestrator_tick",
+                {"run_id": run_id, "candidate_count": len(candidates), "iteration": iteration_count},
                 self.workspace,
             )
-            raise ExecutionFailed(reason)
 
-        log_event(
-            "orchestrator_tick",
-            {"run_id": run_id, "candidate_count": len(candidates), "iteration": iteration_count},
-            self.workspace,
-        )
-
-        # 2. Parallel Dispatch with Semaphore
-        async def semaphore_wrapper(issue_data: Any) -> None:
-            async with semaphore:
-                await self._execute_issue_turn(
-                    issue_data,
-                    epic,
-                    team,
-                    env,
-                    run_id,
-                    active_build,
-                    prompt_strategy_node,
-                    executor,
-                    toolbox,
-                    resume_mode=resume_mode,
-                    model_override=model_override,
-                )
-
-        await asyncio.gather(*(semaphore_wrapper(c) for c in candidates))
-
-    if iteration_count >= max_iterations:
-        final_backlog = await self.async_cards.get_by_build(active_build)
-        exhaustion_fn = getattr(self.loop_policy_node, "should_raise_exhaustion", None)
-        if callable(exhaustion_fn):
-            should_raise = exhaustion_fn(iteration_count, max_iterations, final_backlog)
-        else:
-            should_raise = not self.loop_policy_node.is_backlog_done(final_backlog)
-        if should_raise:
-            raise ExecutionFailed(f"Hyper-Loop exhausted iterations ({max_iterations})")
+            # 2. Parallel Dispatch with Semaphore
+            async def semaphore_wrapper(issue_data: Any) -> None:
+                async with semaphore:
+                    await self._execute_issue_turn(
+                        issue_data,
+                        epic,
+                        team,
+                        env,
+                        run_id,
+                        active_build,
+                        prompt_strategy_node,
+                        executor,
+                        toolbox,
+                        resume_mode=resume_mode,
+                        model_override=model_override,
+                    )
+
+            warm_state = getattr(self, "_model_warm_state", None)
+            prewarm_upcoming: list[Any] = []
+            if warm_state is not None:
+                prewarm_upcoming.append(await _prepare_model_wave(self, warm_state, candidates, seat_models, run_id))
+            ORCHESTRATOR_WAVE_SIZE.observe(len(candidates))
+            ORCHESTRATOR_WAVE_OCCUPANCY.observe(min(len(candidates), concurrency_limit) / max(1, concurrency_limit))
+            await asyncio.gather(*(semaphore_wrapper(c) for c in candidates), *prewarm_upcoming)
+
+        if iteration_count >= max_iterations:
+            final_backlog = await self.async_cards.get_by_build(active_build)
+            exhaustion_fn = getattr(self.loop_policy_node, "should_raise_exhaustion", None)
+            if callable(exhaustion_fn):
+                should_raise = exhaustion_fn(iteration_count, max_iterations, final_backlog)
+            else:
+                should_raise = not self.loop_policy_node.is_backlog_done(final_backlog)
+            if should_raise:
+                raise ExecutionFailed(f"Hyper-Loop exhausted iterations ({max_iterations})")
+    finally:
+        # Each epic builds its own executor; stop its artifact writer thread with it.
+        await executor.aclose()
 
 
 async def _propagate_dependency_blocks(self: Any, backlog: list[Any], run_id: str) -> int:
@@ -1329,17 +1418,26 @@ async def _maybe_schedule_team_replan(
             trigger_issue_ids=[str(getattr(item, "id", "") or "").strip() for item in triggering_issues],
             metadata={"replan_count": next_count},
         )
+    replan_payloads: list[dict[str, Any]] = []
     for issue in triggering_issues:
         params = getattr(issue, "params", None)
         if isinstance(params, dict):
             params["replan_requested"] = False
+        replan_payloads.append(issue.model_dump() if hasattr(issue, "model_dump") else dict(issue.__dict__))
+    save_many = getattr(self.async_cards, "save_many", None)
+    saved_in_bulk = False
+    if callable(save_many) and len(replan_payloads) > 1:
         try:
-            if hasattr(issue, "model_dump"):
-                await self.async_cards.save(issue.model_dump())
-            else:
-                await self.async_cards.save(dict(issue.__dict__))
+            await save_many(replan_payloads)
+            saved_in_bulk = True
         except (CardNotFound, ExecutionFailed, ValueError, TypeError, RuntimeError, OSError):
-            continue
+            saved_in_bulk = False
+    if not saved_in_bulk:
+        for payload in replan_payloads:
+            try:
+                await self.async_cards.save(payload)
+            except (CardNotFound, ExecutionFailed, ValueError, TypeError, RuntimeError, OSError):
+                continue
     log_event(
         "team_replan_scheduled",
         {
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+from pathlib import Path
+
+from orket.logging import log_event
+
+TURN_ARTIFACT_PACK_FILENAME = "turn_artifacts.pack.jsonl"
+
+
+class TurnArtifactSink:
+    """Background writer for per-turn observability artifacts.
+
+    Writes are queued and applied in order by one daemon thread, so turn execution never
+    blocks on filesystem latency. Directories are created once per sink, files land via
+    temp-file plus atomic rename so readers never observe partial content, and queued
+    content stays readable through :meth:`read` until the write lands. In packed mode,
+    packable artifacts are appended as records to one pack file per turn directory with an
+    in-memory name-to-offset index instead of one file each.
+
+    :meth:`flush` is the durability barrier: it returns once every queued write is on disk
+    and re-raises the first write failure seen since the previous flush. :meth:`close` drains
+    the queue and stops the worker thread; a later write starts a new one.
+    """
+
+    def __init__(self, *, packed: bool = False) -> None:
+        self.packed = bool(packed)
+        self._queue: queue.Queue[tuple[int, Path, str, str, bool] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending: dict[Path, tuple[int, str]] = {}
+        self._sequence = 0
+        self._created_dirs: set[Path] = set()
+        self._pack_index: dict[Path, dict[str, int]] = {}
+        self._worker: threading.Thread | None = None
+        self._error: OSError | None = None
+
+    def write(self, turn_dir: Path, name: str, content: str, *, packable: bool = False) -> None:
+        path = turn_dir / name
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending[path] = (sequence, content)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="turn-artifact-sink", daemon=True)
+                self._worker.start()
+        self._queue.put((sequence, turn_dir, name, content, packable and self.packed))
+
+    def read(self, turn_dir: Path, name: str) -> str | None:
+        path = turn_dir / name
+        with self._lock:
+            pending = self._pending.get(path)
+        if pending is not None:
+            return pending[1]
+        if self.packed:
+            packed_content = self._read_packed(turn_dir, name)
+            if packed_content is not None:
+                return packed_content
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def flush(self) -> None:
+        self._queue.join()
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    async def aflush(self) -> None:
+        await asyncio.to_thread(self.flush)
+
+    def close(self) -> None:
+        """Apply every queued write, then stop the worker. Write failures were already logged by the worker."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is None or not worker.is_alive():
+            return
+        self._queue.put(None)
+        worker.join()
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.close)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            sequence, turn_dir, name, content, packed = item
+            try:
+                self._apply(turn_dir, name, content, packed=packed)
+            except OSError as exc:
+                with self._lock:
+                    self._error = self._error or exc
+                log_event("turn_artifact_sink_write_failed", {"path": str(turn_dir / name), "error": str(exc)})
+            finally:
+                self._settle(turn_dir / name, sequence)
+                self._queue.task_done()
+
+    def _apply(self, turn_dir: Path, name: str, content: str, *, packed: bool) -> None:
+        if packed:
+            self._append_packed(turn_dir, name, content)
+            return
+        path = turn_dir / name
+        self._ensure_dir(path.parent)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+        except FileNotFoundError:
+            # The directory was removed after it was cached as created.
+            self._created_dirs.discard(path.parent)
+            self._ensure_dir(path.parent)
+            tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+
+    def _settle(self, path: Path, sequence: int) -> None:
+        with self._lock:
+            pending = self._pending.get(path)
+            # A newer write for the same path may still be queued; only drop our own entry.
+            if pending is not None and pending[0] == sequence:
+                self._pending.pop(path, None)
+
+    def _ensure_dir(self, directory: Path) -> None:
+        if directory in self._created_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(directory)
+
+    def _append_packed(self, turn_dir: Path, name: str, content: str) -> None:
+        self._ensure_dir(turn_dir)
+        pack_path = turn_dir / TURN_ARTIFACT_PACK_FILENAME
+        record = json.dumps({"name": name, "content": content}, ensure_ascii=False, separators=(",", ":"))
+        index = self._load_pack_index(turn_dir)
+        with pack_path.open("ab") as handle:
+            offset = handle.tell()
+            handle.write(record.encode("utf-8") + b"\n")
+        with self._lock:
+            index[name] = offset
+
+    def _read_packed(self, turn_dir: Path, name: str) -> str | None:
+        offset = self._load_pack_index(turn_dir).get(name)
+        if offset is None:
+            return None
+        try:
+            with (turn_dir / TURN_ARTIFACT_PACK_FILENAME).open("rb") as handle:
+                handle.seek(offset)
+                record = json.loads(handle.readline().decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        content = record.get("content") if isinstance(record, dict) else None
+        return content if isinstance(content, str) else None
+
+    def _load_pack_index(self, turn_dir: Path) -> dict[str, int]:
+        with self._lock:
+            cached = self._pack_index.get(turn_dir)
+        if cached is not None:
+            return cached
+        index: dict[str, int] = {}
+        try:
+            with (turn_dir / TURN_ARTIFACT_PACK_FILENAME).open("rb") as handle:
+                offset = 0
+                for line in handle:
+                    try:
+                        record = json.loads(line.decode("utf-8"))
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        record = None
+                    if isinstance(record, dict) and isinstance(record.get("name"), str):
+                        index[record["name"]] = offset
+                    offset += len(line)
+        except OSError:
+            pass
+        with self._lock:
+            return self._pack_index.setdefault(turn_dir, index)
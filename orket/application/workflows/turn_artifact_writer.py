@@ -15,14 +15,30 @@ from orket.runtime.registry.tool_invocation_contracts import (
     compute_tool_call_hash,
     normalize_tool_invocation_manifest,
 )
+from .turn_artifact_sink import TurnArtifactSink
 from .turn_compatibility_artifacts import append_compatibility_artifacts
 
 
 class TurnArtifactWriter:
-    """Observability artifact and replay cache writer for turn execution."""
+    """Observability artifact and replay cache writer for turn execution.
 
-    def __init__(self, workspace: Path) -> None:
+    Turn artifacts and replay caches are queued to a :class:`TurnArtifactSink`; checkpoints
+    are the flush barrier. With ``packed_artifacts`` the tool and operation replay caches are
+    stored in one pack file per turn, and the ``load_*`` readers resolve them transparently.
+    """
+
+    def __init__(self, workspace: Path, *, packed_artifacts: bool = False) -> None:
         self.workspace = workspace
+        self.sink = TurnArtifactSink(packed=packed_artifacts)
+
+    def flush(self) -> None:
+        self.sink.flush()
+
+    async def aflush(self) -> None:
+        await self.sink.aflush()
+
+    async def aclose(self) -> None:
+        await self.sink.aclose()
 
     def message_hash(self, messages: list[dict[str, str]]) -> str:
         return hash_framed_fields("message_hash", [messages])[:16]
@@ -39,11 +55,13 @@ class TurnArtifactWriter:
             fallback = {"non_canonical_repr": str(payload)}
             return hash_canonical_json(fallback)
 
-    @staticmethod
-    def _load_json_dict(path: Path) -> dict[str, Any] | None:
+    def _load_json_dict(self, turn_dir: Path, name: str) -> dict[str, Any] | None:
+        text = self.sink.read(turn_dir, name)
+        if text is None:
+            return None
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError, TypeError, ValueError):
+            payload = json.loads(text)
+        except (json.JSONDecodeError, TypeError, ValueError):
             return None
         return payload if isinstance(payload, dict) else None
 
@@ -211,8 +229,7 @@ class TurnArtifactWriter:
             role_name=role_name,
             turn_index=turn_index,
         )
-        out_dir.mkdir(parents=True, exist_ok=True)
-        (out_dir / filename).write_text(content, encoding="utf-8")
+        self.sink.write(out_dir, filename, content)
 
     def write_turn_checkpoint(
         self,
@@ -247,6 +264,7 @@ class TurnArtifactWriter:
             filename="checkpoint.json",
             content=json.dumps(payload, indent=2, ensure_ascii=False),
         )
+        self.sink.flush()
 
     def tool_replay_key(self, tool_name: str, tool_args: dict[str, Any]) -> str:
         return hash_framed_fields("tool_replay_key", [tool_name, tool_args])[:12]
@@ -268,7 +286,6 @@ class TurnArtifactWriter:
             role_name=role_name,
             turn_index=turn_index,
         )
-        out_dir.mkdir(parents=True, exist_ok=True)
         return out_dir / f"tool_result_{sanitize_name(tool_name)}_{replay_key}.json"
 
     def load_replay_tool_result(
@@ -292,9 +309,7 @@ class TurnArtifactWriter:
             tool_name=tool_name,
             tool_args=tool_args,
         )
-        if not path.exists():
-            return None
-        return self._load_json_dict(path)
+        return self._load_json_dict(path.parent, path.name)
 
     def persist_tool_result(
         self,
@@ -315,7 +330,7 @@ class TurnArtifactWriter:
             tool_name=tool_name,
             tool_args=tool_args,
         )
-        path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        self.sink.write(path.parent, path.name, json.dumps(result, indent=2, ensure_ascii=False), packable=True)
 
     def operation_result_path(
         self,
@@ -333,7 +348,6 @@ class TurnArtifactWriter:
             turn_index=turn_index,
         )
         operation_dir = out_dir / "operations"
-        operation_dir.mkdir(parents=True, exist_ok=True)
         op_id = sanitize_name(str(operation_id).strip() or "unknown-operation")
         return operation_dir / f"{op_id}.json"
 
@@ -353,9 +367,8 @@ class TurnArtifactWriter:
             turn_index=turn_index,
             operation_id=operation_id,
         )
-        if not path.exists():
-            return None
-        return self._load_json_dict(path)
+        # Operation records are keyed relative to the turn directory so a packed turn keeps one pack file.
+        return self._load_json_dict(path.parent.parent, f"{path.parent.name}/{path.name}")
 
     def persist_operation_result(
         self,
@@ -383,7 +396,12 @@ class TurnArtifactWriter:
             "result": dict(result or {}),
             "result_digest": self.hash_payload(result if isinstance(result, dict) else {}),
         }
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        self.sink.write(
+            path.parent.parent,
+            f"{path.parent.name}/{path.name}",
+            json.dumps(payload, indent=2, ensure_ascii=False),
+            packable=True,
+        )
 
     def append_protocol_receipt(
         self,
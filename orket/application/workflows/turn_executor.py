@@ -19,6 +19,7 @@ from orket.core.domain.execution import ExecutionTurn
 from orket.core.domain.state_machine import StateMachine, StateMachineError
 from orket.core.policies.tool_gate import ToolGate
 from orket.exceptions import ModelConnectionError, ModelProviderError, ModelTimeoutError
+from orket.logging import log_event
 from orket.schema import CardStatus, IssueConfig, RoleConfig
 
 from . import turn_executor_ops
@@ -62,6 +63,8 @@ class TurnExecutor:
         workspace: Path,
         middleware: TurnLifecycleInterceptors | None = None,
         control_plane_service: TurnToolControlPlaneService | None = None,
+        max_parallel_read_only_tools: int = 1,
+        packed_turn_artifacts: bool = False,
     ) -> None:
         if tool_gate is None:
             raise TypeError("TurnExecutor requires tool_gate authority on the canonical turn-tool path")
@@ -71,7 +74,7 @@ class TurnExecutor:
         self.middleware = middleware or TurnLifecycleInterceptors([])
         self.middleware.bind_workspace(self.workspace)
 
-        self.artifact_writer = TurnArtifactWriter(workspace)
+        self.artifact_writer = TurnArtifactWriter(workspace, packed_artifacts=packed_turn_artifacts)
         self.response_parser = ResponseParser(workspace, self.artifact_writer.write_turn_artifact)
         self.message_builder = MessageBuilder(workspace)
         self.corrective_prompt_builder = CorrectivePromptBuilder(workspace)
@@ -90,6 +93,7 @@ class TurnExecutor:
             tool_approval_pending_error_factory=lambda message: ToolApprovalPendingError(message),
             tool_validation_error_factory=lambda violations: ToolValidationError(violations),
             control_plane_service=control_plane_service,
+            max_parallel_read_only_tools=max_parallel_read_only_tools,
         )
 
     async def execute_turn(
@@ -101,7 +105,26 @@ class TurnExecutor:
         context: dict[str, Any],
         system_prompt: str | None = None,
     ) -> TurnResult:
-        return await turn_executor_ops.execute_turn(self, issue, role, model_client, toolbox, context, system_prompt)
+        # Turn end is a flush barrier: every queued artifact is on disk before the result is observed.
+        try:
+            result = await turn_executor_ops.execute_turn(self, issue, role, model_client, toolbox, context, system_prompt)
+        except Exception:
+            try:
+                await self.artifact_writer.aflush()
+            except OSError as flush_exc:
+                # The turn's own failure is the one to surface; the flush failure is only logged.
+                log_event(
+                    "turn_artifact_flush_failed",
+                    {"issue_id": getattr(issue, "id", ""), "role": getattr(role, "name", ""), "error": str(flush_exc)},
+                    self.workspace,
+                )
+            raise
+        await self.artifact_writer.aflush()
+        return result
+
+    async def aclose(self) -> None:
+        """Drain queued turn artifacts and stop the artifact writer thread."""
+        await self.artifact_writer.aclose()
 
     async def _prepare_messages(
         self,
@@ -8,8 +8,15 @@ from typing import Any
 import aiofiles
 
 from orket.core.domain.verification_scope import parse_verification_scope
+from orket.instrumentation import PROMPT_PREFIX_LOOKUPS
 from orket.logging import log_event
 from orket.runtime.compact_turn_packet import compact_turn_messages
+from orket.runtime.config.prompt_prefix_layout import (
+    PROMPT_LAYOUT_PREFIX_STABLE,
+    apply_prefix_stable_layout,
+    prefix_affinity_key,
+    resolve_prompt_layout,
+)
 from orket.schema import IssueConfig, RoleConfig
 
 from .turn_artifact_semantic_prompt_hints import artifact_semantic_exact_shape_hints
@@ -23,6 +30,7 @@ class MessageBuilder:
 
     def __init__(self, workspace: Path):
         self.workspace = workspace
+        self._prefix_pins: dict[str, str] = {}
 
     async def prepare_messages(
         self,
@@ -552,8 +560,35 @@ class MessageBuilder:
                         "compacted_message_count": compaction.compacted_message_count,
                     }
 
+        if resolve_prompt_layout(context) == PROMPT_LAYOUT_PREFIX_STABLE:
+            messages = self._apply_prefix_stable_layout(messages, context)
         return messages
 
+    def _apply_prefix_stable_layout(self, messages: list[dict[str, str]], context: dict[str, Any]) -> list[dict[str, str]]:
+        layout = apply_prefix_stable_layout(messages)
+        affinity_key = prefix_affinity_key(context)
+        pinned = self._prefix_pins.get(affinity_key) if affinity_key else None
+        if affinity_key:
+            self._prefix_pins[affinity_key] = layout.stable_prefix_hash
+        result = "first" if pinned is None else ("hit" if pinned == layout.stable_prefix_hash else "miss")
+        PROMPT_PREFIX_LOOKUPS.inc(result)
+        if result == "miss":
+            log_event(
+                "prompt_prefix_changed",
+                {"affinity_key": affinity_key, "previous": pinned, "current": layout.stable_prefix_hash},
+                workspace=self.workspace,
+            )
+        prompt_layers = context.get("prompt_layers")
+        if isinstance(prompt_layers, dict):
+            prompt_layers["prefix_layout"] = {
+                "layout": PROMPT_LAYOUT_PREFIX_STABLE,
+                "stable_prefix_message_count": layout.stable_prefix_message_count,
+                "stable_prefix_hash": layout.stable_prefix_hash,
+                "moved_system_sections": layout.moved_system_sections,
+                "pin_result": result,
+            }
+        return layout.messages
+
     async def _load_required_read_context(self, required_read_paths: list[str]) -> list[str]:
         rendered: list[str] = []
         for rel_path in required_read_paths:
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from orket.adapters.tools.registry import DEFAULT_TOOL_REGISTRY, ToolRegistry
 from orket.application.middleware import TurnLifecycleInterceptors
 from orket.application.services.turn_tool_control_plane_service import TurnToolControlPlaneService
 from orket.core.domain.execution import ExecutionTurn, ToolCallErrorClass
 from orket.core.policies.tool_gate import ToolGate
+from orket.instrumentation import TOOL_DISPATCH_ERRORS, TOOL_DISPATCH_SECONDS
 from orket.logging import log_event
 from orket.schema import IssueConfig
 
@@ -48,6 +52,21 @@ from .turn_tool_dispatcher_support import (
 )
 
 
+@dataclass
+class _ToolCallSlot:
+    index: int
+    tool_call: Any
+    tool_name: str
+    binding: dict[str, Any] | None
+    operation_id: str
+    admitted: bool = False
+    compatibility_translation: dict[str, Any] | None = None
+    ready_memory_calls: list[dict[str, Any]] | None = None
+    outcome: tuple[dict[str, Any], bool] | None = None
+    execution_error: Exception | None = None
+    violations: list[str] = field(default_factory=list)
+
+
 class ToolDispatcher:
     """Execute tool calls with governance checks and replay/idempotency caching."""
 
@@ -73,6 +92,8 @@ class ToolDispatcher:
         tool_approval_pending_error_factory: Callable[[str], Exception] | None = None,
         tool_validation_error_factory: Callable[[list[str]], Exception] | None = None,
         control_plane_service: TurnToolControlPlaneService | None = None,
+        tool_registry: ToolRegistry | None = None,
+        max_parallel_read_only_tools: int = 1,
     ) -> None:
         if tool_gate is None:
             raise TypeError("ToolDispatcher requires tool_gate authority before tool execution can begin")
@@ -94,6 +115,30 @@ class ToolDispatcher:
             tool_validation_error_factory or (lambda violations: RuntimeError(str(list(violations or []))))
         )
         self.control_plane_service = control_plane_service
+        self.tool_registry = tool_registry or DEFAULT_TOOL_REGISTRY
+        self.max_parallel_read_only_tools = max(1, int(max_parallel_read_only_tools))
+
+    def _parallel_read_only_limit(self, context: dict[str, Any]) -> int:
+        override = context.get("max_parallel_read_only_tools")
+        if override is None:
+            return self.max_parallel_read_only_tools
+        try:
+            return max(1, int(override))
+        except (TypeError, ValueError):
+            return self.max_parallel_read_only_tools
+
+    def _is_parallel_read_only(self, tool_call: Any, approval_required_tools: set[str]) -> bool:
+        tool_name = str(tool_call.tool or "").strip()
+        return tool_name not in approval_required_tools and self.tool_registry.is_read_only(tool_name)
+
+    def _emit_ready_memory_event(self, context: dict[str, Any], role_name: str, slot: _ToolCallSlot) -> None:
+        self.append_memory_event(
+            context,
+            role_name=role_name,
+            interceptor="before_tool",
+            decision_type="tool_call_ready",
+            tool_calls=list(slot.ready_memory_calls or []),
+        )
 
     async def execute_tools(
         self,
@@ -204,15 +249,35 @@ class ToolDispatcher:
             resume_mode=bool(context.get("resume_mode")),
         )
 
-        for index, tool_call in enumerate(turn.tool_calls):
-            operation_id = derive_operation_id(
-                run_id=session_id,
-                step_id=step_id,
-                tool_index=index,
-            )
-            receipt_seq = index + 1
+        def _record_exception(slot: _ToolCallSlot, exc: Exception) -> None:
+            slot.tool_call.error = str(exc)
+            slot.tool_call.error_class = ToolCallErrorClass.EXECUTION_FAILED
+            if not protocol_replay_mode:
+                log_event(
+                    "tool_call_exception",
+                    {
+                        "issue_id": turn.issue_id,
+                        "role": turn.role,
+                        "session_id": session_id,
+                        "turn_index": turn_index,
+                        "tool": slot.tool_name,
+                        "error": str(exc),
+                        "operation_id": slot.operation_id,
+                    },
+                    self.workspace,
+                )
+            slot.violations.append(f"Tool {slot.tool_name} error: {exc}")
+
+        async def _prepare(index: int, tool_call: Any, *, defer_ready_event: bool) -> _ToolCallSlot:
             tool_name = str(tool_call.tool or "")
             binding = resolve_skill_tool_binding(context, tool_name)
+            slot = _ToolCallSlot(
+                index=index,
+                tool_call=tool_call,
+                tool_name=tool_name,
+                binding=binding,
+                operation_id=derive_operation_id(run_id=session_id, step_id=step_id, tool_index=index),
+            )
             try:
                 middleware_outcome = self.middleware.apply_before_tool(
                     tool_name,
@@ -233,29 +298,23 @@ class ToolDispatcher:
                         if reason == "interceptor_crash"
                         else ToolCallErrorClass.GATE_BLOCKED
                     )
-                    violations.append(reason)
-                    continue
+                    slot.violations.append(reason)
+                    return slot
 
                 if not protocol_replay_mode:
-                    self.append_memory_event(
-                        context,
-                        role_name=turn.role,
-                        interceptor="before_tool",
-                        decision_type="tool_call_ready",
-                        tool_calls=[
-                            {
-                                "tool_name": tool_name,
-                                "tool_profile_id": str(
-                                    (binding or {}).get("tool_profile_id") or tool_name or "unknown"
-                                ),
-                                "tool_profile_version": str(context.get("tool_profile_version") or "unknown-v1"),
-                                "normalized_args": dict(tool_call.args or {}),
-                                "normalization_version": str(context.get("normalization_version") or "json-v1"),
-                                "tool_result_fingerprint": self.hash_payload({}),
-                                "side_effect_fingerprint": None,
-                            }
-                        ],
-                    )
+                    slot.ready_memory_calls = [
+                        {
+                            "tool_name": tool_name,
+                            "tool_profile_id": str((binding or {}).get("tool_profile_id") or tool_name or "unknown"),
+                            "tool_profile_version": str(context.get("tool_profile_version") or "unknown-v1"),
+                            "normalized_args": dict(tool_call.args or {}),
+                            "normalization_version": str(context.get("normalization_version") or "json-v1"),
+                            "tool_result_fingerprint": self.hash_payload({}),
+                            "side_effect_fingerprint": None,
+                        }
+                    ]
+                    if not defer_ready_event:
+                        self._emit_ready_memory_event(context, turn.role, slot)
 
                 gate_violation = await self.tool_gate.validate(
                     tool_name=tool_name,
@@ -286,8 +345,8 @@ class ToolDispatcher:
                             },
                             self.workspace,
                         )
-                    violations.append(policy_violation)
-                    continue
+                    slot.violations.append(policy_violation)
+                    return slot
                 if gate_violation:
                     tool_call.error = str(gate_violation)
                     tool_call.error_class = ToolCallErrorClass.GATE_BLOCKED
@@ -305,15 +364,15 @@ class ToolDispatcher:
                             },
                             self.workspace,
                         )
-                    violations.append(f"Governance Violation: {gate_violation}")
-                    continue
+                    slot.violations.append(f"Governance Violation: {gate_violation}")
+                    return slot
 
                 if bool(context.get("skill_contract_enforced")):
                     if binding is None:
                         tool_call.error = f"Skill contract violation: undeclared entrypoint/tool '{tool_name}'."
                         tool_call.error_class = ToolCallErrorClass.GATE_BLOCKED
-                        violations.append(f"Skill contract violation: undeclared entrypoint/tool '{tool_name}'.")
-                        continue
+                        slot.violations.append(f"Skill contract violation: undeclared entrypoint/tool '{tool_name}'.")
+                        return slot
                     missing_permissions = missing_required_permissions(binding, context)
                     if missing_permissions:
                         tool_call.error = (
@@ -321,8 +380,8 @@ class ToolDispatcher:
                             f"'{tool_name}' ({', '.join(missing_permissions)})."
                         )
                         tool_call.error_class = ToolCallErrorClass.GATE_BLOCKED
-                        violations.append(tool_call.error)
-                        continue
+                        slot.violations.append(tool_call.error)
+                        return slot
                     limit_violations = runtime_limit_violations(binding, context)
                     if limit_violations:
                         tool_call.error = (
@@ -330,8 +389,8 @@ class ToolDispatcher:
                             f"'{tool_name}' ({', '.join(limit_violations)})."
                         )
                         tool_call.error_class = ToolCallErrorClass.GATE_BLOCKED
-                        violations.append(tool_call.error)
-                        continue
+                        slot.violations.append(tool_call.error)
+                        return slot
 
                 if tool_name in approval_required_tools:
                     admitted_continuation_slice = supports_governed_turn_tool_approval_continuation(
@@ -388,8 +447,8 @@ class ToolDispatcher:
                             raise self.tool_approval_pending_error_factory(message)
                         tool_call.error = message
                         tool_call.error_class = ToolCallErrorClass.GATE_BLOCKED
-                        violations.append(message)
-                        continue
+                        slot.violations.append(message)
+                        return slot
 
                 compatibility_translation, compatibility_violation = resolve_compatibility_translation(
                     tool_name=tool_name,
@@ -400,8 +459,9 @@ class ToolDispatcher:
                 if compatibility_violation:
                     tool_call.error = compatibility_violation
                     tool_call.error_class = ToolCallErrorClass.GATE_BLOCKED
-                    violations.append(compatibility_violation)
-                    continue
+                    slot.violations.append(compatibility_violation)
+                    return slot
+                slot.compatibility_translation = compatibility_translation
 
                 if not protocol_replay_mode:
                     log_event(
@@ -413,20 +473,27 @@ class ToolDispatcher:
                             "turn_index": turn_index,
                             "tool": tool_name,
                             "args": tool_call.args,
-                            "operation_id": operation_id,
+                            "operation_id": slot.operation_id,
                         },
                         self.workspace,
                     )
+                slot.admitted = True
+            except (ValueError, TypeError, KeyError, RuntimeError, OSError, AttributeError) as exc:
+                _record_exception(slot, exc)
+            return slot
 
-                result, replayed = await load_or_execute_tool(
+        async def _execute(slot: _ToolCallSlot) -> None:
+            started = time.perf_counter()
+            try:
+                slot.outcome = await load_or_execute_tool(
                     protocol_enabled=protocol_enabled,
                     session_id=session_id,
                     turn=turn,
-                    tool_name=tool_name,
-                    tool_args=dict(tool_call.args or {}),
+                    tool_name=slot.tool_name,
+                    tool_args=dict(slot.tool_call.args or {}),
                     turn_index=turn_index,
-                    operation_id=operation_id,
-                    binding=binding,
+                    operation_id=slot.operation_id,
+                    binding=slot.binding,
                     toolbox=toolbox,
                     context=context,
                     step_id=step_id,
@@ -434,10 +501,31 @@ class ToolDispatcher:
                     validator_version=validator_version,
                     protocol_hash=protocol_hash,
                     tool_schema_hash=tool_schema_hash,
-                    compatibility_translation=compatibility_translation,
+                    compatibility_translation=slot.compatibility_translation,
                     load_operation_result=self.load_operation_result,
                     load_replay_tool_result=self.load_replay_tool_result,
                 )
+            except (ValueError, TypeError, KeyError, RuntimeError, OSError, AttributeError) as exc:
+                slot.execution_error = exc
+                TOOL_DISPATCH_ERRORS.inc(slot.tool_name)
+            finally:
+                TOOL_DISPATCH_SECONDS.observe(time.perf_counter() - started, slot.tool_name)
+
+        async def _commit(slot: _ToolCallSlot, *, emit_ready_event: bool) -> None:
+            nonlocal executed_step_count, last_result_ref
+            if emit_ready_event and slot.ready_memory_calls is not None:
+                self._emit_ready_memory_event(context, turn.role, slot)
+            if not slot.admitted:
+                violations.extend(slot.violations)
+                return
+            tool_call = slot.tool_call
+            tool_name = slot.tool_name
+            binding = slot.binding
+            operation_id = slot.operation_id
+            try:
+                if slot.execution_error is not None:
+                    raise slot.execution_error
+                result, replayed = slot.outcome or ({}, False)
 
                 result = self.middleware.apply_after_tool(
                     tool_name,
@@ -533,9 +621,9 @@ class ToolDispatcher:
                             issue_id=turn.issue_id,
                             role_name=turn.role,
                             turn_index=turn_index,
-                            index=index,
+                            index=slot.index,
                             step_id=step_id,
-                            receipt_seq=receipt_seq,
+                            receipt_seq=slot.index + 1,
                             proposal_hash=proposal_hash,
                             validator_version=validator_version,
                             protocol_hash=protocol_hash,
@@ -598,25 +686,45 @@ class ToolDispatcher:
                 if not result.get("ok", False):
                     tool_call.error = str(result.get("error") or "tool execution failed")
                     tool_call.error_class = ToolCallErrorClass.EXECUTION_FAILED
-                    violations.append(f"Tool {tool_name} failed: {result.get('error')}")
+                    slot.violations.append(f"Tool {tool_name} failed: {result.get('error')}")
             except (ValueError, TypeError, KeyError, RuntimeError, OSError, AttributeError) as exc:
-                tool_call.error = str(exc)
-                tool_call.error_class = ToolCallErrorClass.EXECUTION_FAILED
-                if not protocol_replay_mode:
-                    log_event(
-                        "tool_call_exception",
-                        {
-                            "issue_id": turn.issue_id,
-                            "role": turn.role,
-                            "session_id": session_id,
-                            "turn_index": turn_index,
-                            "tool": tool_name,
-                            "error": str(exc),
-                            "operation_id": operation_id,
-                        },
-                        self.workspace,
-                    )
-                violations.append(f"Tool {tool_name} error: {exc}")
+                _record_exception(slot, exc)
+            violations.extend(slot.violations)
+
+        tool_calls = list(turn.tool_calls)
+        parallel_limit = 1 if protocol_replay_mode else self._parallel_read_only_limit(context)
+        semaphore = asyncio.Semaphore(parallel_limit)
+
+        async def _bounded_execute(slot: _ToolCallSlot) -> None:
+            async with semaphore:
+                await _execute(slot)
+
+        position = 0
+        while position < len(tool_calls):
+            group_end = position + 1
+            if parallel_limit > 1:
+                while group_end < len(tool_calls) and all(
+                    self._is_parallel_read_only(call, approval_required_tools)
+                    for call in (tool_calls[position], tool_calls[group_end])
+                ):
+                    group_end += 1
+            if group_end - position == 1:
+                slot = await _prepare(position, tool_calls[position], defer_ready_event=False)
+                if slot.admitted:
+                    await _execute(slot)
+                await _commit(slot, emit_ready_event=False)
+                position = group_end
+                continue
+            # Independent read-only calls: gate them in order, run them concurrently, then
+            # commit results, memory events, and receipts in call order so ledgers match
+            # a sequential dispatch.
+            slots = [
+                await _prepare(index, tool_calls[index], defer_ready_event=True) for index in range(position, group_end)
+            ]
+            await asyncio.gather(*(_bounded_execute(slot) for slot in slots if slot.admitted))
+            for slot in slots:
+                await _commit(slot, emit_ready_event=True)
+            position = group_end
 
         if violations:
             await finalize_execution_if_needed(
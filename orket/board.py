@@ -1,11 +1,21 @@
 import asyncio
+import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
+
 from orket.exceptions import CardNotFound
 from orket.runtime import ConfigLoader
 from orket.schema import EpicConfig, IssueConfig, RockConfig
 
+BOARD_REFRESH_INTERVAL_SECONDS = 1.0
+
+AssetFingerprint = tuple[str, int, int]
+AssetLoad = Callable[[str, str, str, type[BaseModel]], Any]
+
 
 def _append_load_failure(
     load_failures: list[dict[str, str]],
@@ -34,32 +44,203 @@ def _run_startup_reconcile() -> None:
     reconciler.reconcile_all()
 
 
+class BoardProjection:
+    """Cached Rock -> Epic -> Issue board for one department.
+
+    Assets are reloaded only when their backing file's path, mtime or size changes, and one
+    loader is kept per department. The assembled hierarchy, including orphans and alerts, is
+    reused for ``refresh_interval_s`` so repeated board reads skip the filesystem entirely.
+    Loaders that cannot resolve asset files (for example test doubles) are reloaded on every
+    refresh. The returned hierarchy is shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        root: Path,
+        department: str,
+        loader_factory: Callable[[Path, str], Any],
+        refresh_interval_s: float = BOARD_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        self.root = root
+        self.department = department
+        self.refresh_interval_s = max(0.0, float(refresh_interval_s))
+        self._loader_factory = loader_factory
+        self._loaders: dict[str, Any] = {}
+        self._assets: dict[tuple[str, str, str], tuple[AssetFingerprint, Any]] = {}
+        self._hierarchy: dict[str, Any] | None = None
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def hierarchy(self, *, force_refresh: bool = False) -> dict[str, Any]:
+        with self._lock:
+            fresh = time.monotonic() - self._refreshed_at < self.refresh_interval_s
+            if self._hierarchy is None or force_refresh or not fresh:
+                self._hierarchy = self._refresh()
+                self._refreshed_at = time.monotonic()
+            return self._hierarchy
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._refreshed_at = 0.0
+
+    def _refresh(self) -> dict[str, Any]:
+        loader = self._loader(self.department)
+        seen: set[tuple[str, str, str]] = set()
+
+        def _load(category: str, name: str, department: str, schema: type[BaseModel]) -> Any:
+            key = (department, category, name)
+            seen.add(key)
+            return self._load_cached(key, schema)
+
+        hierarchy = _assemble_board_hierarchy(
+            department=self.department,
+            rock_names=loader.list_assets("rocks"),
+            epic_names=loader.list_assets("epics"),
+            issue_names=loader.list_assets("issues"),
+            artifacts=_list_artifacts(self.root / self.department / "artifacts"),
+            load=_load,
+        )
+        for key in set(self._assets) - seen:
+            self._assets.pop(key, None)
+        return hierarchy
+
+    def _loader(self, department: str) -> Any:
+        loader = self._loaders.get(department)
+        if loader is None:
+            loader = self._loader_factory(self.root, department)
+            self._loaders[department] = loader
+        return loader
+
+    def _load_cached(self, key: tuple[str, str, str], schema: type[BaseModel]) -> Any:
+        department, category, name = key
+        loader = self._loader(department)
+        path, fingerprint = _asset_fingerprint(loader, department, category, name)
+        cached = self._assets.get(key)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            outcome = cached[1]
+        else:
+            try:
+                if path is not None:
+                    outcome = schema.model_validate_json(path.read_text(encoding="utf-8"))
+                else:
+                    outcome = loader.load_asset(category, name, schema)
+            except (FileNotFoundError, ValueError, CardNotFound, KeyError) as exc:
+                outcome = exc
+            if fingerprint is not None:
+                self._assets[key] = (fingerprint, outcome)
+        if isinstance(outcome, Exception):
+            raise outcome.with_traceback(None)
+        return outcome
+
+
+_projections: dict[tuple[Path, str, Any], BoardProjection] = {}
+_projections_lock = threading.Lock()
+
+
+def board_projection(department: str = "core") -> BoardProjection:
+    root = Path("model")
+    key = (root.resolve(), department, ConfigLoader)
+    with _projections_lock:
+        projection = _projections.get(key)
+        if projection is None:
+            projection = BoardProjection(root=root, department=department, loader_factory=ConfigLoader)
+            _projections[key] = projection
+        return projection
+
+
+def _asset_fingerprint(
+    loader: Any,
+    department: str,
+    category: str,
+    name: str,
+) -> tuple[Path | None, AssetFingerprint | None]:
+    strategy = getattr(loader, "loader_strategy_node", None)
+    if strategy is None:
+        return None, None
+    for candidate in strategy.asset_paths(loader.config_dir, loader.model_dir, department, category, name):
+        try:
+            stat = Path(candidate).stat()
+        except OSError:
+            continue
+        return Path(candidate), (str(candidate), stat.st_mtime_ns, stat.st_size)
+    return None, None
+
+
+def _list_artifacts(artifacts_dir: Path) -> list[str]:
+    if not artifacts_dir.exists():
+        return []
+    try:
+        return [f.name for f in artifacts_dir.iterdir() if f.is_file()]
+    except OSError:
+        return []
+
+
 def get_board_hierarchy(department: str = "core", auto_fix: bool = False) -> dict[str, Any]:
     """
     CLI/test helper that builds a tree: Rock -> Epic -> Issue.
-    Blocks the calling thread while loading config assets.
+    Blocks the calling thread while refreshing the cached board projection.
     """
+    if not auto_fix:
+        return board_projection(department).hierarchy()
+
     auto_fix_error: Exception | None = None
-    if auto_fix:
-        try:
-            _run_startup_reconcile()
-        except (RuntimeError, ValueError, OSError, ImportError) as exc:
-            auto_fix_error = exc
+    try:
+        _run_startup_reconcile()
+    except (RuntimeError, ValueError, OSError, ImportError) as exc:
+        auto_fix_error = exc
 
-    loader = ConfigLoader(Path("model"), department)
+    cached = board_projection(department).hierarchy(force_refresh=True)
+    hierarchy = {**cached, "alerts": [], "load_failures": list(cached["load_failures"])}
+    if auto_fix_error is None:
+        hierarchy["alerts"].append(
+            {
+                "type": "info",
+                "message": "auto_fix requested: startup reconciliation executed before hierarchy load.",
+                "action_required": "none",
+            }
+        )
+    else:
+        _append_load_failure(
+            hierarchy["load_failures"],
+            asset_type="board",
+            asset_name="auto_fix",
+            department=department,
+            stage="auto_fix",
+            error=auto_fix_error,
+        )
+    hierarchy["alerts"].extend(
+        alert for alert in cached["alerts"] if not str(alert.get("message", "")).startswith("Partial board load")
+    )
+    _append_partial_load_alert(hierarchy)
+    return hierarchy
 
-    rocks_names = loader.list_assets("rocks")
-    epics_names = loader.list_assets("epics")
-    issues_names = loader.list_assets("issues")
 
-    artifacts: list[str] = []
-    artifacts_dir = Path("model") / department / "artifacts"
-    if artifacts_dir.exists():
-        try:
-            artifacts = [f.name for f in artifacts_dir.iterdir() if f.is_file()]
-        except OSError:
-            artifacts = []
+def _append_partial_load_alert(hierarchy: dict[str, Any]) -> None:
+    load_failures = hierarchy["load_failures"]
+    if not load_failures:
+        return
+    hierarchy["result_status"] = "partial_success"
+    hierarchy["alerts"].append(
+        {
+            "type": "warning",
+            "message": f"Partial board load: {len(load_failures)} load failure(s).",
+            "action_required": (
+                "Inspect load_failures for broken or missing assets before treating this hierarchy as complete."
+            ),
+        }
+    )
+
 
+def _assemble_board_hierarchy(
+    *,
+    department: str,
+    rock_names: list[str],
+    epic_names: list[str],
+    issue_names: list[str],
+    artifacts: list[str],
+    load: AssetLoad,
+) -> dict[str, Any]:
     rocks: list[dict[str, Any]] = []
     orphaned_epics: list[dict[str, Any]] = []
     orphaned_issues: list[dict[str, Any]] = []
@@ -74,33 +255,15 @@ def get_board_hierarchy(department: str = "core", auto_fix: bool = False) -> dic
         "load_failures": load_failures,
         "result_status": "success",
     }
-    if auto_fix:
-        if auto_fix_error is None:
-            alerts.append(
-                {
-                    "type": "info",
-                    "message": "auto_fix requested: startup reconciliation executed before hierarchy load.",
-                    "action_required": "none",
-                }
-            )
-        else:
-            _append_load_failure(
-                load_failures,
-                asset_type="board",
-                asset_name="auto_fix",
-                department=department,
-                stage="auto_fix",
-                error=auto_fix_error,
-            )
 
     epics_in_rocks: set[str] = set()
     issue_ids_in_epics: set[str] = set()
     issue_names_in_epics: set[str] = set()
 
     # 1. Process Rocks
-    for rname in rocks_names:
+    for rname in rock_names:
         try:
-            rock = loader.load_asset("rocks", rname, RockConfig)
+            rock = load("rocks", rname, department, RockConfig)
             rock_epics: list[dict[str, Any]] = []
             rock_node = {
                 "id": rname,
@@ -116,8 +279,7 @@ def get_board_hierarchy(department: str = "core", auto_fix: bool = False) -> dic
                 epics_in_rocks.add(ename)
 
                 try:
-                    dept_loader = ConfigLoader(Path("model"), edept)
-                    epic = dept_loader.load_asset("epics", ename, EpicConfig)
+                    epic = load("epics", ename, edept, EpicConfig)
 
                     # Track issue identity with stable IDs first, plus names for compatibility.
                     epic_issues: list[dict[str, Any]] = []
@@ -161,10 +323,10 @@ def get_board_hierarchy(department: str = "core", auto_fix: bool = False) -> dic
             )
 
     # 2. Find Orphaned Epics
-    for ename in epics_names:
+    for ename in epic_names:
         if ename not in epics_in_rocks:
             try:
-                epic = loader.load_asset("epics", ename, EpicConfig)
+                epic = load("epics", ename, department, EpicConfig)
                 orphaned_epic_issues: list[dict[str, Any]] = []
                 orph_epic = {
                     "id": ename,
@@ -193,9 +355,9 @@ def get_board_hierarchy(department: str = "core", auto_fix: bool = False) -> dic
                 )
 
     # 3. Find Orphaned Issues (Standalone files not referenced in any Epic)
-    for iname in issues_names:
+    for iname in issue_names:
         try:
-            issue = loader.load_asset("issues", iname, IssueConfig)
+            issue = load("issues", iname, department, IssueConfig)
             issue_id = str(getattr(issue, "id", "") or "")
             issue_name = str(getattr(issue, "name", "") or "")
             is_referenced = issue_id in issue_ids_in_epics or (issue_name and issue_name in issue_names_in_epics)
@@ -226,18 +388,7 @@ def get_board_hierarchy(department: str = "core", auto_fix: bool = False) -> dic
             }
         )
 
-    if load_failures:
-        hierarchy["result_status"] = "partial_success"
-        alerts.append(
-            {
-                "type": "warning",
-                "message": f"Partial board load: {len(load_failures)} load failure(s).",
-                "action_required": (
-                    "Inspect load_failures for broken or missing assets before treating this hierarchy as complete."
-                ),
-            }
-        )
-
+    _append_partial_load_alert(hierarchy)
     return hierarchy
 
 
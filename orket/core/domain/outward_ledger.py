@@ -65,7 +65,13 @@ def canonical_event(event: LedgerEvent) -> dict[str, Any]:
     }
 
 
-def verify_ledger_export(payload: Mapping[str, Any]) -> dict[str, Any]:
+def verify_ledger_export(payload: Mapping[str, Any], *, trusted_through: int = 0) -> dict[str, Any]:
+    """Verify an export's hash chain and canonical anchors.
+
+    Events at or before ``trusted_through`` are covered by a verified checkpoint: their stored
+    hashes are taken as given and only their chain links are checked, so a verification pass
+    rehashes just the events appended since the checkpoint.
+    """
     errors: list[str] = []
     if payload.get("schema_version") != SCHEMA_VERSION:
         errors.append("schema_version must be ledger_export.v1")
@@ -103,9 +109,12 @@ def verify_ledger_export(payload: Mapping[str, Any]) -> dict[str, Any]:
             errors.append(f"duplicate event position: {position}")
         positions.add(position)
         previous_chain_hash = str(raw_event.get("previous_chain_hash") or "")
-        event = _event_from_export(raw_event)
-        expected_event_hash = event_hash_for(event)
-        expected_chain_hash = chain_hash_for(previous_chain_hash, expected_event_hash)
+        if position <= trusted_through:
+            expected_event_hash = str(raw_event.get("event_hash") or "")
+            expected_chain_hash = str(raw_event.get("chain_hash") or "")
+        else:
+            expected_event_hash = event_hash_for(_event_from_export(raw_event))
+            expected_chain_hash = chain_hash_for(previous_chain_hash, expected_event_hash)
         if raw_event.get("event_hash") != expected_event_hash:
             errors.append(f"event_hash mismatch at position {position}")
         if raw_event.get("chain_hash") != expected_chain_hash:
@@ -135,6 +144,7 @@ def verify_ledger_export(payload: Mapping[str, Any]) -> dict[str, Any]:
         "ledger_hash": ledger_hash or None,
         "event_count": canonical_count,
         "checked_event_count": len(raw_events),
+        "trusted_through_position": max(0, int(trusted_through)),
         "errors": errors,
     }
 
@@ -17,4 +17,14 @@ class LedgerEvent:
     chain_hash: str | None = None
 
 
-__all__ = ["LedgerEvent"]
+@dataclass(frozen=True)
+class LedgerCheckpoint:
+    run_id: str
+    position: int
+    event_id: str
+    chain_hash: str
+    created_at: str
+    signature: str
+
+
+__all__ = ["LedgerCheckpoint", "LedgerEvent"]
@@ -728,3 +728,20 @@ class DefaultModelClientPolicyNode:
 
     def create_client(self, provider: Any) -> Any:
         return _DefaultAsyncModelClient(provider)
+
+    def create_warm_backend(self, env: Any, *, keep_alive_seconds: float) -> Any:
+        """Warm-state backend for the environment's provider; None where the server manages residency itself.
+
+        ``env.params`` may name ``provider`` and ``ollama_host``; the process settings fill in the rest.
+        """
+        params = getattr(env, "params", None) or {}
+        provider = (
+            str(params.get("provider") or os.getenv("ORKET_LLM_PROVIDER") or os.getenv("ORKET_MODEL_PROVIDER") or "ollama")
+            .strip()
+            .lower()
+        )
+        if provider != "ollama":
+            return None
+        from orket.adapters.llm.ollama_model_warm_backend import OllamaModelWarmBackend
+
+        return OllamaModelWarmBackend(host=str(params.get("ollama_host") or ""), keep_alive_seconds=keep_alive_seconds)
@@ -73,6 +73,12 @@ class ModelConnectionError(ModelProviderError):
     pass
 
 
+class ModelResponseCacheMiss(ModelProviderError):
+    """Raised when a replay-only model response cache has no entry for a request."""
+
+    pass
+
+
 class GovernanceViolation(ExecutionFailed):
     """Raised when an architectural or organizational policy is violated."""
 
@@ -3,12 +3,15 @@ import os
 import subprocess
 import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 import psutil
 
+from orket.instrumentation import HOST_SAMPLER_CPU_SECONDS, HOST_SAMPLER_CPU_SHARE
+
 _VRAM_CACHE = {
     "ts": 0.0,
     "total": 0.0,
@@ -45,6 +48,11 @@ def get_vram_info() -> float:
 
 
 def get_current_profile() -> HardwareProfile:
+    """Hardware profile from the running sampler's latest sample; probes directly otherwise."""
+    sampler = host_resource_sampler()
+    latest = sampler.latest()
+    if latest is not None and sampler.running:
+        return latest.profile()
     ram = psutil.virtual_memory().total / (1024**3)
     cpu = psutil.cpu_count(logical=False) or 0
     vram = get_vram_info()
@@ -52,7 +60,14 @@ def get_current_profile() -> HardwareProfile:
 
 
 def get_metrics_snapshot() -> dict[str, Any]:
-    """Returns real-time usage stats for graphs."""
+    """Returns real-time usage stats for graphs.
+
+    Reads the background sampler's latest sample when it is running; otherwise probes with a
+    cached VRAM query.
+    """
+    latest = latest_metrics_snapshot()
+    if latest is not None:
+        return latest
     vm = psutil.virtual_memory()
     cache_ttl_sec = 5.0
     try:
@@ -101,6 +116,232 @@ def get_vram_usage() -> float:
         return 0.0
 
 
+@dataclass(frozen=True)
+class HostSample:
+    timestamp: str
+    monotonic_ts: float
+    cpu_percent: float
+    cpu_cores: int
+    ram_percent: float
+    ram_total_gb: float
+    disk_percent: float
+    disk_free_gb: float
+    vram_gb_used: float
+    vram_total_gb: float
+    has_nvidia: bool
+
+    def metrics_snapshot(self) -> dict[str, Any]:
+        return {
+            "cpu_percent": self.cpu_percent,
+            "ram_percent": self.ram_percent,
+            "disk_percent": self.disk_percent,
+            "vram_gb_used": self.vram_gb_used,
+            "vram_total_gb": self.vram_total_gb,
+            "timestamp": self.timestamp,
+        }
+
+    def profile(self) -> HardwareProfile:
+        return HardwareProfile(
+            cpu_cores=self.cpu_cores,
+            ram_gb=self.ram_total_gb,
+            vram_gb=self.vram_total_gb,
+            has_nvidia=self.has_nvidia,
+        )
+
+
+def _query_nvidia_memory_gb() -> tuple[float, float] | None:
+    """Total and used VRAM across GPUs from one nvidia-smi call; None when the call fails.
+
+    A missing nvidia-smi raises ``FileNotFoundError`` so the caller can stop probing for good.
+    """
+    try:
+        res = subprocess.run(
+            ["nvidia-smi", "--query-gpu=memory.total,memory.used", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        )
+        total_mb = used_mb = 0
+        for line in res.stdout.strip().splitlines():
+            total, used = (int(part) for part in line.split(","))
+            total_mb += total
+            used_mb += used
+        return total_mb / 1024.0, used_mb / 1024.0
+    except FileNotFoundError:
+        raise
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError, ValueError):
+        return None
+
+
+_GPU_RETRY_MAX_SECONDS = 300.0
+
+
+class HostResourceSampler:
+    """Samples CPU, RAM, disk, and VRAM on a daemon thread so readers never probe the host.
+
+    ``latest()`` returns the newest immutable sample without locking: the sampler thread
+    publishes each sample with a single reference assignment. ``history()`` copies a bounded
+    ring buffer. Once nvidia-smi is found missing it is not forked again; other nvidia-smi
+    failures back off exponentially and keep the last good VRAM reading. The thread's own CPU
+    time is tracked so the sampler's cost shows up in ``stats()`` and the hot-path metrics.
+    """
+
+    def __init__(self, *, interval_seconds: float = 2.0, history_size: int = 150, disk_path: str = ".") -> None:
+        self.interval_seconds = max(0.05, float(interval_seconds))
+        self.disk_path = disk_path
+        self._history: deque[HostSample] = deque(maxlen=max(1, int(history_size)))
+        self._latest: HostSample | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lifecycle_lock = threading.Lock()
+        self._gpu_available = True
+        self._gpu_failures = 0
+        self._gpu_retry_at = 0.0
+        self._last_vram: tuple[float, float] = (0.0, 0.0)
+        self._cpu_cores = psutil.cpu_count(logical=False) or 0
+        self._samples = 0
+        self._cpu_seconds = 0.0
+        self._started_monotonic = 0.0
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self) -> None:
+        with self._lifecycle_lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._started_monotonic = time.monotonic()
+            self._thread = threading.Thread(target=self._run, name="orket-host-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        with self._lifecycle_lock:
+            thread = self._thread
+            self._stop.set()
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def latest(self) -> HostSample | None:
+        return self._latest
+
+    def history(self) -> list[HostSample]:
+        return list(self._history)
+
+    def sample_once(self) -> HostSample:
+        vm = psutil.virtual_memory()
+        try:
+            disk = psutil.disk_usage(self.disk_path)
+            disk_percent, disk_free_gb = float(disk.percent), disk.free / (1024**3)
+        except OSError:
+            disk_percent, disk_free_gb = 0.0, 0.0
+        vram_total, vram_used = self._sample_vram() if self._gpu_available else (0.0, 0.0)
+        sample = HostSample(
+            timestamp=datetime.now(UTC).isoformat(),
+            monotonic_ts=time.monotonic(),
+            cpu_percent=float(psutil.cpu_percent(interval=None)),
+            cpu_cores=self._cpu_cores,
+            ram_percent=float(vm.percent),
+            ram_total_gb=vm.total / (1024**3),
+            disk_percent=disk_percent,
+            disk_free_gb=disk_free_gb,
+            vram_gb_used=vram_used,
+            vram_total_gb=vram_total,
+            has_nvidia=vram_total > 0,
+        )
+        self._history.append(sample)
+        self._latest = sample
+        return sample
+
+    def _sample_vram(self) -> tuple[float, float]:
+        now = time.monotonic()
+        if now < self._gpu_retry_at:
+            return self._last_vram
+        try:
+            vram = _query_nvidia_memory_gb()
+        except FileNotFoundError:
+            self._gpu_available = False
+            return 0.0, 0.0
+        if vram is None:
+            self._gpu_failures += 1
+            backoff = min(_GPU_RETRY_MAX_SECONDS, self.interval_seconds * 2 ** min(self._gpu_failures, 16))
+            self._gpu_retry_at = now + backoff
+            return self._last_vram
+        self._gpu_failures = 0
+        self._gpu_retry_at = 0.0
+        self._last_vram = vram
+        return vram
+
+    def stats(self) -> dict[str, Any]:
+        wall_seconds = time.monotonic() - self._started_monotonic if self._started_monotonic else 0.0
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "samples": self._samples,
+            "history_size": len(self._history),
+            "gpu_available": self._gpu_available,
+            "gpu_failures": self._gpu_failures,
+            "cpu_seconds": round(self._cpu_seconds, 6),
+            "cpu_share": round(self._cpu_seconds / wall_seconds, 6) if wall_seconds > 0 else 0.0,
+            "cpu_seconds_per_sample": round(self._cpu_seconds / self._samples, 6) if self._samples else 0.0,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started_cpu = time.thread_time()
+            self.sample_once()
+            spent = time.thread_time() - started_cpu
+            self._samples += 1
+            self._cpu_seconds += spent
+            HOST_SAMPLER_CPU_SECONDS.inc(amount=spent)
+            wall_seconds = time.monotonic() - self._started_monotonic
+            if wall_seconds > 0:
+                HOST_SAMPLER_CPU_SHARE.set(self._cpu_seconds / wall_seconds)
+            self._stop.wait(self.interval_seconds)
+
+
+_HOST_SAMPLER: HostResourceSampler | None = None
+_HOST_SAMPLER_LOCK = threading.Lock()
+
+
+def host_resource_sampler() -> HostResourceSampler:
+    """Process-wide sampler configured by ``ORKET_HOST_SAMPLER_INTERVAL_SEC`` and ``ORKET_HOST_SAMPLER_HISTORY``."""
+    global _HOST_SAMPLER
+    with _HOST_SAMPLER_LOCK:
+        if _HOST_SAMPLER is None:
+            try:
+                interval = float(os.getenv("ORKET_HOST_SAMPLER_INTERVAL_SEC", "2"))
+                history_size = int(os.getenv("ORKET_HOST_SAMPLER_HISTORY", "150"))
+            except (TypeError, ValueError):
+                interval, history_size = 2.0, 150
+            _HOST_SAMPLER = HostResourceSampler(interval_seconds=interval, history_size=history_size)
+        return _HOST_SAMPLER
+
+
+def latest_metrics_snapshot() -> dict[str, Any] | None:
+    """O(1) metrics from the running sampler's latest sample; None when the sampler has not produced one."""
+    sampler = host_resource_sampler()
+    latest = sampler.latest()
+    if latest is None or not sampler.running:
+        return None
+    return {**latest.metrics_snapshot(), "sampler": sampler.stats()}
+
+
+def host_sampler_snapshot() -> dict[str, Any]:
+    """Latest sample, recent history, and sampler cost, for diagnostics."""
+    sampler = host_resource_sampler()
+    latest = sampler.latest()
+    return {
+        "latest": asdict(latest) if latest is not None else None,
+        "history": [asdict(sample) for sample in sampler.history()],
+        "sampler": sampler.stats(),
+    }
+
+
 class ToolTier:
     """Definitions for Hardware Requirements."""
 
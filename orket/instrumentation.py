@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+# Per-event budget for recording one observation (histogram, one label, run scope active).
+# Measured at roughly 1.5us on CPython 3.11; the budget leaves headroom for loaded hosts.
+RECORDING_BUDGET_NS = 5_000
+
+LATENCY_BUCKETS_SECONDS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+DEPTH_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+RATIO_BUCKETS = (0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+TOKEN_RATE_BUCKETS = (1, 5, 10, 20, 40, 80, 160, 320, 640)
+
+_RUN_SCOPE: ContextVar[MetricsRegistry | None] = ContextVar("orket_run_metrics_scope", default=None)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _definition(self) -> dict[str, Any]:
+        return {"help_text": self.help, "labelnames": self.labelnames}
+
+    def _scoped(self) -> _Metric | None:
+        scope = _RUN_SCOPE.get()
+        if scope is None:
+            return None
+        return scope._mirror(self)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._inc(labels, amount)
+        scoped = self._scoped()
+        if scoped is not None:
+            scoped._inc(labels, amount)  # type: ignore[attr-defined]
+
+    def _inc(self, labels: tuple[str, ...], amount: float) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> dict[tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._set(labels, value)
+        scoped = self._scoped()
+        if scoped is not None:
+            scoped._set(labels, value)  # type: ignore[attr-defined]
+
+    def _set(self, labels: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[labels] = float(value)
+
+    def samples(self) -> dict[tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class _HistogramSeries:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_counts = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def _definition(self) -> dict[str, Any]:
+        return {**super()._definition(), "buckets": self.buckets}
+
+    def observe(self, value: float, *labels: str) -> None:
+        self._observe(labels, value)
+        scoped = self._scoped()
+        if scoped is not None:
+            scoped._observe(labels, value)  # type: ignore[attr-defined]
+
+    def _observe(self, labels: tuple[str, ...], value: float) -> None:
+        # Buckets are stored non-cumulatively (index = first bound >= value); rendering sums them.
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+            series.bucket_counts[index] += 1
+            series.count += 1
+            series.sum += value
+
+    def time(self, *labels: str) -> _HistogramTimer:
+        """Context manager observing the elapsed seconds of its block."""
+        return _HistogramTimer(self, labels)
+
+    def samples(self) -> dict[tuple[str, ...], tuple[list[int], int, float]]:
+        with self._lock:
+            return {
+                labels: (list(series.bucket_counts), series.count, series.sum)
+                for labels, series in self._series.items()
+            }
+
+
+class _HistogramTimer:
+    __slots__ = ("_histogram", "_labels", "_started")
+
+    def __init__(self, histogram: Histogram, labels: tuple[str, ...]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._started = 0.0
+
+    def __enter__(self) -> _HistogramTimer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._histogram.observe(time.perf_counter() - self._started, *self._labels)
+
+
+_MetricT = TypeVar("_MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Process-local counters, gauges, and histograms with OpenMetrics and JSON export."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter, name, help_text=help_text, labelnames=labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text=help_text, labelnames=labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help_text=help_text, labelnames=labelnames, buckets=buckets)
+
+    def _register(self, metric_type: type[_MetricT], name: str, **definition: Any) -> _MetricT:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, metric_type):
+                    raise ValueError(f"metric '{name}' is already registered as a {existing.kind}")
+                return existing
+            metric = self._metrics[name] = metric_type(name, **definition)
+            return metric
+
+    def _mirror(self, metric: _Metric) -> _Metric:
+        mirrored = self._metrics.get(metric.name)
+        if mirrored is None:
+            mirrored = self._register(type(metric), metric.name, **metric._definition())
+        return mirrored
+
+    def snapshot(self) -> dict[str, Any]:
+        families: dict[str, Any] = {}
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda item: item.name)
+        for metric in metrics:
+            series: list[dict[str, Any]] = []
+            if isinstance(metric, Histogram):
+                for labels, (bucket_counts, count, total) in sorted(metric.samples().items()):
+                    series.append(
+                        {
+                            "labels": dict(zip(metric.labelnames, labels, strict=False)),
+                            "count": count,
+                            "sum": round(total, 9),
+                            "mean": round(total / count, 9) if count else 0.0,
+                            "p50": _bucket_quantile(metric.buckets, bucket_counts, count, 0.50),
+                            "p95": _bucket_quantile(metric.buckets, bucket_counts, count, 0.95),
+                            "buckets": _cumulative_buckets(metric.buckets, bucket_counts),
+                        }
+                    )
+            elif isinstance(metric, Counter | Gauge):
+                for labels, value in sorted(metric.samples().items()):
+                    series.append({"labels": dict(zip(metric.labelnames, labels, strict=False)), "value": value})
+            if series:
+                families[metric.name] = {"type": metric.kind, "help": metric.help, "series": series}
+        return families
+
+    def render_openmetrics(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda item: item.name)
+        for metric in metrics:
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            if isinstance(metric, Histogram):
+                for labels, (bucket_counts, count, total) in sorted(metric.samples().items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(metric.buckets, bucket_counts, strict=False):
+                        cumulative += bucket_count
+                        label_text = _label_text(metric.labelnames, labels, le=_format_number(bound))
+                        lines.append(f"{metric.name}_bucket{label_text} {cumulative}")
+                    label_text = _label_text(metric.labelnames, labels, le="+Inf")
+                    lines.append(f"{metric.name}_bucket{label_text} {count}")
+                    label_text = _label_text(metric.labelnames, labels)
+                    lines.append(f"{metric.name}_count{label_text} {count}")
+                    lines.append(f"{metric.name}_sum{label_text} {_format_number(total)}")
+            elif isinstance(metric, Counter):
+                for labels, value in sorted(metric.samples().items()):
+                    lines.append(f"{metric.name}_total{_label_text(metric.labelnames, labels)} {_format_number(value)}")
+            elif isinstance(metric, Gauge):
+                for labels, value in sorted(metric.samples().items()):
+                    lines.append(f"{metric.name}{_label_text(metric.labelnames, labels)} {_format_number(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+
+def _cumulative_buckets(bounds: tuple[float, ...], bucket_counts: list[int]) -> dict[str, int]:
+    cumulative = 0
+    result: dict[str, int] = {}
+    for bound, bucket_count in zip(bounds, bucket_counts, strict=False):
+        cumulative += bucket_count
+        result[_format_number(bound)] = cumulative
+    result["+Inf"] = cumulative + bucket_counts[-1]
+    return result
+
+
+def _bucket_quantile(bounds: tuple[float, ...], bucket_counts: list[int], count: int, quantile: float) -> float:
+    """Upper bound of the bucket holding the quantile; observations past the last bound report it."""
+    if count <= 0:
+        return 0.0
+    target = math.ceil(quantile * count)
+    cumulative = 0
+    for bound, bucket_count in zip(bounds, bucket_counts, strict=False):
+        cumulative += bucket_count
+        if cumulative >= target:
+            return bound
+    return bounds[-1] if bounds else 0.0
+
+
+def _format_number(value: float) -> str:
+    number = float(value)
+    if number.is_integer() and abs(number) < 1e15:
+        return f"{number:.1f}"
+    return repr(number)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(labelnames: tuple[str, ...], labels: tuple[str, ...], *, le: str | None = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(labelnames, labels, strict=False)]
+    if le is not None:
+        pairs.append(f'le="{le}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+@contextmanager
+def run_metrics_scope() -> Iterator[MetricsRegistry]:
+    """Mirror every observation recorded in this context (and tasks it spawns) into a per-run registry."""
+    registry = MetricsRegistry()
+    token = _RUN_SCOPE.set(registry)
+    try:
+        yield registry
+    finally:
+        _RUN_SCOPE.reset(token)
+
+
+def current_run_metrics() -> MetricsRegistry | None:
+    return _RUN_SCOPE.get()
+
+
+def measure_recording_overhead(iterations: int = 20_000) -> float:
+    """Mean nanoseconds to record one labelled histogram observation with a run scope active."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("orket_overhead_probe_seconds", "Overhead probe.", ("label",))
+    count = max(1, int(iterations))
+    with run_metrics_scope():
+        histogram.observe(0.001, "probe")
+        started = time.perf_counter_ns()
+        for _ in range(count):
+            histogram.observe(0.001, "probe")
+        elapsed = time.perf_counter_ns() - started
+    overhead_ns = elapsed / count
+    RECORDING_OVERHEAD_NS.set(overhead_ns)
+    return overhead_ns
+
+
+_SQLITE_LABELS: dict[str, str] = {}
+
+
+def sqlite_operation_label(repository: object, operation: Callable[..., Any]) -> str:
+    """``Repository.method`` for an operation closure defined inside a repository method."""
+    qualname = getattr(operation, "__qualname__", "")
+    label = _SQLITE_LABELS.get(qualname)
+    if label is None:
+        owner, _, rest = qualname.partition(".<locals>")
+        label = owner if rest else f"{type(repository).__name__}.{qualname or 'unknown'}"
+        _SQLITE_LABELS[qualname] = label
+    return label
+
+
+def record_model_completion(
+    provider: str,
+    *,
+    latency_seconds: float,
+    time_to_first_token_seconds: float | None,
+    completion_tokens: int | None,
+    generation_seconds: float | None,
+) -> None:
+    """Record one model request; unknown TTFT or generation timings are skipped rather than guessed."""
+    MODEL_REQUEST_SECONDS.observe(latency_seconds, provider)
+    if time_to_first_token_seconds is not None and time_to_first_token_seconds > 0:
+        MODEL_TIME_TO_FIRST_TOKEN_SECONDS.observe(time_to_first_token_seconds, provider)
+    if completion_tokens and generation_seconds and generation_seconds > 0:
+        MODEL_TOKENS_PER_SECOND.observe(completion_tokens / generation_seconds, provider)
+
+
+HOT_PATH_METRICS = MetricsRegistry()
+
+LEDGER_APPEND_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_ledger_append_seconds", "Time to append one record to an append-only ledger, fsync included.", ("ledger",)
+)
+LEDGER_FSYNC_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_ledger_fsync_seconds", "Time spent in fsync after a ledger append.", ("ledger",)
+)
+SQLITE_QUERY_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_sqlite_query_seconds", "SQLite repository operation time by repository method.", ("method",)
+)
+MODEL_REQUEST_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_model_request_seconds", "Model request wall time.", ("provider",)
+)
+MODEL_TIME_TO_FIRST_TOKEN_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_model_time_to_first_token_seconds",
+    "Time to first token; prompt evaluation time for non-streaming requests.",
+    ("provider",),
+)
+MODEL_TOKENS_PER_SECOND = HOT_PATH_METRICS.histogram(
+    "orket_model_tokens_per_second", "Completion tokens per second of generation.", ("provider",), TOKEN_RATE_BUCKETS
+)
+STREAM_BUS_QUEUE_DEPTH = HOT_PATH_METRICS.histogram(
+    "orket_stream_bus_queue_depth", "Subscriber queue depth seen when an event is delivered.", (), DEPTH_BUCKETS
+)
+STREAM_BUS_DROPPED_EVENTS = HOT_PATH_METRICS.counter(
+    "orket_stream_bus_dropped_events", "Best-effort stream events dropped by the per-turn budget.", ("event_type",)
+)
+TOOL_DISPATCH_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_tool_dispatch_seconds", "Tool execution time in the turn tool dispatcher.", ("tool",)
+)
+TOOL_DISPATCH_ERRORS = HOT_PATH_METRICS.counter(
+    "orket_tool_dispatch_errors", "Tool executions that raised in the turn tool dispatcher.", ("tool",)
+)
+ORCHESTRATOR_WAVE_OCCUPANCY = HOT_PATH_METRICS.histogram(
+    "orket_orchestrator_wave_occupancy",
+    "Share of the epic concurrency limit filled by each dispatch wave.",
+    (),
+    RATIO_BUCKETS,
+)
+ORCHESTRATOR_WAVE_SIZE = HOT_PATH_METRICS.histogram(
+    "orket_orchestrator_wave_size", "Issues dispatched per orchestrator wave.", (), DEPTH_BUCKETS
+)
+MODEL_RESPONSE_CACHE_LOOKUPS = HOT_PATH_METRICS.counter(
+    "orket_model_response_cache_lookups", "Model response cache lookups by result.", ("result",)
+)
+MODEL_RESPONSE_CACHE_SAVED_SECONDS = HOT_PATH_METRICS.counter(
+    "orket_model_response_cache_saved_seconds", "Original inference time of completions served from the cache."
+)
+PROMPT_PREFIX_LOOKUPS = HOT_PATH_METRICS.counter(
+    "orket_prompt_prefix_lookups",
+    "Prefix-stable prompts whose stable prefix matched the one pinned for the role and session.",
+    ("result",),
+)
+MODEL_PROMPT_CACHE_REUSE_RATIO = HOT_PATH_METRICS.histogram(
+    "orket_model_prompt_cache_reuse_ratio",
+    "Share of prompt tokens the backend served from its prefix cache.",
+    ("provider",),
+    RATIO_BUCKETS,
+)
+MODEL_COLD_STARTS = HOT_PATH_METRICS.counter(
+    "orket_model_cold_starts", "Turns that needed a model that was not resident.", ("model",)
+)
+MODEL_LOAD_SECONDS = HOT_PATH_METRICS.histogram(
+    "orket_model_load_seconds", "Model load time, by whether it was a prewarm or a cold start.", ("model", "reason")
+)
+MODEL_WARM_EVICTIONS = HOT_PATH_METRICS.counter(
+    "orket_model_warm_evictions", "Resident models unloaded to stay within the warm-state memory budget.", ("model",)
+)
+HOST_SAMPLER_CPU_SECONDS = HOT_PATH_METRICS.counter(
+    "orket_host_sampler_cpu_seconds", "CPU time the background host resource sampler spent sampling."
+)
+HOST_SAMPLER_CPU_SHARE = HOT_PATH_METRICS.gauge(
+    "orket_host_sampler_cpu_share", "Sampler CPU time as a fraction of its wall-clock lifetime."
+)
+RECORDING_OVERHEAD_NS = HOT_PATH_METRICS.gauge(
+    "orket_instrumentation_record_overhead_nanoseconds", "Measured cost of recording one observation."
+)
+
+
+@functools.cache
+def _startup_recording_overhead_ns() -> float:
+    return measure_recording_overhead()
+
+
+def render_hot_path_openmetrics() -> str:
+    """OpenMetrics exposition of the process-wide hot-path registry, with the recording overhead gauge."""
+    _startup_recording_overhead_ns()
+    return HOT_PATH_METRICS.render_openmetrics()
@@ -15,10 +15,6 @@ from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader
 
 from orket import __version__
-from orket.adapters.storage.outward_approval_store import OutwardApprovalStore
-from orket.adapters.storage.outward_run_event_store import OutwardRunEventStore
-from orket.adapters.storage.outward_run_store import OutwardRunStore
-from orket.adapters.tools.registry import DEFAULT_BUILTIN_CONNECTOR_REGISTRY
 from orket.application.services.api_runtime_host_service import ApiRuntimeHostService
 from orket.application.services.extension_runtime_service import ExtensionRuntimeService
 from orket.application.services.outward_approval_service import OutwardApprovalService
@@ -62,12 +58,14 @@ from orket.application.services.runtime_policy import (
 )
 from orket.decision_nodes.registry import DecisionNodeRegistry
 from orket.extensions import ExtensionManager
-from orket.hardware import get_metrics_snapshot
+from orket.hardware import get_metrics_snapshot, host_resource_sampler, latest_metrics_snapshot
+from orket.instrumentation import render_hot_path_openmetrics
 from orket.interfaces.api_runtime_context import (
     ApiAppRuntimeContext,
     get_api_runtime_context,
     set_api_runtime_context,
 )
+from orket.interfaces.outward_service_container import OutwardServiceContainer
 from orket.interfaces.routers.card_authoring import build_card_authoring_router
 from orket.interfaces.routers.cards import build_cards_router
 from orket.interfaces.routers.extension_runtime import build_extension_runtime_router
@@ -97,6 +95,7 @@ from orket.streaming import (
     StreamBus,
     StreamBusConfig,
 )
+from orket.streaming.model_provider import shared_http_client_pool
 from orket.time_utils import now_local
 from orket.workloads import is_builtin_workload, run_builtin_workload, validate_builtin_workload_start
 
@@ -560,6 +559,10 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         await initialize()
 
     ensure_log_dir()
+    outward_services = _outward_services()
+    await outward_services.warm()
+    host_sampler = host_resource_sampler()
+    host_sampler.start()
     broadcaster_task = asyncio.create_task(event_broadcaster())
     loop = asyncio.get_running_loop()
     log_subscriber = _on_log_record_factory(loop)
@@ -587,6 +590,9 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         broadcaster_task.cancel()
         with suppress(asyncio.CancelledError):
             await broadcaster_task
+        await outward_services.close()
+        await shared_http_client_pool().aclose()
+        await asyncio.to_thread(host_sampler.stop)
 
 
 app = FastAPI(title="Orket API", version=__version__, lifespan=lifespan)
@@ -634,57 +640,46 @@ def _connector_http_allowlist() -> tuple[str, ...]:
     return tuple(host.strip().lower() for host in raw.split(",") if host.strip())
 
 
-def _outward_run_service() -> OutwardRunService:
-    db_path = _outward_pipeline_db_path()
+def _outward_services() -> OutwardServiceContainer:
+    context = _runtime_context()
     runtime_host = _get_api_runtime_host()
-    return OutwardRunService(
-        run_store=OutwardRunStore(db_path),
-        event_store=OutwardRunEventStore(db_path),
-        run_id_factory=runtime_host.create_session_id,
-        utc_now=runtime_host.utc_now_iso,
-    )
+    db_path = _outward_pipeline_db_path()
+    workspace_root = _project_root()
+    http_allowlist = _connector_http_allowlist()
+    container = context.outward_services
+    if not isinstance(container, OutwardServiceContainer) or not container.matches(
+        db_path=db_path, workspace_root=workspace_root, http_allowlist=http_allowlist, owner=runtime_host
+    ):
+        container = OutwardServiceContainer(
+            db_path=db_path,
+            workspace_root=workspace_root,
+            run_id_factory=runtime_host.create_session_id,
+            utc_now=runtime_host.utc_now_iso,
+            http_allowlist=http_allowlist,
+            owner=runtime_host,
+        )
+        context.outward_services = container
+    return container
+
+
+def _outward_run_service() -> OutwardRunService:
+    return _outward_services().run_service()
 
 
 def _outward_approval_service() -> OutwardApprovalService:
-    db_path = _outward_pipeline_db_path()
-    return OutwardApprovalService(
-        approval_store=OutwardApprovalStore(db_path),
-        run_store=OutwardRunStore(db_path),
-        event_store=OutwardRunEventStore(db_path),
-        connector_registry=DEFAULT_BUILTIN_CONNECTOR_REGISTRY,
-        utc_now=_get_api_runtime_host().utc_now_iso,
-    )
+    return _outward_services().approval_service()
 
 
 def _outward_run_execution_service() -> OutwardRunExecutionService:
-    db_path = _outward_pipeline_db_path()
-    runtime_host = _get_api_runtime_host()
-    return OutwardRunExecutionService(
-        run_store=OutwardRunStore(db_path),
-        event_store=OutwardRunEventStore(db_path),
-        approval_service=_outward_approval_service(),
-        connector_registry=DEFAULT_BUILTIN_CONNECTOR_REGISTRY,
-        workspace_root=_project_root(),
-        utc_now=runtime_host.utc_now_iso,
-        http_allowlist=_connector_http_allowlist(),
-    )
+    return _outward_services().execution_service()
 
 
 def _outward_run_inspection_service() -> OutwardRunInspectionService:
-    db_path = _outward_pipeline_db_path()
-    return OutwardRunInspectionService(
-        run_store=OutwardRunStore(db_path),
-        event_store=OutwardRunEventStore(db_path),
-    )
+    return _outward_services().inspection_service()
 
 
 def _outward_ledger_service() -> OutwardLedgerService:
-    db_path = _outward_pipeline_db_path()
-    return OutwardLedgerService(
-        run_store=OutwardRunStore(db_path),
-        event_store=OutwardRunEventStore(db_path),
-        utc_now=_get_api_runtime_host().utc_now_iso,
-    )
+    return _outward_services().ledger_service()
 
 
 # Apply auth to all v1 endpoints if configured
@@ -869,6 +864,7 @@ v1_router.include_router(
         outward_approval_service_getter=lambda: _outward_approval_service(),
         outward_execution_service_getter=lambda: _outward_run_execution_service(),
         outbound_filter=lambda payload, surface: _filter_operator_payload(payload, surface=surface),
+        endpoint_timer=lambda endpoint: _outward_services().timed(endpoint),
     )
 )
 v1_router.include_router(build_cards_router(lambda: _get_engine(), lambda: api_runtime_node))
@@ -997,6 +993,9 @@ v1_router.include_router(
         runtime_host_getter=lambda: _get_api_runtime_host(),
         now_local=now_local,
         get_metrics_snapshot=get_metrics_snapshot,
+        latest_metrics_snapshot=latest_metrics_snapshot,
+        outward_timing_snapshot=lambda: _outward_services().timing_snapshot(),
+        render_openmetrics=render_hot_path_openmetrics,
         log_event=lambda name, payload, workspace: log_event(name, payload, workspace),
         model_selector_factory=lambda organization, preferences, user_settings: ModelSelector(
             organization=organization,
@@ -1152,9 +1151,11 @@ _RUN_SUBMISSION_BODY = Body(...)
 
 @v1_router.post("/runs")
 async def submit_run(payload: dict[str, Any] = _RUN_SUBMISSION_BODY) -> dict[str, Any]:
+    services = _outward_services()
     try:
-        record = await _outward_run_service().submit(payload)
-        record = await _outward_run_execution_service().start_if_ready(record.run_id)
+        async with services.timed("api.runs.submit"):
+            record = await services.run_service().submit(payload)
+            record = await services.execution_service().start_if_ready(record.run_id)
     except OutwardRunValidationError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     except OutwardRunExecutionValidationError as exc:
@@ -1172,7 +1173,9 @@ async def list_runs(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
 ) -> Any:
-    records = await _outward_run_service().list_runs(status=status, limit=limit, offset=offset)
+    services = _outward_services()
+    async with services.timed("api.runs.list"):
+        records = await services.run_service().list_runs(status=status, limit=limit, offset=offset)
     if records or status is not None or limit != 20 or offset != 0:
         payload = {
             "items": [record.to_status_payload() for record in records],
@@ -1201,15 +1204,17 @@ async def get_outward_run_events(
     agent_id: str | None = Query(default=None),
     limit: int = Query(default=1000, ge=1, le=5000),
 ) -> dict[str, Any]:
+    services = _outward_services()
     try:
-        payload = await _outward_run_inspection_service().events(
-            run_id,
-            from_turn=from_turn,
-            to_turn=to_turn,
-            types=_parse_event_types(types),
-            agent_id=agent_id,
-            limit=limit,
-        )
+        async with services.timed("api.runs.events"):
+            payload = await services.inspection_service().events(
+                run_id,
+                from_turn=from_turn,
+                to_turn=to_turn,
+                types=_parse_event_types(types),
+                agent_id=agent_id,
+                limit=limit,
+            )
     except OutwardRunInspectionError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return _filter_operator_payload(payload, surface="api.runs.events")
@@ -1217,8 +1222,10 @@ async def get_outward_run_events(
 
 @v1_router.get("/runs/{run_id}/summary")
 async def get_outward_run_summary(run_id: str) -> dict[str, Any]:
+    services = _outward_services()
     try:
-        payload = await _outward_run_inspection_service().summary(run_id)
+        async with services.timed("api.runs.summary"):
+            payload = await services.inspection_service().summary(run_id)
     except OutwardRunInspectionError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return _filter_operator_payload(payload, surface="api.runs.summary")
@@ -1229,14 +1236,18 @@ async def stream_outward_run_events(
     run_id: str,
     types: str | None = Query(default=None),
 ) -> StreamingResponse:
-    if await _outward_run_service().get_status(run_id) is None:
+    services = _outward_services()
+    async with services.timed("api.runs.events.stream"):
+        run_record = await services.run_service().get_status(run_id)
+    if run_record is None:
         raise HTTPException(status_code=404, detail=f"Run '{run_id}' not found")
 
     async def _stream() -> AsyncIterator[str]:
         seen: set[str] = set()
         event_types = _parse_event_types(types)
         while True:
-            payload = await _outward_run_inspection_service().events(run_id, types=event_types)
+            async with _outward_services().timed("api.runs.events.stream.poll"):
+                payload = await _outward_run_inspection_service().events(run_id, types=event_types)
             emitted = False
             for event in payload["events"]:
                 event_id = str(event.get("event_id") or "")
@@ -1262,14 +1273,16 @@ async def export_outward_run_ledger(
     types: str | None = Query(default=None),
     include_pii: bool = Query(default=False),
 ) -> dict[str, Any]:
+    services = _outward_services()
     try:
-        payload = await _outward_ledger_service().export(
-            run_id,
-            types=_parse_event_types(types),
-            include_pii=include_pii,
-            operator_ref="operator:api",
-            record_request=include_pii,
-        )
+        async with services.timed("api.runs.ledger"):
+            payload = await services.ledger_service().export(
+                run_id,
+                types=_parse_event_types(types),
+                include_pii=include_pii,
+                operator_ref="operator:api",
+                record_request=include_pii,
+            )
     except OutwardLedgerValidationError as exc:
         status_code = 404 if "not found" in str(exc).lower() else 422
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
@@ -1278,8 +1291,10 @@ async def export_outward_run_ledger(
 
 @v1_router.get("/runs/{run_id}/ledger/verify")
 async def verify_outward_run_ledger(run_id: str) -> dict[str, Any]:
+    services = _outward_services()
     try:
-        payload = await _outward_ledger_service().verify_run(run_id)
+        async with services.timed("api.runs.ledger.verify"):
+            payload = await services.ledger_service().verify_run(run_id)
     except OutwardLedgerValidationError as exc:
         status_code = 404 if "not found" in str(exc).lower() else 422
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
@@ -1288,7 +1303,9 @@ async def verify_outward_run_ledger(run_id: str) -> dict[str, Any]:
 
 @v1_router.get("/runs/{session_id}")
 async def get_run_detail(session_id: str) -> dict[str, Any]:
-    outward_record = await _outward_run_service().get_status(session_id)
+    services = _outward_services()
+    async with services.timed("api.runs.status"):
+        outward_record = await services.run_service().get_status(session_id)
     if outward_record is not None:
         return _filter_operator_payload(outward_record.to_status_payload(), surface="api.runs.status")
 
@@ -1737,11 +1754,24 @@ async def stop_sandbox(sandbox_id: str, request: Request) -> dict[str, bool]:
 
 
 @v1_router.get("/sandboxes/{sandbox_id}/logs")
-async def get_sandbox_logs(sandbox_id: str, service: str | None = None) -> dict[str, Any]:
+async def get_sandbox_logs(
+    sandbox_id: str,
+    service: str | None = None,
+    tail: int | None = Query(default=None, ge=1, le=2000),
+    since: str | None = None,
+) -> dict[str, Any]:
     pipeline = _get_api_runtime_host().create_execution_pipeline(
         api_runtime_node.resolve_sandbox_workspace(_project_root())
     )
     invocation = api_runtime_node.resolve_sandbox_logs_invocation(sandbox_id, service)
+    since_dt = _coerce_datetime(since)
+    log_query: dict[str, Any] = {}
+    if tail is not None:
+        log_query["tail"] = tail
+    if since_dt is not None:
+        log_query["since"] = since_dt.timestamp()
+    if log_query:
+        invocation = {**invocation, "kwargs": {**invocation.get("kwargs", {}), **log_query}}
     logs = await asyncio.to_thread(
         _invoke_sync_method,
         pipeline.sandbox_orchestrator,
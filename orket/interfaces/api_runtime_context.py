@@ -18,6 +18,7 @@ class ApiAppRuntimeContext:
     interaction_manager: Any | None = None
     extension_manager: Any | None = None
     extension_runtime_service: Any | None = None
+    outward_services: Any | None = None
 
 
 def get_api_runtime_context(app: FastAPI) -> ApiAppRuntimeContext | None:
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import inspect
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from orket.adapters.storage.outward_approval_store import OutwardApprovalStore
+from orket.adapters.storage.outward_run_event_store import OutwardRunEventStore
+from orket.adapters.storage.outward_run_store import OutwardRunStore
+from orket.adapters.tools.registry import DEFAULT_BUILTIN_CONNECTOR_REGISTRY
+from orket.application.services.outward_approval_service import OutwardApprovalService
+from orket.application.services.outward_ledger_service import OutwardLedgerService
+from orket.application.services.outward_run_execution_service import OutwardRunExecutionService
+from orket.application.services.outward_run_inspection_service import OutwardRunInspectionService
+from orket.application.services.outward_run_service import OutwardRunService
+
+ENDPOINT_TIMING_SAMPLES = 256
+
+ServiceT = TypeVar("ServiceT")
+
+
+@dataclass
+class _EndpointTiming:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=ENDPOINT_TIMING_SAMPLES))
+
+    def record(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(statistics.median(self.samples), 3) if self.samples else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class OutwardServiceContainer:
+    """App-scoped owner of the outward pipeline stores and services.
+
+    The stores are shared by every service and request, so schema migrations run once per
+    process (``warm`` runs them at startup) instead of on every request. Services are built on
+    first use and cached; their construction time and per-endpoint request timings are kept
+    for ``timing_snapshot``.
+    """
+
+    def __init__(
+        self,
+        *,
+        db_path: Path,
+        workspace_root: Path,
+        run_id_factory: Callable[[], str],
+        utc_now: Callable[[], str],
+        http_allowlist: tuple[str, ...] = (),
+        owner: object | None = None,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.workspace_root = Path(workspace_root)
+        self.run_id_factory = run_id_factory
+        self.utc_now = utc_now
+        self.http_allowlist = tuple(http_allowlist)
+        self.owner = owner
+        self.run_store = OutwardRunStore(self.db_path)
+        self.event_store = OutwardRunEventStore(self.db_path)
+        self.approval_store = OutwardApprovalStore(self.db_path)
+        self._services: dict[str, Any] = {}
+        self._construction_ms: dict[str, float] = {}
+        self._endpoints: dict[str, _EndpointTiming] = {}
+        self.closed = False
+
+    def matches(self, *, db_path: Path, workspace_root: Path, http_allowlist: tuple[str, ...], owner: object) -> bool:
+        return (
+            not self.closed
+            and self.db_path == Path(db_path)
+            and self.workspace_root == Path(workspace_root)
+            and self.http_allowlist == tuple(http_allowlist)
+            and self.owner is owner
+        )
+
+    async def warm(self) -> None:
+        started = time.perf_counter()
+        await self.run_store.ensure_initialized()
+        await self.event_store.ensure_initialized()
+        await self.approval_store.ensure_initialized()
+        self._construction_ms["stores"] = _elapsed_ms(started)
+
+    async def close(self) -> None:
+        """Close every held service, then the shared stores; resources without a close hook are dropped."""
+        self.closed = True
+        services, self._services = list(self._services.values()), {}
+        for resource in [*reversed(services), self.approval_store, self.event_store, self.run_store]:
+            closer = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+            if not callable(closer):
+                continue
+            result = closer()
+            if inspect.isawaitable(result):
+                await result
+
+    def run_service(self) -> OutwardRunService:
+        return self._service(
+            "run_service",
+            lambda: OutwardRunService(
+                run_store=self.run_store,
+                event_store=self.event_store,
+                run_id_factory=self.run_id_factory,
+                utc_now=self.utc_now,
+            ),
+        )
+
+    def approval_service(self) -> OutwardApprovalService:
+        return self._service(
+            "approval_service",
+            lambda: OutwardApprovalService(
+                approval_store=self.approval_store,
+                run_store=self.run_store,
+                event_store=self.event_store,
+                connector_registry=DEFAULT_BUILTIN_CONNECTOR_REGISTRY,
+                utc_now=self.utc_now,
+            ),
+        )
+
+    def execution_service(self) -> OutwardRunExecutionService:
+        return self._service(
+            "execution_service",
+            lambda: OutwardRunExecutionService(
+                run_store=self.run_store,
+                event_store=self.event_store,
+                approval_service=self.approval_service(),
+                connector_registry=DEFAULT_BUILTIN_CONNECTOR_REGISTRY,
+                workspace_root=self.workspace_root,
+                utc_now=self.utc_now,
+                http_allowlist=self.http_allowlist,
+            ),
+        )
+
+    def inspection_service(self) -> OutwardRunInspectionService:
+        return self._service(
+            "inspection_service",
+            lambda: OutwardRunInspectionService(run_store=self.run_store, event_store=self.event_store),
+        )
+
+    def ledger_service(self) -> OutwardLedgerService:
+        return self._service(
+            "ledger_service",
+            lambda: OutwardLedgerService(run_store=self.run_store, event_store=self.event_store, utc_now=self.utc_now),
+        )
+
+    @asynccontextmanager
+    async def timed(self, endpoint: str) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self._endpoints.get(endpoint)
+            if timing is None:
+                timing = self._endpoints[endpoint] = _EndpointTiming()
+            timing.record(_elapsed_ms(started))
+
+    def timing_snapshot(self) -> dict[str, Any]:
+        return {
+            "construction_ms": {name: round(value, 3) for name, value in sorted(self._construction_ms.items())},
+            "endpoints": {name: timing.snapshot() for name, timing in sorted(self._endpoints.items())},
+        }
+
+    def _service(self, name: str, factory: Callable[[], ServiceT]) -> ServiceT:
+        service = self._services.get(name)
+        if service is None:
+            started = time.perf_counter()
+            service = self._services[name] = factory()
+            self._construction_ms[name] = _elapsed_ms(started)
+        return service
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000.0
+
+
+__all__ = ["ENDPOINT_TIMING_SAMPLES", "OutwardServiceContainer"]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+import functools
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any, TypeVar
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 
+HandlerT = TypeVar("HandlerT", bound=Callable[..., Awaitable[Any]])
+
 
 class ApprovalDecisionRequest(BaseModel):
     decision: str
@@ -34,9 +38,24 @@ def build_approvals_router(
     outward_approval_service_getter: Callable[[], Any] | None = None,
     outward_execution_service_getter: Callable[[], Any] | None = None,
     outbound_filter: Callable[[Any, str], Any] | None = None,
+    endpoint_timer: Callable[[str], AbstractAsyncContextManager[Any]] | None = None,
 ) -> APIRouter:
     router = APIRouter()
 
+    def _timed(endpoint: str) -> Callable[[HandlerT], HandlerT]:
+        def decorate(handler: HandlerT) -> HandlerT:
+            if endpoint_timer is None:
+                return handler
+
+            @functools.wraps(handler)
+            async def timed_handler(*args: Any, **kwargs: Any) -> Any:
+                async with endpoint_timer(endpoint):
+                    return await handler(*args, **kwargs)
+
+            return timed_handler  # type: ignore[return-value]
+
+        return decorate
+
     async def _continue_outward_run_after_approval(proposal_id: str) -> None:
         if outward_execution_service_getter is None:
             return
@@ -48,6 +67,7 @@ def build_approvals_router(
         await outward_execution_service_getter().continue_after_denial(proposal_id)
 
     @router.get("/approvals")
+    @_timed("api.approvals.list")
     async def list_approvals(
         status: str | None = Query(default=None),
         session_id: str | None = Query(default=None),
@@ -95,6 +115,7 @@ def build_approvals_router(
         return _filter_payload(outbound_filter, payload, "api.approvals.list")
 
     @router.get("/approvals/{approval_id}")
+    @_timed("api.approvals.review")
     async def get_approval(approval_id: str) -> Any:
         if outward_approval_service_getter is not None:
             outward = await outward_approval_service_getter().get(approval_id)
@@ -114,6 +135,7 @@ def build_approvals_router(
         return _filter_payload(outbound_filter, approval, "api.approvals.review")
 
     @router.post("/approvals/{approval_id}/approve")
+    @_timed("api.approvals.approve")
     async def approve_outward_approval(
         approval_id: str,
         req: OutwardApprovalApproveRequest,
@@ -138,6 +160,7 @@ def build_approvals_router(
         return _filter_payload(outbound_filter, payload, "api.approvals.approve")
 
     @router.post("/approvals/{approval_id}/deny")
+    @_timed("api.approvals.deny")
     async def deny_outward_approval(
         approval_id: str,
         req: OutwardApprovalDenyRequest,
@@ -161,6 +184,7 @@ def build_approvals_router(
         return _filter_payload(outbound_filter, payload, "api.approvals.deny")
 
     @router.post("/approvals/{approval_id}/decision")
+    @_timed("api.approvals.decision")
     async def decide_approval(approval_id: str, req: ApprovalDecisionRequest, request: Request) -> Any:
         if outward_approval_service_getter is not None:
             outward = await outward_approval_service_getter().get(approval_id)
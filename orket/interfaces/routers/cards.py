@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
+from typing import Any, cast
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
@@ -71,6 +71,17 @@ def build_cards_router(engine_getter: Callable[[], Any], api_runtime_node_getter
             issue_count=len(backlog),
         )
 
+    async def _list_cards_keyset(
+        *, engine: Any, filters: dict[str, str | None], limit: int, cursor: str
+    ) -> dict[str, Any]:
+        list_cards_page = getattr(engine.cards, "list_cards_page", None)
+        if not callable(list_cards_page):
+            raise HTTPException(status_code=400, detail="cursor pagination is not supported by the card repository")
+        try:
+            return cast(dict[str, Any], await list_cards_page(**filters, limit=limit, cursor=cursor or None))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     @router.get("/cards")
     async def list_cards(
         build_id: str | None = None,
@@ -78,8 +89,24 @@ def build_cards_router(engine_getter: Callable[[], Any], api_runtime_node_getter
         status: str | None = None,
         limit: int = Query(default=50, ge=1, le=500),
         offset: int = Query(default=0, ge=0),
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         engine = engine_getter()
+        filters = {
+            "build_id": build_id,
+            "session_id": session_id,
+            "status": status,
+        }
+        if cursor is not None:
+            page = await _list_cards_keyset(engine=engine, filters=filters, limit=limit, cursor=cursor)
+            return {
+                "items": page["items"],
+                "limit": limit,
+                "cursor": cursor or None,
+                "next_cursor": page["next_cursor"],
+                "count": len(page["items"]),
+                "filters": filters,
+            }
         cards = await engine.cards.list_cards(
             build_id=build_id,
             session_id=session_id,
@@ -92,11 +119,7 @@ def build_cards_router(engine_getter: Callable[[], Any], api_runtime_node_getter
             "limit": limit,
             "offset": offset,
             "count": len(cards),
-            "filters": {
-                "build_id": build_id,
-                "session_id": session_id,
-                "status": status,
-            },
+            "filters": filters,
         }
 
     @router.get("/cards/view")
@@ -107,15 +130,30 @@ def build_cards_router(engine_getter: Callable[[], Any], api_runtime_node_getter
         filter: str | None = None,
         limit: int = Query(default=50, ge=1, le=500),
         offset: int = Query(default=0, ge=0),
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         engine = engine_getter()
-        cards = await engine.cards.list_cards(
-            build_id=build_id,
-            session_id=session_id,
-            status=status,
-            limit=500 if filter else limit,
-            offset=0 if filter else offset,
-        )
+        if cursor is not None and filter:
+            raise HTTPException(status_code=400, detail="cursor pagination cannot be combined with filter")
+        next_cursor: str | None = None
+        if cursor is not None:
+            keyset_page = await _list_cards_keyset(
+                engine=engine,
+                filters={"build_id": build_id, "session_id": session_id, "status": status},
+                limit=limit,
+                cursor=cursor,
+            )
+            cards = keyset_page["items"]
+            next_cursor = keyset_page["next_cursor"]
+            offset = 0
+        else:
+            cards = await engine.cards.list_cards(
+                build_id=build_id,
+                session_id=session_id,
+                status=status,
+                limit=500 if filter else limit,
+                offset=0 if filter else offset,
+            )
         session_views: dict[str, dict[str, Any] | None] = {}
         items: list[dict[str, Any]] = []
         for card in cards:
@@ -127,7 +165,7 @@ def build_cards_router(engine_getter: Callable[[], Any], api_runtime_node_getter
             if card_view_matches_filter(view, filter):
                 items.append(view)
         page = items[offset : offset + limit]
-        return {
+        response: dict[str, Any] = {
             "items": page,
             "limit": limit,
             "offset": offset,
@@ -140,6 +178,12 @@ def build_cards_router(engine_getter: Callable[[], Any], api_runtime_node_getter
                 "filter": filter,
             },
         }
+        if cursor is not None:
+            response.pop("offset")
+            response.pop("total")
+            response["cursor"] = cursor or None
+            response["next_cursor"] = next_cursor
+        return response
 
     @router.get("/cards/{card_id}/view")
     async def get_card_view(card_id: str) -> dict[str, Any]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Any, cast
 
 from fastapi import APIRouter, HTTPException, Request
@@ -82,6 +83,7 @@ def build_kernel_router(
     outward_approval_service_getter: Callable[[], Any] | None = None,
     outward_execution_service_getter: Callable[[], Any] | None = None,
     outbound_filter: Callable[[Any, str], Any] | None = None,
+    endpoint_timer: Callable[[str], AbstractAsyncContextManager[Any]] | None = None,
 ) -> APIRouter:
     router = APIRouter()
 
@@ -350,6 +352,7 @@ def build_kernel_router(
             outward_approval_service_getter=outward_approval_service_getter,
             outward_execution_service_getter=outward_execution_service_getter,
             outbound_filter=outbound_filter,
+            endpoint_timer=endpoint_timer,
         )
     )
 
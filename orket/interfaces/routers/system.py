@@ -6,8 +6,10 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
+from orket.instrumentation import OPENMETRICS_CONTENT_TYPE
 from orket.interfaces.operator_view_support import build_provider_status_view, build_system_health_view
 
 
@@ -35,6 +37,7 @@ def build_system_router(
     runtime_host_getter: Callable[[], Any],
     now_local: Callable[[], Any],
     get_metrics_snapshot: Callable[[], dict[str, Any]],
+    render_openmetrics: Callable[[], str],
     log_event: Callable[[str, dict[str, Any], Path], None],
     model_selector_factory: Callable[[Any, dict[str, Any], dict[str, Any]], Any],
     load_user_preferences: Callable[[], dict[str, Any]],
@@ -45,6 +48,8 @@ def build_system_router(
     invoke_async_method: Callable[[object, dict[str, Any], str], Any],
     schedule_async_invocation_task: Callable[[object, dict[str, Any], str, str], Any],
     engine_getter: Callable[[], Any],
+    latest_metrics_snapshot: Callable[[], dict[str, Any] | None] | None = None,
+    outward_timing_snapshot: Callable[[], dict[str, Any]] | None = None,
 ) -> APIRouter:
     router = APIRouter()
 
@@ -80,9 +85,17 @@ def build_system_router(
     @router.get("/system/metrics")
     async def get_metrics() -> dict[str, Any]:
         api_runtime_node = api_runtime_node_getter()
-        metrics = await asyncio.to_thread(get_metrics_snapshot)
+        metrics = latest_metrics_snapshot() if latest_metrics_snapshot is not None else None
+        if metrics is None:
+            metrics = await asyncio.to_thread(get_metrics_snapshot)
+        if outward_timing_snapshot is not None:
+            metrics = {**metrics, "outward_services": outward_timing_snapshot()}
         return cast(dict[str, Any], api_runtime_node.normalize_metrics(metrics))
 
+    @router.get("/system/metrics/openmetrics", response_class=PlainTextResponse)
+    async def get_openmetrics() -> PlainTextResponse:
+        return PlainTextResponse(render_openmetrics(), media_type=OPENMETRICS_CONTENT_TYPE)
+
     @router.get("/system/explorer")
     async def list_system_files(path: str = ".") -> dict[str, Any]:
         api_runtime_node = api_runtime_node_getter()
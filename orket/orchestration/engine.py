@@ -245,6 +245,7 @@ class OrchestrationEngine:
         max_duration_seconds: float | None = None,
         idle_sleep_seconds: float = 0.0,
         summary_out: str | Path | None = None,
+        max_in_flight: int = 1,
     ) -> dict[str, Any]:
         return await self._pipeline.run_gitea_state_loop(
             worker_id=worker_id,
@@ -256,6 +257,7 @@ class OrchestrationEngine:
             max_duration_seconds=max_duration_seconds,
             idle_sleep_seconds=idle_sleep_seconds,
             summary_out=summary_out,
+            max_in_flight=max_in_flight,
         )
 
     def get_board(self) -> dict[str, Any]:
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+E_PROMPT_LAYOUT_INVALID = "E_PROMPT_LAYOUT_INVALID"
+PROMPT_LAYOUT_DEFAULT = "default"
+PROMPT_LAYOUT_PREFIX_STABLE = "prefix_stable"
+_PROMPT_LAYOUTS = {PROMPT_LAYOUT_DEFAULT, PROMPT_LAYOUT_PREFIX_STABLE}
+
+# Stability tiers: 0 = stable for a role within a session, 1 = stable for an issue, 2 = changes per turn.
+_ROLE_TIER = 0
+_ISSUE_TIER = 1
+_TURN_TIER = 2
+_TIER_BY_PREFIX: tuple[tuple[str, int], ...] = (
+    ("Protocol Response Contract:\n", _ROLE_TIER),
+    ("Issue Brief:\n", _ISSUE_TIER),
+    ("Issue ", _ISSUE_TIER),
+    ("Artifact Contract JSON:\n", _ISSUE_TIER),
+    ("Artifact Semantic Contract:\n", _ISSUE_TIER),
+    ("Artifact Exact-Shape Hints:\n", _ISSUE_TIER),
+    ("Scenario Truth Contract:\n", _ISSUE_TIER),
+    ("Runtime Verifier Contract:\n", _ISSUE_TIER),
+    ("Architecture Decision Contract:\n", _ISSUE_TIER),
+    ("ODR Prebuild Summary JSON:\n", _ISSUE_TIER),
+    ("ODR Refined Requirement:\n", _ISSUE_TIER),
+    ("Hallucination Verification Scope:\n", _ISSUE_TIER),
+)
+# System prompt sections that are appended per turn and would otherwise break the system prefix.
+_VOLATILE_SYSTEM_MARKERS = ("\n\nPROJECT CONTEXT (PAST DECISIONS):\n", "\n\nPATCH:\n")
+
+
+@dataclass(frozen=True)
+class PrefixStableLayoutResult:
+    messages: list[dict[str, str]]
+    stable_prefix_message_count: int
+    stable_prefix_hash: str
+    moved_system_sections: int
+
+
+def normalize_prompt_layout(value: Any) -> str:
+    token = str(value or "").strip().lower().replace("-", "_")
+    if not token:
+        return PROMPT_LAYOUT_DEFAULT
+    if token not in _PROMPT_LAYOUTS:
+        raise ValueError(f"{E_PROMPT_LAYOUT_INVALID}:{token}")
+    return token
+
+
+def resolve_prompt_layout(context: Mapping[str, Any]) -> str:
+    return normalize_prompt_layout(context.get("prompt_layout") or os.getenv("ORKET_PROMPT_LAYOUT"))
+
+
+def _message_tier(content: str) -> int:
+    for prefix, tier in _TIER_BY_PREFIX:
+        if content.startswith(prefix):
+            return tier
+    return _TURN_TIER
+
+
+def _split_system_prompt(content: str) -> tuple[str, list[str]]:
+    cuts = sorted(index for marker in _VOLATILE_SYSTEM_MARKERS if (index := content.find(marker)) >= 0)
+    if not cuts:
+        return content, []
+    head = content[: cuts[0]]
+    boundaries = [*cuts, len(content)]
+    sections = [content[start:end].strip() for start, end in zip(boundaries, boundaries[1:], strict=False)]
+    return head, [section for section in sections if section]
+
+
+def prefix_hash(messages: list[dict[str, str]]) -> str:
+    encoded = json.dumps(messages, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def apply_prefix_stable_layout(messages: list[dict[str, str]]) -> PrefixStableLayoutResult:
+    """Order turn messages from most to least stable so backend prefix caches keep hitting.
+
+    The system prompt keeps only its role-stable head; memory and patch sections move to a
+    trailing system message, so they keep system authority without breaking the prefix. Other
+    messages are stably sorted into role, issue, and turn tiers, so their relative order inside
+    a tier is unchanged. The stable prefix is the system message plus the role-tier messages
+    that follow it.
+    """
+    if not messages:
+        return PrefixStableLayoutResult([], 0, prefix_hash([]), 0)
+    first = dict(messages[0])
+    rest = [dict(message) for message in messages[1:]]
+    sections: list[str] = []
+    if first.get("role") == "system":
+        head, sections = _split_system_prompt(str(first.get("content") or ""))
+        first["content"] = head
+    else:
+        rest.insert(0, first)
+        first = {}
+    ordered = sorted(rest, key=lambda message: _message_tier(str(message.get("content") or "")))
+    if sections:
+        ordered.append({"role": "system", "content": "\n\n".join(sections)})
+    laid_out = ([first] if first else []) + ordered
+    stable_count = 1 if first else 0
+    while stable_count < len(laid_out) and _message_tier(str(laid_out[stable_count].get("content") or "")) == 0:
+        stable_count += 1
+    return PrefixStableLayoutResult(
+        messages=laid_out,
+        stable_prefix_message_count=stable_count,
+        stable_prefix_hash=prefix_hash(laid_out[:stable_count]),
+        moved_system_sections=len(sections),
+    )
+
+
+def prefix_affinity_key(runtime_context: Mapping[str, Any]) -> str:
+    """Identity whose prompts share a pinned prefix: one per role within a session."""
+    session = str(runtime_context.get("session_id") or runtime_context.get("run_id") or "").strip()
+    role = str(runtime_context.get("role") or "").strip().lower()
+    return f"{session}:{role}" if session and role else ""
+
+
+def _parallel_slot_count() -> int:
+    raw = str(os.getenv("ORKET_LLAMA_CPP_PARALLEL_SLOTS") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else 0
+    except ValueError:
+        return 0
+
+
+def prompt_cache_hints(*, provider_name: str, runtime_context: Mapping[str, Any]) -> dict[str, Any]:
+    """Backend payload fields that keep a role's prompts on a warm KV cache.
+
+    llama.cpp reuses the cached prefix when ``cache_prompt`` is set and the request lands on
+    the slot that served the previous turn; ``ORKET_LLAMA_CPP_PARALLEL_SLOTS`` (the server's
+    ``--parallel``) enables slot affinity. Other backends take no payload hints.
+    """
+    if provider_name != "llama_cpp":
+        return {}
+    hints: dict[str, Any] = {"cache_prompt": True}
+    affinity_key = prefix_affinity_key(runtime_context)
+    slot_count = _parallel_slot_count()
+    if affinity_key and slot_count > 0:
+        digest = hashlib.sha256(affinity_key.encode("utf-8")).digest()
+        hints["id_slot"] = int.from_bytes(digest[:4], "big") % slot_count
+    return hints
+
+
+__all__ = [
+    "E_PROMPT_LAYOUT_INVALID",
+    "PROMPT_LAYOUT_DEFAULT",
+    "PROMPT_LAYOUT_PREFIX_STABLE",
+    "PrefixStableLayoutResult",
+    "apply_prefix_stable_layout",
+    "normalize_prompt_layout",
+    "prefix_affinity_key",
+    "prefix_hash",
+    "prompt_cache_hints",
+    "resolve_prompt_layout",
+]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = [
     'artifact_provenance_block_policy',
+    'contract_snapshot_store',
     'evidence_package_generator_contract',
     'failure_replay_harness_contract',
     'protocol_ledger_parity_campaign',
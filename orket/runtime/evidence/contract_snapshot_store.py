@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import stat
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from orket.runtime_paths import durable_root
+
+CONTRACT_SNAPSHOT_MANIFEST_FILENAME = "contract_snapshot_manifest.json"
+CONTRACT_SNAPSHOT_MANIFEST_SCHEMA_VERSION = "run_start_contract_snapshot_manifest.v1"
+
+_snapshot_cache: dict[Callable[[], dict[str, Any]], ContractSnapshot] = {}
+_snapshot_cache_lock = threading.Lock()
+_stored_blobs: set[Path] = set()
+_stored_blobs_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ContractSnapshot:
+    payload: dict[str, Any]
+    content: bytes
+    digest: str
+
+    def payload_copy(self) -> dict[str, Any]:
+        return copy.deepcopy(self.payload)
+
+
+def serialize_contract_snapshot(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def contract_snapshot(factory: Callable[[], dict[str, Any]]) -> ContractSnapshot:
+    """Return the serialized snapshot for ``factory``, computing it at most once per process.
+
+    Contract and policy snapshots only change between releases, so the payload, its canonical
+    bytes and their digest are memoized by factory. Factories that raise are not cached.
+    """
+    with _snapshot_cache_lock:
+        cached = _snapshot_cache.get(factory)
+    if cached is not None:
+        return cached
+    payload = factory()
+    content = serialize_contract_snapshot(payload)
+    snapshot = ContractSnapshot(payload=payload, content=content, digest=hashlib.sha256(content).hexdigest())
+    with _snapshot_cache_lock:
+        return _snapshot_cache.setdefault(factory, snapshot)
+
+
+def clear_contract_snapshot_cache() -> None:
+    with _snapshot_cache_lock:
+        _snapshot_cache.clear()
+    with _stored_blobs_lock:
+        _stored_blobs.clear()
+
+
+class ContractSnapshotStore:
+    """Content-addressed blob store for run-start contract snapshots.
+
+    Each distinct snapshot is stored once, read-only, as ``<root>/<digest[:2]>/<digest>.json``.
+    Run directories only keep ``contract_snapshot_manifest.json``, which maps each snapshot
+    filename to its digest; readers resolve the bytes through the store with
+    ``resolve_contract_snapshot_file``.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @classmethod
+    def default(cls) -> ContractSnapshotStore:
+        return cls(durable_root() / "cache" / "contract_snapshots")
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def put(self, snapshot: ContractSnapshot) -> Path:
+        """Store ``snapshot`` and return its blob path.
+
+        A blob is hashed at most once per process; later calls for the same digest only
+        check that the file still exists.
+        """
+        blob_path = self.blob_path(snapshot.digest)
+        with _stored_blobs_lock:
+            stored = blob_path in _stored_blobs
+        if stored and blob_path.exists():
+            return blob_path
+        if _file_digest(blob_path) != snapshot.digest:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = blob_path.with_name(f"{blob_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                temp_path.write_bytes(snapshot.content)
+                temp_path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                temp_path.replace(blob_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
+        with _stored_blobs_lock:
+            _stored_blobs.add(blob_path)
+        return blob_path
+
+    def verify_run_copy(self, snapshot: ContractSnapshot, *, path: Path, error_code: str) -> None:
+        """Fail closed when a run directory still holds a copy of ``snapshot`` with a different digest.
+
+        Older runs materialized every snapshot next to the manifest; those copies must keep
+        matching the snapshot they were captured from.
+        """
+        if path.exists() and _file_digest(path) != snapshot.digest:
+            raise ValueError(f"{error_code}:{path}")
+
+
+def resolve_contract_snapshot_file(
+    contracts_dir: Path,
+    filename: str,
+    *,
+    store: ContractSnapshotStore | None = None,
+) -> Path | None:
+    """Return the file holding ``filename`` for a run's ``runtime_contracts`` directory.
+
+    Files present in the directory win, which covers non-snapshot artifacts and runs captured
+    before the manifest existed. Otherwise the digest recorded in the run's snapshot manifest
+    is resolved through ``store``. Returns ``None`` when neither exists.
+    """
+    direct_path = contracts_dir / filename
+    if direct_path.exists():
+        return direct_path
+    try:
+        manifest = json.loads((contracts_dir / CONTRACT_SNAPSHOT_MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    rows = manifest.get("snapshots") if isinstance(manifest, dict) else None
+    if not isinstance(rows, dict):
+        return None
+    resolved_store = store or ContractSnapshotStore.default()
+    for row in rows.values():
+        if not isinstance(row, dict) or row.get("filename") != filename:
+            continue
+        digest = str(row.get("digest") or "").removeprefix("sha256:")
+        blob_path = resolved_store.blob_path(digest) if digest else None
+        return blob_path if blob_path is not None and blob_path.exists() else None
+    return None
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
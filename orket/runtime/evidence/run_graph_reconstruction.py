@@ -19,55 +19,88 @@ def reconstruct_run_graph(
     *,
     session_id: str | None = None,
 ) -> dict[str, Any]:
-    ordered_events = _ordered_events(events)
-    run_id = _resolve_run_id(events=ordered_events, session_id=session_id)
-    root_stage_id = f"workload_stage:{_safe_token(run_id)}:root"
-
-    nodes: dict[str, dict[str, Any]] = {
-        root_stage_id: {
-            "id": root_stage_id,
-            "type": "workload_stage",
-            "run_id": run_id,
-            "stage_id": "root",
-            "label": run_id,
+    return IncrementalRunGraphBuilder.from_events(events, session_id=session_id).build()
+
+
+class IncrementalRunGraphBuilder:
+    """Builds the run graph one ledger event at a time.
+
+    Feeding events in ledger order yields the same payload as :func:`reconstruct_run_graph`
+    over the full event list, which is itself implemented on top of this builder. Callers
+    that keep a builder alongside an append-only ledger only pay for node and edge sorting
+    when the graph is closed. An event that sorts before one already seen (by sequence, then
+    kind) marks the builder ``out_of_order``; callers must then rebuild from the full list.
+    """
+
+    def __init__(self, *, run_id: str) -> None:
+        self.run_id = str(run_id).strip() or "unknown-run"
+        self.root_stage_id = f"workload_stage:{_safe_token(self.run_id)}:root"
+        self.event_count = 0
+        self.last_event_seq = 0
+        self.out_of_order = False
+        self._last_order_key: tuple[int, str] = (0, "")
+        self._schema_versions: set[str] = set()
+        self._nodes: dict[str, dict[str, Any]] = {
+            self.root_stage_id: {
+                "id": self.root_stage_id,
+                "type": "workload_stage",
+                "run_id": self.run_id,
+                "stage_id": "root",
+                "label": self.run_id,
+            }
         }
-    }
-    edges: dict[tuple[str, str, str, int], dict[str, Any]] = {}
-    stage_nodes: dict[str, str] = {"": root_stage_id}
-    call_nodes: dict[int, str] = {}
-    call_sequences: list[int] = []
+        self._edges: dict[tuple[str, str, str, int], dict[str, Any]] = {}
+        self._stage_nodes: dict[str, str] = {"": self.root_stage_id}
+        self._call_nodes: dict[int, str] = {}
+        self._last_call_seq = 0
+
+    @classmethod
+    def from_events(cls, events: list[dict[str, Any]], *, session_id: str | None = None) -> IncrementalRunGraphBuilder:
+        ordered_events = _ordered_events(events)
+        builder = cls(run_id=_resolve_run_id(events=ordered_events, session_id=session_id))
+        for event in ordered_events:
+            builder.add_event(event)
+        return builder
 
-    for event in ordered_events:
+    def add_event(self, event: dict[str, Any]) -> None:
+        self.event_count += 1
+        schema_version = str(event.get("ledger_schema_version") or "1.0").strip()
+        if schema_version:
+            self._schema_versions.add(schema_version)
         kind = str(event.get("kind") or "").strip()
         event_seq = _event_sequence(event)
         if event_seq <= 0:
-            continue
+            return
+        if (event_seq, kind) < self._last_order_key:
+            self.out_of_order = True
+        self._last_order_key = max(self._last_order_key, (event_seq, kind))
+        self.last_event_seq = self._last_order_key[0]
         if kind == "run_started":
             run_name = str(event.get("run_name") or "").strip()
             if run_name:
-                nodes[root_stage_id]["label"] = run_name
+                self._nodes[self.root_stage_id]["label"] = run_name
             _add_run_artifact_nodes(
                 event=event,
-                source_stage_id=root_stage_id,
-                nodes=nodes,
-                edges=edges,
+                source_stage_id=self.root_stage_id,
+                nodes=self._nodes,
+                edges=self._edges,
             )
-            continue
+            return
         if kind == "run_finalized":
             _add_run_artifact_nodes(
                 event=event,
-                source_stage_id=root_stage_id,
-                nodes=nodes,
-                edges=edges,
+                source_stage_id=self.root_stage_id,
+                nodes=self._nodes,
+                edges=self._edges,
             )
-            continue
+            return
         if kind == "tool_call":
             step_id = str(event.get("step_id") or "").strip()
             stage_id = _resolve_stage_node(
-                run_id=run_id,
+                run_id=self.run_id,
                 step_id=step_id,
-                stage_nodes=stage_nodes,
-                nodes=nodes,
+                stage_nodes=self._stage_nodes,
+                nodes=self._nodes,
             )
             call_id = f"tool_call:{event_seq}"
             call_node = {
@@ -94,23 +127,31 @@ def reconstruct_run_graph(
                     token = str(manifest.get(field) or "").strip()
                     if token:
                         call_node[field] = token
-            nodes[call_id] = call_node
-            call_nodes[event_seq] = call_id
-            call_sequences.append(event_seq)
+            self._nodes[call_id] = call_node
+            if self._last_call_seq > 0:
+                _add_edge(
+                    edges=self._edges,
+                    edge_type="execution_order",
+                    source=self._call_nodes[self._last_call_seq],
+                    target=call_id,
+                    ordinal=event_seq,
+                )
+            self._call_nodes[event_seq] = call_id
+            self._last_call_seq = event_seq
             _add_edge(
-                edges=edges,
+                edges=self._edges,
                 edge_type="execution_order",
                 source=stage_id,
                 target=call_id,
                 ordinal=event_seq,
             )
-            continue
+            return
         if kind in _TOOL_RESULT_KINDS:
             call_sequence_number = int(event.get("call_sequence_number") or 0)
             result_payload = event.get("result")
             result_payload = result_payload if isinstance(result_payload, dict) else {}
             result_id = f"artifact:tool_result:{event_seq}"
-            nodes[result_id] = {
+            self._nodes[result_id] = {
                 "id": result_id,
                 "type": "artifact",
                 "artifact_kind": kind,
@@ -121,17 +162,17 @@ def reconstruct_run_graph(
                 "ok": bool(result_payload.get("ok", False)),
                 "artifact_digest": protocol_hashing.hash_canonical_json(result_payload),
             }
-            linked_call_id = call_nodes.get(call_sequence_number)
+            linked_call_id = self._call_nodes.get(call_sequence_number)
             if linked_call_id is not None:
                 _add_edge(
-                    edges=edges,
+                    edges=self._edges,
                     edge_type="call_result",
                     source=linked_call_id,
                     target=result_id,
                     ordinal=event_seq,
                 )
                 _add_edge(
-                    edges=edges,
+                    edges=self._edges,
                     edge_type="artifact_produced",
                     source=linked_call_id,
                     target=result_id,
@@ -139,9 +180,9 @@ def reconstruct_run_graph(
                 )
             compat_translation = result_payload.get("compat_translation")
             if not isinstance(compat_translation, dict):
-                continue
+                return
             compat_node_id = f"compat_mapping:{call_sequence_number or event_seq}"
-            nodes[compat_node_id] = {
+            self._nodes[compat_node_id] = {
                 "id": compat_node_id,
                 "type": "compat_mapping",
                 "compat_tool_name": str(compat_translation.get("compat_tool_name") or "").strip(),
@@ -157,14 +198,14 @@ def reconstruct_run_graph(
             }
             if linked_call_id is not None:
                 _add_edge(
-                    edges=edges,
+                    edges=self._edges,
                     edge_type="compat_expansion",
                     source=linked_call_id,
                     target=compat_node_id,
                     ordinal=event_seq,
                 )
             compat_artifact_id = f"artifact:compat_translation:{event_seq}"
-            nodes[compat_artifact_id] = {
+            self._nodes[compat_artifact_id] = {
                 "id": compat_artifact_id,
                 "type": "artifact",
                 "artifact_kind": "compat_translation",
@@ -173,61 +214,48 @@ def reconstruct_run_graph(
                 "compat_tool_name": str(compat_translation.get("compat_tool_name") or "").strip(),
             }
             _add_edge(
-                edges=edges,
+                edges=self._edges,
                 edge_type="artifact_produced",
                 source=compat_node_id,
                 target=compat_artifact_id,
                 ordinal=event_seq,
             )
 
-    sorted_call_sequences = sorted(call_sequences)
-    for index in range(1, len(sorted_call_sequences)):
-        previous_seq = sorted_call_sequences[index - 1]
-        current_seq = sorted_call_sequences[index]
-        previous_call_id = call_nodes.get(previous_seq)
-        current_call_id = call_nodes.get(current_seq)
-        if previous_call_id is None or current_call_id is None:
-            continue
-        _add_edge(
-            edges=edges,
-            edge_type="execution_order",
-            source=previous_call_id,
-            target=current_call_id,
-            ordinal=current_seq,
+    def build(self) -> dict[str, Any]:
+        if self.out_of_order:
+            raise ValueError("run_graph_builder_out_of_order")
+        node_rows = [dict(row) for row in sorted(self._nodes.values(), key=lambda row: str(row.get("id") or ""))]
+        edge_rows = sorted(
+            (dict(row) for row in self._edges.values()),
+            key=lambda row: (
+                str(row.get("type") or ""),
+                str(row.get("source") or ""),
+                str(row.get("target") or ""),
+                int(row.get("ordinal") or 0),
+            ),
         )
-
-    node_rows = sorted(nodes.values(), key=lambda row: str(row.get("id") or ""))
-    edge_rows = sorted(
-        edges.values(),
-        key=lambda row: (
-            str(row.get("type") or ""),
-            str(row.get("source") or ""),
-            str(row.get("target") or ""),
-            int(row.get("ordinal") or 0),
-        ),
-    )
-    payload = {
-        "run_graph_schema_version": RUN_GRAPH_SCHEMA_VERSION,
-        "run_id": run_id,
-        "derived_from": {
-            "source_of_truth": "ledger+artifacts",
-            "ledger_event_count": len(ordered_events),
-            "ledger_schema_version": _ledger_schema_version(ordered_events),
-        },
-        "node_count": len(node_rows),
-        "edge_count": len(edge_rows),
-        "nodes": node_rows,
-        "edges": edge_rows,
-    }
-    payload["graph_digest"] = protocol_hashing.hash_canonical_json(
-        {
-            "run_id": run_id,
+        payload = {
+            "run_graph_schema_version": RUN_GRAPH_SCHEMA_VERSION,
+            "run_id": self.run_id,
+            "derived_from": {
+                "source_of_truth": "ledger+artifacts",
+                "ledger_event_count": self.event_count,
+                "ledger_schema_version": _schema_version_label(self._schema_versions),
+            },
+            "node_count": len(node_rows),
+            "edge_count": len(edge_rows),
             "nodes": node_rows,
             "edges": edge_rows,
         }
-    )
-    validate_run_graph_payload(payload)
-    return payload
+        payload["graph_digest"] = protocol_hashing.hash_canonical_json(
+            {
+                "run_id": self.run_id,
+                "nodes": node_rows,
+                "edges": edge_rows,
+            }
+        )
+        validate_run_graph_payload(payload)
+        return payload
 
 
 def reconstruct_run_graph_from_events_log(
@@ -316,14 +344,8 @@ def _ordered_events(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return rows
 
 
-def _ledger_schema_version(events: list[dict[str, Any]]) -> str:
-    versions = sorted(
-        {
-            str(event.get("ledger_schema_version") or "1.0").strip()
-            for event in events
-            if str(event.get("ledger_schema_version") or "1.0").strip()
-        }
-    )
+def _schema_version_label(schema_versions: set[str]) -> str:
+    versions = sorted(schema_versions)
     if not versions:
         return "1.0"
     return versions[0] if len(versions) == 1 else "mixed"
@@ -10,6 +10,12 @@ from orket.runtime.contract_bootstrap import (
     load_runtime_contract_snapshots,
     write_runtime_contract_snapshots,
 )
+from orket.runtime.evidence.contract_snapshot_store import (
+    CONTRACT_SNAPSHOT_MANIFEST_FILENAME,
+    CONTRACT_SNAPSHOT_MANIFEST_SCHEMA_VERSION,
+    ContractSnapshotStore,
+    contract_snapshot,
+)
 from orket.runtime.run_start_contract_artifacts import CONTRACT_SNAPSHOT_DEFS
 from orket.runtime.workspace_snapshot import capture_workspace_state_snapshot
 from orket.utils import sanitize_name
@@ -69,7 +75,10 @@ def capture_run_start_artifacts(
         now=now,
     )
 
-    runtime_contract_artifacts = _write_runtime_contract_artifacts(runtime_root=active_root)
+    runtime_contract_artifacts = _write_runtime_contract_artifacts(
+        runtime_root=active_root,
+        store=ContractSnapshotStore.default(),
+    )
 
     capability_manifest = _capability_manifest_payload(
         run_id=resolved_run_id,
@@ -116,18 +125,28 @@ def capture_run_start_artifacts(
     }
 
 
-def _write_runtime_contract_artifacts(*, runtime_root: Path) -> dict[str, Any]:
+def _write_runtime_contract_artifacts(*, runtime_root: Path, store: ContractSnapshotStore) -> dict[str, Any]:
     payload: dict[str, Any] = {}
+    manifest_rows: dict[str, dict[str, str]] = {}
+    manifest_path = runtime_root / CONTRACT_SNAPSHOT_MANIFEST_FILENAME
+    existing_manifest = _load_json_dict(manifest_path) or {}
+    existing_rows = existing_manifest.get("snapshots")
+    recorded_rows = existing_rows if isinstance(existing_rows, dict) else {}
     for artifact_key, filename, factory, error_code in CONTRACT_SNAPSHOT_DEFS:
-        artifact = factory()
-        artifact_path = runtime_root / filename
-        _write_immutable_json(
-            path=artifact_path,
-            payload=artifact,
-            error_code=error_code,
-        )
-        payload[artifact_key] = artifact
-        payload[f"{artifact_key}_path"] = str(artifact_path)
+        snapshot = contract_snapshot(factory)
+        recorded_row = recorded_rows.get(artifact_key)
+        if isinstance(recorded_row, dict) and recorded_row.get("digest") != f"sha256:{snapshot.digest}":
+            raise ValueError(f"{error_code}:{manifest_path}")
+        store.verify_run_copy(snapshot, path=runtime_root / filename, error_code=error_code)
+        manifest_rows[artifact_key] = {"filename": filename, "digest": f"sha256:{snapshot.digest}"}
+        payload[artifact_key] = snapshot.payload_copy()
+        payload[f"{artifact_key}_path"] = str(store.put(snapshot))
+    _write_immutable_json(
+        path=manifest_path,
+        payload={"schema_version": CONTRACT_SNAPSHOT_MANIFEST_SCHEMA_VERSION, "snapshots": manifest_rows},
+        error_code="E_RUN_CONTRACT_SNAPSHOT_MANIFEST_IMMUTABLE",
+    )
+    payload["contract_snapshot_manifest_path"] = str(manifest_path)
     return payload
 
 
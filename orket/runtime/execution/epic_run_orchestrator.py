@@ -14,6 +14,7 @@ from orket.application.services.control_plane_workload_catalog import (
 from orket.core.cards_runtime_contract import apply_epic_cards_runtime_defaults
 from orket.core.contracts import WorkloadContractV1
 from orket.exceptions import CardNotFound, ComplexityViolation, ExecutionFailed, OrketInfrastructureError
+from orket.instrumentation import run_metrics_scope
 from orket.logging import log_event
 from orket.runtime.config_loader import ConfigLoader
 from orket.runtime.deterministic_mode_contract import deterministic_mode_contract_snapshot
@@ -75,19 +76,20 @@ class EpicRunOrchestrator:
             target_issue_id=target_issue_id,
             model_override=model_override,
         )
-        setup = await self._ensure_session_and_cards(setup)
-        context = await self._initialize_run(setup)
-        finalizer = self._build_finalizer()
-        try:
-            await self._execute_workload(context)
-            transcript = self.orchestrator.transcript
-            self.callbacks.set_transcript(transcript)
-            return await finalizer.finalize_success(context=context, transcript=transcript)
-        except (CardNotFound, ComplexityViolation, ExecutionFailed, OrketInfrastructureError) as exc:
-            transcript = self.orchestrator.transcript
-            self.callbacks.set_transcript(transcript)
-            await finalizer.finalize_failure(context=context, transcript=transcript, exc=exc)
-            raise
+        with run_metrics_scope():
+            setup = await self._ensure_session_and_cards(setup)
+            context = await self._initialize_run(setup)
+            finalizer = self._build_finalizer()
+            try:
+                await self._execute_workload(context)
+                transcript = self.orchestrator.transcript
+                self.callbacks.set_transcript(transcript)
+                return await finalizer.finalize_success(context=context, transcript=transcript)
+            except (CardNotFound, ComplexityViolation, ExecutionFailed, OrketInfrastructureError) as exc:
+                transcript = self.orchestrator.transcript
+                self.callbacks.set_transcript(transcript)
+                await finalizer.finalize_failure(context=context, transcript=transcript, exc=exc)
+                raise
 
     async def _load_setup(
         self,
@@ -182,14 +184,22 @@ class EpicRunOrchestrator:
         if existing:
             await self._reconcile_existing_cards(setup=setup, existing=existing)
         epic_params = setup.epic.params if isinstance(setup.epic.params, dict) else {}
+        existing_ids = {existing_issue.id for existing_issue in existing}
+        new_payloads: list[dict[str, Any]] = []
         for issue in setup.epic.issues:
             issue.params = apply_epic_cards_runtime_defaults(
                 issue_params=getattr(issue, "params", None),
                 epic_params=epic_params,
             )
-            if any(existing_issue.id == issue.id for existing_issue in existing):
+            if issue.id in existing_ids:
                 continue
-            await self.cards_repo.save(self._card_payload(issue=issue, setup=setup))
+            new_payloads.append(self._card_payload(issue=issue, setup=setup))
+        save_many = getattr(self.cards_repo, "save_many", None)
+        if callable(save_many) and len(new_payloads) > 1:
+            await save_many(new_payloads)
+        else:
+            for payload in new_payloads:
+                await self.cards_repo.save(payload)
         return replace(setup, resume_mode=resume_mode)
 
     async def _reconcile_existing_cards(self, *, setup: EpicRunSetup, existing: list[Any]) -> None:
@@ -163,6 +163,7 @@ class ExecutionPipelineCardDispatchMixin:
         max_duration_seconds: float | None = None,
         idle_sleep_seconds: float = 0.0,
         summary_out: str | Path | None = None,
+        max_in_flight: int = 1,
     ) -> dict[str, Any]:
         await self.initialize()
         return await run_gitea_state_loop(
@@ -178,6 +179,7 @@ class ExecutionPipelineCardDispatchMixin:
             max_duration_seconds=max_duration_seconds,
             idle_sleep_seconds=idle_sleep_seconds,
             summary_out=summary_out,
+            max_in_flight=max_in_flight,
         )
 
     def _resolve_idesign_mode(self) -> str:
@@ -4,12 +4,14 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from orket.instrumentation import current_run_metrics
 from orket.logging import log_event
 from orket.runtime.run_start_artifacts import validate_run_identity_projection
 from orket.runtime.run_summary import (
     PACKET1_MISSING_TOKEN,
     build_degraded_run_summary_payload,
     generate_run_summary_for_finalize,
+    write_hot_path_metrics_artifact,
     write_run_summary_artifact,
 )
 from orket.runtime.run_summary_artifact_provenance import normalize_artifact_provenance_facts
@@ -364,5 +366,19 @@ class ExecutionPipelineRunSummaryMixin:
                 {"run_id": run_id, "error_type": type(exc).__name__, "error": str(exc)},
                 workspace=self.workspace,
             )
+        run_metrics = current_run_metrics()
+        if run_metrics is not None:
+            try:
+                await write_hot_path_metrics_artifact(
+                    root=self.workspace,
+                    session_id=run_id,
+                    metrics=run_metrics.snapshot(),
+                )
+            except (RuntimeError, ValueError, TypeError, OSError) as exc:
+                log_event(
+                    "hot_path_metrics_artifact_write_failed",
+                    {"run_id": run_id, "error_type": type(exc).__name__, "error": str(exc)},
+                    workspace=self.workspace,
+                )
         resolved_artifacts["run_summary"] = dict(run_summary)
         return run_summary, resolved_artifacts
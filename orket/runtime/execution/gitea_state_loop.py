@@ -59,6 +59,7 @@ class GiteaStateLoopRunner:
         max_duration_seconds: float | None = None,
         idle_sleep_seconds: float = 0.0,
         summary_out: str | Path | None = None,
+        max_in_flight: int = 1,
     ) -> dict[str, Any]:
         inputs = self._collect_ready_inputs()
         limits = await self._resolve_limits(
@@ -79,11 +80,13 @@ class GiteaStateLoopRunner:
             max_idle_streak=limits["max_idle_streak"],
             max_duration_seconds=limits["max_duration_seconds"],
             idle_sleep_seconds=idle_sleep_seconds,
+            max_in_flight=max_in_flight,
         )
         summary = await coordinator.run(work_fn=self._work_claimed_card, summary_out=summary_out)
         return {
             "worker_id": str(worker_id),
             "fetch_limit": max(1, int(fetch_limit)),
+            "max_in_flight": max(1, int(max_in_flight)),
             **limits,
             "summary": summary,
         }
@@ -187,6 +190,7 @@ async def run_gitea_state_loop(
     max_duration_seconds: float | None = None,
     idle_sleep_seconds: float = 0.0,
     summary_out: str | Path | None = None,
+    max_in_flight: int = 1,
 ) -> dict[str, Any]:
     return await GiteaStateLoopRunner(
         state_backend_mode=state_backend_mode,
@@ -202,4 +206,5 @@ async def run_gitea_state_loop(
         max_duration_seconds=max_duration_seconds,
         idle_sleep_seconds=idle_sleep_seconds,
         summary_out=summary_out,
+        max_in_flight=max_in_flight,
     )
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
-from dataclasses import dataclass
+import os
+import threading
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from orket.runtime.registry.protocol_hashing import hash_canonical_json
+from orket.runtime_paths import durable_root
 
 DEFAULT_ARTIFACT_SCHEMA_REGISTRY_PATH = Path("core/artifacts/schema_registry.yaml")
 DEFAULT_COMPATIBILITY_MAP_PATH = Path("core/tools/compatibility_map.yaml")
@@ -18,6 +23,14 @@ TOOL_DETERMINISM_CLASSES = {"pure", "workspace", "external"}
 TOOL_RING_CLASSES = {"core", "compatibility", "experimental"}
 DETERMINISM_RANK = {"pure": 0, "workspace": 1, "external": 2}
 
+PRECOMPILED_CONTRACT_CACHE_ENV = "ORKET_RUNTIME_CONTRACT_PRECOMPILED_CACHE"
+PRECOMPILED_CONTRACT_SCHEMA_VERSION = "runtime_contract_snapshots.precompiled.v1"
+_COMPILED_CACHE_MAX_ENTRIES = 8
+_TRUTHY = {"1", "true", "yes", "on", "enabled"}
+
+_compiled_cache: dict[tuple[tuple[str, str], ...], RuntimeContractSnapshots] = {}
+_compiled_cache_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class RuntimeContractSnapshots:
@@ -36,6 +49,12 @@ class RuntimeContractSnapshots:
             "compatibility_map_snapshot": dict(self.compatibility_map_snapshot),
         }
 
+    def as_payload(self) -> dict[str, dict[str, Any]]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    def clone(self) -> RuntimeContractSnapshots:
+        return RuntimeContractSnapshots(**copy.deepcopy(self.as_payload()))
+
 
 def parse_contract_version(value: Any, *, field_name: str) -> str:
     token = str(value or "").strip()
@@ -53,11 +72,53 @@ def load_runtime_contract_snapshots(
     compatibility_map_path: Path | str = DEFAULT_COMPATIBILITY_MAP_PATH,
     compatibility_map_schema_path: Path | str = DEFAULT_COMPATIBILITY_MAP_SCHEMA_PATH,
     tool_registry_path: Path | str = DEFAULT_TOOL_REGISTRY_PATH,
+    precompiled_cache_dir: Path | str | None = None,
 ) -> RuntimeContractSnapshots:
-    artifact_registry = _load_yaml_dict(Path(artifact_schema_registry_path))
-    tool_registry = _load_yaml_dict(Path(tool_registry_path))
-    compatibility_schema = _load_yaml_dict(Path(compatibility_map_schema_path))
-    compatibility_map = _load_yaml_dict(Path(compatibility_map_path))
+    """Return compiled contract snapshots, reusing a per-process compile keyed by source file digests.
+
+    Callers always receive their own copy, so the cached compile stays immutable. When
+    ``precompiled_cache_dir`` is given (or ``ORKET_RUNTIME_CONTRACT_PRECOMPILED_CACHE`` is
+    enabled) the compiled snapshots are also persisted under that directory and reused by
+    later processes that see the same source digests.
+    """
+    sources = {
+        "artifact_schema_registry": Path(artifact_schema_registry_path),
+        "tool_registry": Path(tool_registry_path),
+        "compatibility_map_schema": Path(compatibility_map_schema_path),
+        "compatibility_map": Path(compatibility_map_path),
+    }
+    contents = {name: _read_contract_source(path) for name, path in sources.items()}
+    cache_key = tuple((name, hashlib.sha256(contents[name]).hexdigest()) for name in sorted(contents))
+    with _compiled_cache_lock:
+        cached = _compiled_cache.get(cache_key)
+    if cached is not None:
+        return cached.clone()
+
+    precompiled_path = _precompiled_artifact_path(cache_key, precompiled_cache_dir)
+    compiled = _read_precompiled_snapshots(precompiled_path, cache_key) if precompiled_path is not None else None
+    if compiled is None:
+        compiled = _compile_runtime_contract_snapshots(
+            {name: _parse_yaml_dict(sources[name], contents[name]) for name in sources}
+        )
+        if precompiled_path is not None:
+            _write_precompiled_snapshots(precompiled_path, cache_key, compiled)
+    with _compiled_cache_lock:
+        if len(_compiled_cache) >= _COMPILED_CACHE_MAX_ENTRIES:
+            _compiled_cache.pop(next(iter(_compiled_cache)))
+        _compiled_cache[cache_key] = compiled
+    return compiled.clone()
+
+
+def clear_runtime_contract_snapshot_cache() -> None:
+    with _compiled_cache_lock:
+        _compiled_cache.clear()
+
+
+def _compile_runtime_contract_snapshots(registries: dict[str, dict[str, Any]]) -> RuntimeContractSnapshots:
+    artifact_registry = registries["artifact_schema_registry"]
+    tool_registry = registries["tool_registry"]
+    compatibility_schema = registries["compatibility_map_schema"]
+    compatibility_map = registries["compatibility_map"]
 
     artifact_registry_version, artifact_versions = _parse_artifact_schema_registry(artifact_registry)
     tool_registry_version, tools = _parse_tool_registry(tool_registry)
@@ -163,11 +224,71 @@ def write_runtime_contract_snapshots(
     return {key: str(path) for key, path in file_map.items()}
 
 
-def _load_yaml_dict(path: Path) -> dict[str, Any]:
+def _precompiled_artifact_path(
+    cache_key: tuple[tuple[str, str], ...],
+    precompiled_cache_dir: Path | str | None,
+) -> Path | None:
+    if precompiled_cache_dir is not None:
+        root = Path(precompiled_cache_dir)
+    elif str(os.getenv(PRECOMPILED_CONTRACT_CACHE_ENV, "")).strip().lower() in _TRUTHY:
+        root = durable_root() / "cache" / "runtime_contracts"
+    else:
+        return None
+    return root / f"{hash_canonical_json([list(item) for item in cache_key])}.json"
+
+
+def _read_precompiled_snapshots(
+    path: Path,
+    cache_key: tuple[tuple[str, str], ...],
+) -> RuntimeContractSnapshots | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("schema_version") != PRECOMPILED_CONTRACT_SCHEMA_VERSION:
+        return None
+    if payload.get("source_digests") != {name: digest for name, digest in cache_key}:
+        return None
+    snapshots = payload.get("snapshots")
+    expected = {field.name for field in fields(RuntimeContractSnapshots)}
+    if not isinstance(snapshots, dict) or set(snapshots) != expected:
+        return None
+    if not all(isinstance(value, dict) for value in snapshots.values()):
+        return None
+    return RuntimeContractSnapshots(**snapshots)
+
+
+def _write_precompiled_snapshots(
+    path: Path,
+    cache_key: tuple[tuple[str, str], ...],
+    snapshots: RuntimeContractSnapshots,
+) -> None:
+    payload = {
+        "schema_version": PRECOMPILED_CONTRACT_SCHEMA_VERSION,
+        "source_digests": {name: digest for name, digest in cache_key},
+        "snapshots": snapshots.as_payload(),
+    }
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
     try:
-        content = path.read_text(encoding="utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(payload, ensure_ascii=True, sort_keys=True) + "\n", encoding="utf-8")
+        temp_path.replace(path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+
+
+def _read_contract_source(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
     except OSError as exc:
         raise ValueError(f"runtime_contract_load:{path}:{exc}") from exc
+
+
+def _parse_yaml_dict(path: Path, raw: bytes) -> dict[str, Any]:
+    try:
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise ValueError(f"runtime_contract_load:{path}:{exc}") from exc
     try:
         payload = yaml.safe_load(content)
     except yaml.YAMLError as exc:
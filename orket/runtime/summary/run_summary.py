@@ -22,6 +22,7 @@ from orket.runtime.run_summary_packet2 import (
     normalize_packet2_facts,
 )
 
+HOT_PATH_METRICS_SCHEMA_VERSION = "orket.hot_path_metrics.v1"
 _EXCLUDED_ARTIFACT_IDS = {"gitea_export", "run_summary", "run_summary_path"}
 _PACKET1_SCHEMA_VERSION = "1.0"
 _PACKET1_KEY = "truthful_runtime_packet1"
@@ -338,6 +339,25 @@ async def write_run_summary_artifact(
     return run_summary_path
 
 
+async def write_hot_path_metrics_artifact(
+    *,
+    root: Path,
+    session_id: str,
+    metrics: dict[str, Any],
+) -> Path:
+    metrics_path = Path(root) / "runs" / str(session_id).strip() / "hot_path_metrics.json"
+    payload = {
+        "schema_version": HOT_PATH_METRICS_SCHEMA_VERSION,
+        "run_id": str(session_id).strip(),
+        "metrics": metrics,
+    }
+    await asyncio.to_thread(metrics_path.parent.mkdir, parents=True, exist_ok=True)
+    content = json.dumps(payload, ensure_ascii=True, indent=2, sort_keys=True) + "\n"
+    async with aiofiles.open(metrics_path, mode="w", encoding="utf-8") as handle:
+        await handle.write(content)
+    return metrics_path
+
+
 async def _tool_names_from_receipts(*, workspace: Path, run_id: str) -> list[str]:
     receipt_paths = await asyncio.to_thread(_receipt_paths, Path(workspace), str(run_id))
     tool_names: list[str] = []
@@ -126,3 +126,9 @@ def resolve_gitea_artifact_cache_root(path: str | None = None) -> Path:
     _migrate_legacy_dir(legacy=Path.cwd() / ".orket" / "gitea_artifacts", target=target)
     target.mkdir(parents=True, exist_ok=True)
     return target
+
+
+def resolve_model_response_cache_root(path: str | Path | None = None) -> Path:
+    if path:
+        return Path(path)
+    return durable_root() / "cache" / "model_responses"
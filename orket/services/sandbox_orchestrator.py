@@ -9,6 +9,7 @@ import os
 import secrets
 import socket
 import subprocess
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -19,6 +20,11 @@ from orket.adapters.storage.async_executor_service import run_coroutine_blocking
 from orket.adapters.storage.async_file_tools import AsyncFileTools
 from orket.adapters.storage.async_sandbox_lifecycle_repository import AsyncSandboxLifecycleRepository
 from orket.adapters.storage.command_runner import CommandRunner
+from orket.adapters.storage.sandbox_log_follower import (
+    render_log_lines,
+    sandbox_log_follower,
+    stop_sandbox_log_follower,
+)
 from orket.application.services.control_plane_publication_service import ControlPlanePublicationService
 from orket.application.services.control_plane_workload_catalog import (
     sandbox_runtime_workload_for_tech_stack,
@@ -123,6 +129,7 @@ class SandboxOrchestrator:
         }
         self._initial_health_attempts = int(os.getenv("ORKET_SANDBOX_INITIAL_HEALTH_ATTEMPTS", "20"))
         self._initial_health_delay_seconds = float(os.getenv("ORKET_SANDBOX_INITIAL_HEALTH_DELAY_SECONDS", "0.5"))
+        self._reconcile_concurrency = int(os.getenv("ORKET_SANDBOX_RECONCILE_CONCURRENCY", "8"))
 
     async def create_sandbox(
         self,
@@ -325,6 +332,7 @@ class SandboxOrchestrator:
             sandbox.deleted_at = self._now()
         self.registry.port_allocator.release(sandbox_id)
         self.registry.unregister(sandbox_id)
+        stop_sandbox_log_follower(current.compose_project)
         log_event("sandbox_deleted", {"sandbox_id": sandbox_id}, Path(current.workspace_path))
 
     async def health_check(self, sandbox_id: str) -> bool:
@@ -334,6 +342,80 @@ class SandboxOrchestrator:
         Returns:
             True if all containers running, False otherwise
         """
+        return await self._health_check(sandbox_id, container_rows_by_project=None)
+
+    async def health_check_all(
+        self,
+        sandbox_ids: list[str] | None = None,
+        *,
+        concurrency: int | None = None,
+    ) -> dict[str, bool]:
+        """
+        Check many sandboxes from one batched ``docker ps`` listing, probing them concurrently.
+
+        Args:
+            sandbox_ids: Sandboxes to check; defaults to every registered or non-cleaned sandbox
+            concurrency: Maximum probes in flight
+
+        Returns:
+            Health result per sandbox ID
+        """
+        if sandbox_ids is None:
+            sandbox_ids = sorted(
+                {sandbox.id for sandbox in self.registry.list_active()}
+                | {
+                    record.sandbox_id
+                    for record in await self.lifecycle_repository.list_records()
+                    if record.state is not LifecycleState.CLEANED
+                }
+            )
+        if not sandbox_ids:
+            return {}
+        container_rows_by_project = await self.runtime_inspector.list_container_rows_by_project()
+        limit = asyncio.Semaphore(max(1, concurrency or self._reconcile_concurrency))
+
+        async def _probe(sandbox_id: str) -> bool:
+            async with limit:
+                return await self._health_check(sandbox_id, container_rows_by_project=container_rows_by_project)
+
+        results = await asyncio.gather(*(_probe(sandbox_id) for sandbox_id in sandbox_ids))
+        return dict(zip(sandbox_ids, results, strict=True))
+
+    async def reconcile_all(self, *, max_cleanup_records: int = 50, concurrency: int | None = None) -> dict[str, Any]:
+        """
+        Run one reconciliation pass: orphan discovery, batched health probes, then a cleanup sweep.
+
+        Returns:
+            Per-phase results and durations in milliseconds
+        """
+        resolved_concurrency = max(1, concurrency or self._reconcile_concurrency)
+        started = time.perf_counter()
+        orphans = await self.discover_orphaned_sandboxes()
+        discovered = time.perf_counter()
+        health = await self.health_check_all(concurrency=resolved_concurrency)
+        probed = time.perf_counter()
+        cleaned = await self.sweep_due_cleanups(max_records=max_cleanup_records, concurrency=resolved_concurrency)
+        finished = time.perf_counter()
+        report = {
+            "orphans_discovered": len(orphans),
+            "sandboxes_probed": len(health),
+            "sandboxes_healthy": sum(1 for healthy in health.values() if healthy),
+            "cleanups_completed": len(cleaned),
+            "concurrency": resolved_concurrency,
+            "orphan_discovery_ms": round((discovered - started) * 1000, 3),
+            "health_probe_ms": round((probed - discovered) * 1000, 3),
+            "cleanup_sweep_ms": round((finished - probed) * 1000, 3),
+            "duration_ms": round((finished - started) * 1000, 3),
+        }
+        log_event("sandbox_reconciliation_pass_completed", report)
+        return {**report, "health": health}
+
+    async def _health_check(
+        self,
+        sandbox_id: str,
+        *,
+        container_rows_by_project: dict[str, list[dict[str, Any]]] | None,
+    ) -> bool:
         sandbox = self.registry.get(sandbox_id)
         record = await self.lifecycle_service.repository.get_record(sandbox_id)
         if not sandbox and not record:
@@ -348,9 +430,12 @@ class SandboxOrchestrator:
             return False
 
         try:
-            container_rows = await self.runtime_inspector.list_project_container_rows(
-                compose_project=compose_project,
-            )
+            if container_rows_by_project is None:
+                container_rows = await self.runtime_inspector.list_project_container_rows(
+                    compose_project=compose_project,
+                )
+            else:
+                container_rows = container_rows_by_project.get(compose_project, [])
             tracked = self.runtime_inspector.tracked_container_rows(container_rows)
             all_running = self.runtime_inspector.all_core_services_running(container_rows)
             observed_at = self._now()
@@ -417,8 +502,8 @@ class SandboxOrchestrator:
         self._sync_registry_with_lifecycle(record)
         return record.model_dump(mode="json")
 
-    async def sweep_due_cleanups(self, *, max_records: int = 1) -> list[dict[str, Any]]:
-        records = await self.lifecycle_recovery.sweep_due_cleanups(max_records=max_records)
+    async def sweep_due_cleanups(self, *, max_records: int = 1, concurrency: int = 1) -> list[dict[str, Any]]:
+        records = await self.lifecycle_recovery.sweep_due_cleanups(max_records=max_records, concurrency=concurrency)
         for record in records:
             self._sync_registry_with_lifecycle(record)
         return [record.model_dump(mode="json") for record in records]
@@ -430,17 +515,62 @@ class SandboxOrchestrator:
         record = await self.lifecycle_service.reacquire_ownership(sandbox_id=sandbox_id)
         return record.model_dump(mode="json")
 
-    def get_logs(self, sandbox_id: str, service: str | None = None) -> str:
+    def get_logs(
+        self,
+        sandbox_id: str,
+        service: str | None = None,
+        *,
+        tail: int = 100,
+        since: float | None = None,
+    ) -> str:
         """
         Retrieve logs from sandbox containers.
 
+        Logs are served from the sandbox's in-memory follow buffer, fed by one streaming
+        ``docker-compose logs -f`` process per sandbox, so repeated polls do not fork.
+
         Args:
             sandbox_id: Sandbox ID
             service: Optional service name (api, frontend, database)
+            tail: Maximum number of most recent lines to return
+            since: Optional epoch timestamp; only lines received at or after it are returned
 
         Returns:
             Log output
         """
+        compose_path, compose_project, service_name = self._resolve_log_target(sandbox_id, service)
+        open_stream = getattr(self.command_runner, "open_stream", None)
+        if open_stream is None:
+            # Injected runners without streaming support keep the one-shot command.
+            cmd = ["docker-compose", "-f", str(compose_path), "-p", compose_project, "logs", f"--tail={tail}"]
+            if service_name:
+                cmd.append(service_name)
+            result = self.command_runner.run_sync(*cmd, timeout=10)
+            return result.stdout
+        follower = sandbox_log_follower(compose_path, compose_project, open_stream=open_stream)
+        lines = follower.tail(tail, service=service_name) if since is None else follower.since(since, service=service_name)
+        return render_log_lines(lines[-tail:] if tail > 0 else [])
+
+    def get_log_lines(
+        self,
+        sandbox_id: str,
+        service: str | None = None,
+        *,
+        after_seq: int = 0,
+        before_seq: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return buffered log lines with ``after_seq < seq < before_seq`` for cursor-style polling."""
+        compose_path, compose_project, service_name = self._resolve_log_target(sandbox_id, service)
+        open_stream = getattr(self.command_runner, "open_stream", None)
+        if open_stream is None:
+            raise ValueError("Sandbox log ranges require a streaming command runner")
+        follower = sandbox_log_follower(compose_path, compose_project, open_stream=open_stream)
+        return [
+            {"seq": line.seq, "service": line.service, "text": line.text, "received_at": line.received_at}
+            for line in follower.seq_range(after_seq + 1, before_seq, service=service_name)
+        ]
+
+    def _resolve_log_target(self, sandbox_id: str, service: str | None) -> tuple[Path, str, str | None]:
         sandbox = self.registry.get(sandbox_id)
         record = None
         if sandbox is None:
@@ -455,26 +585,12 @@ class SandboxOrchestrator:
             compose_project = sandbox.compose_project
         else:
             raise ValueError(f"Sandbox {sandbox_id} not found")
-        compose_path = self._compose_path(log_workspace_path)
-
-        cmd = [
-            "docker-compose",
-            "-f",
-            str(compose_path),
-            "-p",
-            compose_project,
-            "logs",
-            "--tail=100",
-        ]
-
+        service_name = None
         if service:
             service_name = str(service).strip()
             if service_name not in self._allowed_log_services:
                 raise ValueError(f"Unsupported sandbox service: {service_name}")
-            cmd.append(service_name)
-
-        result = self.command_runner.run_sync(*cmd, timeout=10)
-        return result.stdout
+        return self._compose_path(log_workspace_path), compose_project, service_name
 
     # -------------------------------------------------------------------------
     # Private Helpers
@@ -558,6 +674,7 @@ class SandboxOrchestrator:
         sandbox.deleted_at = self._now()
         self.registry.port_allocator.release(sandbox_id)
         self.registry.unregister(sandbox_id)
+        stop_sandbox_log_follower(sandbox.compose_project)
         log_event("sandbox_deleted", {"sandbox_id": sandbox_id}, Path(sandbox.workspace_path))
 
     @staticmethod
@@ -6,6 +6,8 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from orket.instrumentation import STREAM_BUS_DROPPED_EVENTS, STREAM_BUS_QUEUE_DEPTH
+
 from .contracts import (
     BEST_EFFORT_EVENTS,
     BOUNDED_EVENTS,
@@ -124,6 +126,7 @@ class StreamBus:
                     raise RuntimeError("bounded event queue capacity exceeded")
 
             if dropped:
+                STREAM_BUS_DROPPED_EVENTS.inc(event_type.value)
                 state.next_seq += 1
                 self._append_drop_range(state.pending_dropped_ranges, dropped_seq, dropped_seq)
                 subscribers = list(self._subscribers.get(session_id, set()))
@@ -172,6 +175,7 @@ class StreamBus:
         if outgoing_event is not None:
             for queue in subscribers:
                 await queue.put(outgoing_event)
+                STREAM_BUS_QUEUE_DEPTH.observe(queue.qsize())
         return event
 
     async def purge_turn(self, session_id: str, turn_id: str, *, drain_subscriber_queues: bool = True) -> None:
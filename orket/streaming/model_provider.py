@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import json
 import os
 import time
@@ -13,6 +14,9 @@ from typing import Any
 import httpx
 from pydantic import BaseModel, Field
 
+# Longest a coalescer holds buffered text when neither limit fires first.
+TOKEN_DELTA_MAX_HOLD_MS = 50
+
 
 class ProviderEventType(str, Enum):
     SELECTED = "selected"
@@ -81,15 +85,167 @@ def _deterministic_chunk(seed: int, index: int, chunk_size: int) -> str:
     return "".join(chars)
 
 
+class _CancelFlags:
+    """Per-turn cancel flags shared by a provider's turns.
+
+    All access happens on the event loop thread, so plain set operations are
+    atomic and the per-token cancel check needs no lock.
+    """
+
+    def __init__(self) -> None:
+        self._canceled: set[str] = set()
+
+    def register(self, provider_turn_id: str, *, keep_pending_cancel: bool = False) -> None:
+        if not keep_pending_cancel:
+            self._canceled.discard(provider_turn_id)
+
+    def cancel(self, provider_turn_id: str) -> None:
+        self._canceled.add(provider_turn_id)
+
+    def is_canceled(self, provider_turn_id: str) -> bool:
+        return provider_turn_id in self._canceled
+
+    def release(self, provider_turn_id: str) -> None:
+        self._canceled.discard(provider_turn_id)
+
+
+class ModelProviderHTTPClientPool:
+    """Long-lived ``httpx.AsyncClient`` instances shared by model stream providers.
+
+    Clients are keyed by base URL, timeout, and event loop so keep-alive connections
+    survive across turns without leaking a client into a loop it was not created on.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_s: float = 30.0,
+        http2: bool | None = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max(1, int(max_connections)),
+            max_keepalive_connections=max(0, int(max_keepalive_connections)),
+            keepalive_expiry=max(0.0, float(keepalive_expiry_s)),
+        )
+        self._http2 = importlib.util.find_spec("h2") is not None if http2 is None else bool(http2)
+        self._clients: dict[tuple[str, float, int], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+    def get(self, *, base_url: str, timeout_s: float) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        key = (base_url, float(timeout_s), id(loop))
+        cached = self._clients.get(key)
+        if cached is not None and cached[0] is loop and not cached[1].is_closed:
+            return cached[1]
+        self._drop_closed_loops()
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=_request_timeout(timeout_s),
+            limits=self._limits,
+            http2=self._http2,
+        )
+        self._clients[key] = (loop, client)
+        return client
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for client_loop, client in clients.values():
+            if client_loop is loop:
+                await client.aclose()
+
+    def _drop_closed_loops(self) -> None:
+        for key, (loop, _client) in list(self._clients.items()):
+            if loop.is_closed():
+                self._clients.pop(key, None)
+
+
+_shared_http_client_pool = ModelProviderHTTPClientPool()
+
+
+def shared_http_client_pool() -> ModelProviderHTTPClientPool:
+    return _shared_http_client_pool
+
+
+def _request_timeout(timeout_s: float) -> httpx.Timeout:
+    return httpx.Timeout(
+        timeout=timeout_s,
+        connect=min(10.0, timeout_s),
+        read=min(10.0, timeout_s),
+        write=min(10.0, timeout_s),
+    )
+
+
+class TokenDeltaCoalescer:
+    """Merges provider token deltas into fewer, larger stream events.
+
+    The first delta is released immediately so time-to-first-token is unchanged;
+    later deltas are buffered until ``max_chars`` characters or ``max_interval_ms``
+    since the previous release. Buffered text is never held longer than the hold
+    window: callers poll :meth:`flush_expired` so a stream that pauses mid-output
+    still delivers it, and call :meth:`flush` before any terminal or error event.
+    Zero for both limits disables coalescing.
+    """
+
+    def __init__(self, *, max_chars: int = 0, max_interval_ms: int = 0, max_hold_ms: int = 0) -> None:
+        self.max_chars = max(0, int(max_chars))
+        self.max_interval_ms = max(0, int(max_interval_ms))
+        self.max_hold_ms = max(0, int(max_hold_ms)) or self.max_interval_ms or TOKEN_DELTA_MAX_HOLD_MS
+        self._parts: list[str] = []
+        self._first_index: int | None = None
+        self._buffered_since_ms: float | None = None
+        self._last_release_ms: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_chars > 0 or self.max_interval_ms > 0
+
+    def add(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
+        delta = payload.get("delta")
+        if not self.enabled or not isinstance(delta, str) or payload.get("synthetic"):
+            return [*self.flush(), payload]
+        now_ms = time.monotonic() * 1000.0
+        if self._first_index is None:
+            self._first_index = _int_value(payload.get("index"), 0)
+            self._buffered_since_ms = now_ms
+        self._parts.append(delta)
+        buffered_chars = sum(len(part) for part in self._parts)
+        due = (
+            self._last_release_ms is None
+            or (self.max_chars > 0 and buffered_chars >= self.max_chars)
+            or (self.max_interval_ms > 0 and now_ms - self._last_release_ms >= self.max_interval_ms)
+        )
+        return self.flush() if due else []
+
+    def flush_expired(self) -> list[dict[str, Any]]:
+        """Release buffered text once it has been held for ``max_hold_ms``."""
+        if self._buffered_since_ms is None:
+            return []
+        if time.monotonic() * 1000.0 - self._buffered_since_ms < self.max_hold_ms:
+            return []
+        return self.flush()
+
+    def flush(self) -> list[dict[str, Any]]:
+        if not self._parts:
+            return []
+        released: dict[str, Any] = {"delta": "".join(self._parts), "index": self._first_index or 0}
+        if len(self._parts) > 1:
+            released["coalesced_count"] = len(self._parts)
+        self._parts = []
+        self._first_index = None
+        self._buffered_since_ms = None
+        self._last_release_ms = time.monotonic() * 1000.0
+        return [released]
+
+
 class StubModelStreamProvider(ModelStreamProvider):
     def __init__(self) -> None:
-        self._canceled: dict[str, asyncio.Event] = {}
-        self._lock = asyncio.Lock()
+        self._cancel_flags = _CancelFlags()
 
     async def start_turn(self, req: ProviderTurnRequest) -> AsyncIterator[ProviderEvent]:
         provider_turn_id = f"provider-turn-{uuid.uuid4().hex[:12]}"
-        async with self._lock:
-            self._canceled.setdefault(provider_turn_id, asyncio.Event())
+        self._cancel_flags.register(provider_turn_id, keep_pending_cancel=True)
         try:
             seed = _int_value(req.input_config.get("seed"), 0)
             mode = str(req.input_config.get("mode") or req.turn_params.get("mode") or "basic").strip().lower()
@@ -118,10 +274,9 @@ class StubModelStreamProvider(ModelStreamProvider):
             chunk_size = _int_value(req.input_config.get("chunk_size"), 4 if mode == "basic" else 2, minimum=1)
             delay_ms = _int_value(req.input_config.get("delta_delay_ms"), 0, minimum=0)
             first_token_delay_ms = _int_value(req.input_config.get("first_token_delay_ms"), 0, minimum=0)
-            canceled = await self._is_canceled(provider_turn_id)
             if first_token_delay_ms > 0:
                 await asyncio.sleep(first_token_delay_ms / 1000.0)
-                if canceled.is_set():
+                if self._cancel_flags.is_canceled(provider_turn_id):
                     yield ProviderEvent(
                         provider_turn_id=provider_turn_id,
                         event_type=ProviderEventType.STOPPED,
@@ -129,7 +284,7 @@ class StubModelStreamProvider(ModelStreamProvider):
                     )
                     return
             for index in range(delta_count):
-                if canceled.is_set():
+                if self._cancel_flags.is_canceled(provider_turn_id):
                     yield ProviderEvent(
                         provider_turn_id=provider_turn_id,
                         event_type=ProviderEventType.STOPPED,
@@ -153,16 +308,10 @@ class StubModelStreamProvider(ModelStreamProvider):
                 payload={"stop_reason": "completed"},
             )
         finally:
-            async with self._lock:
-                self._canceled.pop(provider_turn_id, None)
+            self._cancel_flags.release(provider_turn_id)
 
     async def cancel(self, provider_turn_id: str) -> None:
-        canceled = await self._is_canceled(provider_turn_id)
-        canceled.set()
-
-    async def _is_canceled(self, provider_turn_id: str) -> asyncio.Event:
-        async with self._lock:
-            return self._canceled.setdefault(provider_turn_id, asyncio.Event())
+        self._cancel_flags.cancel(provider_turn_id)
 
 
 class OllamaModelStreamProvider(ModelStreamProvider):
@@ -185,13 +334,11 @@ class OllamaModelStreamProvider(ModelStreamProvider):
         self._connect_timeout_s = max(1.0, float(timeout_s))
         resolved_stream_timeout = stream_timeout_s if stream_timeout_s is not None else float(timeout_s) * 3.0
         self._stream_timeout_s = max(1.0, float(resolved_stream_timeout))
-        self._canceled: dict[str, asyncio.Event] = {}
-        self._lock = asyncio.Lock()
+        self._cancel_flags = _CancelFlags()
 
     async def start_turn(self, req: ProviderTurnRequest) -> AsyncIterator[ProviderEvent]:
         provider_turn_id = f"provider-turn-{uuid.uuid4().hex[:12]}"
-        async with self._lock:
-            self._canceled[provider_turn_id] = asyncio.Event()
+        self._cancel_flags.register(provider_turn_id)
         try:
             messages = req.input_config.get("messages")
             if not isinstance(messages, list):
@@ -235,8 +382,7 @@ class OllamaModelStreamProvider(ModelStreamProvider):
             index = 0
             async with asyncio.timeout(self._stream_timeout_s):
                 async for chunk in stream:
-                    canceled = await self._is_canceled(provider_turn_id)
-                    if canceled.is_set():
+                    if self._cancel_flags.is_canceled(provider_turn_id):
                         yield ProviderEvent(
                             provider_turn_id=provider_turn_id,
                             event_type=ProviderEventType.STOPPED,
@@ -276,20 +422,14 @@ class OllamaModelStreamProvider(ModelStreamProvider):
                 payload={"error": str(exc)},
             )
         finally:
-            async with self._lock:
-                self._canceled.pop(provider_turn_id, None)
+            self._cancel_flags.release(provider_turn_id)
 
     async def cancel(self, provider_turn_id: str) -> None:
-        canceled = await self._is_canceled(provider_turn_id)
-        canceled.set()
+        self._cancel_flags.cancel(provider_turn_id)
 
     async def health(self) -> dict[str, Any]:
         return {"ok": True, "provider": "ollama", "model_id": self._model_id, "base_url": self._base_url or None}
 
-    async def _is_canceled(self, provider_turn_id: str) -> asyncio.Event:
-        async with self._lock:
-            return self._canceled.setdefault(provider_turn_id, asyncio.Event())
-
     @staticmethod
     def _extract_delta(chunk: Any) -> str:
         if isinstance(chunk, dict):
@@ -313,18 +453,25 @@ class OllamaModelStreamProvider(ModelStreamProvider):
 
 
 class OpenAICompatModelStreamProvider(ModelStreamProvider):
-    def __init__(self, *, model_id: str, base_url: str, api_key: str | None = None, timeout_s: float = 60.0) -> None:
+    def __init__(
+        self,
+        *,
+        model_id: str,
+        base_url: str,
+        api_key: str | None = None,
+        timeout_s: float = 60.0,
+        client_pool: ModelProviderHTTPClientPool | None = None,
+    ) -> None:
         self._model_id = model_id
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key or ""
         self._timeout_s = max(1.0, float(timeout_s))
-        self._canceled: dict[str, asyncio.Event] = {}
-        self._lock = asyncio.Lock()
+        self._client_pool = client_pool or shared_http_client_pool()
+        self._cancel_flags = _CancelFlags()
 
     async def start_turn(self, req: ProviderTurnRequest) -> AsyncIterator[ProviderEvent]:
         provider_turn_id = f"provider-turn-{uuid.uuid4().hex[:12]}"
-        async with self._lock:
-            self._canceled[provider_turn_id] = asyncio.Event()
+        self._cancel_flags.register(provider_turn_id)
         try:
             messages = req.input_config.get("messages")
             if not isinstance(messages, list):
@@ -368,73 +515,64 @@ class OpenAICompatModelStreamProvider(ModelStreamProvider):
                 payload={"model_id": self._model_id, "warm_state": "unknown", "load_ms": 0},
             )
             index = 0
+            usage_tokens = 0
             fallback_body: dict[str, Any] | None = None
-            canceled = await self._is_canceled(provider_turn_id)
-            if canceled.is_set():
+            if self._cancel_flags.is_canceled(provider_turn_id):
                 yield ProviderEvent(
                     provider_turn_id=provider_turn_id,
                     event_type=ProviderEventType.STOPPED,
                     payload={"stop_reason": "canceled"},
                 )
                 return
-            timeout = httpx.Timeout(
-                timeout=self._timeout_s,
-                connect=min(10.0, self._timeout_s),
-                read=min(10.0, self._timeout_s),
-                write=min(10.0, self._timeout_s),
-            )
             if use_stream:
-                async with httpx.AsyncClient(base_url=self._base_url, timeout=timeout) as client:
-                    start_ts = time.monotonic()
-                    async with client.stream("POST", "/chat/completions", headers=headers, json=payload) as response:
-                        response.raise_for_status()
-                        async for line in response.aiter_lines():
-                            if (time.monotonic() - start_ts) >= self._timeout_s:
-                                raise TimeoutError(
-                                    f"openai_compat stream exceeded timeout ({self._timeout_s}s) before completion"
-                                )
-                            canceled = await self._is_canceled(provider_turn_id)
-                            if canceled.is_set():
-                                yield ProviderEvent(
-                                    provider_turn_id=provider_turn_id,
-                                    event_type=ProviderEventType.STOPPED,
-                                    payload={"stop_reason": "canceled"},
-                                )
-                                return
-                            if not line:
-                                continue
-                            raw = line.strip()
-                            if not raw.startswith("data:"):
-                                continue
-                            body = raw[5:].strip()
-                            if not body or body == "[DONE]":
-                                continue
-                            try:
-                                chunk = json.loads(body)
-                            except json.JSONDecodeError:
-                                continue
-                            delta = self._extract_delta(chunk)
-                            if not delta:
-                                continue
+                client = self._client_pool.get(base_url=self._base_url, timeout_s=self._timeout_s)
+                start_ts = time.monotonic()
+                async with client.stream("POST", "/chat/completions", headers=headers, json=payload) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if (time.monotonic() - start_ts) >= self._timeout_s:
+                            raise TimeoutError(
+                                f"openai_compat stream exceeded timeout ({self._timeout_s}s) before completion"
+                            )
+                        if self._cancel_flags.is_canceled(provider_turn_id):
                             yield ProviderEvent(
                                 provider_turn_id=provider_turn_id,
-                                event_type=ProviderEventType.TOKEN_DELTA,
-                                payload={"delta": delta, "index": index},
+                                event_type=ProviderEventType.STOPPED,
+                                payload={"stop_reason": "canceled"},
                             )
-                            index += 1
-                            if index >= local_max_tokens:
-                                yield ProviderEvent(
-                                    provider_turn_id=provider_turn_id,
-                                    event_type=ProviderEventType.STOPPED,
-                                    payload={"stop_reason": "completed"},
-                                )
-                                return
+                            return
+                        if not line:
+                            continue
+                        raw = line.strip()
+                        if not raw.startswith("data:"):
+                            continue
+                        body = raw[5:].strip()
+                        if not body or body == "[DONE]":
+                            continue
+                        try:
+                            chunk = json.loads(body)
+                        except json.JSONDecodeError:
+                            continue
+                        usage_tokens = self._extract_completion_tokens(chunk) or usage_tokens
+                        delta = self._extract_delta(chunk)
+                        if not delta:
+                            continue
+                        yield ProviderEvent(
+                            provider_turn_id=provider_turn_id,
+                            event_type=ProviderEventType.TOKEN_DELTA,
+                            payload={"delta": delta, "index": index},
+                        )
+                        index += 1
+                        if index >= local_max_tokens:
+                            yield ProviderEvent(
+                                provider_turn_id=provider_turn_id,
+                                event_type=ProviderEventType.STOPPED,
+                                payload={"stop_reason": "completed"},
+                            )
+                            return
             else:
-                fallback_body = await asyncio.to_thread(
-                    self._post_chat_completion_sync,
-                    headers,
-                    payload,
-                )
+                fallback_body = await self._post_chat_completion(headers, payload)
+                usage_tokens = self._extract_completion_tokens(fallback_body)
                 completion_text = self._extract_non_stream_text(fallback_body)
                 if completion_text:
                     yield ProviderEvent(
@@ -448,13 +586,10 @@ class OpenAICompatModelStreamProvider(ModelStreamProvider):
                 if fallback_body is None:
                     fallback_payload = dict(payload)
                     fallback_payload["stream"] = False
-                    fallback_body = await asyncio.to_thread(
-                        self._post_chat_completion_sync,
-                        headers,
-                        fallback_payload,
-                    )
+                    fallback_body = await self._post_chat_completion(headers, fallback_payload)
                 completion_text = self._extract_non_stream_text(fallback_body)
                 completion_tokens = self._extract_completion_tokens(fallback_body)
+                usage_tokens = completion_tokens or usage_tokens
                 if completion_text or completion_tokens > 0:
                     token_payload: dict[str, Any] = {
                         "delta": completion_text,
@@ -471,10 +606,13 @@ class OpenAICompatModelStreamProvider(ModelStreamProvider):
                     )
                     index += 1
 
+            stopped_payload: dict[str, Any] = {"stop_reason": "completed"}
+            if usage_tokens > 0:
+                stopped_payload["completion_tokens"] = usage_tokens
             yield ProviderEvent(
                 provider_turn_id=provider_turn_id,
                 event_type=ProviderEventType.STOPPED,
-                payload={"stop_reason": "completed"},
+                payload=stopped_payload,
             )
         except asyncio.CancelledError:
             raise
@@ -495,20 +633,14 @@ class OpenAICompatModelStreamProvider(ModelStreamProvider):
                 payload={"error": str(exc)},
             )
         finally:
-            async with self._lock:
-                self._canceled.pop(provider_turn_id, None)
+            self._cancel_flags.release(provider_turn_id)
 
     async def cancel(self, provider_turn_id: str) -> None:
-        canceled = await self._is_canceled(provider_turn_id)
-        canceled.set()
+        self._cancel_flags.cancel(provider_turn_id)
 
     async def health(self) -> dict[str, Any]:
         return {"ok": True, "provider": "openai_compat", "model_id": self._model_id, "base_url": self._base_url}
 
-    async def _is_canceled(self, provider_turn_id: str) -> asyncio.Event:
-        async with self._lock:
-            return self._canceled.setdefault(provider_turn_id, asyncio.Event())
-
     @staticmethod
     def _extract_delta(chunk: Any) -> str:
         if not isinstance(chunk, dict):
@@ -562,15 +694,9 @@ class OpenAICompatModelStreamProvider(ModelStreamProvider):
             return raw
         return 0
 
-    def _post_chat_completion_sync(self, headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
-        timeout = httpx.Timeout(
-            timeout=self._timeout_s,
-            connect=min(10.0, self._timeout_s),
-            read=min(10.0, self._timeout_s),
-            write=min(10.0, self._timeout_s),
-        )
-        with httpx.Client(base_url=self._base_url, timeout=timeout) as client:
-            response = client.post("/chat/completions", headers=headers, json=payload)
-            response.raise_for_status()
-            parsed = response.json()
-            return parsed if isinstance(parsed, dict) else {}
+    async def _post_chat_completion(self, headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
+        client = self._client_pool.get(base_url=self._base_url, timeout_s=self._timeout_s)
+        response = await client.post("/chat/completions", headers=headers, json=payload)
+        response.raise_for_status()
+        parsed = response.json()
+        return parsed if isinstance(parsed, dict) else {}
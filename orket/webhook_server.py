@@ -12,8 +12,7 @@ import hashlib
 import hmac
 import json
 import os
-import time
-from collections import deque
+import sqlite3
 from pathlib import Path
 from typing import Any
 
@@ -24,7 +23,15 @@ from pydantic import BaseModel, Field, ValidationError
 
 from orket import __version__
 from orket.adapters.vcs.gitea_webhook_handler import GiteaWebhookHandler
+from orket.adapters.vcs.webhook_delivery_queue import (
+    DELIVERY_RETENTION_SECONDS,
+    SharedSlidingWindowRateLimiter,
+    WebhookDeliveryQueue,
+    WebhookDeliveryWorkerPool,
+    webhook_delivery_id,
+)
 from orket.logging import log_event
+from orket.runtime_paths import durable_root
 from orket.settings import load_env
 
 app = FastAPI(
@@ -76,6 +83,70 @@ class _WebhookHandlerProxy:
 
 
 webhook_handler = _WebhookHandlerProxy()
+
+
+def _webhook_queue_db_path() -> Path:
+    raw = str(os.getenv("ORKET_WEBHOOK_QUEUE_DB_PATH") or "").strip()
+    return Path(raw) if raw else durable_root() / "db" / "webhook_queue.db"
+
+
+def _configured_delivery_worker_count() -> int:
+    try:
+        return max(1, int(os.getenv("ORKET_WEBHOOK_DELIVERY_WORKERS", "4")))
+    except ValueError:
+        return 4
+
+
+def _configured_delivery_retention_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("ORKET_WEBHOOK_QUEUE_RETENTION_HOURS", "168"))) * 3600.0
+    except ValueError:
+        return DELIVERY_RETENTION_SECONDS
+
+
+class _WebhookDeliveryRuntime:
+    """Delivery queue, worker pool, and shared rate limiter, built from the environment on first use."""
+
+    def __init__(self) -> None:
+        self._queue: WebhookDeliveryQueue | None = None
+        self._workers: WebhookDeliveryWorkerPool | None = None
+        self._rate_limiter: SharedSlidingWindowRateLimiter | None = None
+
+    @property
+    def queue(self) -> WebhookDeliveryQueue:
+        if self._queue is None:
+            self._queue = WebhookDeliveryQueue(_webhook_queue_db_path())
+        return self._queue
+
+    @property
+    def workers(self) -> WebhookDeliveryWorkerPool:
+        if self._workers is None:
+            self._workers = WebhookDeliveryWorkerPool(
+                self.queue,
+                lambda event_type, payload: webhook_handler.handle_webhook(event_type, payload),
+                workers=_configured_delivery_worker_count(),
+                retention_seconds=_configured_delivery_retention_seconds(),
+            )
+        return self._workers
+
+    @property
+    def rate_limiter(self) -> SharedSlidingWindowRateLimiter:
+        if self._rate_limiter is None:
+            self._rate_limiter = SharedSlidingWindowRateLimiter(self.queue, _rate_limit, window_seconds=60)
+        return self._rate_limiter
+
+    async def start(self) -> None:
+        await self.queue.ensure_initialized()
+        self.workers.start()
+
+    async def stop(self) -> None:
+        if self._workers is not None:
+            await self._workers.stop()
+
+
+webhook_delivery = _WebhookDeliveryRuntime()
+app.router.add_event_handler("startup", webhook_delivery.start)
+app.router.add_event_handler("shutdown", webhook_delivery.stop)
 app.router.add_event_handler("shutdown", webhook_handler.close)
 
 
@@ -144,33 +215,11 @@ def _validate_test_webhook_auth(
     return False, "Test webhook auth not configured", 403
 
 
-class SlidingWindowRateLimiter:
-    """Simple per-process sliding-window limiter."""
-
-    def __init__(self, limit: int, window_seconds: int = 60) -> None:
-        self.limit = max(1, int(limit))
-        self.window_seconds = window_seconds
-        self._events: deque[float] = deque()
-        self._lock = asyncio.Lock()
-
-    async def allow(self) -> bool:
-        now = time.monotonic()
-        cutoff = now - self.window_seconds
-        async with self._lock:
-            while self._events and self._events[0] < cutoff:
-                self._events.popleft()
-            if len(self._events) >= self.limit:
-                return False
-            self._events.append(now)
-            return True
-
-
 _rate_limit_raw = os.getenv("ORKET_RATE_LIMIT", "60")
 try:
     _rate_limit = int(_rate_limit_raw)
 except ValueError:
     _rate_limit = 60
-webhook_rate_limiter = SlidingWindowRateLimiter(_rate_limit, window_seconds=60)
 
 
 def validate_signature(payload: bytes, signature: str) -> bool:
@@ -209,9 +258,11 @@ async def health() -> dict[str, Any]:
     """Kubernetes-style health check."""
     return {
         "status": "healthy",
-        "rate_limit_scope": "per_process",
+        "rate_limit_scope": "shared",
         "webhook_rate_limit_per_minute": _rate_limit,
         "worker_count_hint": _configured_webhook_worker_count(),
+        "delivery_workers": webhook_delivery.workers.workers,
+        "delivery_queue": await webhook_delivery.queue.pending_counts(),
     }
 
 
@@ -235,17 +286,15 @@ async def gitea_webhook(
     request: Request,
     x_gitea_event: str | None = Header(None),
     x_gitea_signature: str | None = Header(None),
+    x_gitea_delivery: str | None = Header(None),
 ) -> JSONResponse:
     """
     Main Gitea webhook endpoint.
-    """
-    if not await webhook_rate_limiter.allow():
-        raise HTTPException(
-            status_code=429,
-            detail="Webhook rate limit exceeded",
-            headers={"Retry-After": "60"},
-        )
 
+    Verified deliveries are written to the durable delivery queue and acknowledged with 202;
+    the delivery workers call Gitea and run orchestration off the request path. The shared
+    rate limit is checked after the signature, so unsigned traffic never touches the queue database.
+    """
     # Size limit: 1MB
     MAX_SIZE = 1024 * 1024
     body = await request.body()
@@ -261,6 +310,13 @@ async def gitea_webhook(
         log_event("webhook", {"message": "Invalid webhook signature", "level": "error"}, workspace=Path.cwd())
         raise HTTPException(status_code=401, detail="Invalid signature")
 
+    if not await webhook_delivery.rate_limiter.allow():
+        raise HTTPException(
+            status_code=429,
+            detail="Webhook rate limit exceeded",
+            headers={"Retry-After": "60"},
+        )
+
     # Parse and validate JSON payload
     try:
         payload_data = json.loads(body)
@@ -286,13 +342,24 @@ async def gitea_webhook(
         workspace=Path.cwd(),
     )
 
-    # Route to handler
+    delivery_id = webhook_delivery_id(x_gitea_delivery, body)
+    repo_key = str((payload.repository or {}).get("full_name") or "") or "<unknown>"
     try:
-        result = await webhook_handler.handle_webhook(str(x_gitea_event or ""), payload.model_dump())
-        return JSONResponse(content=result, status_code=200)
-    except (RuntimeError, ValueError, TypeError, KeyError, OSError) as exc:
-        log_event("webhook", {"message": f"Webhook handler error: {exc}", "level": "error"}, workspace=Path.cwd())
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+        queued = await webhook_delivery.queue.enqueue(
+            delivery_id=delivery_id,
+            event_type=str(x_gitea_event or ""),
+            repo_key=repo_key,
+            payload=payload.model_dump(),
+        )
+    except (OSError, RuntimeError, sqlite3.Error) as exc:
+        log_event("webhook", {"message": f"Webhook enqueue error: {exc}", "level": "error"}, workspace=Path.cwd())
+        raise HTTPException(status_code=503, detail="Webhook delivery queue unavailable") from exc
+    if queued:
+        webhook_delivery.workers.notify()
+    return JSONResponse(
+        content={"status": "accepted" if queued else "duplicate", "delivery_id": delivery_id},
+        status_code=202,
+    )
 
 
 @app.post("/webhook/test")
@@ -3,8 +3,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import os
+import time
 from typing import Any
 
+from orket.instrumentation import record_model_completion
 from orket.runtime.defaults import DEFAULT_LOCAL_MODEL
 from orket.runtime.provider_runtime_target import (
     resolve_bool_env,
@@ -22,6 +24,7 @@ from orket.streaming.model_provider import (
     ProviderEventType,
     ProviderTurnRequest,
     StubModelStreamProvider,
+    TokenDeltaCoalescer,
 )
 
 
@@ -49,6 +52,15 @@ def _real_timeout_s() -> float:
     return resolve_float_env("ORKET_MODEL_STREAM_REAL_TIMEOUT_S", default=20.0)
 
 
+def _delta_coalescer() -> TokenDeltaCoalescer:
+    # Off by default; interactive clients that render at frame rate can opt in to fewer bus events.
+    return TokenDeltaCoalescer(
+        max_chars=resolve_int_env("ORKET_MODEL_STREAM_COALESCE_CHARS", default=0),
+        max_interval_ms=resolve_int_env("ORKET_MODEL_STREAM_COALESCE_MS", default=0),
+        max_hold_ms=resolve_int_env("ORKET_MODEL_STREAM_COALESCE_MAX_HOLD_MS", default=0),
+    )
+
+
 async def _build_real_provider(*, input_config: dict[str, Any], turn_params: dict[str, Any]) -> ModelStreamProvider:
     requested_provider = _real_provider_name()
     target = await resolve_provider_runtime_target(
@@ -154,15 +166,48 @@ async def run_model_stream_v1(
         if provider_turn_id:
             await provider.cancel(provider_turn_id)
 
+    coalescer = _delta_coalescer()
+    # Serializes coalescer releases so the hold-window flusher never reorders deltas.
+    emit_lock = asyncio.Lock()
+
+    async def _emit_deltas(payloads: list[dict[str, Any]]) -> None:
+        for delta_payload in payloads:
+            await interaction_context.emit_event(StreamEventType.TOKEN_DELTA, {**delta_payload, "authoritative": False})
+
+    async def _flush_deltas() -> None:
+        async with emit_lock:
+            await _emit_deltas(coalescer.flush())
+
+    async def _flush_held_deltas() -> None:
+        while True:
+            await asyncio.sleep(coalescer.max_hold_ms / 1000.0)
+            async with emit_lock:
+                await _emit_deltas(coalescer.flush_expired())
+
     async def _consume_provider() -> None:
         nonlocal provider_turn_id, provider_error, stop_reason
+        started = time.perf_counter()
+        first_token_at: float | None = None
         async for provider_event in provider.start_turn(req):
             provider_turn_id = provider_event.provider_turn_id
             if provider_event.event_type == ProviderEventType.ERROR:
                 provider_error = str(provider_event.payload.get("error") or "provider_error")
+                await _flush_deltas()
                 break
             if provider_event.event_type == ProviderEventType.STOPPED:
                 stop_reason = str(provider_event.payload.get("stop_reason") or "").strip().lower()
+                finished = time.perf_counter()
+                # Deltas are not tokens; only provider-reported usage feeds the tokens-per-second histogram.
+                usage_tokens = provider_event.payload.get("completion_tokens")
+                record_model_completion(
+                    "model_stream",
+                    latency_seconds=finished - started,
+                    time_to_first_token_seconds=None if first_token_at is None else first_token_at - started,
+                    completion_tokens=usage_tokens if isinstance(usage_tokens, int) else None,
+                    generation_seconds=None if first_token_at is None else finished - first_token_at,
+                )
+                if stop_reason != "canceled" and not interaction_context.is_canceled():
+                    await _flush_deltas()
                 break
             stream_mapping, payload = _event_mapping(provider_event)
             if stream_mapping is None:
@@ -170,6 +215,13 @@ async def run_model_stream_v1(
             if interaction_context.is_canceled():
                 await provider.cancel(provider_turn_id)
                 break
+            if stream_mapping == StreamEventType.TOKEN_DELTA:
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                async with emit_lock:
+                    await _emit_deltas(coalescer.add(dict(provider_event.payload)))
+                continue
+            await _flush_deltas()
             await interaction_context.emit_event(stream_mapping, payload)
 
     turn_timeout_raw = str(os.getenv("ORKET_MODEL_STREAM_TURN_TIMEOUT_S", "12")).strip()
@@ -179,15 +231,22 @@ async def run_model_stream_v1(
         turn_timeout_s = 12.0
 
     cancel_task = asyncio.create_task(_cancel_watch())
+    hold_task = asyncio.create_task(_flush_held_deltas()) if coalescer.enabled else None
     try:
         try:
             await asyncio.wait_for(_consume_provider(), timeout=turn_timeout_s)
         except asyncio.TimeoutError:
             provider_error = f"provider_turn_timeout:{turn_timeout_s}s"
     finally:
-        cancel_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await cancel_task
+        for task in (cancel_task, hold_task):
+            if task is None:
+                continue
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    if provider_error and not interaction_context.is_canceled():
+        # Text already generated before a timeout is still delivered ahead of the failure decision.
+        await _flush_deltas()
 
     if provider_error:
         await interaction_context.request_commit(
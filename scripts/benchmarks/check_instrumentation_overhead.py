@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+from orket.instrumentation import RECORDING_BUDGET_NS, measure_recording_overhead  # noqa: E402
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check that recording one metric observation stays within budget.")
+    parser.add_argument("--iterations", type=int, default=20_000, help="Observations timed per pass.")
+    parser.add_argument("--passes", type=int, default=5, help="Timed passes; the fastest one is compared.")
+    parser.add_argument("--budget-ns", type=float, default=float(RECORDING_BUDGET_NS), help="Per-observation budget.")
+    parser.add_argument("--out", default="", help="Optional output path for report JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    passes = [measure_recording_overhead(args.iterations) for _ in range(max(1, int(args.passes)))]
+    best_ns = min(passes)
+    report = {
+        "status": "PASS" if best_ns < args.budget_ns else "FAIL",
+        "budget_ns": args.budget_ns,
+        "best_ns": round(best_ns, 1),
+        "passes_ns": [round(value, 1) for value in passes],
+        "iterations": args.iterations,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+
+    out_text = str(args.out or "").strip()
+    if out_text:
+        out_path = Path(out_text)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(text + "\n", encoding="utf-8")
+    return 0 if report["status"] == "PASS" else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
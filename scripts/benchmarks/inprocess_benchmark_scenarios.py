@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from orket.adapters.llm.local_model_provider import LocalModelProvider
+from orket.adapters.storage.async_protocol_run_ledger import AsyncProtocolRunLedgerRepository
+from orket.application.workflows.turn_executor import TurnExecutor
+from orket.application.workflows.turn_message_builder import MessageBuilder
+from orket.core.domain.state_machine import StateMachine
+from orket.core.policies.tool_gate import ToolGate
+from orket.kernel.v1.odr.core import ReactorConfig, ReactorState, run_round
+from orket.kernel.v1.state.lsi import LocalSovereignIndex
+from orket.kernel.v1.state.promotion import promote_turn
+from orket.orchestration.engine import OrchestrationEngine
+from orket.rulesim.workload import run_rulesim_v0_sync
+from orket.runtime.config.prompt_prefix_layout import PROMPT_LAYOUT_DEFAULT, PROMPT_LAYOUT_PREFIX_STABLE
+from orket.schema import CardStatus, IssueConfig, RoleConfig
+from orket.streaming.bus import StreamBus
+from orket.streaming.contracts import StreamEventType
+
+try:
+    from scripts.benchmarks.inprocess_benchmark_support import (
+        BenchmarkScenario,
+        PrefixCachingStubBackend,
+        StubModelClientNode,
+        StubModelProvider,
+    )
+except ModuleNotFoundError:  # pragma: no cover - direct script execution fallback
+    from inprocess_benchmark_support import (
+        BenchmarkScenario,
+        PrefixCachingStubBackend,
+        StubModelClientNode,
+        StubModelProvider,
+    )
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def write_epic_assets(root: Path, *, epic_name: str, issues: int) -> None:
+    """Write a minimal organization, team, and epic whose issues each take a builder and a verifier turn."""
+    _write_json(
+        root / "config" / "organization.json",
+        {
+            "name": "Benchmark",
+            "vision": "Benchmark",
+            "ethos": "Benchmark",
+            "branding": {"design_dos": []},
+            "architecture": {"cicd_rules": [], "preferred_stack": {}, "idesign_threshold": 7},
+            "process_rules": {"small_project_builder_variant": "architect"},
+            "departments": ["core"],
+        },
+    )
+    core = root / "model" / "core"
+    for dialect in ("qwen", "llama3", "deepseek-r1", "phi", "generic"):
+        _write_json(
+            core / "dialects" / f"{dialect}.json",
+            {"model_family": dialect, "dsl_format": "JSON", "constraints": [], "hallucination_guard": "None"},
+        )
+    roles = {
+        "lead_architect": ("ARCH", ["write_file", "update_issue_status"]),
+        "integrity_guard": ("VERI", ["update_issue_status", "read_file"]),
+        "code_reviewer": ("REV", ["update_issue_status", "read_file"]),
+    }
+    for name, (role_id, tools) in roles.items():
+        _write_json(
+            core / "roles" / f"{name}.json",
+            {"id": role_id, "summary": name, "type": "utility", "description": name, "prompt": name, "tools": tools},
+        )
+    _write_json(
+        core / "teams" / "standard.json",
+        {
+            "name": "standard",
+            "seats": {
+                "lead_architect": {"name": "lead_architect", "roles": ["lead_architect"]},
+                "reviewer_seat": {"name": "reviewer_seat", "roles": ["code_reviewer"]},
+                "verifier_seat": {"name": "verifier_seat", "roles": ["integrity_guard"]},
+            },
+        },
+    )
+    _write_json(
+        core / "environments" / "standard.json",
+        {"name": "standard", "model": "benchmark-stub", "temperature": 0.1, "timeout": 300},
+    )
+    _write_json(
+        core / "epics" / f"{epic_name}.json",
+        {
+            "id": epic_name.upper(),
+            "name": epic_name,
+            "type": "epic",
+            "team": "standard",
+            "environment": "standard",
+            "description": "In-process benchmark epic.",
+            "architecture_governance": {"idesign": False, "pattern": "Tactical"},
+            "issues": [
+                {"id": f"ISSUE-{index + 1}", "summary": f"Benchmark issue {index + 1}", "seat": "lead_architect"}
+                for index in range(max(1, issues))
+            ],
+        },
+    )
+
+
+class ExecuteEpicScenario:
+    """One ``run_card`` over a fresh epic per operation; the engine is built untimed in ``prepare``."""
+
+    name = "execute_epic"
+
+    def __init__(self, provider: StubModelProvider, *, issues: int = 3) -> None:
+        self.provider = provider
+        self.issues = issues
+        self.root = Path()
+        self.engine: OrchestrationEngine | None = None
+
+    async def setup(self, root: Path) -> None:
+        self.root = root
+
+    async def prepare(self, index: int) -> None:
+        await self._close_engine()
+        run_root = self.root / f"epic_{index + 1 if index >= 0 else f'warmup_{-index}'}"
+        write_epic_assets(run_root, epic_name="benchmark_epic", issues=self.issues)
+        workspace = run_root / "workspace"
+        (workspace / "agent_output").mkdir(parents=True, exist_ok=True)
+        (workspace / "verification").mkdir(parents=True, exist_ok=True)
+        self.engine = OrchestrationEngine(
+            workspace, department="core", db_path=str(run_root / "orket.db"), config_root=run_root
+        )
+        self.engine._pipeline.orchestrator.model_client_node = StubModelClientNode(self.provider)
+
+    async def run_once(self, index: int) -> None:
+        assert self.engine is not None
+        await self.engine.run_card("benchmark_epic")
+
+    async def teardown(self) -> None:
+        await self._close_engine()
+
+    async def _close_engine(self) -> None:
+        if self.engine is not None:
+            await self.engine.close()
+            self.engine = None
+
+
+class _BenchmarkToolbox:
+    async def execute(self, tool_name: str, args: dict[str, Any], context: dict[str, Any] | None = None) -> dict:
+        return {"ok": True, "tool": tool_name}
+
+
+class TurnExecutionScenario:
+    """One builder turn (prompt build, stub model call, parse, tool dispatch, artifacts) per operation."""
+
+    name = "turn_execution"
+
+    def __init__(self, provider: StubModelProvider) -> None:
+        self.provider = provider
+        self.executor: TurnExecutor | None = None
+        self.issue = IssueConfig(id="ISSUE-1", summary="Benchmark turn", status=CardStatus.IN_PROGRESS)
+        self.role = RoleConfig(
+            id="ARCH", summary="lead_architect", description="Builds", tools=["write_file", "update_issue_status"]
+        )
+        self._turns = 0
+
+    async def setup(self, root: Path) -> None:
+        await asyncio.to_thread(root.mkdir, parents=True, exist_ok=True)
+        self.executor = TurnExecutor(StateMachine(), ToolGate(organization=None, workspace_root=root), workspace=root)
+
+    async def prepare(self, index: int) -> None:
+        self._turns += 1
+
+    async def run_once(self, index: int) -> None:
+        assert self.executor is not None
+        context = {
+            "session_id": f"bench-turn-{self._turns}",
+            "turn_index": 0,
+            "issue_id": self.issue.id,
+            "role": "lead_architect",
+            "roles": ["lead_architect"],
+            "current_status": "in_progress",
+            "selected_model": self.provider.model,
+            "dependency_context": {},
+            "required_action_tools": [],
+            "required_statuses": [],
+            "required_read_paths": [],
+            "required_write_paths": [],
+            "stage_gate_mode": "auto",
+            "history": [],
+        }
+        result = await self.executor.execute_turn(
+            issue=self.issue,
+            role=self.role,
+            model_client=self.provider,
+            toolbox=_BenchmarkToolbox(),
+            context=context,
+            system_prompt="IDENTITY: lead_architect",
+        )
+        if not result.success:
+            raise RuntimeError(f"benchmark turn failed: {result.error}")
+
+    async def teardown(self) -> None:
+        self.executor = None
+
+
+class ProtocolLedgerAppendScenario:
+    """One append to a protocol run ledger per operation, on a run that grows for the whole pass."""
+
+    name = "protocol_ledger_append"
+
+    def __init__(self) -> None:
+        self.repo: AsyncProtocolRunLedgerRepository | None = None
+        self.session_id = "bench-protocol-ledger"
+
+    async def setup(self, root: Path) -> None:
+        self.repo = AsyncProtocolRunLedgerRepository(root)
+        await self.repo.start_run(
+            session_id=self.session_id,
+            run_type="epic",
+            run_name="benchmark",
+            department="core",
+            build_id="benchmark",
+        )
+
+    async def prepare(self, index: int) -> None:
+        return None
+
+    async def run_once(self, index: int) -> None:
+        assert self.repo is not None
+        await self.repo.append_event(
+            session_id=self.session_id,
+            kind="turn_completed",
+            payload={"issue_id": "ISSUE-1", "turn_index": index, "tokens": 128},
+        )
+
+    async def teardown(self) -> None:
+        self.repo = None
+
+
+class StreamBusPublishScenario:
+    """A burst of token deltas published to one subscriber and drained, per operation."""
+
+    name = "stream_bus_publish"
+
+    def __init__(self, *, events_per_operation: int = 100) -> None:
+        self.events_per_operation = max(1, events_per_operation)
+        self.bus: StreamBus | None = None
+        self.queue: Any = None
+        self._turns = 0
+
+    async def setup(self, root: Path) -> None:
+        self.bus = StreamBus()
+        self.queue = await self.bus.subscribe("bench-session")
+
+    async def prepare(self, index: int) -> None:
+        self._turns += 1
+
+    async def run_once(self, index: int) -> None:
+        assert self.bus is not None
+        turn_id = f"turn-{self._turns}"
+        for event_index in range(self.events_per_operation):
+            await self.bus.publish(
+                session_id="bench-session",
+                turn_id=turn_id,
+                event_type=StreamEventType.TOKEN_DELTA,
+                payload={"delta": "tok", "index": event_index},
+            )
+            while not self.queue.empty():
+                self.queue.get_nowait()
+        await self.bus.clear_turn("bench-session", turn_id)
+
+    async def teardown(self) -> None:
+        if self.bus is not None and self.queue is not None:
+            await self.bus.unsubscribe("bench-session", self.queue)
+        self.bus = None
+
+
+class KernelLsiPromotionScenario:
+    """Stage one triplet and promote its turn in the local sovereign index, per operation."""
+
+    name = "kernel_lsi_promote"
+
+    def __init__(self) -> None:
+        self.root = Path()
+        self.lsi: LocalSovereignIndex | None = None
+        self._turns = 0
+
+    async def setup(self, root: Path) -> None:
+        await asyncio.to_thread(root.mkdir, parents=True, exist_ok=True)
+        self.root = root
+        self.lsi = LocalSovereignIndex(str(root))
+
+    async def prepare(self, index: int) -> None:
+        self._turns += 1
+
+    async def run_once(self, index: int) -> None:
+        assert self.lsi is not None
+        turn_id = f"turn-{self._turns:04d}"
+        self.lsi.stage_triplet(
+            run_id="bench-lsi",
+            turn_id=turn_id,
+            stem=f"data/dto/bench/item_{self._turns}",
+            body={"dto_type": "invocation", "id": f"inv:{self._turns}"},
+            links={"declares": {"type": "skill", "id": f"skill:{self._turns}", "relationship": "declares"}},
+            manifest={},
+        )
+        result = promote_turn(root=str(self.root), run_id="bench-lsi", turn_id=turn_id)
+        if result.outcome != "PASS":
+            raise RuntimeError(f"benchmark promotion failed: {[issue.code for issue in result.issues]}")
+
+    async def teardown(self) -> None:
+        self.lsi = None
+
+
+# The llama.cpp model with a registered local prompt profile, so governed turns resolve one.
+_PREFIX_BENCHMARK_MODEL = "qwen3.6-27b-q4_k_m"
+
+
+class PromptPrefixScenario:
+    """One turn per role (prompt build and llama.cpp request) against a prefix-caching stub, per operation.
+
+    Roles alternate on a backend with fewer slots than roles, and each turn carries new memory,
+    history, and execution context, so the reported prefix hit rate and prompt-eval time show
+    how much of each prompt the layout keeps reusable.
+    """
+
+    def __init__(self, *, layout: str, roles: tuple[str, ...] = ("lead_architect", "code_reviewer")) -> None:
+        self.layout = layout
+        self.name = f"prompt_prefix_{layout}"
+        self.roles = roles
+        self.backend = PrefixCachingStubBackend(slots=len(roles))
+        self.builder: MessageBuilder | None = None
+        self.provider: LocalModelProvider | None = None
+        self.issue = IssueConfig(id="ISSUE-1", summary="Benchmark prompt prefix", status=CardStatus.IN_PROGRESS)
+        self._turns = 0
+
+    async def setup(self, root: Path) -> None:
+        await asyncio.to_thread(root.mkdir, parents=True, exist_ok=True)
+        self.builder = MessageBuilder(root)
+        self.provider = LocalModelProvider(model=_PREFIX_BENCHMARK_MODEL, provider="llama_cpp", response_cache=None)
+        await self.provider.client.aclose()
+        self.provider.client = self.backend
+
+    async def prepare(self, index: int) -> None:
+        self._turns += 1
+
+    async def run_once(self, index: int) -> None:
+        assert self.builder is not None and self.provider is not None
+        for role_name in self.roles:
+            role = RoleConfig(id=role_name, summary=role_name, description=role_name, tools=["write_file"])
+            context = self._context(role_name)
+            system_prompt = (
+                f"IDENTITY: {role_name}\n" + "Follow the governed tool protocol and keep changes minimal. " * 20
+            ) + f"\n\nPROJECT CONTEXT (PAST DECISIONS):\nDecision {self._turns} for {role_name}."
+            messages = await self.builder.prepare_messages(
+                issue=self.issue, role=role, context=context, system_prompt=system_prompt
+            )
+            await self.provider.complete(messages, runtime_context=context)
+
+    def _context(self, role_name: str) -> dict[str, Any]:
+        return {
+            "session_id": "bench-prompt-prefix",
+            "prompt_layout": self.layout,
+            "compact_turn_packet_enabled": False,
+            "turn_index": self._turns,
+            "issue_id": self.issue.id,
+            "role": role_name,
+            "current_status": "in_progress",
+            "protocol_governed_enabled": True,
+            "artifact_contract": {"kind": "app", "primary_output": "agent_output/main.py", "notes": "x " * 200},
+            "required_action_tools": ["write_file"],
+            "required_statuses": ["code_review"],
+            "required_read_paths": [],
+            "required_write_paths": ["agent_output/main.py"],
+            "prompt_metadata": {"turn": self._turns},
+            "history": [{"role": role_name, "content": f"turn {turn} output"} for turn in range(self._turns)][-4:],
+        }
+
+    def metrics(self) -> dict[str, Any]:
+        return self.backend.stats()
+
+    async def teardown(self) -> None:
+        self.builder = None
+        self.provider = None
+
+
+_ODR_ARCHITECT = (
+    "### REQUIREMENT\nStore all user data locally on the device and never upload it. Revision {revision}.\n\n"
+    "### CHANGELOG\n- revision {revision}\n\n### ASSUMPTIONS\n- local-first\n\n### OPEN_QUESTIONS\n- none\n"
+)
+_ODR_AUDITOR = "### CRITIQUE\n- c1\n\n### PATCHES\n- p1\n\n### EDGE_CASES\n- e1\n\n### TEST_GAPS\n- t1\n"
+
+
+class KernelOdrScenario:
+    """Run the ODR reactor from an empty state until it stops, per operation."""
+
+    name = "kernel_odr_rounds"
+
+    def __init__(self, *, max_attempts: int = 8) -> None:
+        self.config = ReactorConfig(max_attempts=max_attempts)
+
+    async def setup(self, root: Path) -> None:
+        return None
+
+    async def prepare(self, index: int) -> None:
+        return None
+
+    async def run_once(self, index: int) -> None:
+        state = ReactorState()
+        for round_index in range(self.config.max_attempts):
+            # Two distinct revisions, then a stable one, so the reactor converges.
+            state = run_round(state, _ODR_ARCHITECT.format(revision=min(round_index, 2)), _ODR_AUDITOR, self.config)
+            if state.stop_reason is not None:
+                break
+
+    async def teardown(self) -> None:
+        return None
+
+
+class RulesimScenario:
+    """One deterministic rulesim batch per operation."""
+
+    name = "rulesim_batch"
+
+    def __init__(self, *, episodes: int = 200) -> None:
+        self.episodes = max(1, episodes)
+        self.workspace = Path()
+
+    async def setup(self, root: Path) -> None:
+        self.workspace = root
+
+    async def prepare(self, index: int) -> None:
+        return None
+
+    async def run_once(self, index: int) -> None:
+        run_rulesim_v0_sync(
+            input_config={
+                "schema_version": "rulesim_v0",
+                "rulesystem_id": "loop",
+                "run_seed": 20260301,
+                "episodes": self.episodes,
+                "max_steps": 6,
+                "agents": [{"id": "agent_0", "strategy": "random_uniform", "params": {}}],
+                "scenario": {"turn_order": ["agent_0"]},
+                "artifact_policy": "none",
+                "enforce_contract_checks": True,
+            },
+            workspace_path=self.workspace,
+        )
+
+    async def teardown(self) -> None:
+        return None
+
+
+def build_scenarios(
+    *, model_latency_ms: float = 0.0, model_jitter_ms: float = 0.0
+) -> dict[str, Callable[[], BenchmarkScenario]]:
+    """Scenario factories by name; each call builds a fresh instance with its own stub model."""
+
+    def _provider() -> StubModelProvider:
+        return StubModelProvider(latency_ms=model_latency_ms, jitter_ms=model_jitter_ms)
+
+    return {
+        ExecuteEpicScenario.name: lambda: ExecuteEpicScenario(_provider()),
+        TurnExecutionScenario.name: lambda: TurnExecutionScenario(_provider()),
+        ProtocolLedgerAppendScenario.name: ProtocolLedgerAppendScenario,
+        StreamBusPublishScenario.name: StreamBusPublishScenario,
+        KernelLsiPromotionScenario.name: KernelLsiPromotionScenario,
+        KernelOdrScenario.name: KernelOdrScenario,
+        RulesimScenario.name: RulesimScenario,
+        f"prompt_prefix_{PROMPT_LAYOUT_DEFAULT}": lambda: PromptPrefixScenario(layout=PROMPT_LAYOUT_DEFAULT),
+        f"prompt_prefix_{PROMPT_LAYOUT_PREFIX_STABLE}": lambda: PromptPrefixScenario(
+            layout=PROMPT_LAYOUT_PREFIX_STABLE
+        ),
+    }
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import hashlib
+import math
+import os
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+import httpx
+
+from orket.adapters.llm.local_model_provider import ModelResponse
+
+REPORT_SCHEMA_VERSION = "orket.inprocess_benchmark.v1"
+DEFAULT_MAX_REGRESSION_PCT = 20.0
+
+# metric path -> direction in which the metric improves.
+TRACKED_METRICS: dict[str, str] = {
+    "throughput_ops_per_second": "higher",
+    "latency_ms.p95": "lower",
+    "alloc_peak_bytes": "lower",
+}
+
+_REVIEW_ROLES = {"integrity_guard", "verifier_seat", "code_reviewer", "reviewer_seat"}
+_IDENTITY_PREFIX = "IDENTITY: "
+_WRITE_AND_REVIEW = (
+    '```json\n{"tool": "write_file", "args": {"path": "agent_output/benchmark.txt", "content": "benchmark output"}}\n```\n'
+    '```json\n{"tool": "update_issue_status", "args": {"status": "code_review"}}\n```'
+)
+_FINALIZE = '```json\n{"tool": "update_issue_status", "args": {"status": "done"}}\n```'
+
+
+class BenchmarkScenario(Protocol):
+    """One benchmarked workflow. ``prepare`` is untimed; ``run_once`` is one timed operation.
+
+    A scenario may also define ``metrics()``; its dict is reported as ``scenario_metrics``
+    after the timed pass.
+    """
+
+    name: str
+
+    async def setup(self, root: Path) -> None: ...
+
+    async def prepare(self, index: int) -> None: ...
+
+    async def run_once(self, index: int) -> None: ...
+
+    async def teardown(self) -> None: ...
+
+
+class StubModelProvider:
+    """Deterministic model provider with configurable latency.
+
+    Builder seats write one file and move the card to review; review and verifier seats
+    finish it. Latency is ``latency_ms`` plus a jitter derived from the call index, so two
+    runs with the same settings see the same delays.
+    """
+
+    def __init__(self, *, latency_ms: float = 0.0, jitter_ms: float = 0.0, model: str = "benchmark-stub") -> None:
+        self.latency_ms = max(0.0, float(latency_ms))
+        self.jitter_ms = max(0.0, float(jitter_ms))
+        self.model = model
+        self.timeout = 300
+        self.calls = 0
+
+    async def complete(self, messages: list[dict[str, Any]], **_kwargs: Any) -> ModelResponse:
+        self.calls += 1
+        delay_ms = self.latency_ms + self._jitter(self.calls)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+        content = _FINALIZE if _turn_role(messages) in _REVIEW_ROLES else _WRITE_AND_REVIEW
+        tokens = max(1, len(content) // 4)
+        return ModelResponse(
+            content=content,
+            raw={"model": self.model, "prompt_tokens": 0, "completion_tokens": tokens, "total_tokens": tokens},
+        )
+
+    async def clear_context(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    def _jitter(self, call_index: int) -> float:
+        if not self.jitter_ms:
+            return 0.0
+        digest = hashlib.sha256(f"{self.model}:{call_index}".encode()).digest()
+        return self.jitter_ms * int.from_bytes(digest[:4], "big") / 0xFFFFFFFF
+
+
+class StubModelClientNode:
+    """Model client policy node that hands every turn the shared stub provider."""
+
+    def __init__(self, provider: StubModelProvider) -> None:
+        self.provider = provider
+
+    def create_provider(self, selected_model: str, env: Any) -> StubModelProvider:
+        return self.provider
+
+    def create_client(self, provider: Any) -> Any:
+        return provider
+
+
+class PrefixCachingStubBackend:
+    """OpenAI-compatible chat endpoint that simulates a llama.cpp-style KV prefix cache.
+
+    Each of ``slots`` slots remembers the tokens of the last prompt it evaluated. A request
+    reuses the longest common token prefix with its slot's cache unless it sends
+    ``cache_prompt: false`` (llama.cpp caches by default); only
+    the remaining tokens are charged ``prompt_ms_per_token``. Requests without ``id_slot``
+    take slots round-robin. Timings come back as llama.cpp reports them (``cache_n``,
+    ``prompt_n``, ``prompt_ms``); no real time is spent.
+    """
+
+    def __init__(self, *, slots: int = 2, prompt_ms_per_token: float = 0.5, content: str = _FINALIZE) -> None:
+        self.slots: list[list[str]] = [[] for _ in range(max(1, int(slots)))]
+        self.prompt_ms_per_token = max(0.0, float(prompt_ms_per_token))
+        self.content = content
+        self.requests: list[dict[str, Any]] = []
+        self._next_slot = 0
+
+    async def post(self, path: str, headers: dict[str, str] | None = None, json: dict[str, Any] | None = None) -> Any:
+        payload = dict(json or {})
+        tokens = _prompt_tokens(payload.get("messages") or [])
+        slot_index = payload.get("id_slot")
+        if not isinstance(slot_index, int) or not 0 <= slot_index < len(self.slots):
+            slot_index = self._next_slot
+            self._next_slot = (self._next_slot + 1) % len(self.slots)
+        cached = self.slots[slot_index]
+        cache_n = 0
+        if payload.get("cache_prompt", True):
+            limit = min(len(cached), len(tokens))
+            while cache_n < limit and cached[cache_n] == tokens[cache_n]:
+                cache_n += 1
+        self.slots[slot_index] = tokens
+        prompt_n = len(tokens) - cache_n
+        completion_tokens = max(1, len(self.content) // 4)
+        self.requests.append({"path": path, "slot": slot_index, "cache_n": cache_n, "prompt_n": prompt_n})
+        body = {
+            "choices": [{"message": {"role": "assistant", "content": self.content}}],
+            "usage": {
+                "prompt_tokens": len(tokens),
+                "completion_tokens": completion_tokens,
+                "total_tokens": len(tokens) + completion_tokens,
+            },
+            "timings": {
+                "cache_n": cache_n,
+                "prompt_n": prompt_n,
+                "prompt_ms": prompt_n * self.prompt_ms_per_token,
+                "predicted_ms": 1.0,
+            },
+        }
+        return httpx.Response(200, json=body, request=httpx.Request("POST", f"http://prefix-stub/v1{path}"))
+
+    def stats(self) -> dict[str, Any]:
+        cached = sum(request["cache_n"] for request in self.requests)
+        total = cached + sum(request["prompt_n"] for request in self.requests)
+        turns = len(self.requests)
+        return {
+            "turns": turns,
+            "prefix_hit_rate": round(cached / total, 4) if total else 0.0,
+            "prompt_eval_ms_per_turn": round(
+                sum(request["prompt_n"] for request in self.requests) * self.prompt_ms_per_token / turns, 3
+            )
+            if turns
+            else 0.0,
+        }
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _prompt_tokens(messages: list[dict[str, Any]]) -> list[str]:
+    tokens: list[str] = []
+    for message in messages:
+        tokens.append(f"<|{(message or {}).get('role')}|>")
+        tokens.extend(str((message or {}).get("content") or "").split())
+    return tokens
+
+
+def _turn_role(messages: list[dict[str, Any]]) -> str:
+    for message in messages:
+        for line in str((message or {}).get("content") or "").splitlines():
+            if line.startswith(_IDENTITY_PREFIX):
+                return line[len(_IDENTITY_PREFIX) :].strip().lower()
+    return ""
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def peak_rss_bytes() -> int:
+    if os.name != "nt":
+        import resource
+
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+    try:
+        import psutil  # type: ignore
+
+        return int(psutil.Process().memory_info().peak_wset)
+    except (ImportError, AttributeError, OSError):
+        return 0
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    operations: int
+    elapsed_seconds: float
+    latencies_ms: list[float] = field(default_factory=list)
+    alloc_operations: int = 0
+    alloc_peak_bytes: int = 0
+    alloc_total_bytes: int = 0
+    alloc_blocks: int = 0
+    peak_rss_bytes: int = 0
+    scenario_metrics: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        latencies = self.latencies_ms
+        payload = {
+            "operations": self.operations,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "throughput_ops_per_second": round(self.operations / self.elapsed_seconds, 3)
+            if self.elapsed_seconds > 0
+            else 0.0,
+            "latency_ms": {
+                "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+                "p50": round(percentile(latencies, 50), 3),
+                "p95": round(percentile(latencies, 95), 3),
+                "p99": round(percentile(latencies, 99), 3),
+                "max": round(max(latencies), 3) if latencies else 0.0,
+            },
+            "alloc_operations": self.alloc_operations,
+            "alloc_peak_bytes": self.alloc_peak_bytes,
+            "alloc_bytes_per_op": round(self.alloc_total_bytes / self.alloc_operations, 1)
+            if self.alloc_operations
+            else 0.0,
+            "alloc_blocks_per_op": round(self.alloc_blocks / self.alloc_operations, 1)
+            if self.alloc_operations
+            else 0.0,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+        if self.scenario_metrics:
+            payload["scenario_metrics"] = dict(self.scenario_metrics)
+        return payload
+
+
+async def measure_scenario(
+    factory: Callable[[], BenchmarkScenario],
+    *,
+    root: Path,
+    iterations: int,
+    warmup: int = 1,
+    alloc_iterations: int = 1,
+) -> ScenarioResult:
+    """Time ``iterations`` operations, then count allocations over a separate traced pass.
+
+    tracemalloc slows every allocation, so latencies come from an untraced pass and the
+    allocation figures from a short traced one on a fresh scenario instance. Warmup
+    operations get negative indexes. Allocation figures count memory still held when the
+    operation returns; the peak includes transient allocations.
+    """
+    scenario = factory()
+    result = ScenarioResult(name=scenario.name, operations=max(1, int(iterations)), elapsed_seconds=0.0)
+    await scenario.setup(root / "timed")
+    try:
+        for index in range(max(0, int(warmup))):
+            await _run_timed(scenario, -(index + 1))
+        for index in range(result.operations):
+            elapsed_ms = await _run_timed(scenario, index)
+            result.latencies_ms.append(elapsed_ms)
+            result.elapsed_seconds += elapsed_ms / 1000.0
+        scenario_metrics = getattr(scenario, "metrics", None)
+        if callable(scenario_metrics):
+            result.scenario_metrics = dict(scenario_metrics())
+    finally:
+        await scenario.teardown()
+
+    if alloc_iterations > 0:
+        traced = factory()
+        await traced.setup(root / "traced")
+        try:
+            await _run_timed(traced, -1)
+            for index in range(int(alloc_iterations)):
+                await traced.prepare(index)
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    before = tracemalloc.take_snapshot()
+                    await traced.run_once(index)
+                    after = tracemalloc.take_snapshot()
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                grown = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+                result.alloc_operations += 1
+                result.alloc_peak_bytes = max(result.alloc_peak_bytes, int(peak))
+                result.alloc_total_bytes += sum(stat.size_diff for stat in grown)
+                result.alloc_blocks += sum(max(0, stat.count_diff) for stat in grown)
+        finally:
+            await traced.teardown()
+    result.peak_rss_bytes = peak_rss_bytes()
+    return result
+
+
+async def _run_timed(scenario: BenchmarkScenario, index: int) -> float:
+    await scenario.prepare(index)
+    started = time.perf_counter()
+    await scenario.run_once(index)
+    return (time.perf_counter() - started) * 1000.0
+
+
+def _metric_value(payload: dict[str, Any], path: str) -> float | None:
+    value: Any = payload
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_regression_pct: float = DEFAULT_MAX_REGRESSION_PCT,
+    tracked_metrics: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Compare tracked scenario metrics; a regression is a worse-direction change past the threshold."""
+    tracked = tracked_metrics or TRACKED_METRICS
+    current_scenarios = current.get("scenarios") if isinstance(current.get("scenarios"), dict) else {}
+    baseline_scenarios = baseline.get("scenarios") if isinstance(baseline.get("scenarios"), dict) else {}
+    comparisons: list[dict[str, Any]] = []
+    regressions: list[str] = []
+    for scenario_name in sorted(set(current_scenarios) & set(baseline_scenarios)):
+        for metric, direction in tracked.items():
+            now = _metric_value(current_scenarios[scenario_name], metric)
+            then = _metric_value(baseline_scenarios[scenario_name], metric)
+            if now is None or then is None or then <= 0:
+                continue
+            change_pct = (now - then) / then * 100.0
+            worse_pct = -change_pct if direction == "higher" else change_pct
+            regressed = worse_pct > max_regression_pct
+            comparisons.append(
+                {
+                    "scenario": scenario_name,
+                    "metric": metric,
+                    "baseline": then,
+                    "current": now,
+                    "change_pct": round(change_pct, 2),
+                    "regressed": regressed,
+                }
+            )
+            if regressed:
+                regressions.append(f"{scenario_name}:{metric}:{round(worse_pct, 2)}%")
+    return {
+        "status": "FAIL" if regressions else "PASS",
+        "max_regression_pct": max_regression_pct,
+        "missing_in_current": sorted(set(baseline_scenarios) - set(current_scenarios)),
+        "comparisons": comparisons,
+        "regressions": regressions,
+    }
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+from orket.settings import load_env  # noqa: E402
+from scripts.benchmarks.inprocess_benchmark_scenarios import build_scenarios  # noqa: E402
+from scripts.benchmarks.inprocess_benchmark_support import (  # noqa: E402
+    DEFAULT_MAX_REGRESSION_PCT,
+    REPORT_SCHEMA_VERSION,
+    compare_reports,
+    measure_scenario,
+)
+
+DEFAULT_OUT = "benchmarks/results/benchmarks/inprocess_benchmarks.json"
+DEFAULT_ITERATIONS = {
+    "execute_epic": 5,
+    "turn_execution": 50,
+    "protocol_ledger_append": 200,
+    "stream_bus_publish": 50,
+    "kernel_lsi_promote": 50,
+    "kernel_odr_rounds": 100,
+    "rulesim_batch": 10,
+    "prompt_prefix_default": 20,
+    "prompt_prefix_prefix_stable": 20,
+}
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Drive Orket workflows in-process against a deterministic stub model and report performance."
+    )
+    parser.add_argument("--scenario", action="append", default=[], help="Scenario to run; repeat. Defaults to all.")
+    parser.add_argument("--iterations", type=int, default=0, help="Timed operations per scenario (0 = per-scenario).")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed operations before the timed pass.")
+    parser.add_argument("--alloc-iterations", type=int, default=1, help="Operations traced for allocations.")
+    parser.add_argument("--model-latency-ms", type=float, default=0.0, help="Stub model latency per completion.")
+    parser.add_argument("--model-jitter-ms", type=float, default=0.0, help="Deterministic extra stub latency.")
+    parser.add_argument("--work-dir", default="", help="Scratch directory; a temporary one is used by default.")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="Output path for the report JSON.")
+    parser.add_argument("--baseline", default="", help="Baseline report to compare against.")
+    parser.add_argument(
+        "--max-regression-pct",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION_PCT,
+        help="Fail when a tracked metric is this much worse than the baseline.",
+    )
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit.")
+    return parser.parse_args(argv)
+
+
+async def run_benchmarks(
+    *,
+    scenarios: list[str],
+    work_dir: Path,
+    iterations: int = 0,
+    warmup: int = 1,
+    alloc_iterations: int = 1,
+    model_latency_ms: float = 0.0,
+    model_jitter_ms: float = 0.0,
+) -> dict[str, Any]:
+    factories = build_scenarios(model_latency_ms=model_latency_ms, model_jitter_ms=model_jitter_ms)
+    unknown = sorted(set(scenarios) - set(factories))
+    if unknown:
+        raise ValueError(f"unknown benchmark scenarios: {', '.join(unknown)}")
+    results: dict[str, Any] = {}
+    for name in scenarios or list(factories):
+        result = await measure_scenario(
+            factories[name],
+            root=work_dir / name,
+            iterations=iterations or DEFAULT_ITERATIONS.get(name, 20),
+            warmup=warmup,
+            alloc_iterations=alloc_iterations,
+        )
+        results[name] = result.as_dict()
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "generated_at_utc": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "iterations": iterations,
+            "warmup": warmup,
+            "alloc_iterations": alloc_iterations,
+            "model_latency_ms": model_latency_ms,
+            "model_jitter_ms": model_jitter_ms,
+        },
+        "scenarios": results,
+    }
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.list:
+        for name in build_scenarios():
+            print(name)
+        return 0
+    load_env()
+
+    def _run(work_dir: Path) -> dict[str, Any]:
+        return asyncio.run(
+            run_benchmarks(
+                scenarios=list(args.scenario),
+                work_dir=work_dir,
+                iterations=args.iterations,
+                warmup=args.warmup,
+                alloc_iterations=args.alloc_iterations,
+                model_latency_ms=args.model_latency_ms,
+                model_jitter_ms=args.model_jitter_ms,
+            )
+        )
+
+    if args.work_dir:
+        report = _run(Path(args.work_dir))
+    else:
+        with tempfile.TemporaryDirectory(prefix="orket_inprocess_bench_") as tmp:
+            report = _run(Path(tmp))
+
+    status = "PASS"
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        comparison = compare_reports(report, baseline, max_regression_pct=args.max_regression_pct)
+        comparison["baseline"] = str(args.baseline).replace("\\", "/")
+        report["comparison"] = comparison
+        status = comparison["status"]
+    report["status"] = status
+    if args.out:
+        _write_json(Path(args.out), report)
+    print(json.dumps(report, indent=2))
+    return 0 if status == "PASS" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
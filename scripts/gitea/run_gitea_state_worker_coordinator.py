@@ -34,6 +34,12 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--worker-id", default="", help="Worker identifier. Defaults to host-pid.")
     parser.add_argument("--fetch-limit", type=int, default=5, help="Fetch limit per run_once cycle.")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1,
+        help="Maximum concurrently claimed cards per worker. 1 keeps the serial run_once loop.",
+    )
     parser.add_argument("--lease-seconds", type=int, default=30, help="Lease duration in seconds.")
     parser.add_argument(
         "--renew-interval-seconds",
@@ -121,6 +127,7 @@ async def _run_loop(args: argparse.Namespace) -> Dict[str, Any]:
         max_idle_streak=max_idle_streak,
         max_duration_seconds=max_duration_seconds,
         idle_sleep_seconds=args.idle_sleep_seconds,
+        max_in_flight=args.max_in_flight,
     )
 
     async def _work_fn(_card: Dict[str, Any]) -> Dict[str, Any]:
@@ -131,6 +138,7 @@ async def _run_loop(args: argparse.Namespace) -> Dict[str, Any]:
         "timestamp_utc": datetime.now(UTC).isoformat(),
         "worker_id": worker_id,
         "fetch_limit": max(1, int(args.fetch_limit)),
+        "max_in_flight": max(1, int(args.max_in_flight)),
         "max_iterations": max_iterations,
         "max_idle_streak": max_idle_streak,
         "max_duration_seconds": max_duration_seconds,
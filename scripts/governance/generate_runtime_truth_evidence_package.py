@@ -11,6 +11,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from orket.runtime.evidence.contract_snapshot_store import resolve_contract_snapshot_file
 from orket.runtime.evidence_package_generator_contract import (
     evidence_package_generator_contract_snapshot,
 )
@@ -60,14 +61,14 @@ def _runtime_contract_inventory(*, workspace: Path, run_id: str) -> dict[str, An
         }
 
     contracts_dir = workspace / "observability" / normalized_run_id / "runtime_contracts"
-    files_present = (
-        sorted(path.name for path in contracts_dir.glob("*.json") if path.is_file())
-        if contracts_dir.exists()
-        else []
+    present = {path.name for path in contracts_dir.glob("*.json") if path.is_file()} if contracts_dir.exists() else set()
+    present.update(
+        filename
+        for filename in REQUIRED_RUNTIME_CONTRACT_FILES
+        if resolve_contract_snapshot_file(contracts_dir, filename) is not None
     )
-    required_files_missing = [
-        filename for filename in REQUIRED_RUNTIME_CONTRACT_FILES if not (contracts_dir / filename).exists()
-    ]
+    files_present = sorted(present)
+    required_files_missing = [filename for filename in REQUIRED_RUNTIME_CONTRACT_FILES if filename not in present]
     return {
         "runtime_contracts_dir": str(contracts_dir),
         "files_present": files_present,
@@ -10,6 +10,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from orket.runtime.evidence.contract_snapshot_store import resolve_contract_snapshot_file
 from orket.runtime.retry_classification_policy import (
     retry_classification_policy_snapshot,
     validate_retry_classification_policy,
@@ -536,8 +537,8 @@ def evaluate_runtime_truth_acceptance_gate(
         invalid_json_files: list[str] = []
         parsed_contract_files: dict[str, dict[str, Any]] = {}
         for filename in REQUIRED_RUNTIME_CONTRACT_FILES:
-            path = contracts_dir / filename
-            if not path.exists():
+            path = resolve_contract_snapshot_file(contracts_dir, filename)
+            if path is None:
                 missing_files.append(filename)
                 continue
             try:
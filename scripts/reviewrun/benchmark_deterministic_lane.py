@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+from orket.application.review.lanes.deterministic import run_deterministic_lane  # noqa: E402
+from orket.application.review.models import ChangedFile, ReviewSnapshot, SnapshotBounds, TruncationReport  # noqa: E402
+from orket.application.review.policy_resolver import DEFAULT_POLICY  # noqa: E402
+
+LINE_TEMPLATES = (
+    "    value_{n} = compute(item_{n}, factor={n})",
+    "    # refactor step {n}: move helper into module",
+    "    return {{'id': {n}, 'name': f'record-{n}'}}",
+    "    if result_{n} is None:",
+    "        raise ValueError('missing record {n}')",
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the deterministic review lane on a synthetic large diff.")
+    parser.add_argument("--files", type=int, default=500, help="Changed files in the synthetic diff.")
+    parser.add_argument("--lines-per-file", type=int, default=200, help="Added lines per changed file.")
+    parser.add_argument(
+        "--extra-patterns", type=int, default=30, help="Forbidden patterns added to the default policy."
+    )
+    parser.add_argument("--blocked-prefixes", type=int, default=50, help="Path blocklist entries in the policy.")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=1.0, help="Fail when the median run exceeds this.")
+    parser.add_argument("--out", default="", help="Optional output path for report JSON.")
+    return parser.parse_args()
+
+
+def _synthetic_diff(files: int, lines_per_file: int) -> tuple[str, list[ChangedFile]]:
+    chunks: list[str] = []
+    changed: list[ChangedFile] = []
+    for file_index in range(files):
+        path = f"src/pkg_{file_index % 20}/module_{file_index}.py"
+        changed.append(ChangedFile(path=path, status="M", additions=lines_per_file, deletions=0))
+        chunks.append(f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -0,0 +1,{lines_per_file} @@\n")
+        for line_index in range(lines_per_file):
+            n = file_index * lines_per_file + line_index
+            chunks.append("+" + LINE_TEMPLATES[n % len(LINE_TEMPLATES)].format(n=n) + "\n")
+    return "".join(chunks), changed
+
+
+def _policy(extra_patterns: int, blocked_prefixes: int) -> dict[str, Any]:
+    checks = dict(DEFAULT_POLICY["deterministic"]["checks"])
+    checks["forbidden_patterns"] = [
+        *checks["forbidden_patterns"],
+        *({"pattern": rf"\bforbidden_call_{index}\(", "severity": "high"} for index in range(extra_patterns)),
+    ]
+    checks["path_blocklist"] = [f"vendor/blocked_{index}/" for index in range(blocked_prefixes)]
+    return {"deterministic": {"checks": checks}}
+
+
+def main() -> int:
+    args = _parse_args()
+    diff, changed = _synthetic_diff(args.files, args.lines_per_file)
+    snapshot = ReviewSnapshot(
+        source="diff",
+        repo={"remote": "", "repo_id": "benchmark"},
+        base_ref="base",
+        head_ref="head",
+        bounds=SnapshotBounds(),
+        truncation=TruncationReport(),
+        changed_files=changed,
+        diff_unified=diff,
+        context_blobs=[],
+        metadata={},
+    )
+    snapshot.compute_snapshot_digest()
+    policy = _policy(args.extra_patterns, args.blocked_prefixes)
+
+    durations: list[float] = []
+    decision = ""
+    for _ in range(max(1, args.iterations)):
+        started = time.perf_counter()
+        result = run_deterministic_lane(
+            snapshot=snapshot,
+            resolved_policy=policy,
+            run_id="benchmark",
+            policy_digest="sha256:benchmark",
+        )
+        durations.append(time.perf_counter() - started)
+        decision = result.decision
+
+    median_seconds = statistics.median(durations)
+    report = {
+        "status": "PASS" if median_seconds <= args.max_seconds else "FAIL",
+        "files": args.files,
+        "added_lines": args.files * args.lines_per_file,
+        "diff_bytes": len(diff.encode("utf-8")),
+        "forbidden_patterns": len(policy["deterministic"]["checks"]["forbidden_patterns"]),
+        "blocked_prefixes": args.blocked_prefixes,
+        "decision": decision,
+        "first_run_seconds": round(durations[0], 4),
+        "median_seconds": round(median_seconds, 4),
+        "max_seconds": args.max_seconds,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(text + "\n", encoding="utf-8")
+    return 0 if report["status"] == "PASS" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -302,3 +302,152 @@ async def test_find_related_card_ids(repo):
     assert set(ids) == {"ISSUE-X1", "ISSUE-X3"}
 
 
+
+
+@pytest.mark.asyncio
+async def test_save_many_and_update_status_many_use_single_batches(repo):
+    """Layer: integration. Verifies bulk card writes persist every row and log one transaction per card."""
+    records = [IssueRecord(id=f"BULK-{index}", summary=f"Bulk {index}", build_id="BB", seat="standard") for index in range(5)]
+    assert await repo.save_many(records) == 5
+    assert await repo.save_many([]) == 0
+
+    updated = await repo.update_status_many(
+        [record.id for record in records] + ["BULK-0"],
+        CardStatus.IN_PROGRESS,
+        assignee="agent-bulk",
+        reason="wave start",
+    )
+
+    assert updated == 5
+    issues = await repo.get_by_build("BB")
+    assert {issue.status for issue in issues} == {CardStatus.IN_PROGRESS}
+    assert {issue.assignee for issue in issues} == {"agent-bulk"}
+    history = await repo.get_card_history("BULK-3")
+    assert len(history) == 1
+    assert "Set Status to 'in_progress' (from 'ready') reason='wave start'" in history[0]
+
+
+@pytest.mark.asyncio
+async def test_append_transactions_writes_all_rows(repo):
+    """Layer: integration. Verifies append_transactions inserts every row in one call."""
+    await repo.save(IssueRecord(id="APP-1", summary="Append", seat="standard"))
+    written = await repo.append_transactions([("APP-1", "system", "one"), ("APP-1", "coder", "two")])
+
+    assert written == 2
+    history = await repo.get_card_history("APP-1")
+    assert [entry.split(": ", 1)[1] for entry in history] == ["system -> one", "coder -> two"]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_buffers_rows_until_size_threshold_or_read(db_path):
+    """Layer: integration. Verifies write-behind rows flush on the size threshold and before reads."""
+    repo = AsyncCardRepository(db_path, write_behind=True, write_behind_max_rows=3, write_behind_max_delay_seconds=60)
+    await repo.save(IssueRecord(id="WB-1", summary="Write behind", seat="standard"))
+
+    await repo.add_transaction("WB-1", "system", "first")
+    await repo.add_comment("WB-1", "author", "hello")
+    assert repo._write_behind.pending_count == 2
+    async with aiosqlite.connect(repo.db_path) as conn:
+        cursor = await conn.execute("SELECT COUNT(*) FROM card_transactions WHERE card_id = 'WB-1'")
+        assert (await cursor.fetchone())[0] == 0
+
+    await repo.add_transaction("WB-1", "system", "second")
+    assert repo._write_behind.pending_count == 0
+
+    await repo.add_comment("WB-1", "author", "follow up")
+    comments = await repo.get_comments("WB-1")
+    assert [comment["content"] for comment in comments] == ["hello", "follow up"]
+    await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_after_delay(db_path):
+    """Layer: integration. Verifies write-behind rows flush on the time threshold without an explicit read."""
+    repo = AsyncCardRepository(db_path, write_behind=True, write_behind_max_rows=100, write_behind_max_delay_seconds=0.01)
+    await repo.save(IssueRecord(id="WB-2", summary="Timed", seat="standard"))
+    await repo.add_transaction("WB-2", "system", "timed")
+
+    for _ in range(50):
+        if repo._write_behind.pending_count == 0:
+            break
+        await asyncio.sleep(0.01)
+
+    assert repo._write_behind.pending_count == 0
+    assert any("timed" in entry for entry in await repo.get_card_history("WB-2"))
+    await repo.close()
+
+
+@pytest.mark.asyncio
+async def test_list_cards_page_keyset_matches_offset_pages(repo):
+    """Layer: integration. Verifies cursor pages walk the same order as offset pages, including created_at ties."""
+    for index in range(7):
+        await repo.save(IssueRecord(id=f"PAGE-{index}", summary=f"page {index}", build_id="B-PAGE", seat="standard"))
+    await repo.save(IssueRecord(id="OTHER-BUILD", summary="other", build_id="B-OTHER", seat="standard"))
+    async with aiosqlite.connect(repo.db_path) as conn:
+        await conn.execute("UPDATE issues SET created_at = '2026-01-01T00:00:00+00:00' WHERE id IN ('PAGE-2', 'PAGE-3')")
+        await conn.commit()
+
+    offset_ids = [card["id"] for card in await repo.list_cards(build_id="B-PAGE", limit=50)]
+    keyset_ids: list[str] = []
+    cursor = None
+    while True:
+        page = await repo.list_cards_page(build_id="B-PAGE", limit=3, cursor=cursor)
+        assert all("created_sort_key" not in card and "status_key" not in card for card in page["items"])
+        keyset_ids.extend(card["id"] for card in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(offset_ids) == 7
+    assert keyset_ids == offset_ids
+
+
+@pytest.mark.asyncio
+async def test_list_cards_page_rejects_malformed_cursor(repo):
+    """Layer: unit. Verifies malformed cursors raise ValueError instead of silently restarting the listing."""
+    with pytest.raises(ValueError, match="invalid card listing cursor"):
+        await repo.list_cards_page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_card_listing_queries_use_listing_indexes(repo):
+    """Layer: integration. Verifies filtered listing queries seek the covering indexes instead of sorting a scan."""
+    await repo.get_by_id("missing")
+    async with aiosqlite.connect(repo.db_path) as conn:
+        cursor = await conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM issues WHERE build_id = ? AND status_key = ? "
+            "ORDER BY created_sort_key DESC, id DESC LIMIT 10",
+            ("B1", "done"),
+        )
+        plan = " ".join(str(row[3]) for row in await cursor.fetchall())
+
+    assert "idx_issues_build_status_listing" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_card_listing_migration_upgrades_existing_database(tmp_path):
+    """Layer: integration. Verifies a pre-listing-index database gains sort keys and keeps its rows listable."""
+    db_path = str(tmp_path / "legacy.db")
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.execute(
+            "CREATE TABLE issues (id TEXT PRIMARY KEY, session_id TEXT, build_id TEXT, seat TEXT, summary TEXT, "
+            "type TEXT, priority TEXT, sprint TEXT, status TEXT DEFAULT 'ready', assignee TEXT, note TEXT, "
+            "resolution TEXT, credits_spent REAL DEFAULT 0, verification_json TEXT, metrics_json TEXT, "
+            "created_at DATETIME)"
+        )
+        await conn.execute(
+            "INSERT INTO issues (id, build_id, seat, summary, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            ("LEGACY-1", "B-LEGACY", "standard", "legacy", "DONE", "2025-01-01T00:00:00+00:00"),
+        )
+        await conn.commit()
+
+    repo = AsyncCardRepository(db_path)
+    page = await repo.list_cards_page(build_id="B-LEGACY", status="done")
+
+    async with aiosqlite.connect(db_path) as conn:
+        cursor = await conn.execute("PRAGMA table_xinfo(issues)")
+        columns = {str(row[1]) for row in await cursor.fetchall()}
+    assert {"created_sort_key", "status_key"} <= columns
+    assert [card["id"] for card in page["items"]] == ["LEGACY-1"]
+    assert page["next_cursor"] is None
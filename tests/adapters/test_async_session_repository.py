@@ -4,7 +4,10 @@ from pathlib import Path
 
 import pytest
 
+from orket.adapters.storage.async_card_repository import AsyncCardRepository
 from orket.adapters.storage.async_repositories import AsyncSessionRepository
+from orket.adapters.storage.card_migrations import CARD_LISTING_GENERATED_COLUMNS
+from orket.core.domain.records import IssueRecord
 
 pytestmark = pytest.mark.integration
 
@@ -32,3 +35,17 @@ async def test_session_repository_reinitializes_after_db_file_recreated(tmp_path
     loaded = await repo.get_session("session-after-delete")
     assert loaded is not None
     assert loaded["id"] == "session-after-delete"
+
+
+@pytest.mark.asyncio
+async def test_session_issues_omit_card_listing_generated_columns(tmp_path: Path) -> None:
+    """Layer: integration. Verifies backlog rows hide the virtual sort/filter columns the card listing adds."""
+    db_path = tmp_path / "runtime.sqlite3"
+    await AsyncCardRepository(db_path).save(
+        IssueRecord(id="ISSUE-1", summary="Backlog item", session_id="session-1", seat="coder")
+    )
+
+    issues = await AsyncSessionRepository(db_path).get_session_issues("session-1")
+
+    assert [issue["id"] for issue in issues] == ["ISSUE-1"]
+    assert not set(CARD_LISTING_GENERATED_COLUMNS) & set(issues[0])
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from orket.adapters.storage.gitea_state_adapter import GiteaStateAdapter
+from orket.adapters.storage.gitea_state_models import CardSnapshot, encode_snapshot
+
+
+class _StubGiteaIssueServer:
+    """Minimal Gitea issue API that honors ETag / If-None-Match and page/limit paging."""
+
+    def __init__(self, issues: list[dict]) -> None:
+        self.issues = issues
+        self.requests: list[dict[str, object]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_type())
+        host, port = self._server.server_address
+        self.base_url = f"http://{host}:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> _StubGiteaIssueServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+    def _handler_type(self):
+        owner = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args) -> None:  # noqa: A003
+                return None
+
+            def do_GET(self) -> None:  # noqa: N802
+                parsed = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+                if parsed.path == "/api/v1/repos/acme/orket/issues":
+                    limit = int(query.get("limit", "50"))
+                    page = int(query.get("page", "1"))
+                    payload: object = owner.issues[(page - 1) * limit : page * limit]
+                elif parsed.path.startswith("/api/v1/repos/acme/orket/issues/"):
+                    number = int(parsed.path.rsplit("/", 1)[-1])
+                    payload = next(issue for issue in owner.issues if issue["number"] == number)
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps(payload).encode("utf-8")
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                not_modified = self.headers.get("If-None-Match") == etag
+                owner.requests.append({"path": parsed.path, "query": query, "status": 304 if not_modified else 200})
+                if not_modified:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return _Handler
+
+
+def _issue(number: int, *, state: str = "ready", version: int = 1) -> dict:
+    snapshot = CardSnapshot(card_id=f"ISSUE-{number}", state=state, version=version)
+    return {"number": number, "body": encode_snapshot(snapshot)}
+
+
+def _adapter(base_url: str, **overrides) -> GiteaStateAdapter:
+    return GiteaStateAdapter(base_url=base_url, owner="acme", repo="orket", token="secret", max_retries=0, **overrides)
+
+
+@pytest.mark.asyncio
+async def test_idle_ready_poll_revalidates_with_304_and_skips_snapshot_decoding() -> None:
+    """Layer: integration. Verifies repeated polls of an unchanged ready queue cost one 304 and no decoding."""
+    with _StubGiteaIssueServer([_issue(1), _issue(2)]) as server:
+        adapter = _adapter(server.base_url)
+        try:
+            first = await adapter.fetch_ready_cards(limit=5)
+            decodes_after_first = adapter.snapshot_decode_count
+            second = await adapter.fetch_ready_cards(limit=5)
+            third = await adapter.fetch_ready_cards(limit=5)
+        finally:
+            await adapter.close()
+
+    assert [card["card_id"] for card in first] == ["ISSUE-1", "ISSUE-2"]
+    assert second == first
+    assert third == first
+    assert decodes_after_first == 2
+    assert adapter.snapshot_decode_count == 2
+    assert [request["status"] for request in server.requests] == [200, 304, 304]
+    assert adapter.http.cache_stats["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_changed_issue_is_the_only_snapshot_decoded_again() -> None:
+    """Layer: integration. Verifies a changed issue body invalidates the ETag and only that issue is re-decoded."""
+    issues = [_issue(1), _issue(2), _issue(3)]
+    with _StubGiteaIssueServer(issues) as server:
+        adapter = _adapter(server.base_url)
+        try:
+            await adapter.fetch_ready_cards(limit=5)
+            issues[1] = _issue(2, version=2)
+            cards = await adapter.fetch_ready_cards(limit=5)
+        finally:
+            await adapter.close()
+
+    assert [request["status"] for request in server.requests] == [200, 200]
+    assert adapter.snapshot_decode_count == 4
+    assert [card["version"] for card in cards] == [1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_iter_ready_cards_streams_large_queue_across_pages() -> None:
+    """Layer: integration. Verifies large ready queues are paged with bounded page sizes."""
+    with _StubGiteaIssueServer([_issue(number) for number in range(1, 8)]) as server:
+        adapter = _adapter(server.base_url, page_size=3)
+        try:
+            streamed = [card["issue_number"] async for card in adapter.iter_ready_cards()]
+            limited = await adapter.fetch_ready_cards(limit=4)
+        finally:
+            await adapter.close()
+
+    assert streamed == [1, 2, 3, 4, 5, 6, 7]
+    assert [card["issue_number"] for card in limited] == [1, 2, 3, 4]
+    pages = [(request["query"]["page"], request["query"]["limit"]) for request in server.requests]
+    assert pages[:3] == [("1", "3"), ("2", "3"), ("3", "3")]
+
+
+@pytest.mark.asyncio
+async def test_fetch_card_snapshot_uses_conditional_requests() -> None:
+    """Layer: integration. Verifies single-card snapshot reads revalidate instead of refetching."""
+    with _StubGiteaIssueServer([_issue(9, state="in_progress")]) as server:
+        adapter = _adapter(server.base_url)
+        try:
+            first = await adapter.fetch_card_snapshot("9")
+            second = await adapter.fetch_card_snapshot("9")
+        finally:
+            await adapter.close()
+
+    assert first is not None and first["state"] == "in_progress"
+    assert second == first
+    assert [request["status"] for request in server.requests] == [200, 304]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_can_be_disabled() -> None:
+    """Layer: integration. Verifies response_cache_size=0 falls back to unconditional GETs."""
+    with _StubGiteaIssueServer([_issue(1)]) as server:
+        adapter = _adapter(server.base_url, response_cache_size=0)
+        try:
+            await adapter.fetch_ready_cards(limit=1)
+            await adapter.fetch_ready_cards(limit=1)
+        finally:
+            await adapter.close()
+
+    assert [request["status"] for request in server.requests] == [200, 200]
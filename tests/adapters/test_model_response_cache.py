@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from orket.adapters.llm.local_model_provider import LocalModelProvider
+from orket.adapters.llm.model_response_cache import (
+    ModelResponseCache,
+    ModelResponseCacheMode,
+    model_response_cache_key,
+    resolve_model_response_cache,
+)
+from orket.exceptions import ModelResponseCacheMiss
+
+
+class _CountingClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def chat(self, model, messages, options, format=None):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return {
+            "message": {"content": f"answer for {messages[-1]['content']}"},
+            "prompt_eval_count": 4,
+            "eval_count": 2,
+            "total_duration": 250_000_000,
+        }
+
+
+def _provider(monkeypatch: pytest.MonkeyPatch, cache: ModelResponseCache) -> LocalModelProvider:
+    monkeypatch.setenv("ORKET_LLM_PROVIDER", "ollama")
+    monkeypatch.delenv("ORKET_MODEL_PROVIDER", raising=False)
+    provider = LocalModelProvider(model="dummy", response_cache=cache)
+    provider.client = _CountingClient()
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_provider_serves_repeated_requests_from_cache(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Layer: contract. Verifies an identical request skips the backend and reports hit rate and time saved."""
+    cache = ModelResponseCache(tmp_path / "cache")
+    provider = _provider(monkeypatch, cache)
+    messages = [{"role": "user", "content": "hello"}]
+
+    first = await provider.complete(messages)
+    second = await provider.complete(messages)
+    other = await provider.complete([{"role": "user", "content": "bye"}])
+
+    assert provider.client.calls == 2
+    assert second.content == first.content == "answer for hello"
+    assert first.raw["response_cache"]["status"] == "miss"
+    assert second.raw["response_cache"]["status"] == "hit"
+    assert second.raw["response_cache"]["key"] == first.raw["response_cache"]["key"]
+    assert second.raw["usage"] == first.raw["usage"]
+    assert other.raw["response_cache"]["status"] == "miss"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 2, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert stats["saved_latency_ms"] == first.raw["latency_ms"]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_carries_current_request_identity(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Layer: contract. Verifies a hit reports the current request and session ids, not the recorded call's."""
+    monkeypatch.setenv("ORKET_LLM_PROVIDER", "lmstudio")
+    monkeypatch.setenv("ORKET_LLM_OPENAI_BASE_URL", "http://127.0.0.1:1234/v1")
+    root = tmp_path / "cache"
+    provider = LocalModelProvider(model="dummy", response_cache=ModelResponseCache(root))
+    seen_request_ids: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        seen_request_ids.append(request.headers["x-orket-request-id"])
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-cache",
+                "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+                "usage": {"prompt_tokens": 4, "completion_tokens": 1, "total_tokens": 5},
+            },
+        )
+
+    provider.client = httpx.AsyncClient(base_url="http://127.0.0.1:1234/v1", transport=httpx.MockTransport(_handler))
+    messages = [{"role": "user", "content": "hello"}]
+    first = await provider.complete(messages, runtime_context={"run_id": "run-42"})
+    await provider.clear_context()
+    second = await provider.complete(messages, runtime_context={"run_id": "run-42"})
+    await provider.close()
+
+    assert seen_request_ids == [first.raw["orket_request_id"]]
+    assert second.raw["response_cache"]["status"] == "hit"
+    assert second.raw["orket_request_id"].startswith("orket-")
+    assert second.raw["orket_request_id"] != first.raw["orket_request_id"]
+    assert (first.raw["orket_session_id"], second.raw["orket_session_id"]) == ("run-42", "run-42-ctx1")
+    assert second.raw["provider_session_epoch"] == 1
+    assert second.raw["latency_ms"] == 0
+    (entry_path,) = root.glob("*/*.json")
+    stored_raw = json.loads(entry_path.read_text(encoding="utf-8"))["raw"]
+    assert "orket_request_id" not in stored_raw
+    assert "orket_session_id" not in stored_raw
+    assert "timings" not in stored_raw
+
+
+@pytest.mark.asyncio
+async def test_replay_only_mode_raises_on_miss_and_never_writes(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Layer: contract. Verifies replay-only serves recorded completions and fails closed on anything new."""
+    root = tmp_path / "cache"
+    recorder = _provider(monkeypatch, ModelResponseCache(root))
+    await recorder.complete([{"role": "user", "content": "recorded"}])
+
+    replay = _provider(monkeypatch, ModelResponseCache(root, mode=ModelResponseCacheMode.REPLAY_ONLY))
+    replayed = await replay.complete([{"role": "user", "content": "recorded"}])
+    with pytest.raises(ModelResponseCacheMiss):
+        await replay.complete([{"role": "user", "content": "never recorded"}])
+
+    assert replayed.content == "answer for recorded"
+    assert replay.client.calls == 0
+    assert len(list(root.glob("*/*.json"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_and_expires_old_entries(tmp_path) -> None:
+    """Layer: unit. Verifies size eviction keeps recently read entries and age eviction drops stale ones."""
+    cache = ModelResponseCache(tmp_path, max_bytes=2200, max_age_seconds=3600)
+    keys = [model_response_cache_key(model="m", parameters={}, prompt_fingerprint=str(i)) for i in range(3)]
+    for index, key in enumerate(keys):
+        await cache.store(key, content="x" * 400, raw={}, latency_ms=10)
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, (time.time() - 100 + index, time.time() - 100 + index))
+    assert await cache.lookup(keys[0]) is not None
+
+    fourth = model_response_cache_key(model="m", parameters={}, prompt_fingerprint="3")
+    await cache.store(fourth, content="x" * 400, raw={}, latency_ms=10)
+
+    assert await cache.lookup(keys[0]) is not None
+    assert await cache.lookup(keys[1]) is None
+    assert cache.stats()["evictions"] >= 1
+
+    expired = ModelResponseCache(tmp_path, max_age_seconds=1)
+    entry_path = tmp_path / fourth[:2] / f"{fourth}.json"
+    entry = json.loads(entry_path.read_text(encoding="utf-8"))
+    entry_path.write_text(json.dumps({**entry, "created_at": time.time() - 60}), encoding="utf-8")
+    assert await expired.lookup(fourth) is None
+    assert expired.stats()["expired"] == 1
+
+
+def test_cache_mode_env_defaults_off_and_rejects_unknown(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Layer: unit. Verifies the cache is opt-in and an unknown mode fails closed."""
+    monkeypatch.delenv("ORKET_MODEL_RESPONSE_CACHE", raising=False)
+    assert resolve_model_response_cache() is None
+
+    monkeypatch.setenv("ORKET_MODEL_RESPONSE_CACHE", "replay-only")
+    monkeypatch.setenv("ORKET_MODEL_RESPONSE_CACHE_DIR", str(tmp_path))
+    cache = resolve_model_response_cache()
+    assert cache is not None and cache.mode == ModelResponseCacheMode.REPLAY_ONLY
+    assert resolve_model_response_cache() is cache
+
+    monkeypatch.setenv("ORKET_MODEL_RESPONSE_CACHE", "sometimes")
+    with pytest.raises(ValueError, match="ORKET_MODEL_RESPONSE_CACHE"):
+        resolve_model_response_cache()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from orket.adapters.llm.local_model_provider import LocalModelProvider
+
+
+class _RecordingLlamaCppClient:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+
+    async def post(self, path: str, headers: dict[str, str], json: dict[str, Any]) -> httpx.Response:
+        self.requests.append({"headers": dict(headers), "payload": dict(json)})
+        return httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+                "timings": {"cache_n": 30, "prompt_n": 10, "prompt_ms": 5.0, "predicted_ms": 1.0},
+            },
+            request=httpx.Request("POST", f"http://127.0.0.1:8080/v1{path}"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_prefix_stable_requests_carry_cache_hints_and_report_reuse(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: contract. Verifies prefix-stable llama.cpp requests pin a slot per role and surface cache reuse."""
+    monkeypatch.setenv("ORKET_LLAMA_CPP_PARALLEL_SLOTS", "4")
+    monkeypatch.delenv("ORKET_PROMPT_LAYOUT", raising=False)
+    provider = LocalModelProvider(model="demo", provider="llama_cpp", response_cache=None)
+    await provider.client.aclose()
+    provider.client = _RecordingLlamaCppClient()
+    messages = [{"role": "system", "content": "You are coder"}, {"role": "user", "content": "go"}]
+    stable = {"session_id": "run-1", "role": "coder", "prompt_layout": "prefix_stable"}
+
+    first = await provider.complete(messages, runtime_context=stable)
+    await provider.complete(messages, runtime_context=stable)
+    default = await provider.complete(messages, runtime_context={"session_id": "run-1", "role": "coder"})
+
+    pinned, repeated, plain = provider.client.requests
+    assert pinned["payload"]["cache_prompt"] is True
+    assert pinned["payload"]["id_slot"] == repeated["payload"]["id_slot"]
+    assert pinned["headers"]["X-Orket-Session-Id"] == "run-1:coder"
+    assert "cache_prompt" not in plain["payload"] and "id_slot" not in plain["payload"]
+    assert plain["headers"]["X-Orket-Session-Id"] == "run-1"
+    assert first.raw["prompt_cache"] == {
+        "layout": "prefix_stable",
+        "cached_tokens": 30,
+        "prompt_tokens": 40,
+        "reuse_ratio": 0.75,
+        "prompt_eval_ms": 5.0,
+    }
+    assert default.raw["prompt_cache"]["layout"] == "default"
@@ -150,3 +150,35 @@ async def test_sandbox_orchestrator_health_check_ignores_optional_admin_services
     result = await orchestrator.health_check("sandbox-test")
 
     assert result is True
+
+
+@pytest.mark.asyncio
+async def test_sandbox_orchestrator_health_check_all_batches_one_container_listing(tmp_path):
+    """Layer: unit. Verifies fleet health probes share one project-grouped docker ps listing."""
+    registry = SandboxRegistry()
+    rows = []
+    for suffix, state in (("a", "running"), ("b", "running"), ("c", "exited")):
+        project = f"orket-sandbox-{suffix}"
+        rows.append(
+            f'{{"Names":"{project}-api-1","State":"{state}",'
+            f'"Labels":"com.docker.compose.project={project},com.docker.compose.service=api"}}\n'
+        )
+    runner = FakeRunner(async_result=CommandResult(returncode=0, stdout="".join(rows), stderr=""))
+    orchestrator = SandboxOrchestrator(
+        workspace_root=tmp_path,
+        registry=registry,
+        command_runner=runner,
+        lifecycle_db_path=str(tmp_path / "sandbox_lifecycle.db"),
+    )
+    for suffix in ("a", "b", "c", "d"):
+        sandbox = _sandbox(tmp_path).model_copy(
+            update={"id": f"sandbox-{suffix}", "compose_project": f"orket-sandbox-{suffix}"}
+        )
+        registry.register(sandbox)
+
+    results = await orchestrator.health_check_all(concurrency=2)
+
+    assert results == {"sandbox-a": True, "sandbox-b": True, "sandbox-c": False, "sandbox-d": False}
+    assert len(runner.async_calls) == 1
+    assert runner.async_calls[0][:5] == ("docker", "ps", "-a", "--filter", "label=com.docker.compose.project")
+    assert registry.get("sandbox-c").status.value == "unhealthy"
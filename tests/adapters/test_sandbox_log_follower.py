@@ -0,0 +1,108 @@
+# Layer: integration
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+from orket.adapters.storage.command_runner import CommandRunner
+from orket.adapters.storage.sandbox_log_follower import SandboxLogFollower, parse_compose_log_line
+
+FAKE_COMPOSE = """
+import sys
+import time
+
+project = sys.argv[sys.argv.index("-p") + 1]
+with open(sys.argv[1], "a", encoding="utf-8") as handle:
+    handle.write("start\\n")
+with open(sys.argv[1], encoding="utf-8") as handle:
+    starts = handle.read().count("start")
+since = next((arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--since=")), None)
+
+
+def seconds(stamp):
+    return float(stamp[17:].rstrip("Z"))
+
+
+lines = []
+for index in range(3):
+    lines.append((f"2026-01-01T00:00:0{index}.25Z", "api-1       | ", f"api line {index}"))
+    lines.append((f"2026-01-01T00:00:0{index}.5Z", f"{project}_frontend_1  | ", f"frontend line {index}"))
+if starts > 1:
+    lines.append(("2026-01-01T00:00:03.25Z", "api-1       | ", "api line 3"))
+for stamp, prefix, text in lines:
+    if since is None or seconds(stamp) >= seconds(since):
+        print(f"{prefix}{stamp} {text}" if "--timestamps" in sys.argv else f"{prefix}{text}", flush=True)
+print("no configuration file provided", flush=True)
+if "-f" in sys.argv[2:]:
+    time.sleep(float(sys.argv[2]))
+"""
+
+
+class _CountingRunner(CommandRunner):
+    def __init__(self) -> None:
+        self.stream_calls: list[tuple[str, ...]] = []
+
+    def open_stream(self, *cmd: str):
+        self.stream_calls.append(cmd)
+        return super().open_stream(*cmd)
+
+
+def _follower(tmp_path: Path, *, linger_seconds: float, runner: CommandRunner, **kwargs) -> SandboxLogFollower:
+    script = tmp_path / "fake_compose.py"
+    script.write_text(FAKE_COMPOSE, encoding="utf-8")
+    command = [sys.executable, str(script), str(tmp_path / "starts.log"), str(linger_seconds)]
+    command += ["-p", "orket-sandbox-test", "logs", "-f", "--no-color", "--timestamps", "--tail=100"]
+    return SandboxLogFollower(command, compose_project="orket-sandbox-test", open_stream=runner.open_stream, **kwargs)
+
+
+def test_parse_compose_log_line_strips_project_and_replica_suffix() -> None:
+    assert parse_compose_log_line("api-1  | ready", compose_project="p") == ("api", "api-1  | ready")
+    assert parse_compose_log_line("p_database_1  | up", compose_project="p") == ("database", "p_database_1  | up")
+    assert parse_compose_log_line("plain error", compose_project="p") == (None, "plain error")
+
+
+def test_follower_serves_repeated_queries_from_one_stream(tmp_path: Path) -> None:
+    runner = _CountingRunner()
+    follower = _follower(tmp_path, linger_seconds=30, runner=runner)
+    try:
+        before = time.time()
+        api_tail = follower.tail(2, service="api")
+        for _ in range(20):
+            follower.tail(100)
+
+        assert [line.text for line in api_tail] == ["api-1       | api line 1", "api-1       | api line 2"]
+        assert [line.service for line in follower.tail(100)] == ["api", "frontend"] * 3 + [None]
+        assert [line.seq for line in follower.seq_range(3, 5)] == [3, 4]
+        assert len(follower.since(before - 1, service="frontend")) == 3
+        assert follower.since(time.time() + 60) == []
+        assert len(runner.stream_calls) == 1
+        assert (tmp_path / "starts.log").read_text(encoding="utf-8") == "start\n"
+    finally:
+        follower.close()
+    assert follower.running is False
+
+
+def test_follower_restarts_ended_stream_at_most_once_per_backoff(tmp_path: Path) -> None:
+    runner = _CountingRunner()
+    follower = _follower(tmp_path, linger_seconds=0, runner=runner, restart_backoff_seconds=0.5)
+    try:
+        assert len(follower.tail(100)) == 7
+        time.sleep(0.1)
+        for _ in range(10):
+            follower.tail(100)
+        assert len(runner.stream_calls) == 1
+
+        time.sleep(0.5)
+        lines = follower.tail(100)
+
+        assert len(runner.stream_calls) == 2
+        assert runner.stream_calls[1][-1] == "--since=2026-01-01T00:00:02.250000000Z"
+        assert [line.seq for line in lines] == list(range(1, 10))
+        assert [line.text for line in follower.seq_range(8)] == [
+            "api-1       | api line 3",
+            "no configuration file provided",
+        ]
+    finally:
+        follower.close()
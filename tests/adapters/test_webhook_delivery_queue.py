@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from orket.adapters.vcs.webhook_delivery_queue import (
+    SharedSlidingWindowRateLimiter,
+    WebhookDeliveryQueue,
+    WebhookDeliveryWorkerPool,
+    webhook_delivery_id,
+)
+
+
+async def _enqueue(queue: WebhookDeliveryQueue, delivery_id: str, repo_key: str, *, now: float = 100.0) -> bool:
+    return await queue.enqueue(
+        delivery_id=delivery_id,
+        event_type="pull_request",
+        repo_key=repo_key,
+        payload={"delivery": delivery_id},
+        now=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_delivery_queue_dedupes_and_claims_in_per_repo_order(tmp_path) -> None:
+    """Layer: integration. Verifies a repository's deliveries are claimed one at a time in arrival order."""
+    queue = WebhookDeliveryQueue(tmp_path / "queue.db")
+    assert await _enqueue(queue, "a-1", "org/a")
+    assert await _enqueue(queue, "a-2", "org/a")
+    assert await _enqueue(queue, "b-1", "org/b")
+    assert not await _enqueue(queue, "a-1", "org/a")
+
+    first = await queue.claim_next(worker_id="w1", now=101.0)
+    second = await queue.claim_next(worker_id="w2", now=101.0)
+    blocked = await queue.claim_next(worker_id="w3", now=101.0)
+    assert first is not None and first.delivery_id == "a-1"
+    assert second is not None and second.delivery_id == "b-1"
+    assert blocked is None
+
+    await queue.complete("a-1", result={"status": "ok"}, now=102.0)
+    after = await queue.claim_next(worker_id="w3", now=102.0)
+    assert after is not None and after.delivery_id == "a-2"
+    assert await queue.pending_counts() == {"queued": 0, "processing": 2}
+
+
+@pytest.mark.asyncio
+async def test_delivery_queue_retries_with_backoff_and_reclaims_expired_leases(tmp_path) -> None:
+    """Layer: integration. Verifies failed deliveries back off, dead-letter, and abandoned claims return."""
+    queue = WebhookDeliveryQueue(tmp_path / "queue.db")
+    await _enqueue(queue, "a-1", "org/a")
+    claimed = await queue.claim_next(worker_id="w1", now=101.0)
+    assert claimed is not None
+
+    assert await queue.fail("a-1", error="gitea down", attempts=claimed.attempts, now=101.0) == "queued"
+    assert await queue.claim_next(worker_id="w1", now=102.0) is None
+    retried = await queue.claim_next(worker_id="w1", lease_seconds=10.0, now=107.0)
+    assert retried is not None and retried.attempts == 2
+
+    reclaimed = await queue.claim_next(worker_id="w2", now=118.0)
+    assert reclaimed is not None and reclaimed.attempts == 3
+    assert await queue.fail("a-1", error="gitea down", attempts=3, max_attempts=3, now=118.0) == "failed"
+    row = await queue.get("a-1")
+    assert row is not None and row["status"] == "failed" and row["last_error"] == "gitea down"
+
+
+@pytest.mark.asyncio
+async def test_shared_rate_limiter_counts_hits_across_queue_instances(tmp_path) -> None:
+    """Layer: integration. Verifies two processes sharing the queue file share one rate-limit window."""
+    db_path = tmp_path / "queue.db"
+    first = SharedSlidingWindowRateLimiter(WebhookDeliveryQueue(db_path), 2, window_seconds=60)
+    second = SharedSlidingWindowRateLimiter(WebhookDeliveryQueue(db_path), 2, window_seconds=60)
+
+    assert await first.allow()
+    assert await second.allow()
+    assert not await first.allow()
+    assert not await second.allow()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_drains_queue_without_overlapping_a_repository(tmp_path) -> None:
+    """Layer: integration. Verifies pooled workers process repositories in parallel but each in order."""
+    queue = WebhookDeliveryQueue(tmp_path / "queue.db")
+    for index in range(3):
+        await _enqueue(queue, f"a-{index}", "org/a")
+        await _enqueue(queue, f"b-{index}", "org/b")
+    seen: list[str] = []
+    active: set[str] = set()
+
+    async def _handler(event_type: str, payload: dict[str, object]) -> dict[str, object]:
+        delivery = str(payload["delivery"])
+        repo = delivery.split("-")[0]
+        assert repo not in active
+        active.add(repo)
+        await asyncio.sleep(0.01)
+        active.discard(repo)
+        seen.append(delivery)
+        return {"status": "ok"}
+
+    pool = WebhookDeliveryWorkerPool(queue, _handler, workers=3, poll_interval_seconds=0.01, workspace=tmp_path)
+    pool.start()
+    for _ in range(200):
+        if len(seen) == 6 and await queue.pending_counts() == {"queued": 0, "processing": 0}:
+            break
+        await asyncio.sleep(0.01)
+    await pool.stop()
+
+    assert [item for item in seen if item.startswith("a-")] == ["a-0", "a-1", "a-2"]
+    assert [item for item in seen if item.startswith("b-")] == ["b-0", "b-1", "b-2"]
+    assert webhook_delivery_id(None, b"{}") == webhook_delivery_id("", b"{}")
+
+
+@pytest.mark.asyncio
+async def test_prune_clears_expired_finished_payloads_but_keeps_dedupe(tmp_path) -> None:
+    """Layer: integration. Verifies retention drops old finished payloads while replays stay deduplicated."""
+    queue = WebhookDeliveryQueue(tmp_path / "queue.db")
+    await _enqueue(queue, "a-1", "org/a")
+    await _enqueue(queue, "b-1", "org/b")
+    await _enqueue(queue, "c-1", "org/c")
+    for _ in range(2):
+        claimed = await queue.claim_next(worker_id="w1", now=101.0)
+        assert claimed is not None
+    await queue.complete("a-1", result={"status": "ok"}, now=102.0)
+    await queue.fail("b-1", error="boom", attempts=1, max_attempts=1, now=500.0)
+
+    assert await queue.prune_finished(older_than_seconds=100.0, now=400.0) == 1
+    assert await queue.prune_finished(older_than_seconds=100.0, now=400.0) == 0
+
+    pruned = await queue.get("a-1")
+    kept = await queue.get("b-1")
+    assert pruned is not None and pruned["payload_json"] == "" and pruned["result_json"] is None
+    assert kept is not None and kept["payload_json"] == '{"delivery":"b-1"}'
+    assert not await _enqueue(queue, "a-1", "org/a")
+    assert await queue.pending_counts() == {"queued": 1, "processing": 0}
+
+
+@pytest.mark.asyncio
+async def test_worker_renews_its_claim_while_a_slow_handler_runs(tmp_path) -> None:
+    """Layer: integration. Verifies a delivery outliving its lease is not re-claimed while its handler runs."""
+    queue = WebhookDeliveryQueue(tmp_path / "queue.db")
+    await _enqueue(queue, "a-1", "org/a", now=0.0)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_handler(event_type: str, payload: dict[str, object]) -> dict[str, object]:
+        started.set()
+        await release.wait()
+        return {"status": "ok"}
+
+    pool = WebhookDeliveryWorkerPool(queue, _slow_handler, lease_seconds=0.15, workspace=tmp_path)
+    worker = asyncio.create_task(pool.run_once("w1"))
+    await started.wait()
+    for _ in range(6):
+        await asyncio.sleep(0.1)
+        assert await queue.claim_next(worker_id="w2", lease_seconds=0.15) is None
+    release.set()
+    assert await worker
+
+    row = await queue.get("a-1")
+    assert row is not None and row["status"] == "done" and row["attempts"] == 1
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass
 
 import pytest
 
-from orket.board import get_board_hierarchy, get_board_hierarchy_async
+from orket.board import BoardProjection, get_board_hierarchy, get_board_hierarchy_async
 from orket.exceptions import CardNotFound
+from orket.runtime import ConfigLoader
 
 
 @dataclass
@@ -183,3 +186,39 @@ async def test_get_board_hierarchy_async_uses_thread_wrapper(monkeypatch):
 
     assert result == {"department": "product", "auto_fix": True}
     assert seen == {"department": "product", "auto_fix": True}
+
+
+def test_board_projection_reloads_only_changed_asset_files(tmp_path):
+    """Layer: integration. Verifies the cached board reuses unchanged assets and picks up edited files."""
+    epics_dir = tmp_path / "config" / "epics"
+    issues_dir = tmp_path / "config" / "issues"
+    epics_dir.mkdir(parents=True)
+    issues_dir.mkdir(parents=True)
+    (epics_dir / "epic_a.json").write_text(
+        json.dumps(
+            {
+                "id": "epic_a",
+                "name": "Epic A",
+                "team": "standard",
+                "environment": "standard",
+                "issues": [{"id": "ISS-1", "summary": "One"}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    loose_issue = issues_dir / "loose.json"
+    loose_issue.write_text(json.dumps({"id": "ISS-2", "summary": "Loose"}), encoding="utf-8")
+    projection = BoardProjection(root=tmp_path, department="core", loader_factory=ConfigLoader, refresh_interval_s=0)
+
+    first = projection.hierarchy()
+    epic_before = projection._assets[("core", "epics", "epic_a")][1]
+    assert [issue["id"] for issue in first["orphaned_issues"]] == ["ISS-2"]
+
+    loose_issue.write_text(json.dumps({"id": "ISS-1", "summary": "Now referenced"}), encoding="utf-8")
+    stat = loose_issue.stat()
+    os.utime(loose_issue, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = projection.hierarchy()
+
+    assert projection._assets[("core", "epics", "epic_a")][1] is epic_before
+    assert second["orphaned_issues"] == []
+    assert [epic["id"] for epic in second["orphaned_epics"]] == ["epic_a"]
@@ -205,3 +205,76 @@ def test_is_lease_expired_detects_nested_epoch_mismatch() -> None:
     }
 
     assert GiteaStateWorker._is_lease_expired(renewed, expected_epoch=4) is True
+
+
+class _ConcurrentAdapter(_FakeAdapter):
+    def __init__(self, *, refused: set[str] | None = None):
+        super().__init__()
+        self.refused = set(refused or set())
+        self.active = 0
+        self.peak_active = 0
+
+    async def acquire_lease(self, card_id: str, *, owner_id: str, lease_seconds: int):
+        self.calls.append(("acquire_lease", card_id, owner_id, lease_seconds))
+        if card_id in self.refused:
+            return None
+        return {"card_id": card_id, "lease_epoch": 1}
+
+
+@pytest.mark.asyncio
+async def test_run_concurrent_runs_claimed_cards_in_parallel_from_one_fetch():
+    adapter = _ConcurrentAdapter()
+    adapter.cards = [{"issue_number": number, "state": "ready"} for number in range(1, 6)]
+    worker = GiteaStateWorker(adapter=adapter, worker_id="worker-a")
+
+    async def _work(_card):
+        adapter.active += 1
+        adapter.peak_active = max(adapter.peak_active, adapter.active)
+        await asyncio.sleep(0.02)
+        adapter.active -= 1
+        return {"ok": True}
+
+    consumed = await worker.run_concurrent(work_fn=_work, fetch_limit=5, max_in_flight=3)
+
+    assert consumed == 5
+    assert adapter.peak_active == 3
+    assert [item for item in adapter.calls if item[0] == "fetch_ready_cards"] == [("fetch_ready_cards", 5)]
+    released = sorted(item[1] for item in adapter.calls if item[0] == "release_or_fail")
+    assert released == ["1", "2", "3", "4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_run_concurrent_stops_claiming_after_consecutive_lease_failures():
+    adapter = _ConcurrentAdapter(refused={"2", "3"})
+    adapter.cards = [{"issue_number": number, "state": "ready"} for number in range(1, 6)]
+    worker = GiteaStateWorker(adapter=adapter, worker_id="worker-a")
+
+    async def _work(_card):
+        return {"ok": True}
+
+    consumed = await worker.run_concurrent(
+        work_fn=_work,
+        fetch_limit=5,
+        max_in_flight=4,
+        max_consecutive_lease_failures=2,
+    )
+
+    assert consumed == 1
+    attempted = [item[1] for item in adapter.calls if item[0] == "acquire_lease"]
+    assert attempted == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_run_concurrent_finishes_in_flight_cards_before_raising():
+    adapter = _ConcurrentAdapter()
+    adapter.cards = [{"issue_number": 1, "state": "ready"}, {"issue_number": 2, "state": "ready"}]
+    adapter.transition_error = ValueError("Stale transition rejected")
+    worker = GiteaStateWorker(adapter=adapter, worker_id="worker-a")
+
+    async def _work(_card):
+        return {"ok": True}
+
+    with pytest.raises(ValueError, match="Stale transition rejected"):
+        await worker.run_concurrent(work_fn=_work, fetch_limit=2, max_in_flight=2)
+    transitions = [item[1] for item in adapter.calls if item[0] == "transition_state"]
+    assert sorted(transitions) == ["1", "2"]
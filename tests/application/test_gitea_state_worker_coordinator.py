@@ -23,6 +23,14 @@ class _FakeWorker:
             return self._outcomes.pop(0)
         return False
 
+    async def run_concurrent(self, *, work_fn, fetch_limit: int = 1, max_in_flight: int = 1):
+        self.calls += 1
+        self.work_fns.append(work_fn)
+        self.fetch_limits.append((fetch_limit, max_in_flight))
+        if self._outcomes:
+            return self._outcomes.pop(0)
+        return 0
+
 
 @pytest.mark.asyncio
 async def test_run_stops_on_max_iterations_and_reports_summary():
@@ -123,3 +131,25 @@ async def test_run_writes_summary_artifact_when_path_provided(tmp_path):
     assert out_path.exists()
     payload = json.loads(out_path.read_text(encoding="utf-8"))
     assert payload == summary
+
+
+@pytest.mark.asyncio
+async def test_run_uses_concurrent_worker_mode_when_max_in_flight_above_one():
+    worker = _FakeWorker([3, 0, 2])
+    coordinator = GiteaStateWorkerCoordinator(
+        worker=worker,
+        fetch_limit=2,
+        max_iterations=3,
+        max_idle_streak=10,
+        max_duration_seconds=60.0,
+        max_in_flight=4,
+    )
+
+    async def _work(_card):
+        return {"ok": True}
+
+    summary = await coordinator.run(work_fn=_work)
+    assert worker.fetch_limits == [(4, 4), (4, 4), (4, 4)]
+    assert summary["consumed_count"] == 5
+    assert summary["idle_count"] == 1
+    assert summary["max_in_flight"] == 4
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from scripts.benchmarks.inprocess_benchmark_support import StubModelProvider, compare_reports
+from scripts.benchmarks.run_inprocess_benchmarks import run_benchmarks
+
+
+@pytest.mark.asyncio
+async def test_stub_model_provider_answers_by_seat_with_deterministic_jitter() -> None:
+    """Layer: unit. Verifies the stub model routes builder and verifier seats and repeats its delays."""
+    first = StubModelProvider(jitter_ms=4.0)
+    second = StubModelProvider(jitter_ms=4.0)
+
+    builder = await first.complete([{"role": "system", "content": "IDENTITY: lead_architect"}])
+    verifier = await first.complete([{"role": "system", "content": "IDENTITY: verifier_seat"}])
+
+    assert '"write_file"' in builder.content and '"code_review"' in builder.content
+    assert '"done"' in verifier.content and '"write_file"' not in verifier.content
+    assert [first._jitter(index) for index in range(1, 4)] == [second._jitter(index) for index in range(1, 4)]
+    assert all(0.0 <= first._jitter(index) <= 4.0 for index in range(1, 10))
+
+
+@pytest.mark.asyncio
+async def test_inprocess_benchmarks_report_metrics_and_flag_regressions(tmp_path) -> None:
+    """Layer: integration. Verifies scenarios report throughput, percentiles, and allocations and compare to a baseline."""
+    report = await run_benchmarks(
+        scenarios=["protocol_ledger_append", "stream_bus_publish", "kernel_odr_rounds"],
+        work_dir=tmp_path,
+        iterations=3,
+        warmup=1,
+        alloc_iterations=1,
+    )
+
+    ledger = report["scenarios"]["protocol_ledger_append"]
+    assert ledger["operations"] == 3
+    assert ledger["throughput_ops_per_second"] > 0
+    assert set(ledger["latency_ms"]) == {"mean", "p50", "p95", "p99", "max"}
+    assert ledger["alloc_peak_bytes"] > 0
+    assert ledger["peak_rss_bytes"] > 0
+
+    assert compare_reports(report, report)["status"] == "PASS"
+    faster_baseline = copy.deepcopy(report)
+    faster_baseline["scenarios"]["kernel_odr_rounds"]["throughput_ops_per_second"] *= 2
+    comparison = compare_reports(report, faster_baseline, max_regression_pct=20.0)
+    assert comparison["status"] == "FAIL"
+    assert len(comparison["regressions"]) == 1
+    assert comparison["regressions"][0].startswith("kernel_odr_rounds:throughput_ops_per_second:")
+
+    with pytest.raises(ValueError, match="unknown benchmark scenarios"):
+        await run_benchmarks(scenarios=["missing"], work_dir=tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_prefix_stable_layout_raises_prefix_hit_rate_on_caching_stub(tmp_path) -> None:
+    """Layer: integration. Verifies prefix-stable prompts get more prefix reuse and less prompt eval on the caching stub."""
+    report = await run_benchmarks(
+        scenarios=["prompt_prefix_default", "prompt_prefix_prefix_stable"],
+        work_dir=tmp_path,
+        iterations=4,
+        warmup=1,
+        alloc_iterations=0,
+    )
+
+    default = report["scenarios"]["prompt_prefix_default"]["scenario_metrics"]
+    stable = report["scenarios"]["prompt_prefix_prefix_stable"]["scenario_metrics"]
+    assert default["turns"] == stable["turns"] == 10
+    assert stable["prefix_hit_rate"] > default["prefix_hit_rate"]
+    assert stable["prompt_eval_ms_per_turn"] < default["prompt_eval_ms_per_turn"]
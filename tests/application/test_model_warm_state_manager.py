@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from orket.application.services.model_warm_state_manager import ModelWarmStateManager
+from orket.application.workflows.orchestrator_ops import _model_warm_state_scope
+from orket.instrumentation import record_model_completion, run_metrics_scope
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeBackend:
+    """Local model server that loads models in ``load_seconds`` and unloads them after ``idle_seconds``."""
+
+    def __init__(self, clock: _FakeClock, load_seconds: dict[str, float], *, idle_seconds: float = 300.0) -> None:
+        self.clock = clock
+        self.load_seconds = load_seconds
+        self.idle_seconds = idle_seconds
+        self.last_used: dict[str, float] = {}
+        self.unloaded: list[str] = []
+
+    def _expire(self) -> None:
+        for model, last_used in list(self.last_used.items()):
+            if self.clock.now - last_used > self.idle_seconds:
+                del self.last_used[model]
+
+    def _touch(self, model: str) -> float:
+        self._expire()
+        load = 0.0 if model in self.last_used else self.load_seconds[model]
+        self.clock.now += load
+        self.last_used[model] = self.clock.now
+        return load
+
+    async def prewarm(self, model_id: str) -> None:
+        self._touch(model_id)
+
+    async def keep_alive(self, model_id: str) -> None:
+        self._touch(model_id)
+
+    async def unload(self, model_id: str) -> None:
+        self.last_used.pop(model_id, None)
+        self.unloaded.append(model_id)
+
+    async def turn(self, model_id: str) -> float:
+        time_to_first_token = self._touch(model_id) + 0.05
+        record_model_completion(
+            "fake",
+            latency_seconds=time_to_first_token + 1.0,
+            time_to_first_token_seconds=time_to_first_token,
+            completion_tokens=20,
+            generation_seconds=1.0,
+        )
+        return time_to_first_token
+
+
+async def _run_sparse_epic(*, managed: bool) -> tuple[list[float], dict]:
+    clock = _FakeClock()
+    backend = _FakeBackend(clock, {"coder-7b": 3.0, "reviewer-14b": 6.0})
+    manager = ModelWarmStateManager(backend, memory_budget_mb=16384, keep_alive_seconds=300, clock=clock)
+    ttfts: list[float] = []
+    with run_metrics_scope() as run_metrics:
+        for _ in range(3):
+            for model, other in (("coder-7b", "reviewer-14b"), ("reviewer-14b", "coder-7b")):
+                if managed:
+                    await manager.prepare_wave([model])
+                    await manager.prewarm([other], protected=[model])
+                ttfts.append(await backend.turn(model))
+                for _tick in range(4):
+                    clock.now += 100.0
+                    if managed:
+                        await manager.send_keep_alives()
+    return ttfts, run_metrics.snapshot()
+
+
+@pytest.mark.asyncio
+async def test_warm_state_manager_removes_cold_starts_between_sparse_turns() -> None:
+    """Layer: integration. Verifies prewarm plus keep-alives leave one cold start and cut per-run time to first token."""
+    cold_ttfts, cold_metrics = await _run_sparse_epic(managed=False)
+    warm_ttfts, warm_metrics = await _run_sparse_epic(managed=True)
+
+    assert cold_ttfts == [3.05, 6.05] * 3
+    assert warm_ttfts == [0.05] * 6
+    assert "orket_model_cold_starts" not in cold_metrics
+    cold_starts = warm_metrics["orket_model_cold_starts"]["series"]
+    assert [(series["labels"], series["value"]) for series in cold_starts] == [({"model": "coder-7b"}, 1.0)]
+    warm_ttft = warm_metrics["orket_model_time_to_first_token_seconds"]["series"][0]
+    cold_ttft = cold_metrics["orket_model_time_to_first_token_seconds"]["series"][0]
+    assert warm_ttft["mean"] < cold_ttft["mean"]
+
+
+@pytest.mark.asyncio
+async def test_warm_state_manager_evicts_least_recently_needed_within_budget() -> None:
+    """Layer: unit. Verifies prewarms never evict the wave's models and cold starts evict the stalest model first."""
+    clock = _FakeClock()
+    backend = _FakeBackend(clock, {"a-7b": 1.0, "b-7b": 1.0, "c-7b": 1.0})
+    manager = ModelWarmStateManager(backend, memory_budget_mb=10_000, keep_alive_seconds=300, clock=clock)
+
+    assert await manager.prepare_wave(["a-7b", "b-7b"]) == ["a-7b", "b-7b"]
+    assert await manager.prewarm(["c-7b"], protected=["a-7b", "b-7b"]) == []
+    clock.now += 10.0
+    assert await manager.ensure_warm("b-7b") is False
+    assert await manager.ensure_warm("c-7b") is True
+
+    report = manager.report()
+    assert backend.unloaded == ["a-7b"]
+    assert report["resident_models"] == ["b-7b", "c-7b"]
+    assert (report["cold_starts"], report["prewarms"], report["evictions"]) == (3, 0, 1)
+    assert report["used_memory_mb"] <= report["memory_budget_mb"]
+
+
+@pytest.mark.asyncio
+async def test_epic_warm_state_scope_is_opt_in_and_needs_a_backend(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Layer: contract. Verifies an epic gets a manager only when enabled and the model client offers a backend."""
+    backend = _FakeBackend(_FakeClock(), {})
+
+    class _ModelClientNode:
+        def create_warm_backend(self, env, *, keep_alive_seconds):  # type: ignore[no-untyped-def]
+            return backend
+
+    orchestrator = SimpleNamespace(model_client_node=_ModelClientNode(), workspace=tmp_path)
+
+    monkeypatch.delenv("ORKET_MODEL_WARM_STATE", raising=False)
+    async with _model_warm_state_scope(orchestrator, run_id="run-1", env=None):
+        assert orchestrator._model_warm_state is None
+
+    monkeypatch.setenv("ORKET_MODEL_WARM_STATE", "on")
+    monkeypatch.setenv("ORKET_MODEL_WARM_MEMORY_BUDGET_MB", "8192")
+    async with _model_warm_state_scope(orchestrator, run_id="run-1", env=None):
+        warm_state = orchestrator._model_warm_state
+        assert warm_state is not None and warm_state.backend is backend
+        assert warm_state.memory_budget_mb == 8192
+    assert orchestrator._model_warm_state is None
+
+    orchestrator.model_client_node = object()
+    async with _model_warm_state_scope(orchestrator, run_id="run-1", env=None):
+        assert orchestrator._model_warm_state is None
+
+
+def test_default_warm_backend_follows_the_environment_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: unit. Verifies the epic environment's provider wins over the process provider setting."""
+    from orket.decision_nodes.builtins import DefaultModelClientPolicyNode
+
+    node = DefaultModelClientPolicyNode()
+    monkeypatch.setenv("ORKET_LLM_PROVIDER", "ollama")
+    assert node.create_warm_backend(SimpleNamespace(params={"provider": "llama_cpp"}), keep_alive_seconds=60) is None
+
+    monkeypatch.setenv("ORKET_LLM_PROVIDER", "lmstudio")
+    backend = node.create_warm_backend(
+        SimpleNamespace(params={"provider": "ollama", "ollama_host": "http://gpu-box:11434"}), keep_alive_seconds=60
+    )
+    assert backend is not None and backend.keep_alive_duration == "60s"
@@ -138,3 +138,92 @@ async def test_include_pii_export_records_audit_event_before_serialization(tmp_p
     assert audit_events[0]["payload"]["include_pii"] is True
     assert audit_events[0]["payload"]["operator_ref"] == "operator:test"
     assert verify_ledger_export(exported)["result"] == "valid"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_ledger_checkpoint_bounds_rehashing_and_out_of_order_append_rechains(tmp_path, monkeypatch) -> None:
+    """Layer: integration. Verifies append-time chaining, signed checkpoints and rechaining on late events."""
+    monkeypatch.setenv("ORKET_OUTWARD_LEDGER_CHECKPOINT_HMAC_KEY", "test-checkpoint-key")
+    db_path = tmp_path / "phase4-ledger-checkpoint.sqlite3"
+    await _seed_completed_run(db_path)
+    event_store = OutwardRunEventStore(db_path)
+    service = OutwardLedgerService(
+        run_store=OutwardRunStore(db_path),
+        event_store=event_store,
+        utc_now=lambda: "2026-04-25T12:02:00+00:00",
+        checkpoint_interval=3,
+    )
+
+    appended = await event_store.append(
+        LedgerEvent(
+            event_id="run:run-ledger:0600:commitment:late",
+            event_type="commitment_recorded",
+            run_id="run-ledger",
+            turn=2,
+            agent_id="outward-agent",
+            at="2026-04-25T12:00:50+00:00",
+            payload={"tool": "write_file", "outcome": "committed"},
+        )
+    )
+    assert appended.chain_hash is not None
+    first = await service.export("run-ledger")
+    checkpoints = await event_store.list_checkpoints("run-ledger")
+    assert [item.position for item in checkpoints] == [first["canonical"]["event_count"]]
+    assert checkpoints[0].chain_hash == first["canonical"]["ledger_hash"]
+    assert first["events"][-1]["chain_hash"] == appended.chain_hash
+
+    verified = await service.verify_run("run-ledger")
+    assert verified["result"] == "valid"
+    assert verified["trusted_through_position"] == checkpoints[0].position
+
+    await event_store.append(
+        LedgerEvent(
+            event_id="run:run-ledger:0050:proposal:early",
+            event_type="proposal_made",
+            run_id="run-ledger",
+            turn=0,
+            agent_id="outward-agent",
+            at="2026-04-25T12:00:05+00:00",
+            payload={"tool": "read_file"},
+        )
+    )
+    assert await event_store.list_checkpoints("run-ledger") == []
+    rechained = await service.export("run-ledger")
+    stored = await event_store.list_for_run("run-ledger", limit=None)
+
+    assert rechained["canonical"]["event_count"] == first["canonical"]["event_count"] + 1
+    assert [event.chain_hash for event in stored] == [event["chain_hash"] for event in rechained["events"]]
+    assert (await service.verify_run("run-ledger"))["result"] == "valid"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_ledger_checkpoints_need_a_key_and_reads_never_delete_them(tmp_path, monkeypatch) -> None:
+    """Layer: integration. Verifies no key means no trusted checkpoints and forged checkpoints are skipped in place."""
+    db_path = tmp_path / "phase4-ledger-checkpoint-key.sqlite3"
+    await _seed_completed_run(db_path)
+    event_store = OutwardRunEventStore(db_path)
+    service = OutwardLedgerService(
+        run_store=OutwardRunStore(db_path),
+        event_store=event_store,
+        utc_now=lambda: "2026-04-25T12:02:00+00:00",
+        checkpoint_interval=1,
+    )
+
+    monkeypatch.delenv("ORKET_OUTWARD_LEDGER_CHECKPOINT_HMAC_KEY", raising=False)
+    unkeyed = await service.verify_run("run-ledger")
+    assert unkeyed["result"] == "valid" and unkeyed["trusted_through_position"] == 0
+    assert await event_store.list_checkpoints("run-ledger") == []
+
+    monkeypatch.setenv("ORKET_OUTWARD_LEDGER_CHECKPOINT_HMAC_KEY", "test-checkpoint-key")
+    await service.export("run-ledger")
+    [checkpoint] = await event_store.list_checkpoints("run-ledger")
+    await event_store.save_checkpoint(replace(checkpoint, signature="0" * 64))
+
+    reader = OutwardLedgerService(
+        run_store=OutwardRunStore(db_path), event_store=event_store, utc_now=lambda: "2026-04-25T12:03:00+00:00"
+    )
+    forged = await reader.verify_run("run-ledger")
+    assert forged["result"] == "valid" and forged["trusted_through_position"] == 0
+    assert [item.signature for item in await event_store.list_checkpoints("run-ledger")] == ["0" * 64]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+import re
 
+import orket.application.review.lanes.deterministic as deterministic_lane
 from orket.application.review.lanes.deterministic import run_deterministic_lane
 from orket.application.review.models import ChangedFile, ReviewSnapshot, SnapshotBounds, TruncationReport
 from orket.application.review.policy_resolver import DEFAULT_POLICY
@@ -155,3 +157,92 @@ def test_deterministic_lane_caps_forbidden_pattern_occurrences() -> None:
     matched = [item for item in result.findings if item.code == "PATTERN_MATCHED"]
     assert len(matched) == 2
     assert [item.span["start"] for item in matched] == [1, 2]
+
+
+def test_deterministic_lane_scanner_reports_every_rule_hit_on_shared_lines() -> None:
+    """Layer: unit. Verifies the combined pattern scan keeps per-rule hits, inline flags, backrefs, and path prefixes."""
+    policy = {
+        "deterministic": {
+            "checks": {
+                "path_blocklist": ["src/", "src/app", "docs/"],
+                "forbidden_patterns": [
+                    {"pattern": r"(?i)\bsecret\b", "severity": "high", "max_occurrences": 5},
+                    {"pattern": r"token", "severity": "medium", "max_occurrences": 1},
+                    {"pattern": r"(['\"])x\1", "severity": "low"},
+                    {"pattern": r"(unclosed", "severity": "high"},
+                ],
+            }
+        }
+    }
+    snap = _snapshot(
+        "diff --git a/src/app.py b/src/app.py\n"
+        "--- a/src/app.py\n"
+        "+++ b/src/app.py\n"
+        "@@ -0,0 +1,3 @@\n"
+        '+token = "SECRET"\n'
+        "+token = 'x'\n"
+        "+plain = 1\n"
+    )
+
+    result = run_deterministic_lane(snapshot=snap, resolved_policy=policy, run_id="R1", policy_digest="sha256:scan")
+
+    observed = sorted(
+        (item.code, item.details.get("pattern") or item.details.get("prefix"), (item.span or {}).get("start"))
+        for item in result.findings
+        if item.code in {"PATH_BLOCKED", "PATTERN_MATCHED", "PATTERN_INVALID"}
+    )
+    assert observed == [
+        ("PATH_BLOCKED", "src/", None),
+        ("PATH_BLOCKED", "src/app", None),
+        ("PATTERN_INVALID", "(unclosed", None),
+        ("PATTERN_MATCHED", r"(?i)\bsecret\b", 1),
+        ("PATTERN_MATCHED", r"(['\"])x\1", 2),
+        ("PATTERN_MATCHED", "token", 1),
+    ]
+
+
+def test_deterministic_lane_combined_scan_matches_per_rule_search() -> None:
+    """Layer: unit. Verifies the single alternation scan finds exactly the lines each rule finds on its own."""
+    patterns = [
+        r"(?i)\bsecret\b",
+        r"api_(key|token)",
+        r"\d{4}",
+        r"api",
+        r"(?x) year \s* =  # verbose comment",
+        r"(?P<quote>['\"])x(?P=quote)",
+        r"^$",
+    ]
+    checks = {
+        "forbidden_patterns": [{"pattern": pattern, "severity": "low", "max_occurrences": 10} for pattern in patterns]
+    }
+    lines = ['api_key = "Secret"', "year = 2026", "", "api_token = 'x'", "secrets = None"]
+    snap = _snapshot(
+        "diff --git a/src/app.py b/src/app.py\n"
+        "--- a/src/app.py\n"
+        "+++ b/src/app.py\n"
+        f"@@ -0,0 +1,{len(lines)} @@\n" + "".join(f"+{line}\n" for line in lines)
+    )
+
+    result = run_deterministic_lane(
+        snapshot=snap,
+        resolved_policy={"deterministic": {"checks": checks}},
+        run_id="R1",
+        policy_digest="sha256:combined",
+    )
+
+    program = deterministic_lane._compiled_scanner("sha256:combined", checks)
+    assert program.combined is not None
+    assert program.isolated_rules == (patterns.index(r"(?P<quote>['\"])x(?P=quote)"),)
+    observed = sorted(
+        (str(item.details["pattern"]), int((item.span or {})["start"]))
+        for item in result.findings
+        if item.code == "PATTERN_MATCHED"
+    )
+    expected = sorted(
+        (pattern, line_number)
+        for pattern in patterns
+        for line_number, line in enumerate(lines, start=1)
+        if re.search(pattern, line, re.MULTILINE)
+    )
+    assert observed == expected
+    assert (r"api", 1) in observed and (r"api_(key|token)", 1) in observed
@@ -3,6 +3,8 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from orket.application.review.models import SnapshotBounds
 from orket.application.review.snapshot_loader import load_from_diff, load_from_files
 
@@ -54,3 +56,32 @@ def test_snapshot_files_truncation_is_explicit(tmp_path: Path) -> None:
     assert snapshot.truncation.blob_truncated is True
     assert snapshot.truncation.blob_bytes_original >= snapshot.truncation.blob_bytes_kept
 
+
+
+def test_snapshot_loaders_match_per_command_git_output(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    (repo / "a.txt").write_text("one\n", encoding="utf-8")
+    (repo / "old.txt").write_text("moved\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "init")
+    (repo / "a.txt").write_text("one\ntwo\n", encoding="utf-8")
+    (repo / "b.txt").write_text("bee\n", encoding="utf-8")
+    _git(repo, "mv", "old.txt", "new.txt")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "update")
+
+    snapshot = load_from_diff(repo_root=repo, base_ref="HEAD~1", head_ref="HEAD", bounds=SnapshotBounds())
+    expected_unified = subprocess.run(
+        ["git", "diff", "--unified=3", "HEAD~1", "HEAD"], cwd=repo, check=True, capture_output=True
+    ).stdout.decode("utf-8")
+    assert snapshot.diff_unified == expected_unified
+    statuses = {row.path: (row.status, row.additions) for row in snapshot.changed_files}
+    assert statuses["a.txt"] == ("M", 1)
+    assert statuses["b.txt"] == ("A", 1)
+    assert statuses["new.txt"][0] == "R100"
+
+    files = load_from_files(repo_root=repo, ref="HEAD", paths=["b.txt", "a.txt"], bounds=SnapshotBounds())
+    assert [(blob.path, blob.content) for blob in files.context_blobs] == [("a.txt", "one\ntwo\n"), ("b.txt", "bee\n")]
+    with pytest.raises(FileNotFoundError):
+        load_from_files(repo_root=repo, ref="HEAD", paths=["old.txt"], bounds=SnapshotBounds())
@@ -11,6 +11,7 @@ def _args(**overrides) -> argparse.Namespace:
     base = {
         "worker_id": "",
         "fetch_limit": 5,
+        "max_in_flight": 1,
         "lease_seconds": 30,
         "renew_interval_seconds": 5.0,
         "max_iterations": 100,
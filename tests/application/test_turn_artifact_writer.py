@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -10,7 +13,11 @@ from orket.runtime.registry.tool_invocation_contracts import (
     build_tool_invocation_manifest,
     compute_tool_call_hash,
 )
+from orket.application.workflows import turn_executor_ops
 from orket.application.workflows.turn_artifact_writer import TurnArtifactWriter
+from orket.application.workflows.turn_executor import TurnExecutor
+from orket.core.domain.state_machine import StateMachine
+from orket.core.policies.tool_gate import ToolGate
 
 
 def test_turn_artifact_writer_replay_round_trip(tmp_path: Path) -> None:
@@ -218,3 +225,110 @@ def test_turn_artifact_writer_append_protocol_receipt_rejects_missing_manifest(t
             turn_index=4,
             receipt={"run_id": "s1", "step_id": "ISSUE-1:4", "receipt_seq": 1, "tool": "write_file"},
         )
+
+
+# Layer: unit
+def test_turn_artifact_writer_packed_replay_caches_share_one_turn_pack(tmp_path: Path) -> None:
+    writer = TurnArtifactWriter(tmp_path, packed_artifacts=True)
+    args = {"path": "agent_output/main.py"}
+    writer.persist_tool_result(
+        session_id="s1",
+        issue_id="ISSUE-1",
+        role_name="coder",
+        turn_index=5,
+        tool_name="write_file",
+        tool_args=args,
+        result={"ok": True},
+    )
+    writer.persist_operation_result(
+        session_id="s1",
+        issue_id="ISSUE-1",
+        role_name="coder",
+        turn_index=5,
+        operation_id="op-5",
+        tool_name="write_file",
+        tool_args=args,
+        result={"ok": True},
+    )
+    writer.flush()
+
+    turn_dir = tmp_path / "observability" / "s1" / "issue-1" / "005_coder"
+    assert sorted(path.name for path in turn_dir.iterdir()) == ["turn_artifacts.pack.jsonl"]
+
+    reopened = TurnArtifactWriter(tmp_path, packed_artifacts=True)
+    loaded = reopened.load_replay_tool_result(
+        session_id="s1",
+        issue_id="ISSUE-1",
+        role_name="coder",
+        turn_index=5,
+        tool_name="write_file",
+        tool_args=args,
+        resume_mode=True,
+    )
+    operation = reopened.load_operation_result(
+        session_id="s1", issue_id="ISSUE-1", role_name="coder", turn_index=5, operation_id="op-5"
+    )
+    assert loaded == {"ok": True}
+    assert operation is not None and operation["operation_id"] == "op-5"
+
+
+# Layer: unit
+def test_turn_artifact_writer_flush_lands_queued_artifacts_atomically(tmp_path: Path) -> None:
+    writer = TurnArtifactWriter(tmp_path)
+    for index in range(3):
+        writer.write_turn_artifact(
+            session_id="s1",
+            issue_id="ISSUE-1",
+            role_name="coder",
+            turn_index=6,
+            filename="model_response.txt",
+            content=f"response {index}",
+        )
+    writer.flush()
+
+    turn_dir = tmp_path / "observability" / "s1" / "issue-1" / "006_coder"
+    assert [path.name for path in turn_dir.iterdir()] == ["model_response.txt"]
+    assert (turn_dir / "model_response.txt").read_text(encoding="utf-8") == "response 2"
+
+
+# Layer: unit
+def test_turn_artifact_sink_close_drains_queue_and_stops_worker(tmp_path: Path) -> None:
+    writer = TurnArtifactWriter(tmp_path)
+    writer.write_turn_artifact(
+        session_id="s1",
+        issue_id="ISSUE-1",
+        role_name="coder",
+        turn_index=7,
+        filename="model_response.txt",
+        content="final",
+    )
+    worker = writer.sink._worker
+    assert worker is not None
+
+    asyncio.run(writer.aclose())
+
+    assert not worker.is_alive()
+    turn_dir = tmp_path / "observability" / "s1" / "issue-1" / "007_coder"
+    assert (turn_dir / "model_response.txt").read_text(encoding="utf-8") == "final"
+
+
+# Layer: unit
+@pytest.mark.asyncio
+async def test_turn_executor_keeps_turn_error_when_failure_flush_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    executor = TurnExecutor(StateMachine(), ToolGate(organization=None, workspace_root=tmp_path), tmp_path)
+
+    async def failing_turn(*_args: Any, **_kwargs: Any) -> Any:
+        raise ValueError("turn failed")
+
+    async def failing_flush() -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(turn_executor_ops, "execute_turn", failing_turn)
+    monkeypatch.setattr(executor.artifact_writer, "aflush", failing_flush)
+
+    with pytest.raises(ValueError, match="turn failed"):
+        await executor.execute_turn(
+            SimpleNamespace(id="ISSUE-1"), SimpleNamespace(name="coder"), object(), object(), {}
+        )
@@ -809,3 +809,41 @@ async def test_message_builder_preloads_builder_grounding_without_read_tool_requ
     assert "workflow_id, max_concurrency, tasks" in rendered
     assert "Empty or placeholder content for required write_file paths is invalid." in rendered
     assert "prefer single-quoted literals" in rendered
+
+
+async def test_message_builder_prefix_stable_layout_pins_role_prefix_across_turns(tmp_path: Path) -> None:
+    """Layer: contract. Verifies prefix-stable turns lead with identical stable messages and report pin hits."""
+    builder = MessageBuilder(tmp_path)
+
+    async def _turn(turn_index: int) -> tuple[list[dict[str, str]], dict]:
+        prompt_layers: dict = {}
+        context = {
+            "session_id": "run-1",
+            "issue_id": "ISSUE-1",
+            "role": "coder",
+            "prompt_layout": "prefix_stable",
+            "compact_turn_packet_enabled": False,
+            "protocol_governed_enabled": True,
+            "turn_index": turn_index,
+            "required_action_tools": ["write_file"],
+            "required_statuses": ["done"],
+            "required_read_paths": [],
+            "required_write_paths": ["agent_output/main.py"],
+            "prompt_metadata": {"turn": turn_index},
+            "prompt_layers": prompt_layers,
+            "history": [{"role": "coder", "content": f"turn {turn_index}"}],
+        }
+        system_prompt = f"You are coder\n\nPROJECT CONTEXT (PAST DECISIONS):\nDecision {turn_index}"
+        messages = await builder.prepare_messages(
+            issue=_issue(), role=_role(), context=context, system_prompt=system_prompt
+        )
+        return messages, prompt_layers["prefix_layout"]
+
+    first, first_layout = await _turn(1)
+    second, second_layout = await _turn(2)
+
+    assert first[0] == second[0] == {"role": "system", "content": "You are coder"}
+    assert first[1]["content"].startswith("Protocol Response Contract:")
+    assert first[: first_layout["stable_prefix_message_count"]] == second[: second_layout["stable_prefix_message_count"]]
+    assert second[-1]["content"] == "PROJECT CONTEXT (PAST DECISIONS):\nDecision 2"
+    assert (first_layout["pin_result"], second_layout["pin_result"]) == ("first", "hit")
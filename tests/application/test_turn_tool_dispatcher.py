@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -803,3 +804,67 @@ async def test_tool_dispatcher_preflight_failure_publishes_control_plane_final_t
     assert run.lifecycle_state.value == "failed_terminal"
     assert truth.result_class.value == "blocked"
     assert reservation.status is ReservationStatus.INVALIDATED
+
+
+# Layer: integration
+@pytest.mark.asyncio
+async def test_tool_dispatcher_parallel_read_only_calls_commit_in_call_order(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("c", encoding="utf-8")
+
+    class _Toolbox:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.completed: list[str] = []
+
+        async def execute(self, tool_name, args, context):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            # Later reads finish first so commit order cannot follow completion order.
+            await asyncio.sleep({"a.txt": 0.03, "b.txt": 0.02, "c.txt": 0.01}.get(args.get("path"), 0))
+            self.in_flight -= 1
+            self.completed.append(str(args.get("path")))
+            return {"ok": True, "tool": tool_name, "path": args.get("path")}
+
+    async def _run(max_parallel: int) -> tuple[_Toolbox, list[dict[str, Any]], list[dict[str, Any]], ExecutionTurn]:
+        receipt_rows: list[dict[str, Any]] = []
+        memory_events: list[dict[str, Any]] = []
+        dispatcher = _dispatcher(tmp_path, receipt_rows=receipt_rows)
+        dispatcher.append_memory_event = lambda _context, **kwargs: memory_events.append(kwargs)
+        turn = ExecutionTurn(
+            role="coder",
+            issue_id="ISSUE-1",
+            content="",
+            tool_calls=[
+                ToolCall(tool="read_file", args={"path": "a.txt"}),
+                ToolCall(tool="read_file", args={"path": "b.txt"}),
+                ToolCall(tool="read_file", args={"path": "c.txt"}),
+                ToolCall(tool="write_file", args={"path": "d.txt", "content": "d"}),
+            ],
+        )
+        toolbox = _Toolbox()
+        await dispatcher.execute_tools(
+            turn=turn,
+            toolbox=toolbox,
+            context={
+                "roles": ["coder"],
+                "session_id": "s1",
+                "turn_index": 1,
+                "protocol_governed_enabled": True,
+                "max_parallel_read_only_tools": max_parallel,
+            },
+            issue=None,
+        )
+        return toolbox, receipt_rows, memory_events, turn
+
+    sequential_toolbox, sequential_receipts, sequential_memory, _ = await _run(1)
+    parallel_toolbox, parallel_receipts, parallel_memory, parallel_turn = await _run(3)
+
+    assert sequential_toolbox.max_in_flight == 1
+    assert parallel_toolbox.max_in_flight == 3
+    assert parallel_toolbox.completed[:3] == ["c.txt", "b.txt", "a.txt"]
+    assert [call.result.get("path") for call in parallel_turn.tool_calls] == ["a.txt", "b.txt", "c.txt", "d.txt"]
+    assert parallel_receipts == sequential_receipts
+    assert parallel_memory == sequential_memory
@@ -222,6 +222,19 @@ def clear_settings_caches_between_tests():
     settings_module.clear_settings_cache()
 
 
+@pytest.fixture(autouse=True)
+def clear_contract_snapshot_cache_between_tests(monkeypatch, tmp_path_factory):
+    # Run-start contract snapshots are memoized per process; tests patch their factories.
+    # The blob store defaults to the repo's .orket/durable; keep test runs out of it.
+    from orket.runtime.evidence.contract_snapshot_store import ContractSnapshotStore, clear_contract_snapshot_cache
+
+    store_root = tmp_path_factory.getbasetemp() / "contract_snapshots"
+    monkeypatch.setattr(ContractSnapshotStore, "default", classmethod(lambda cls: cls(store_root)))
+    clear_contract_snapshot_cache()
+    yield
+    clear_contract_snapshot_cache()
+
+
 @pytest.fixture
 def fresh_runtime_state(monkeypatch):
     """Layer: unit. Provides isolated GlobalState for tests that touch runtime_state."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -12,7 +13,12 @@ from orket.adapters.storage.async_control_plane_record_repository import (
 )
 from orket.adapters.storage.sqlite_connection import current_journal_mode
 from orket.application.services.control_plane_publication_service import ControlPlanePublicationService
-from orket.core.contracts import CheckpointRecord, ResolvedConfigurationSnapshot, ResolvedPolicySnapshot
+from orket.core.contracts import (
+    CheckpointRecord,
+    ReservationRecord,
+    ResolvedConfigurationSnapshot,
+    ResolvedPolicySnapshot,
+)
 from orket.core.domain import (
     AuthoritySourceClass,
     CheckpointReobservationClass,
@@ -336,3 +342,60 @@ async def test_async_control_plane_record_repository_persists_resolved_snapshots
 
     assert loaded_policy == policy_snapshot
     assert loaded_configuration == configuration_snapshot
+
+
+def _reservation(reservation_id: str, holder_ref: str, creation_timestamp: str) -> ReservationRecord:
+    return ReservationRecord(
+        reservation_id=reservation_id,
+        holder_ref=holder_ref,
+        reservation_kind=ReservationKind.RESOURCE,
+        target_scope_ref=f"scope:{reservation_id}",
+        creation_timestamp=creation_timestamp,
+        expiry_or_invalidation_basis="test",
+        status=ReservationStatus.ACTIVE,
+        supervisor_authority_ref="test-supervisor",
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_control_plane_record_repository_indexes_holder_ref_lookups(tmp_path: Path) -> None:
+    """Layer: integration. Verifies holder-ref lookups use the indexed columns, including on legacy tables."""
+    db_path = tmp_path / "control_plane.sqlite3"
+    legacy = _reservation("reservation-legacy", "holder-a", "2026-03-23T01:00:00+00:00")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE reservation_records (
+                reservation_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                creation_timestamp TEXT NOT NULL,
+                payload_json TEXT NOT NULL,
+                PRIMARY KEY (reservation_id, status)
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO reservation_records VALUES (?, ?, ?, ?)",
+            (legacy.reservation_id, legacy.status.value, legacy.creation_timestamp, legacy.model_dump_json()),
+        )
+    repository = AsyncControlPlaneRecordRepository(db_path)
+
+    await repository.save_reservation_record(
+        record=_reservation("reservation-b", "holder-b", "2026-03-23T01:05:00+00:00")
+    )
+    await repository.save_reservation_record(
+        record=_reservation("reservation-a2", "holder-a", "2026-03-23T01:10:00+00:00")
+    )
+
+    latest = await repository.get_latest_reservation_record_for_holder_ref(holder_ref="holder-a")
+    history = await repository.list_reservation_records_for_holder_ref(holder_ref="holder-a")
+    assert latest is not None and latest.reservation_id == "reservation-a2"
+    assert [record.reservation_id for record in history] == ["reservation-legacy", "reservation-a2"]
+    assert await repository.get_latest_reservation_record_for_holder_ref(holder_ref="holder-missing") is None
+    with sqlite3.connect(db_path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT payload_json FROM reservation_records WHERE holder_ref = ? "
+            "ORDER BY creation_timestamp DESC, reservation_id DESC, rowid DESC LIMIT 1",
+            ("holder-a",),
+        ).fetchall()
+    assert any("idx_reservation_records_holder" in str(row[-1]) for row in plan)
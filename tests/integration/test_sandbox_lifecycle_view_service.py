@@ -109,3 +109,48 @@ async def test_view_service_projects_latest_restart_diagnostics_from_events(tmp_
 
     assert views[0].restart_summary["terminal_reason"] == "restart_loop"
     assert views[0].restart_summary["restart_summary"]["triggered_services"] == ["api"]
+
+
+@pytest.mark.asyncio
+async def test_view_service_refreshes_only_sandboxes_mutated_since_last_listing(tmp_path) -> None:
+    repo = AsyncSandboxLifecycleRepository(tmp_path / "sandbox_lifecycle.db")
+    await repo.save_record(_record("sb-1", cleanup_due_at=None, last_heartbeat_at="2026-03-11T00:01:00+00:00"))
+    await repo.save_record(_record("sb-2", cleanup_due_at=None, last_heartbeat_at="2026-03-11T00:01:00+00:00"))
+    service = SandboxLifecycleViewService(repo)
+    fetched: list[str] = []
+    original_get_record = repo.get_record
+
+    async def _tracking_get_record(sandbox_id: str):
+        fetched.append(sandbox_id)
+        return await original_get_record(sandbox_id)
+
+    repo.get_record = _tracking_get_record  # type: ignore[method-assign]
+
+    await service.list_views(observed_at="2026-03-11T00:02:00+00:00")
+    assert sorted(fetched) == ["sb-1", "sb-2"]
+
+    fetched.clear()
+    views = await service.list_views(observed_at="2026-03-11T00:03:00+00:00")
+    assert fetched == []
+    assert [view.heartbeat_age_seconds for view in views] == [120, 120]
+
+    await repo.append_event(
+        SandboxLifecycleEventRecord(
+            event_id="evt-1",
+            sandbox_id="sb-2",
+            event_kind="lifecycle",
+            event_type="sandbox.runtime_health_observed",
+            created_at="2026-03-11T00:03:30+00:00",
+            payload={"status": "unhealthy"},
+        )
+    )
+    await repo.save_record(
+        _record("sb-1", cleanup_due_at=None, last_heartbeat_at="2026-03-11T00:03:00+00:00", requires_reconciliation=True)
+    )
+    views = await service.list_views(observed_at="2026-03-11T00:04:00+00:00")
+
+    assert sorted(fetched) == ["sb-1", "sb-2"]
+    by_id = {view.sandbox_id: view for view in views}
+    assert by_id["sb-1"].requires_reconciliation is True
+    assert by_id["sb-1"].heartbeat_age_seconds == 60
+    assert by_id["sb-2"].restart_summary == {"status": "unhealthy"}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
@@ -92,40 +93,69 @@ class FakeRecoveryRunner:
         return [payload]
 
 
+class FakeMultiSandboxRecoveryRunner:
+    def __init__(self, sandbox_ids: list[str]) -> None:
+        self.runners = {
+            f"orket-sandbox-{sandbox_id}": FakeRecoveryRunner(
+                compose_project=f"orket-sandbox-{sandbox_id}",
+                sandbox_id=sandbox_id,
+                run_id=f"run-{sandbox_id.removeprefix('sb-')}",
+            )
+            for sandbox_id in sandbox_ids
+        }
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run_async(self, *cmd: str) -> CommandResult:
+        if "-p" in cmd:
+            project = cmd[cmd.index("-p") + 1]
+        else:
+            project = next(
+                token.split("=", 2)[-1] for token in cmd if token.startswith("label=com.docker.compose.project=")
+            )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await self.runners[project].run_async(*cmd)
+        finally:
+            self.in_flight -= 1
+
+
 class FakeOrphanDiscoveryRunner:
     def __init__(self) -> None:
         self.projects = [
             {"Name": "orket-sandbox-orphan-verified"},
             {"Name": "orket-sandbox-orphan-unverified"},
         ]
+        self.async_calls: list[tuple[str, ...]] = []
 
     async def run_async(self, *cmd: str) -> CommandResult:
-        project = next(
-            (
-                token.split("=", 2)[-1]
-                for token in cmd
-                if token.startswith("label=com.docker.compose.project=")
-            ),
-            "",
-        )
+        self.async_calls.append(cmd)
+        if "label=com.docker.compose.project" in cmd:
+            projects = [str(row["Name"]) for row in self.projects]
+        else:
+            projects = [
+                token.split("=", 2)[-1] for token in cmd if token.startswith("label=com.docker.compose.project=")
+            ]
         if cmd[:3] == ("docker-compose", "ls", "--format"):
             return CommandResult(returncode=0, stdout=json.dumps(self.projects), stderr="")
         if cmd[:3] == ("docker", "ps", "-a"):
             return CommandResult(
                 returncode=0,
-                stdout=self._container_rows(project),
+                stdout="".join(self._container_rows(project) for project in projects),
                 stderr="",
             )
         if cmd[:3] == ("docker", "network", "ls"):
             return CommandResult(
                 returncode=0,
-                stdout=self._network_rows(project),
+                stdout="".join(self._network_rows(project) for project in projects),
                 stderr="",
             )
         if cmd[:3] == ("docker", "volume", "ls"):
             return CommandResult(
                 returncode=0,
-                stdout=self._volume_rows(project),
+                stdout="".join(self._volume_rows(project) for project in projects),
                 stderr="",
             )
         raise AssertionError(f"Unexpected command: {cmd}")
@@ -133,25 +163,25 @@ class FakeOrphanDiscoveryRunner:
     @staticmethod
     def _container_rows(project: str) -> str:
         if project == "orket-sandbox-orphan-verified":
-            return '{"Names":"verified-api-1","Labels":"orket.managed=true,orket.sandbox_id=orphan-verified,orket.run_id=run-verified"}\n'
+            return '{"Names":"verified-api-1","Labels":"com.docker.compose.project=orket-sandbox-orphan-verified,orket.managed=true,orket.sandbox_id=orphan-verified,orket.run_id=run-verified"}\n'
         if project == "orket-sandbox-orphan-unverified":
-            return '{"Names":"unverified-api-1","Labels":""}\n'
+            return '{"Names":"unverified-api-1","Labels":"com.docker.compose.project=orket-sandbox-orphan-unverified"}\n'
         return ""
 
     @staticmethod
     def _network_rows(project: str) -> str:
         if project == "orket-sandbox-orphan-verified":
-            return '{"Name":"verified_default","Labels":"orket.managed=true,orket.sandbox_id=orphan-verified,orket.run_id=run-verified"}\n'
+            return '{"Name":"verified_default","Labels":"com.docker.compose.project=orket-sandbox-orphan-verified,orket.managed=true,orket.sandbox_id=orphan-verified,orket.run_id=run-verified"}\n'
         if project == "orket-sandbox-orphan-unverified":
-            return '{"Name":"unverified_default","Labels":""}\n'
+            return '{"Name":"unverified_default","Labels":"com.docker.compose.project=orket-sandbox-orphan-unverified"}\n'
         return ""
 
     @staticmethod
     def _volume_rows(project: str) -> str:
         if project == "orket-sandbox-orphan-verified":
-            return '{"Name":"verified-data","Labels":"orket.managed=true,orket.sandbox_id=orphan-verified,orket.run_id=run-verified"}\n'
+            return '{"Name":"verified-data","Labels":"com.docker.compose.project=orket-sandbox-orphan-verified,orket.managed=true,orket.sandbox_id=orphan-verified,orket.run_id=run-verified"}\n'
         if project == "orket-sandbox-orphan-unverified":
-            return '{"Name":"unverified-data","Labels":""}\n'
+            return '{"Name":"unverified-data","Labels":"com.docker.compose.project=orket-sandbox-orphan-unverified"}\n'
         return ""
 
 
@@ -180,7 +210,9 @@ def _record(**overrides) -> SandboxLifecycleRecord:
     return SandboxLifecycleRecord(**payload)
 
 
-def _service(tmp_path: Path, runner: FakeRecoveryRunner) -> tuple[AsyncSandboxLifecycleRepository, SandboxRuntimeRecoveryService]:
+def _service(
+    tmp_path: Path, runner: FakeRecoveryRunner | FakeMultiSandboxRecoveryRunner
+) -> tuple[AsyncSandboxLifecycleRepository, SandboxRuntimeRecoveryService]:
     repo = AsyncSandboxLifecycleRepository(tmp_path / "sandbox_lifecycle.db")
     lifecycle = SandboxRuntimeLifecycleService(
         repository=repo,
@@ -291,6 +323,43 @@ async def test_sweeper_executes_due_cleanup_for_terminal_record(tmp_path) -> Non
     assert any(event.event_type == "sandbox.cleanup_execution_result" for event in events)
 
 
+@pytest.mark.asyncio
+async def test_sweeper_cleans_due_records_in_bounded_parallel_batches(tmp_path) -> None:
+    runner = FakeMultiSandboxRecoveryRunner([f"sb-{index}" for index in range(1, 6)])
+    repo, recovery = _service(tmp_path, runner)
+    for index in range(1, 6):
+        workspace = tmp_path / f"sb-{index}"
+        compose_path = workspace / AGENT_OUTPUT_DIR / "deployment"
+        compose_path.mkdir(parents=True, exist_ok=True)
+        (compose_path / "docker-compose.sandbox.yml").touch()
+        await repo.save_record(
+            _record(
+                sandbox_id=f"sb-{index}",
+                compose_project=f"orket-sandbox-sb-{index}",
+                run_id=f"run-{index}",
+                state=SandboxState.TERMINAL,
+                cleanup_state=CleanupState.SCHEDULED,
+                record_version=4,
+                requires_reconciliation=False,
+                terminal_reason=TerminalReason.SUCCESS,
+                terminal_at="2026-03-11T00:00:00+00:00",
+                cleanup_due_at="2026-03-11T00:01:00+00:00",
+                workspace_path=str(workspace),
+            )
+        )
+
+    cleaned = await recovery.sweep_due_cleanups(max_records=10, concurrency=2)
+
+    assert sorted(record.sandbox_id for record in cleaned) == [f"sb-{index}" for index in range(1, 6)]
+    assert all(record.state is SandboxState.CLEANED for record in await repo.list_records())
+    assert recovery.last_sweep_metrics["claimed"] == 5
+    assert recovery.last_sweep_metrics["cleaned"] == 5
+    assert recovery.last_sweep_metrics["batches"] == 3
+    assert recovery.last_sweep_metrics["concurrency"] == 2
+    assert runner.max_in_flight == 2
+    assert isinstance(recovery.last_sweep_metrics["duration_ms"], float)
+
+
 @pytest.mark.asyncio
 async def test_preview_due_cleanup_emits_dry_run_decision_with_reason_code(tmp_path) -> None:
     runner = FakeRecoveryRunner(compose_project="orket-sandbox-sb-1", sandbox_id="sb-1", run_id="run-1")
@@ -327,10 +396,11 @@ async def test_preview_due_cleanup_emits_dry_run_decision_with_reason_code(tmp_p
 
 @pytest.mark.asyncio
 async def test_orphan_discovery_persists_verified_and_unverified_orphan_records(tmp_path) -> None:
+    runner = FakeOrphanDiscoveryRunner()
     repo = AsyncSandboxLifecycleRepository(tmp_path / "sandbox_lifecycle.db")
     lifecycle = SandboxRuntimeLifecycleService(
         repository=repo,
-        command_runner=FakeOrphanDiscoveryRunner(),
+        command_runner=runner,
         instance_id="runner-a",
         docker_context="desktop-linux",
         docker_host_id="host-a",
@@ -339,6 +409,7 @@ async def test_orphan_discovery_persists_verified_and_unverified_orphan_records(
 
     created = await recovery.discover_orphans()
     records = {record.compose_project: record for record in created}
+    observation_calls = [call for call in runner.async_calls if call[0] == "docker"]
 
     assert set(records) == {"orket-sandbox-orphan-verified", "orket-sandbox-orphan-unverified"}
     assert records["orket-sandbox-orphan-verified"].terminal_reason is TerminalReason.ORPHAN_DETECTED
@@ -348,6 +419,7 @@ async def test_orphan_discovery_persists_verified_and_unverified_orphan_records(
     assert records["orket-sandbox-orphan-verified"].cleanup_state is CleanupState.SCHEDULED
     assert records["orket-sandbox-orphan-unverified"].terminal_reason is TerminalReason.ORPHAN_UNVERIFIED_OWNERSHIP
     assert records["orket-sandbox-orphan-unverified"].cleanup_due_at is None
+    assert len(observation_calls) == 3
 
 
 @pytest.mark.asyncio
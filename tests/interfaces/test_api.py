@@ -917,6 +917,22 @@ def test_metrics():
         datetime.fromisoformat(data["timestamp"])
 
 
+def test_openmetrics_exposes_hot_path_histograms(monkeypatch):
+    monkeypatch.setenv("ORKET_API_KEY", "test-key")
+    from orket.instrumentation import TOOL_DISPATCH_SECONDS
+
+    TOOL_DISPATCH_SECONDS.observe(0.002, "write_file")
+
+    response = client.get("/v1/system/metrics/openmetrics", headers={"X-API-Key": "test-key"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    body = response.text
+    assert "# TYPE orket_tool_dispatch_seconds histogram" in body
+    assert 'orket_tool_dispatch_seconds_bucket{tool="write_file",le="+Inf"}' in body
+    assert "orket_instrumentation_record_overhead_nanoseconds " in body
+    assert body.endswith("# EOF\n")
+
+
 def test_system_board_uses_dept_query(monkeypatch):
     monkeypatch.setenv("ORKET_API_KEY", "test-key")
 
@@ -1644,6 +1660,47 @@ async def test_cards_endpoints_real_runtime_filters_and_pagination(monkeypatch,
     assert "created_at" in payload["items"][0]
 
 
+@pytest.mark.asyncio
+async def test_cards_endpoint_cursor_mode_pages_with_next_cursor(monkeypatch, tmp_path):
+    monkeypatch.setenv("ORKET_API_KEY", "test-key")
+    from orket.orchestration.engine import OrchestrationEngine
+
+    workspace_root = Path(tmp_path) / "workspace"
+    workspace_root.mkdir(parents=True, exist_ok=True)
+    real_engine = OrchestrationEngine(
+        workspace_root=workspace_root,
+        db_path=str(Path(tmp_path) / "runtime.db"),
+    )
+    monkeypatch.setattr(api_module, "engine", real_engine)
+    for card_id in ("CARD-1", "CARD-2", "CARD-3"):
+        await real_engine.cards.save(
+            {"id": card_id, "session_id": "S-K", "build_id": "B-K", "seat": "COD-1", "summary": card_id}
+        )
+
+    first = client.get("/v1/cards?build_id=B-K&limit=2&cursor=", headers={"X-API-Key": "test-key"})
+    assert first.status_code == 200
+    first_payload = first.json()
+    assert first_payload["count"] == 2
+    assert first_payload["cursor"] is None
+    assert "offset" not in first_payload
+    assert first_payload["next_cursor"]
+
+    second = client.get(
+        f"/v1/cards?build_id=B-K&limit=2&cursor={first_payload['next_cursor']}",
+        headers={"X-API-Key": "test-key"},
+    )
+    assert second.status_code == 200
+    second_payload = second.json()
+    assert second_payload["next_cursor"] is None
+    seen = [item["id"] for item in first_payload["items"] + second_payload["items"]]
+    assert sorted(seen) == ["CARD-1", "CARD-2", "CARD-3"]
+
+    bad_cursor = client.get("/v1/cards?cursor=%21%21", headers={"X-API-Key": "test-key"})
+    assert bad_cursor.status_code == 400
+    filtered_cursor = client.get("/v1/cards/view?cursor=&filter=blocked", headers={"X-API-Key": "test-key"})
+    assert filtered_cursor.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_cards_detail_history_comments_real_runtime(monkeypatch, tmp_path):
     monkeypatch.setenv("ORKET_API_KEY", "test-key")
@@ -112,3 +112,33 @@ async def test_run_submit_creates_initial_run_event(tmp_path, monkeypatch: pytes
 
     events = await OutwardRunEventStore(db_path).list_for_run("run-event-phase1")
     assert [event.event_type for event in events] == ["run_submitted"]
+
+
+@pytest.mark.integration
+def test_run_api_reuses_app_scoped_outward_services(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: integration. Verifies outward endpoints share one warmed service container and record timings."""
+    client, db_path = _client(tmp_path, monkeypatch)
+    try:
+        with client:
+            services = api_module._outward_services()
+            payload = {"run_id": "run-api-shared", "task": {"description": "Demo", "instruction": "Do the work"}}
+
+            client.post("/v1/runs", headers={"X-API-Key": "test-key"}, json=payload)
+            client.get("/v1/runs/run-api-shared", headers={"X-API-Key": "test-key"})
+            client.get("/v1/runs/run-api-shared", headers={"X-API-Key": "test-key"})
+            client.get("/v1/approvals/missing-approval", headers={"X-API-Key": "test-key"})
+            metrics = client.get("/v1/system/metrics", headers={"X-API-Key": "test-key"}).json()
+
+            assert api_module._outward_services() is services
+            assert api_module._outward_run_service() is services.run_service()
+            assert str(services.db_path) == db_path
+            timings = services.timing_snapshot()
+            assert "stores" in timings["construction_ms"]
+            assert timings["endpoints"]["api.runs.submit"]["count"] == 1
+            assert timings["endpoints"]["api.runs.status"]["count"] == 2
+            assert timings["endpoints"]["api.approvals.review"]["count"] == 1
+            assert metrics["outward_services"]["endpoints"]["api.runs.submit"]["count"] == 1
+        assert services.closed is True
+        assert api_module._outward_services() is not services
+    finally:
+        client.close()
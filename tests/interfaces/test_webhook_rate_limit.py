@@ -1,12 +1,14 @@
 ﻿import importlib
+import time
 
 from fastapi.testclient import TestClient
 
 
-def test_webhook_rate_limit(monkeypatch):
+def test_webhook_rate_limit(monkeypatch, tmp_path):
     monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
     monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
     monkeypatch.setenv("ORKET_RATE_LIMIT", "1")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "webhook_queue.db"))
 
     module = importlib.import_module("orket.webhook_server")
     module = importlib.reload(module)
@@ -24,13 +26,14 @@ def test_webhook_rate_limit(monkeypatch):
     first = client.post("/webhook/gitea", json=body, headers=headers)
     second = client.post("/webhook/gitea", json=body, headers=headers)
 
-    assert first.status_code == 200
+    assert first.status_code == 202
     assert second.status_code == 429
 
 
-def test_webhook_requires_signature_header(monkeypatch):
+def test_webhook_requires_signature_header(monkeypatch, tmp_path):
     monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
     monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "webhook_queue.db"))
 
     module = importlib.import_module("orket.webhook_server")
     module = importlib.reload(module)
@@ -51,9 +54,10 @@ def test_webhook_requires_signature_header(monkeypatch):
     assert called["count"] == 0
 
 
-def test_webhook_rejects_invalid_signature(monkeypatch):
+def test_webhook_rejects_invalid_signature(monkeypatch, tmp_path):
     monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
     monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "webhook_queue.db"))
 
     module = importlib.import_module("orket.webhook_server")
     module = importlib.reload(module)
@@ -108,11 +112,13 @@ def test_webhook_test_endpoint_enabled_with_flag(monkeypatch):
     assert response.json()["status"] == "ok"
 
 
-def test_webhook_health_reports_per_process_rate_limit_scope(monkeypatch):
+def test_webhook_health_reports_shared_rate_limit_scope(monkeypatch, tmp_path):
     monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
     monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
     monkeypatch.setenv("ORKET_RATE_LIMIT", "17")
     monkeypatch.setenv("ORKET_WEBHOOK_WORKERS", "3")
+    monkeypatch.setenv("ORKET_WEBHOOK_DELIVERY_WORKERS", "2")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "webhook_queue.db"))
 
     module = importlib.import_module("orket.webhook_server")
     module = importlib.reload(module)
@@ -123,9 +129,11 @@ def test_webhook_health_reports_per_process_rate_limit_scope(monkeypatch):
     assert response.status_code == 200
     assert response.json() == {
         "status": "healthy",
-        "rate_limit_scope": "per_process",
+        "rate_limit_scope": "shared",
         "webhook_rate_limit_per_minute": 17,
         "worker_count_hint": 3,
+        "delivery_workers": 2,
+        "delivery_queue": {"queued": 0, "processing": 0},
     }
 
 
@@ -173,3 +181,76 @@ def test_webhook_test_endpoint_uses_test_token_when_configured(monkeypatch):
     assert authorized.status_code == 200
     assert authorized.json()["status"] == "ok"
 
+
+
+def test_webhook_acknowledges_after_enqueue_and_workers_drain_in_background(monkeypatch, tmp_path):
+    """Layer: integration. Verifies signed deliveries are queued, deduplicated by delivery id and drained."""
+    monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
+    monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "webhook_queue.db"))
+
+    module = importlib.import_module("orket.webhook_server")
+    module = importlib.reload(module)
+    handled = []
+
+    async def _recording_handler(event_type, payload):
+        handled.append((event_type, payload["number"]))
+        return {"status": "ok"}
+
+    module.webhook_handler.handle_webhook = _recording_handler
+    module.validate_signature = lambda payload, signature: True
+    body = {"action": "opened", "number": 7, "repository": {"full_name": "org/repo"}}
+    headers = {"x-gitea-event": "pull_request", "x-gitea-signature": "ignored", "x-gitea-delivery": "delivery-7"}
+
+    with TestClient(module.app) as client:
+        first = client.post("/webhook/gitea", json=body, headers=headers)
+        replay = client.post("/webhook/gitea", json=body, headers=headers)
+        for _ in range(100):
+            if handled and client.get("/health").json()["delivery_queue"] == {"queued": 0, "processing": 0}:
+                break
+            time.sleep(0.02)
+
+    assert first.status_code == 202
+    assert first.json() == {"status": "accepted", "delivery_id": "delivery-7"}
+    assert replay.status_code == 202
+    assert replay.json()["status"] == "duplicate"
+    assert handled == [("pull_request", 7)]
+
+
+def test_unsigned_webhooks_do_not_spend_the_shared_rate_limit(monkeypatch, tmp_path):
+    """Layer: integration. Verifies signatures are checked before the queue-backed rate limit."""
+    monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
+    monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
+    monkeypatch.setenv("ORKET_RATE_LIMIT", "1")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "webhook_queue.db"))
+
+    module = importlib.import_module("orket.webhook_server")
+    module = importlib.reload(module)
+    module.validate_signature = lambda payload, signature: signature == "valid"
+    client = TestClient(module.app)
+    body = {"action": "opened", "number": 1, "repository": {"full_name": "org/repo"}}
+
+    rejected = [
+        client.post("/webhook/gitea", json=body, headers={"x-gitea-event": "pull_request", "x-gitea-signature": "bad"})
+        for _ in range(3)
+    ]
+    accepted = client.post(
+        "/webhook/gitea", json=body, headers={"x-gitea-event": "pull_request", "x-gitea-signature": "valid"}
+    )
+
+    assert [response.status_code for response in rejected] == [401, 401, 401]
+    assert accepted.status_code == 202
+
+
+def test_webhook_queue_path_is_resolved_on_first_use(monkeypatch, tmp_path):
+    """Layer: integration. Verifies the delivery queue path follows the environment at first use, not import."""
+    monkeypatch.setenv("GITEA_ADMIN_PASSWORD", "test-pass")
+    monkeypatch.setenv("GITEA_WEBHOOK_SECRET", "test-secret")
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "import_time.db"))
+
+    module = importlib.import_module("orket.webhook_server")
+    module = importlib.reload(module)
+    monkeypatch.setenv("ORKET_WEBHOOK_QUEUE_DB_PATH", str(tmp_path / "first_use.db"))
+
+    assert module.webhook_delivery.queue.db_path == tmp_path / "first_use.db"
+    assert module.webhook_delivery.rate_limiter.queue is module.webhook_delivery.queue
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+import types
+
+import pytest
+
+import orket.hardware as hardware
+
+
+def _fake_host(monkeypatch: pytest.MonkeyPatch, *, nvidia: bool) -> dict[str, int]:
+    calls = {"nvidia_smi": 0, "cpu_percent": 0}
+
+    def fake_run(cmd, **_kwargs):  # type: ignore[no-untyped-def]
+        calls["nvidia_smi"] += 1
+        if not nvidia:
+            raise FileNotFoundError(cmd[0])
+        return types.SimpleNamespace(stdout="12288, 4096\n12288, 2048\n")
+
+    def fake_cpu_percent(interval=None):  # type: ignore[no-untyped-def]
+        calls["cpu_percent"] += 1
+        return 25.0
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(hardware.psutil, "cpu_percent", fake_cpu_percent)
+    monkeypatch.setattr(hardware.psutil, "cpu_count", lambda logical=False: 8)
+    monkeypatch.setattr(
+        hardware.psutil, "virtual_memory", lambda: types.SimpleNamespace(percent=40.0, total=32 * 1024**3)
+    )
+    monkeypatch.setattr(
+        hardware.psutil, "disk_usage", lambda _path: types.SimpleNamespace(percent=70.0, free=100 * 1024**3)
+    )
+    return calls
+
+
+def test_sampler_keeps_bounded_history_and_stops_probing_missing_gpu(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: unit. Verifies one nvidia-smi call per sample, a bounded ring buffer, and no retries without a GPU."""
+    calls = _fake_host(monkeypatch, nvidia=True)
+    sampler = hardware.HostResourceSampler(history_size=3)
+    for _ in range(5):
+        sampler.sample_once()
+
+    latest = sampler.latest()
+    assert latest is not None and latest is sampler.history()[-1]
+    assert len(sampler.history()) == 3
+    assert calls["nvidia_smi"] == 5
+    assert (latest.vram_total_gb, latest.vram_gb_used, latest.has_nvidia) == (24.0, 6.0, True)
+    assert latest.profile() == hardware.HardwareProfile(cpu_cores=8, ram_gb=32.0, vram_gb=24.0, has_nvidia=True)
+
+    calls = _fake_host(monkeypatch, nvidia=False)
+    no_gpu = hardware.HostResourceSampler()
+    no_gpu.sample_once()
+    no_gpu.sample_once()
+    assert calls["nvidia_smi"] == 1
+    assert no_gpu.latest() is not None and no_gpu.latest().has_nvidia is False  # type: ignore[union-attr]
+
+
+def test_running_sampler_serves_metrics_and_profile_without_probing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: integration. Verifies readers use the latest sample while the sampler thread reports its CPU cost."""
+    calls = _fake_host(monkeypatch, nvidia=True)
+    sampler = hardware.HostResourceSampler(interval_seconds=60.0)
+    monkeypatch.setattr(hardware, "_HOST_SAMPLER", sampler)
+    sampled = threading.Event()
+    original_sample_once = sampler.sample_once
+
+    def sample_once() -> hardware.HostSample:
+        sample = original_sample_once()
+        sampled.set()
+        return sample
+
+    monkeypatch.setattr(sampler, "sample_once", sample_once)
+    assert hardware.latest_metrics_snapshot() is None
+
+    sampler.start()
+    try:
+        assert sampled.wait(5.0)
+        probes_before = dict(calls)
+        snapshot = hardware.get_metrics_snapshot()
+        profile = hardware.get_current_profile()
+        assert calls == probes_before
+    finally:
+        sampler.stop()
+
+    assert snapshot["cpu_percent"] == 25.0
+    assert snapshot["disk_percent"] == 70.0
+    assert snapshot["vram_total_gb"] == 24.0
+    assert snapshot["sampler"]["running"] is True
+    assert profile.vram_gb == 24.0 and profile.cpu_cores == 8
+    stats = sampler.stats()
+    assert stats["running"] is False
+    assert stats["samples"] >= 1
+    assert stats["cpu_seconds"] >= 0.0 and 0.0 <= stats["cpu_share"] < 1.0
+
+
+def test_sampler_backs_off_transient_gpu_errors_and_stopped_sampler_is_not_served(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Layer: unit. Verifies a failing nvidia-smi is retried after a backoff and a stopped sampler's sample is ignored."""
+    calls = _fake_host(monkeypatch, nvidia=True)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(hardware.time, "monotonic", lambda: clock["now"])
+    outcomes = ["ok", "error", "ok"]
+
+    def flaky_run(cmd, **_kwargs):  # type: ignore[no-untyped-def]
+        calls["nvidia_smi"] += 1
+        if outcomes.pop(0) == "error":
+            raise subprocess.CalledProcessError(9, cmd)
+        return types.SimpleNamespace(stdout="12288, 4096\n")
+
+    monkeypatch.setattr(subprocess, "run", flaky_run)
+    sampler = hardware.HostResourceSampler(interval_seconds=2.0)
+    sampler.sample_once()
+    failed = sampler.sample_once()
+    backed_off = sampler.sample_once()
+    assert calls["nvidia_smi"] == 2
+    assert (failed.vram_total_gb, backed_off.vram_total_gb) == (12.0, 12.0)
+    assert sampler.stats()["gpu_available"] is True and sampler.stats()["gpu_failures"] == 1
+
+    clock["now"] += 4.0
+    recovered = sampler.sample_once()
+    assert calls["nvidia_smi"] == 3 and recovered.has_nvidia is True
+    assert sampler.stats()["gpu_failures"] == 0
+
+    monkeypatch.setattr(hardware, "_HOST_SAMPLER", sampler)
+    monkeypatch.setattr(hardware, "get_vram_info", lambda: 0.0)
+    assert sampler.running is False
+    assert hardware.get_current_profile() == hardware.HardwareProfile(
+        cpu_cores=8, ram_gb=32.0, vram_gb=0.0, has_nvidia=False
+    )
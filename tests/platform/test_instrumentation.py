@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from orket.adapters.storage.async_flow_repository import AsyncFlowRepository
+from orket.instrumentation import (
+    HOT_PATH_METRICS,
+    RECORDING_BUDGET_NS,
+    SQLITE_QUERY_SECONDS,
+    MetricsRegistry,
+    measure_recording_overhead,
+    run_metrics_scope,
+)
+from orket.runtime.run_summary import write_hot_path_metrics_artifact
+
+
+def test_openmetrics_rendering_uses_cumulative_buckets_and_terminates_with_eof() -> None:
+    """Layer: unit. Verifies counter, gauge, and histogram exposition follows the OpenMetrics text format."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo latency.", ("op",), buckets=(0.01, 0.1))
+    counter = registry.counter("demo_drops", 'Dropped "demo" events.', ("kind",))
+    gauge = registry.gauge("demo_depth", "Demo depth.")
+    histogram.observe(0.005, "read")
+    histogram.observe(0.05, "read")
+    histogram.observe(5.0, "read")
+    counter.inc('say "hi"', amount=2)
+    gauge.set(3)
+
+    text = registry.render_openmetrics()
+
+    assert 'demo_seconds_bucket{op="read",le="0.01"} 1' in text
+    assert 'demo_seconds_bucket{op="read",le="0.1"} 2' in text
+    assert 'demo_seconds_bucket{op="read",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{op="read"} 3' in text
+    assert 'demo_drops_total{kind="say \\"hi\\""} 2.0' in text
+    assert "demo_depth 3.0" in text
+    assert text.endswith("# EOF\n")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("demo_seconds", "Clash.")
+
+
+def test_run_scope_mirrors_observations_from_spawned_tasks_only() -> None:
+    """Layer: unit. Verifies a run scope collects observations from its own tasks but not from outside it."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("scoped_seconds", "Scoped latency.")
+
+    async def _scenario() -> MetricsRegistry:
+        with run_metrics_scope() as run_registry:
+            await asyncio.gather(*(asyncio.to_thread(histogram.observe, 0.002) for _ in range(3)))
+        histogram.observe(0.002)
+        return run_registry
+
+    run_registry = asyncio.run(_scenario())
+
+    assert run_registry.snapshot()["scoped_seconds"]["series"][0]["count"] == 3
+    assert registry.snapshot()["scoped_seconds"]["series"][0]["count"] == 4
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_and_run_artifact_carry_method_labels(tmp_path) -> None:
+    """Layer: integration. Verifies SQLite operations are timed per repository method and land in the run artifact."""
+    repo = AsyncFlowRepository(tmp_path / "flows.db")
+    with run_metrics_scope() as run_registry:
+        await repo.list_flows()
+        path = await write_hot_path_metrics_artifact(root=tmp_path, session_id="run-1", metrics=run_registry.snapshot())
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    series = payload["metrics"]["orket_sqlite_query_seconds"]["series"]
+    assert path == tmp_path / "runs" / "run-1" / "hot_path_metrics.json"
+    assert series[0]["labels"] == {"method": "AsyncFlowRepository.list_flows"}
+    assert series[0]["count"] == 1
+    assert SQLITE_QUERY_SECONDS.name in HOT_PATH_METRICS.snapshot()
+
+
+def test_recording_overhead_is_bounded() -> None:
+    """Layer: unit. Verifies recording stays within a loose multiple of its budget.
+
+    The strict budget check is scripts/benchmarks/check_instrumentation_overhead.py; wall-clock
+    timings on shared CI hosts are too noisy to assert it here.
+    """
+    best = min(measure_recording_overhead(5_000) for _ in range(3))
+    assert best < RECORDING_BUDGET_NS * 20
@@ -4,7 +4,8 @@ from pathlib import Path
 
 import pytest
 
-from orket.runtime.contract_bootstrap import load_runtime_contract_snapshots
+from orket.runtime import contract_bootstrap as contract_bootstrap_module
+from orket.runtime.contract_bootstrap import clear_runtime_contract_snapshot_cache, load_runtime_contract_snapshots
 
 
 def _write(path: Path, content: str) -> None:
@@ -341,3 +342,77 @@ mappings:
             compatibility_map_schema_path=tmp_path / "core" / "tools" / "compatibility_map_schema.yaml",
             tool_registry_path=tmp_path / "core" / "tools" / "tool_registry.yaml",
         )
+
+
+def _copy_repo_contract_sources(tmp_path: Path) -> dict[str, Path]:
+    project_root = Path(__file__).resolve().parents[2]
+    paths = {
+        "artifact_schema_registry_path": Path("core/artifacts/schema_registry.yaml"),
+        "tool_registry_path": Path("core/tools/tool_registry.yaml"),
+        "compatibility_map_schema_path": Path("core/tools/compatibility_map_schema.yaml"),
+        "compatibility_map_path": Path("core/tools/compatibility_map.yaml"),
+    }
+    copied: dict[str, Path] = {}
+    for key, relative in paths.items():
+        target = tmp_path / relative
+        _write(target, (project_root / relative).read_text(encoding="utf-8"))
+        copied[key] = target
+    return copied
+
+
+@pytest.fixture
+def _fresh_contract_cache():
+    clear_runtime_contract_snapshot_cache()
+    yield
+    clear_runtime_contract_snapshot_cache()
+
+
+# Layer: unit
+def test_load_runtime_contract_snapshots_reuses_compiled_snapshot_until_sources_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    _fresh_contract_cache,
+) -> None:
+    sources = _copy_repo_contract_sources(tmp_path)
+    parse_calls = {"count": 0}
+    real_safe_load = contract_bootstrap_module.yaml.safe_load
+
+    def _counting_safe_load(content):
+        parse_calls["count"] += 1
+        return real_safe_load(content)
+
+    monkeypatch.setattr(contract_bootstrap_module.yaml, "safe_load", _counting_safe_load)
+
+    first = load_runtime_contract_snapshots(**sources)
+    second = load_runtime_contract_snapshots(**sources)
+    assert parse_calls["count"] == 4
+    assert second == first
+    second.tool_registry_snapshot["tools"].append("mutated")
+    assert load_runtime_contract_snapshots(**sources) == first
+
+    artifact_path = sources["artifact_schema_registry_path"]
+    artifact_path.write_text(artifact_path.read_text(encoding="utf-8") + "\n# touched\n", encoding="utf-8")
+    load_runtime_contract_snapshots(**sources)
+    assert parse_calls["count"] == 8
+
+
+# Layer: unit
+def test_load_runtime_contract_snapshots_persists_and_reuses_precompiled_artifact(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    _fresh_contract_cache,
+) -> None:
+    sources = _copy_repo_contract_sources(tmp_path)
+    cache_dir = tmp_path / ".orket" / "cache" / "runtime_contracts"
+
+    compiled = load_runtime_contract_snapshots(**sources, precompiled_cache_dir=cache_dir)
+    artifacts = list(cache_dir.glob("*.json"))
+    assert len(artifacts) == 1
+
+    clear_runtime_contract_snapshot_cache()
+
+    def _fail_safe_load(_content):
+        raise AssertionError("precompiled artifact should satisfy the load without parsing YAML")
+
+    monkeypatch.setattr(contract_bootstrap_module.yaml, "safe_load", _fail_safe_load)
+    assert load_runtime_contract_snapshots(**sources, precompiled_cache_dir=cache_dir) == compiled
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from orket.runtime.config.prompt_prefix_layout import (
+    E_PROMPT_LAYOUT_INVALID,
+    PROMPT_LAYOUT_DEFAULT,
+    PROMPT_LAYOUT_PREFIX_STABLE,
+    apply_prefix_stable_layout,
+    prompt_cache_hints,
+    resolve_prompt_layout,
+)
+
+
+def _turn_messages(*, memory: str, turn: int) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": f"You are coder\n\nPROJECT CONTEXT (PAST DECISIONS):\n{memory}"},
+        {"role": "user", "content": "Issue ISSUE-1: Demo\n\nType: story\nPriority: High"},
+        {"role": "user", "content": f'Execution Context JSON:\n{{"turn": {turn}}}'},
+        {"role": "user", "content": "Artifact Contract JSON:\n{}"},
+        {"role": "user", "content": "Protocol Response Contract:\n- one envelope"},
+        {"role": "user", "content": "Turn Success Contract:\n- write main.py"},
+    ]
+
+
+def test_prefix_stable_layout_orders_by_stability_and_keeps_prefix_byte_identical() -> None:
+    """Layer: unit. Verifies volatile system tails move last and the stable prefix survives per-turn changes."""
+    first = apply_prefix_stable_layout(_turn_messages(memory="decision one", turn=1))
+    second = apply_prefix_stable_layout(_turn_messages(memory="decision two", turn=2))
+
+    assert [message["content"].split("\n", 1)[0] for message in first.messages] == [
+        "You are coder",
+        "Protocol Response Contract:",
+        "Issue ISSUE-1: Demo",
+        "Artifact Contract JSON:",
+        "Execution Context JSON:",
+        "Turn Success Contract:",
+        "PROJECT CONTEXT (PAST DECISIONS):",
+    ]
+    assert first.messages[-1] == {"role": "system", "content": "PROJECT CONTEXT (PAST DECISIONS):\ndecision one"}
+    assert first.stable_prefix_message_count == 2
+    assert first.moved_system_sections == 1
+    assert first.stable_prefix_hash == second.stable_prefix_hash
+    assert first.messages[:4] == second.messages[:4]
+
+
+def test_prefix_stable_layout_keeps_memory_and_patch_in_one_trailing_system_message() -> None:
+    """Layer: unit. Verifies moved system sections keep system role and their original order."""
+    layout = apply_prefix_stable_layout(
+        [
+            {"role": "system", "content": "You are coder\n\nPROJECT CONTEXT (PAST DECISIONS):\nd1\n\nPATCH:\nfix it"},
+            {"role": "user", "content": "Turn Success Contract:\n- write main.py"},
+        ]
+    )
+
+    assert layout.messages[0] == {"role": "system", "content": "You are coder"}
+    assert layout.messages[-1] == {
+        "role": "system",
+        "content": "PROJECT CONTEXT (PAST DECISIONS):\nd1\n\nPATCH:\nfix it",
+    }
+    assert layout.moved_system_sections == 2
+    assert [message["role"] for message in layout.messages] == ["system", "user", "system"]
+
+
+def test_prompt_layout_resolution_and_llama_cpp_cache_hints(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: unit. Verifies layout selection fails closed and llama.cpp hints pin each role to one slot."""
+    monkeypatch.delenv("ORKET_PROMPT_LAYOUT", raising=False)
+    assert resolve_prompt_layout({}) == PROMPT_LAYOUT_DEFAULT
+    monkeypatch.setenv("ORKET_PROMPT_LAYOUT", "prefix-stable")
+    assert resolve_prompt_layout({}) == PROMPT_LAYOUT_PREFIX_STABLE
+    with pytest.raises(ValueError, match=E_PROMPT_LAYOUT_INVALID):
+        resolve_prompt_layout({"prompt_layout": "shuffled"})
+
+    monkeypatch.delenv("ORKET_LLAMA_CPP_PARALLEL_SLOTS", raising=False)
+    coder = {"session_id": "run-1", "role": "coder"}
+    assert prompt_cache_hints(provider_name="llama_cpp", runtime_context=coder) == {"cache_prompt": True}
+    assert prompt_cache_hints(provider_name="lmstudio", runtime_context=coder) == {}
+
+    monkeypatch.setenv("ORKET_LLAMA_CPP_PARALLEL_SLOTS", "4")
+    slots = {
+        prompt_cache_hints(provider_name="llama_cpp", runtime_context=coder)["id_slot"] for _ in range(3)
+    }
+    assert len(slots) == 1 and 0 <= slots.pop() < 4
+
+    monkeypatch.setenv("ORKET_LLAMA_CPP_PARALLEL_SLOTS", "four")
+    assert prompt_cache_hints(provider_name="llama_cpp", runtime_context=coder) == {"cache_prompt": True}
@@ -6,12 +6,14 @@ from typing import Any
 
 import pytest
 
+import orket.adapters.storage.async_protocol_run_ledger as protocol_run_ledger_module
 from orket.adapters.storage.async_protocol_run_ledger import AsyncProtocolRunLedgerRepository
 from orket.runtime.registry.tool_invocation_contracts import (
     build_tool_invocation_manifest,
     compute_tool_call_hash,
 )
 from orket.runtime.run_graph_reconstruction import (
+    IncrementalRunGraphBuilder,
     reconstruct_run_graph,
     reconstruct_run_graph_from_events_log,
 )
@@ -288,3 +290,81 @@ async def test_run_graph_live_vs_replay_parity_for_deterministic_runs(tmp_path:
     live = await _record_protocol_run(root=tmp_path / "live", session_id="sess-run-graph-parity", replayed=False)
     replay = await _record_protocol_run(root=tmp_path / "replay", session_id="sess-run-graph-parity", replayed=True)
     assert live == replay
+
+
+# Layer: integration
+@pytest.mark.asyncio
+async def test_incremental_run_graph_matches_full_reconstruction_bytes(tmp_path: Path) -> None:
+    session_id = "sess-run-graph-incremental"
+    repo = AsyncProtocolRunLedgerRepository(tmp_path)
+    await repo.start_run(
+        session_id=session_id,
+        run_type="epic",
+        run_name="Incremental Graph",
+        department="core",
+        build_id="build-run-graph",
+    )
+    for index in range(3):
+        call_payload = _tool_call_payload(
+            session_id=session_id,
+            operation_id=f"op-{index}",
+            tool_name="workspace.read",
+            tool_args={"path": f"file_{index}.md"},
+        )
+        call_event = await repo.append_event(session_id=session_id, kind="tool_call", payload=call_payload)
+        await repo.append_event(
+            session_id=session_id,
+            kind="operation_result",
+            payload=_tool_result_payload(
+                call_payload=call_payload,
+                call_sequence_number=int(call_event["event_seq"]),
+                result={"ok": True, "content": str(index)},
+            ),
+        )
+    # A fresh repository instance seeds its builder from the ledger on the next append.
+    resumed = AsyncProtocolRunLedgerRepository(tmp_path)
+    await resumed.append_event(session_id=session_id, kind="turn_note", payload={"note": "resumed"})
+    await resumed.finalize_run(session_id=session_id, status="incomplete", summary={"session_status": "incomplete"})
+
+    events_log = tmp_path / "runs" / session_id / "events.log"
+    written = (tmp_path / "runs" / session_id / "run_graph.json").read_text(encoding="utf-8")
+    rebuilt = reconstruct_run_graph_from_events_log(events_log_path=events_log, session_id=session_id)
+    assert written == json.dumps(rebuilt, indent=2, ensure_ascii=True) + "\n"
+
+    events = await resumed.list_events(session_id)
+    builder = IncrementalRunGraphBuilder(run_id=session_id)
+    for event in events:
+        builder.add_event(event)
+    assert builder.build() == reconstruct_run_graph(list(reversed(events)), session_id=session_id)
+    builder.add_event(events[0])
+    assert builder.out_of_order is True
+
+
+# Layer: integration
+@pytest.mark.asyncio
+async def test_run_graph_builders_are_bounded_and_released_on_finalize(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(protocol_run_ledger_module, "MAX_CACHED_GRAPH_BUILDERS", 2)
+    repo = AsyncProtocolRunLedgerRepository(tmp_path)
+    sessions = ["sess-bounded-a", "sess-bounded-b", "sess-bounded-c"]
+    for session_id in sessions:
+        await repo.start_run(
+            session_id=session_id,
+            run_type="epic",
+            run_name="Bounded Graph",
+            department="core",
+            build_id="build-run-graph",
+        )
+        await repo.append_event(session_id=session_id, kind="turn_note", payload={"note": session_id})
+
+    assert list(repo._graph_builders) == ["sess-bounded-b", "sess-bounded-c"]
+
+    for session_id in ("sess-bounded-a", "sess-bounded-c"):
+        await repo.finalize_run(session_id=session_id, status="incomplete", summary={"session_status": "incomplete"})
+        events_log = tmp_path / "runs" / session_id / "events.log"
+        written = (tmp_path / "runs" / session_id / "run_graph.json").read_text(encoding="utf-8")
+        rebuilt = reconstruct_run_graph_from_events_log(events_log_path=events_log, session_id=session_id)
+        assert written == json.dumps(rebuilt, indent=2, ensure_ascii=True) + "\n"
+
+    assert list(repo._graph_builders) == ["sess-bounded-b"]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
 from orket.runtime import run_start_contract_artifacts
+from orket.runtime.evidence import contract_snapshot_store
+from orket.runtime.evidence.contract_snapshot_store import ContractSnapshotStore, resolve_contract_snapshot_file
 import orket.runtime.run_start_artifacts as run_start_artifacts_module
 from orket.runtime.run_start_artifacts import capture_run_start_artifacts
 
@@ -1116,3 +1120,67 @@ def test_capture_run_start_artifacts_fails_closed_before_persisting_invalid_retr
         / "retry_classification_policy.json"
     )
     assert retry_policy_path.exists() is False
+
+
+# Layer: integration
+def test_capture_run_start_artifacts_shares_content_addressed_snapshots_across_runs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store_root = tmp_path / "contract_snapshots"
+    monkeypatch.setattr(ContractSnapshotStore, "default", classmethod(lambda cls: cls(store_root)))
+    drift_calls = {"count": 0}
+    original_drift_report = run_start_contract_artifacts.runtime_truth_contract_drift_report
+
+    def _counting_drift_report() -> dict[str, object]:
+        drift_calls["count"] += 1
+        return original_drift_report()
+
+    monkeypatch.setattr(run_start_contract_artifacts, "runtime_truth_contract_drift_report", _counting_drift_report)
+    workspace = tmp_path / "workspace"
+    first = capture_run_start_artifacts(workspace=workspace, run_id="run-shared-a", workload="core_epic")
+    original_file_digest = contract_snapshot_store._file_digest
+    hashed_paths: list[Path] = []
+
+    def _counting_file_digest(path: Path) -> str | None:
+        hashed_paths.append(path)
+        return original_file_digest(path)
+
+    monkeypatch.setattr(contract_snapshot_store, "_file_digest", _counting_file_digest)
+    second = capture_run_start_artifacts(workspace=workspace, run_id="run-shared-b", workload="core_epic")
+
+    assert drift_calls["count"] == 1
+    assert hashed_paths == []
+    first_manifest = json.loads(Path(first["contract_snapshot_manifest_path"]).read_text(encoding="utf-8"))
+    second_manifest = json.loads(Path(second["contract_snapshot_manifest_path"]).read_text(encoding="utf-8"))
+    assert first_manifest == second_manifest
+    row = first_manifest["snapshots"]["run_phase_contract"]
+    assert row["filename"] == "run_phase_contract.json"
+    blob = store_root / row["digest"][7:9] / f"{row['digest'][7:]}.json"
+    assert blob.is_file()
+    assert hashlib.sha256(blob.read_bytes()).hexdigest() == row["digest"][7:]
+    assert Path(first["run_phase_contract_path"]) == blob
+    assert Path(second["run_phase_contract_path"]) == blob
+
+    contracts_dir = Path(first["contract_snapshot_manifest_path"]).parent
+    store = ContractSnapshotStore(store_root)
+    for snapshot_row in first_manifest["snapshots"].values():
+        assert (contracts_dir / snapshot_row["filename"]).exists() is False
+        assert resolve_contract_snapshot_file(contracts_dir, snapshot_row["filename"], store=store) == (
+            store.blob_path(snapshot_row["digest"][7:])
+        )
+    blob_bytes = {path.read_bytes() for path in store_root.rglob("*.json")}
+    assert all(path.read_bytes() not in blob_bytes for path in contracts_dir.iterdir())
+
+
+# Layer: integration
+def test_capture_run_start_artifacts_rejects_manifest_digest_drift(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    payload = capture_run_start_artifacts(workspace=workspace, run_id="run-manifest-drift", workload="core_epic")
+    manifest_path = Path(payload["contract_snapshot_manifest_path"])
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["snapshots"]["run_phase_contract"]["digest"] = "sha256:" + "0" * 64
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="E_RUN_PHASE_CONTRACT_IMMUTABLE"):
+        capture_run_start_artifacts(workspace=workspace, run_id="run-manifest-drift", workload="core_epic")
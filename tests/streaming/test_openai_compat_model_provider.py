@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
 
+import orket.streaming.model_provider as model_provider_module
 from orket.streaming.model_provider import (
+    ModelProviderHTTPClientPool,
     OpenAICompatModelStreamProvider,
+    ProviderEvent,
     ProviderEventType,
     ProviderTurnRequest,
+    TokenDeltaCoalescer,
 )
+from orket.workloads import model_stream_v1
 
 
 class _FakeStreamResponse:
@@ -31,9 +37,17 @@ class _FakeStreamResponse:
 
 
 class _FakeAsyncClient:
+    instances: list[_FakeAsyncClient] = []
+    lines: list[str] = [
+        'data: {"choices":[{"delta":{}}]}',
+        "data: [DONE]",
+    ]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         _ = args
-        _ = kwargs
+        self.kwargs = kwargs
+        self.is_closed = False
+        type(self).instances.append(self)
 
     async def __aenter__(self) -> _FakeAsyncClient:
         return self
@@ -53,12 +67,7 @@ class _FakeAsyncClient:
         _ = json
         assert method == "POST"
         assert path == "/chat/completions"
-        return _FakeStreamResponse(
-            [
-                'data: {"choices":[{"delta":{}}]}',
-                "data: [DONE]",
-            ]
-        )
+        return _FakeStreamResponse(list(type(self).lines))
 
 
 def _event_payloads(events: list[Any], event_type: ProviderEventType) -> list[dict[str, Any]]:
@@ -74,10 +83,14 @@ async def test_openai_compat_stream_zero_deltas_emits_synthetic_token(
     monkeypatch.setenv("ORKET_MODEL_STREAM_OPENAI_USE_STREAM", "true")
     monkeypatch.setattr(model_provider.httpx, "AsyncClient", _FakeAsyncClient)
 
-    provider = OpenAICompatModelStreamProvider(model_id="test-model", base_url="http://example.test/v1")
+    provider = OpenAICompatModelStreamProvider(
+        model_id="test-model",
+        base_url="http://example.test/v1",
+        client_pool=ModelProviderHTTPClientPool(),
+    )
     fallback_calls: list[dict[str, Any]] = []
 
-    def fake_post_chat_completion_sync(headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
+    async def fake_post_chat_completion(headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
         _ = headers
         fallback_calls.append(dict(payload))
         return {
@@ -85,7 +98,7 @@ async def test_openai_compat_stream_zero_deltas_emits_synthetic_token(
             "usage": {"completion_tokens": 1},
         }
 
-    monkeypatch.setattr(provider, "_post_chat_completion_sync", fake_post_chat_completion_sync)
+    monkeypatch.setattr(provider, "_post_chat_completion", fake_post_chat_completion)
 
     request = ProviderTurnRequest(input_config={"prompt": "hi", "max_tokens": 1}, turn_params={})
     events = [event async for event in provider.start_turn(request)]
@@ -110,7 +123,7 @@ async def test_openai_compat_non_stream_uses_completion_text(monkeypatch: pytest
     monkeypatch.setenv("ORKET_MODEL_STREAM_OPENAI_USE_STREAM", "false")
     provider = OpenAICompatModelStreamProvider(model_id="test-model", base_url="http://example.test/v1")
 
-    def fake_post_chat_completion_sync(headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
+    async def fake_post_chat_completion(headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
         _ = headers
         _ = payload
         return {
@@ -118,7 +131,7 @@ async def test_openai_compat_non_stream_uses_completion_text(monkeypatch: pytest
             "usage": {"completion_tokens": 1},
         }
 
-    monkeypatch.setattr(provider, "_post_chat_completion_sync", fake_post_chat_completion_sync)
+    monkeypatch.setattr(provider, "_post_chat_completion", fake_post_chat_completion)
 
     request = ProviderTurnRequest(input_config={"prompt": "hi", "max_tokens": 8}, turn_params={})
     events = [event async for event in provider.start_turn(request)]
@@ -126,6 +139,7 @@ async def test_openai_compat_non_stream_uses_completion_text(monkeypatch: pytest
     assert len(token_payloads) == 1
     assert token_payloads[0]["delta"] == "ok"
     assert "synthetic" not in token_payloads[0]
+    assert _event_payloads(events, ProviderEventType.STOPPED) == [{"stop_reason": "completed", "completion_tokens": 1}]
 
 
 def test_openai_compat_extract_delta_supports_reasoning_and_text() -> None:
@@ -134,3 +148,137 @@ def test_openai_compat_extract_delta_supports_reasoning_and_text() -> None:
 
     assert OpenAICompatModelStreamProvider._extract_delta(reasoning_chunk) == "thinking"
     assert OpenAICompatModelStreamProvider._extract_delta(text_chunk) == "answer"
+
+
+@pytest.mark.asyncio
+async def test_openai_compat_stream_turns_reuse_one_pooled_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: unit. Verifies consecutive turns and providers share one keep-alive client per base URL."""
+    from orket.streaming import model_provider
+
+    monkeypatch.setenv("ORKET_MODEL_STREAM_OPENAI_USE_STREAM", "true")
+    monkeypatch.setattr(model_provider.httpx, "AsyncClient", _FakeAsyncClient)
+    monkeypatch.setattr(_FakeAsyncClient, "instances", [])
+    monkeypatch.setattr(_FakeAsyncClient, "lines", ['data: {"choices":[{"delta":{"content":"hi"}}]}', "data: [DONE]"])
+    pool = ModelProviderHTTPClientPool(max_connections=4, max_keepalive_connections=2)
+    request = ProviderTurnRequest(input_config={"prompt": "hi", "max_tokens": 8}, turn_params={})
+
+    for _ in range(2):
+        provider = OpenAICompatModelStreamProvider(
+            model_id="test-model", base_url="http://example.test/v1", client_pool=pool
+        )
+        events = [event async for event in provider.start_turn(request)]
+        assert _event_payloads(events, ProviderEventType.TOKEN_DELTA) == [{"delta": "hi", "index": 0}]
+
+    assert len(_FakeAsyncClient.instances) == 1
+    limits = _FakeAsyncClient.instances[0].kwargs["limits"]
+    assert (limits.max_connections, limits.max_keepalive_connections) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_openai_compat_cancel_before_first_line_stops_without_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: unit. Verifies cancel flags are honored without awaiting a provider lock."""
+    monkeypatch.setenv("ORKET_MODEL_STREAM_OPENAI_USE_STREAM", "false")
+    provider = OpenAICompatModelStreamProvider(
+        model_id="test-model", base_url="http://example.test/v1", client_pool=ModelProviderHTTPClientPool()
+    )
+    posted: list[dict[str, Any]] = []
+
+    async def fake_post_chat_completion(headers: dict[str, str], payload: dict[str, Any]) -> dict[str, Any]:
+        _ = headers
+        posted.append(payload)
+        return {}
+
+    monkeypatch.setattr(provider, "_post_chat_completion", fake_post_chat_completion)
+    events = []
+    async for event in provider.start_turn(ProviderTurnRequest(input_config={"prompt": "hi"})):
+        events.append(event)
+        if event.event_type == ProviderEventType.READY:
+            await provider.cancel(event.provider_turn_id)
+
+    assert events[-1].payload == {"stop_reason": "canceled"}
+    assert posted == []
+
+
+def test_token_delta_coalescer_releases_first_delta_then_batches() -> None:
+    coalescer = TokenDeltaCoalescer(max_chars=6, max_interval_ms=60_000)
+
+    assert coalescer.add({"delta": "a", "index": 0}) == [{"delta": "a", "index": 0}]
+    assert coalescer.add({"delta": "bc", "index": 1}) == []
+    assert coalescer.add({"delta": "def", "index": 2}) == []
+    assert coalescer.add({"delta": "g", "index": 3}) == [{"delta": "bcdefg", "index": 1, "coalesced_count": 3}]
+    assert coalescer.add({"delta": "h", "index": 4}) == []
+    assert coalescer.flush() == [{"delta": "h", "index": 4}]
+    assert TokenDeltaCoalescer().add({"delta": "x", "index": 9}) == [{"delta": "x", "index": 9}]
+
+
+class _PausingProvider:
+    """Streams three deltas, pauses mid-output, then fails."""
+
+    def __init__(self, emitted: list[str]) -> None:
+        self.emitted = emitted
+        self.released_during_pause: list[str] = []
+
+    async def start_turn(self, req: ProviderTurnRequest) -> AsyncIterator[ProviderEvent]:
+        for index, delta in enumerate("abc"):
+            yield ProviderEvent(
+                provider_turn_id="turn-1",
+                event_type=ProviderEventType.TOKEN_DELTA,
+                payload={"delta": delta, "index": index},
+            )
+        await asyncio.sleep(0.2)
+        self.released_during_pause = list(self.emitted)
+        yield ProviderEvent(provider_turn_id="turn-1", event_type=ProviderEventType.ERROR, payload={"error": "boom"})
+
+    async def cancel(self, provider_turn_id: str) -> None:
+        return None
+
+
+class _RecordingInteraction:
+    def __init__(self) -> None:
+        self.deltas: list[str] = []
+        self.commits: list[str] = []
+
+    async def emit_event(self, event_type: Any, payload: dict[str, Any]) -> None:
+        self.deltas.append(payload["delta"])
+
+    async def await_cancel(self) -> None:
+        await asyncio.Event().wait()
+
+    def is_canceled(self) -> bool:
+        return False
+
+    async def request_commit(self, intent: Any) -> None:
+        self.commits.append(intent.ref)
+
+
+def test_token_delta_coalescer_releases_held_text_after_max_hold(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 100.0}
+    monkeypatch.setattr(model_provider_module.time, "monotonic", lambda: clock["now"])
+    coalescer = TokenDeltaCoalescer(max_chars=64, max_interval_ms=1_000, max_hold_ms=20)
+
+    assert coalescer.add({"delta": "a", "index": 0}) == [{"delta": "a", "index": 0}]
+    assert coalescer.add({"delta": "b", "index": 1}) == []
+    clock["now"] += 0.01
+    assert coalescer.flush_expired() == []
+    clock["now"] += 0.015
+    assert coalescer.flush_expired() == [{"delta": "b", "index": 1}]
+    assert coalescer.flush_expired() == []
+
+
+@pytest.mark.asyncio
+async def test_model_stream_flushes_paused_and_failed_streams(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Layer: integration. Verifies held deltas reach clients during a pause and before the failure decision."""
+    interaction = _RecordingInteraction()
+    provider = _PausingProvider(interaction.deltas)
+    monkeypatch.setattr(model_stream_v1, "StubModelStreamProvider", lambda: provider)
+    monkeypatch.setenv("ORKET_MODEL_STREAM_COALESCE_CHARS", "64")
+    monkeypatch.setenv("ORKET_MODEL_STREAM_COALESCE_MS", "1000")
+    monkeypatch.setenv("ORKET_MODEL_STREAM_COALESCE_MAX_HOLD_MS", "20")
+
+    await model_stream_v1.run_model_stream_v1(
+        input_config={}, turn_params={}, interaction_context=interaction  # type: ignore[arg-type]
+    )
+
+    assert provider.released_during_pause == ["a", "bc"]
+    assert interaction.deltas == ["a", "bc"]
+    assert interaction.commits == ["fail_closed:provider_error:boom"]